@@ -3,6 +3,12 @@ from api.nexon_api import (
     get_character_info,
     get_character_stat,
     extract_combat_power,
+    crop_character_image,
+    image_to_png,
     load_character_pixmap,
     CharacterFetchThread,
-)
\ No newline at end of file
+)
+from api.http_client import ApiResult, NexonClient, shared_client
+from api.async_client import AsyncNexonClient, shared_async_client, shared_loop
+from api.bulk_refresh import BulkRefreshThread, fetch_character_row
+from api.image_service import CharacterImageService, ThumbnailSpec
@@ -0,0 +1,363 @@
+"""
+asyncio 기반 Nexon Open API 클라이언트.
+
+- 백그라운드 스레드 하나에서 이벤트 루프 하나를 돌리고 (AsyncLoopThread),
+  여러 캐릭터 조회를 그 루프 위에서 동시에 처리 — 조회마다 스레드를 만들지 않음
+- HTTP는 asyncio 스트림 위의 최소 HTTP/1.1 GET (keep-alive 커넥션 재사용,
+  Content-Length / chunked 응답). 추가 의존성 없음
+- 호출 수 제한(토큰 버킷)과 응답 캐시는 동기 클라이언트(shared_client)와 공유
+- 호출마다 타임아웃, Future.cancel()로 취소
+
+사용 흐름 (GUI 스레드):
+    future = shared_loop().submit(shared_async_client().fetch_character("쿠루리우타"))
+    future.add_done_callback(...)       # 루프 스레드에서 호출됨 → 시그널로 전달
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import random
+import ssl
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+
+from api.http_client import ApiResult, TokenBucket, error_result, shared_client
+from api.response_cache import ResponseCache
+from utils.profiling import profiled
+from config import (
+    API_KEY, NEXON_API_BASE, NEXON_API_MAX_RETRIES, NEXON_API_TIMEOUT, NEXON_API_POOL_SIZE,
+)
+
+
+# ---------------------------------------------------------------------------
+# 최소 HTTP/1.1 클라이언트
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Response:
+    status: int
+    reason: str
+    headers: dict[str, str]   # 소문자 키
+    body: bytes
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.headers.get("connection", "").lower() != "close"
+
+
+class _ConnectionPool:
+    """(호스트, 포트, TLS) 별 유휴 keep-alive 커넥션. 루프 스레드 전용."""
+
+    def __init__(self, max_idle: int):
+        self._max_idle = max_idle
+        self._idle: dict[tuple, list] = {}
+        self.stats = {"opened": 0, "reused": 0}
+
+    async def acquire(self, host: str, port: int, use_tls: bool):
+        idle = self._idle.get((host, port, use_tls))
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                self.stats["reused"] += 1
+                return reader, writer, True
+            writer.close()
+        ctx = ssl.create_default_context() if use_tls else None
+        reader, writer = await asyncio.open_connection(host, port, ssl=ctx)
+        self.stats["opened"] += 1
+        return reader, writer, False
+
+    def release(self, key: tuple, reader, writer) -> None:
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self._max_idle:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+
+    def close(self) -> None:
+        for idle in self._idle.values():
+            for _, writer in idle:
+                writer.close()
+        self._idle.clear()
+
+
+async def _read_response(reader: asyncio.StreamReader) -> _Response:
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("서버가 연결을 닫았습니다.")
+    _, status, *reason = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    status = int(status)
+    if status in (204, 304) or 100 <= status < 200:
+        body = b""
+    elif headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()   # 마지막 빈 줄 (trailer 미지원)
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        headers["connection"] = "close"
+    return _Response(status, reason[0] if reason else "", headers, body)
+
+
+# ---------------------------------------------------------------------------
+# 클라이언트
+# ---------------------------------------------------------------------------
+
+class AsyncNexonClient:
+    """
+    asyncio Nexon Open API 클라이언트. 하나의 이벤트 루프에서만 사용.
+    limiter / cache를 주지 않으면 shared_client()의 것을 공유한다.
+    """
+
+    def __init__(self, base_url: str = NEXON_API_BASE, api_key: str = API_KEY,
+                 limiter: TokenBucket | None = None, cache: ResponseCache | None = None,
+                 max_connections: int = NEXON_API_POOL_SIZE,
+                 max_retries: int = NEXON_API_MAX_RETRIES, timeout: float = NEXON_API_TIMEOUT,
+                 backoff_base: float = 0.5, backoff_cap: float = 8.0,
+                 share_sync_state: bool = True):
+        sync = shared_client() if share_sync_state and (limiter is None or cache is None) else None
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.limiter = limiter or (sync.limiter if sync else TokenBucket(1e9, 1_000_000))
+        self.cache = cache if cache is not None else (sync.cache if sync else None)
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._max_connections = max_connections
+        self._slots: asyncio.Semaphore | None = None
+        self._pool = _ConnectionPool(max_connections)
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0, "failures": 0,
+                      "timeouts": 0}
+
+    def close(self) -> None:
+        """유휴 커넥션 정리. 루프 스레드(코루틴 안)에서 호출."""
+        self._pool.close()
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    @profiled(cat="api")
+    async def get(self, endpoint: str, params: dict | None = None, use_cache: bool = True,
+                  timeout: float | None = None) -> ApiResult:
+        """
+        GET 요청. 재시도·대기를 포함한 전체 호출에 timeout 적용.
+        예외 대신 ApiResult 반환 (취소는 CancelledError 그대로 전파).
+        """
+        started = time.monotonic()
+        stale = None
+        # 캐시는 SQLite 파일 I/O라 루프 스레드에서 부르면 진행 중인 요청이 모두 멈춘다 → 스레드 풀로
+        if self.cache is not None and use_cache:
+            body, stale = await asyncio.to_thread(self.cache.lookup, endpoint, params)
+            if body is not None:
+                return ApiResult(ok=True, data=body, status=200, cached=True,
+                                 elapsed=time.monotonic() - started)
+        try:
+            result = await asyncio.wait_for(self._get_network(endpoint, params, stale),
+                                            timeout or self.timeout * (self.max_retries + 1))
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            result = ApiResult(ok=False, error="Timeout", message="요청 시간 초과")
+
+        if self.cache is not None:
+            if result.status == 304 and stale is not None:
+                await asyncio.to_thread(self.cache.touch, endpoint, params)
+                result.data, result.cached = stale["body"], True
+            elif result.ok:
+                await asyncio.to_thread(self.cache.store, endpoint, params, result.data,
+                                        result.etag, result.last_modified)
+        result.elapsed = time.monotonic() - started
+        return result
+
+    async def fetch_character(self, name: str) -> dict:
+        """
+        이름 → OCID → 기본 정보. 기본 정보 dict에 ocid를 더해 반환.
+        실패 시 ValueError (메시지는 UI에 그대로 표시).
+        """
+        ocid_result = await self.get("id", {"character_name": name})
+        if not ocid_result.ok or not ocid_result.data.get("ocid"):
+            raise ValueError("OCID를 불러오지 못했습니다.")
+        ocid = ocid_result.data["ocid"]
+        info = await self.get("character/basic", {"ocid": ocid})
+        if not info.ok:
+            raise ValueError("캐릭터 정보를 불러오지 못했습니다.")
+        return {**info.data, "ocid": ocid}
+
+    async def fetch_many(self, names: list[str]) -> dict[str, dict | Exception]:
+        """여러 캐릭터를 동시에 조회. {이름: 정보 dict 또는 예외}"""
+        results = await asyncio.gather(*(self.fetch_character(n) for n in names),
+                                       return_exceptions=True)
+        return dict(zip(names, results))
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    def _backoff(self, attempt: int, retry_after: str | None) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_cap)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    async def _get_network(self, endpoint: str, params: dict | None,
+                           stale: dict | None) -> ApiResult:
+        query = urllib.parse.urlencode(params or {})
+        url = f"{self.base_url}/{endpoint}" + (f"?{query}" if query else "")
+        headers = {"x-nxopen-api-key": self.api_key}
+        if stale is not None:
+            if stale["etag"]:
+                headers["If-None-Match"] = stale["etag"]
+            if stale["last_modified"]:
+                headers["If-Modified-Since"] = stale["last_modified"]
+
+        result = ApiResult(ok=False)
+        for attempt in range(self.max_retries + 1):
+            delay = self.limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+            self.stats["requests"] += 1
+            result = await self._request_once(url, headers)
+            result.attempts = attempt + 1
+            if result.ok or not result.retryable or attempt == self.max_retries:
+                break
+
+            delay = self._backoff(attempt, result.retry_after)
+            self.stats["retries"] += 1
+            if result.status == 429:
+                self.stats["throttled"] += 1
+                self.limiter.penalize(delay)
+            else:
+                await asyncio.sleep(delay)
+
+        if not result.ok:
+            self.stats["failures"] += 1
+        return result
+
+    async def _request_once(self, url: str, headers: dict) -> ApiResult:
+        try:
+            resp = await asyncio.wait_for(self._http_get(url, headers), self.timeout)
+        except asyncio.TimeoutError:
+            return ApiResult(ok=False, error="Timeout", message="응답 시간 초과")
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            return ApiResult(ok=False, error=type(e).__name__, message=str(e))
+
+        if resp.status == 200:
+            try:
+                data = json.loads(resp.body)
+            except ValueError as e:
+                return ApiResult(ok=False, status=200, error="InvalidJSON", message=str(e))
+            return ApiResult(ok=True, data=data, status=200, etag=resp.headers.get("etag"),
+                             last_modified=resp.headers.get("last-modified"))
+        if resp.status == 304:
+            return ApiResult(ok=True, status=304)
+        if resp.status == 429:
+            return ApiResult(ok=False, status=429, error="TooManyRequests",
+                             message="호출 한도 초과", retry_after=resp.headers.get("retry-after"))
+        return error_result(resp.status, resp.body, resp.reason)
+
+    async def _http_get(self, url: str, headers: dict) -> _Response:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._max_connections)
+        parts = urllib.parse.urlsplit(url)
+        use_tls = parts.scheme == "https"
+        host = parts.hostname
+        port = parts.port or (443 if use_tls else 80)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        lines = [f"GET {target} HTTP/1.1", f"Host: {parts.netloc}",
+                 "Accept: application/json", "Connection: keep-alive"]
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+        async with self._slots:
+            for _ in range(2):   # 재사용한 커넥션이 이미 닫혔으면 새 커넥션으로 한 번 더
+                reader, writer, reused = await self._pool.acquire(host, port, use_tls)
+                try:
+                    writer.write(request)
+                    await writer.drain()
+                    resp = await _read_response(reader)
+                except (ConnectionResetError, asyncio.IncompleteReadError, BrokenPipeError):
+                    writer.close()
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()   # 취소·타임아웃 시 응답이 반쯤 남은 커넥션은 버림
+                    raise
+                if resp.keep_alive:
+                    self._pool.release((host, port, use_tls), reader, writer)
+                else:
+                    writer.close()
+                return resp
+        raise ConnectionResetError("연결할 수 없습니다.")
+
+
+# ---------------------------------------------------------------------------
+# 백그라운드 루프
+# ---------------------------------------------------------------------------
+
+class AsyncLoopThread:
+    """이벤트 루프 하나를 도는 데몬 스레드. 다른 스레드에서 코루틴을 제출한다."""
+
+    def __init__(self, name: str = "nexon-asyncio"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """코루틴 실행 예약. 반환된 Future의 cancel()은 루프 안의 작업도 취소한다."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout: float | None = None):
+        """코루틴을 실행하고 결과를 기다린다 (GUI 스레드에서는 사용하지 말 것)."""
+        return self.submit(coro).result(timeout)
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=2)
+
+
+_loop: AsyncLoopThread | None = None
+_client: AsyncNexonClient | None = None
+_lock = threading.Lock()
+
+
+def shared_loop() -> AsyncLoopThread:
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = AsyncLoopThread()
+        return _loop
+
+
+def shared_async_client() -> AsyncNexonClient:
+    """shared_loop()에서 사용하는 앱 공용 asyncio 클라이언트."""
+    global _client
+    with _lock:
+        if _client is None:
+            _client = AsyncNexonClient()
+        return _client
@@ -0,0 +1,104 @@
+"""
+전체 캐릭터 정보 일괄 새로고침.
+
+캐릭터마다 OCID(없을 때만) → 기본 정보 + 스탯을 조회한다.
+캐릭터 단위 작업을 제한된 스레드 풀에서 동시에 돌리고,
+호출 수 제한은 공유 클라이언트(shared_client)의 토큰 버킷이 맡는다.
+(N명 ≈ N / 병렬도 라운드트립, 호출 한도에 걸리면 그 한도만큼)
+
+결과는 DB에 바로 쓰지 않고 행 목록으로 넘긴다 — 저장은 받는 쪽에서
+DataManager.upsert_characters()로 한 트랜잭션에 처리.
+
+사용자가 누른 새로고침은 최신 값을 원하므로 기본 정보/스탯은 응답 캐시를
+읽지 않는다 (use_cache=False, 받은 결과는 캐시에 저장). OCID는 항상 캐시 사용.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PySide6.QtCore import QThread, Signal
+
+from api.http_client import NexonClient, shared_client
+from api.nexon_api import extract_combat_power
+from config import NEXON_API_PARALLELISM
+
+
+def fetch_character_row(client: NexonClient, name: str, ocid: str | None = None,
+                        use_cache: bool = False) -> dict:
+    """
+    캐릭터 한 명의 최신 정보 조회. 실패 시 예외 대신 error 키에 메시지.
+
+    Returns:
+        {"name": ..., "ocid": ..., "level": ..., "job": ..., "power": ..., "image_url": ...}
+        또는 {"name": ..., "error": "OCID 조회 실패 (OPENAPI00004)"}
+    """
+    if not ocid:
+        result = client.get("id", {"character_name": name})
+        if not result.ok or not result.data.get("ocid"):
+            return {"name": name, "error": f"OCID 조회 실패 ({result.error})"}
+        ocid = result.data["ocid"]
+
+    basic = client.get("character/basic", {"ocid": ocid}, use_cache=use_cache)
+    if not basic.ok:
+        return {"name": name, "error": f"기본 정보 조회 실패 ({basic.error})"}
+    stat = client.get("character/stat", {"ocid": ocid}, use_cache=use_cache)
+
+    info = basic.data
+    return {
+        "name": name,
+        "ocid": ocid,
+        "level": info.get("character_level"),
+        "job": info.get("character_class"),
+        "image_url": info.get("character_image"),
+        # 스탯만 실패하면 전투력은 기존 값 유지 (upsert의 COALESCE)
+        "power": extract_combat_power(stat.data) if stat.ok else None,
+    }
+
+
+class BulkRefreshThread(QThread):
+    """
+    여러 캐릭터를 동시에 새로고침.
+
+    progress(완료 수, 전체 수, 캐릭터 이름)로 진행 상황을 알리고,
+    끝나면 completed(성공 행 목록, {이름: 에러 메시지})를 보낸다.
+    """
+
+    progress = Signal(int, int, str)
+    completed = Signal(list, dict)
+
+    def __init__(self, characters: list[dict], parallelism: int = NEXON_API_PARALLELISM,
+                 client: NexonClient | None = None, use_cache: bool = False, parent=None):
+        """characters: [{"name": ..., "ocid": ...}, ...] (ocid가 없으면 조회)"""
+        super().__init__(parent)
+        self._characters = characters
+        self._use_cache = use_cache
+        self._parallelism = max(1, parallelism)
+        self._client = client
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """남은 캐릭터는 시작하지 않는다 (진행 중인 요청은 끝까지)."""
+        self._cancel.set()
+
+    def _fetch(self, client: NexonClient, char: dict) -> dict:
+        if self._cancel.is_set():
+            return {"name": char["name"], "error": "취소됨"}
+        return fetch_character_row(client, char["name"], char.get("ocid"), self._use_cache)
+
+    def run(self) -> None:
+        client = self._client or shared_client()
+        total = len(self._characters)
+        rows, errors = [], {}
+
+        with ThreadPoolExecutor(max_workers=self._parallelism,
+                                thread_name_prefix="bulk-refresh") as pool:
+            futures = [pool.submit(self._fetch, client, c) for c in self._characters]
+            for done, future in enumerate(as_completed(futures), start=1):
+                row = future.result()
+                if "error" in row:
+                    errors[row["name"]] = row["error"]
+                else:
+                    rows.append(row)
+                self.progress.emit(done, total, row["name"])
+
+        self.completed.emit(rows, errors)
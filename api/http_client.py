@@ -0,0 +1,261 @@
+"""
+Nexon Open API 공용 HTTP 클라이언트.
+
+- requests.Session 하나를 공유해 keep-alive 커넥션 재사용 (풀 크기 설정 가능)
+- 토큰 버킷으로 초당 호출 수 제한 (여러 스레드가 같은 버킷 공유)
+- 429 / 5xx / 연결 오류는 지터가 섞인 지수 백오프로 재시도 (Retry-After 우선)
+- 결과는 예외 대신 ApiResult로 반환 (성공 여부, 상태 코드, 에러 이름, 시도 횟수)
+- ResponseCache가 있으면 유효한 캐시 응답은 네트워크 없이 반환 (use_cache=False로 우회)
+
+사용 흐름:
+    client = shared_client()
+    result = client.get("id", {"character_name": "쿠루리우타"})
+    if result.ok:
+        ocid = result.data["ocid"]
+    else:
+        print(result.error, result.status)
+"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from api.response_cache import ResponseCache
+from utils.profiling import profiled
+from config import (
+    API_KEY, NEXON_API_BASE,
+    NEXON_API_RATE, NEXON_API_BURST, NEXON_API_MAX_RETRIES,
+    NEXON_API_TIMEOUT, NEXON_API_POOL_SIZE, USE_API_CACHE,
+)
+
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class ApiResult:
+    """API 호출 결과. ok가 False면 data는 None."""
+    ok: bool
+    data: Any = None
+    status: int | None = None     # HTTP 상태 코드 (연결 실패 시 None)
+    error: str | None = None      # Nexon 에러 이름 또는 예외 종류
+    message: str = ""
+    attempts: int = 0
+    elapsed: float = 0.0          # 대기·재시도 포함 총 소요 시간(초)
+    retry_after: str | None = None  # 429 응답의 Retry-After 헤더
+    cached: bool = False          # 캐시에서 반환 (304 재검증 포함)
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def retryable(self) -> bool:
+        return self.status is None or self.status in _RETRY_STATUS
+
+
+# ---------------------------------------------------------------------------
+# 호출 수 제한
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """
+    초당 rate개 토큰이 채워지는 버킷 (최대 burst개). 스레드 안전.
+    acquire()는 토큰이 생길 때까지 대기하고, reserve()는 토큰을 미리 차감한 뒤
+    기다려야 할 시간만 돌려준다 (asyncio 클라이언트가 같은 버킷을 공유할 때 사용).
+    """
+
+    def __init__(self, rate: float, burst: int | None = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """토큰 1개 예약 (잔량이 음수가 될 수 있음). 사용 전까지 기다릴 시간(초) 반환."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> float:
+        """토큰 1개 사용. 기다린 시간(초) 반환."""
+        delay = self.reserve()
+        if delay:
+            self._sleep(delay)
+        return delay
+
+    def penalize(self, seconds: float) -> None:
+        """서버가 429를 돌려주면 버킷을 비워 다른 스레드도 함께 쉬게 한다."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+# ---------------------------------------------------------------------------
+# 클라이언트
+# ---------------------------------------------------------------------------
+
+class NexonClient:
+    """세션 재사용 + 호출 수 제한 + 재시도를 묶은 Nexon Open API 클라이언트."""
+
+    def __init__(self, base_url: str = NEXON_API_BASE, api_key: str = API_KEY,
+                 rate: float = NEXON_API_RATE, burst: int = NEXON_API_BURST,
+                 max_retries: int = NEXON_API_MAX_RETRIES, timeout: float = NEXON_API_TIMEOUT,
+                 pool_size: int = NEXON_API_POOL_SIZE,
+                 backoff_base: float = 0.5, backoff_cap: float = 8.0,
+                 session: requests.Session | None = None,
+                 cache: ResponseCache | None = None):
+        self.base_url = base_url.rstrip("/")
+        self.cache = cache
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.limiter = TokenBucket(rate, burst)
+
+        self._session = session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["x-nxopen-api-key"] = api_key
+
+        self._stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0, "failures": 0,
+                      "wait_seconds": 0.0}
+
+    def close(self) -> None:
+        self._session.close()
+
+    def _count(self, key: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _backoff(self, attempt: int, retry_after: str | None) -> float:
+        """Retry-After가 있으면 그 값, 없으면 full jitter 지수 백오프."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_cap)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    @profiled(cat="api")
+    def get(self, endpoint: str, params: dict | None = None, use_cache: bool = True) -> ApiResult:
+        """
+        GET 요청. 예외를 던지지 않고 항상 ApiResult 반환.
+        use_cache=False면 캐시를 읽지 않고 항상 새로 받는다 (결과는 캐시에 저장).
+        """
+        started = time.monotonic()
+        stale = None
+        if self.cache is not None and use_cache:
+            body, stale = self.cache.lookup(endpoint, params)
+            if body is not None:
+                return ApiResult(ok=True, data=body, status=200, cached=True,
+                                 elapsed=time.monotonic() - started)
+
+        result = self._get_network(endpoint, params, stale)
+        if self.cache is not None:
+            if result.status == 304 and stale is not None:
+                self.cache.touch(endpoint, params)
+                result.data, result.cached = stale["body"], True
+            elif result.ok:
+                self.cache.store(endpoint, params, result.data, result.etag, result.last_modified)
+        result.elapsed = time.monotonic() - started
+        return result
+
+    def _get_network(self, endpoint: str, params: dict | None, stale: dict | None) -> ApiResult:
+        url = f"{self.base_url}/{endpoint}"
+        headers = {}
+        if stale is not None:
+            if stale["etag"]:
+                headers["If-None-Match"] = stale["etag"]
+            if stale["last_modified"]:
+                headers["If-Modified-Since"] = stale["last_modified"]
+        result = ApiResult(ok=False)
+
+        for attempt in range(self.max_retries + 1):
+            self._count("wait_seconds", self.limiter.acquire())
+            self._count("requests")
+            result = self._request_once(url, params, headers)
+            result.attempts = attempt + 1
+            if result.ok or not result.retryable or attempt == self.max_retries:
+                break
+
+            delay = self._backoff(attempt, result.retry_after)
+            self._count("retries")
+            if result.status == 429:
+                # 버킷을 비워 두면 다음 acquire()에서 이 스레드도 함께 대기
+                self._count("throttled")
+                self.limiter.penalize(delay)
+            else:
+                time.sleep(delay)
+
+        if not result.ok:
+            self._count("failures")
+        return result
+
+    def _request_once(self, url: str, params: dict | None, headers: dict) -> ApiResult:
+        try:
+            resp = self._session.get(url, params=params, headers=headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            return ApiResult(ok=False, error=type(e).__name__, message=str(e))
+
+        if resp.status_code == 200:
+            try:
+                return ApiResult(ok=True, data=resp.json(), status=200,
+                                 etag=resp.headers.get("ETag"),
+                                 last_modified=resp.headers.get("Last-Modified"))
+            except ValueError as e:
+                return ApiResult(ok=False, status=200, error="InvalidJSON", message=str(e))
+
+        if resp.status_code == 304:
+            return ApiResult(ok=True, status=304)
+
+        if resp.status_code == 429:
+            return ApiResult(ok=False, status=429, error="TooManyRequests",
+                             message="호출 한도 초과",
+                             retry_after=resp.headers.get("Retry-After"))
+
+        return error_result(resp.status_code, resp.content, resp.reason)
+
+
+def error_result(status: int, body: bytes, reason: str | None = None) -> ApiResult:
+    """
+    에러 응답 → ApiResult.
+    Nexon 에러 본문: {"error": {"name": "OPENAPI00004", "message": "..."}}
+    """
+    error, message = f"HTTP{status}", reason or ""
+    try:
+        detail = json.loads(body).get("error") or {}
+        error = detail.get("name") or error
+        message = detail.get("message") or message
+    except (ValueError, AttributeError):
+        pass
+    return ApiResult(ok=False, status=status, error=error, message=message)
+
+
+_shared: NexonClient | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_client() -> NexonClient:
+    """앱 전체가 공유하는 클라이언트 (세션·호출 한도·응답 캐시 공유)."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = NexonClient(cache=ResponseCache() if USE_API_CACHE else None)
+        return _shared
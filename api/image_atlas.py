@@ -0,0 +1,159 @@
+"""
+캐릭터 썸네일 묶음 파일 (atlas).
+
+사이드바/상세용으로 크롭·스케일이 끝난 PNG를 파일 하나에 모아두고
+mmap으로 읽는다. 캐릭터 수와 무관하게 파일 열기는 한 번.
+
+파일 구조:
+    b"BTATLAS1" | 인덱스 길이 (uint32 LE) | 인덱스 JSON | PNG 데이터 ...
+    인덱스: {"<캐릭터>\\t<spec 태그>": [offset, length, source_id], ...}
+    offset은 데이터 영역 시작 기준.
+
+source_id는 원본 이미지의 식별자 (blob 해시 등)로,
+원본이 바뀌면 달라지므로 오래된 항목은 조회되지 않는다.
+"""
+
+import json
+import mmap
+import os
+import struct
+
+from config import IMAGE_ATLAS_FILE, USE_IMAGE_ATLAS
+
+
+_MAGIC = b"BTATLAS1"
+_HEADER = struct.Struct("<I")
+
+
+class ImageAtlas:
+    """mmap 기반 atlas 리더 + 새 항목을 모아 한 번에 다시 쓰는 라이터."""
+
+    def __init__(self, path: str = IMAGE_ATLAS_FILE):
+        self.path = path
+        self._file = None
+        self._mm = None
+        self._data_start = 0
+        self._index: dict[str, list] = {}
+        self._pending: dict[str, tuple[bytes, str]] = {}
+        self.stats = {"hits": 0, "misses": 0, "opens": 0, "writes": 0}
+        self._open()
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _key(char_name: str, tag: str) -> str:
+        return f"{char_name}\t{tag}"
+
+    def _open(self) -> None:
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if mm[:len(_MAGIC)] != _MAGIC:
+                raise ValueError("atlas 형식이 아닙니다.")
+            (index_len,) = _HEADER.unpack_from(mm, len(_MAGIC))
+            index_start = len(_MAGIC) + _HEADER.size
+            self._index = json.loads(mm[index_start:index_start + index_len].decode("utf-8"))
+            self._data_start = index_start + index_len
+            self._file, self._mm = f, mm
+            self.stats["opens"] += 1
+        except (ValueError, OSError) as e:
+            print(f"[Atlas] {self.path} 읽기 실패, 무시: {e}")
+            f.close()
+            self._index = {}
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def get(self, char_name: str, tag: str, source_id: str) -> bytes | None:
+        """source_id가 일치하는 항목의 PNG 바이트. 없거나 오래됐으면 None."""
+        key = self._key(char_name, tag)
+        pending = self._pending.get(key)
+        if pending is not None and pending[1] == source_id:
+            self.stats["hits"] += 1
+            return pending[0]
+
+        entry = self._index.get(key)
+        if entry is None or entry[2] != source_id or self._mm is None:
+            self.stats["misses"] += 1
+            return None
+        offset, length, _ = entry
+        self.stats["hits"] += 1
+        start = self._data_start + offset
+        return self._mm[start:start + length]
+
+    def __len__(self) -> int:
+        return len(set(self._index) | set(self._pending))
+
+    # ------------------------------------------------------------------
+    # 쓰기
+    # ------------------------------------------------------------------
+
+    def add(self, char_name: str, tag: str, source_id: str, png: bytes) -> None:
+        """새 항목 추가 (flush 전까지 메모리에만 보관)."""
+        self._pending[self._key(char_name, tag)] = (png, source_id)
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending)
+
+    def flush(self, keep: set[str] | None = None) -> None:
+        """
+        기존 항목 + 새 항목을 새 파일로 쓰고 교체 (임시 파일 → os.replace).
+        keep이 주어지면 그 캐릭터들의 항목만 남긴다 (삭제된 캐릭터 정리).
+        """
+        if not self._pending and keep is None:
+            return
+
+        entries: dict[str, tuple[bytes, str]] = {}
+        for key, (offset, length, source_id) in self._index.items():
+            if key not in self._pending and self._mm is not None:
+                start = self._data_start + offset
+                entries[key] = (self._mm[start:start + length], source_id)
+        entries.update(self._pending)
+        if keep is not None:
+            entries = {k: v for k, v in entries.items() if k.split("\t", 1)[0] in keep}
+
+        index, blobs, offset = {}, [], 0
+        for key, (png, source_id) in entries.items():
+            index[key] = [offset, len(png), source_id]
+            blobs.append(png)
+            offset += len(png)
+        index_bytes = json.dumps(index, ensure_ascii=False).encode("utf-8")
+
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(_MAGIC)
+            f.write(_HEADER.pack(len(index_bytes)))
+            f.write(index_bytes)
+            for png in blobs:
+                f.write(png)
+
+        # mmap이 열린 파일은 (Windows에서) 교체할 수 없으므로 닫고 교체
+        self.close()
+        os.replace(tmp, self.path)
+        self._pending.clear()
+        self.stats["writes"] += 1
+        self._open()
+
+
+_shared: ImageAtlas | None = None
+
+
+def shared_atlas() -> ImageAtlas | None:
+    """앱 전체가 공유하는 atlas. USE_IMAGE_ATLAS가 꺼져 있으면 None."""
+    global _shared
+    if not USE_IMAGE_ATLAS:
+        return None
+    if _shared is None:
+        _shared = ImageAtlas()
+    return _shared
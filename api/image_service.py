@@ -0,0 +1,235 @@
+"""
+비동기 캐릭터 이미지 서비스.
+
+- 다운로드 / 디코딩 / 크롭·스케일은 워커 스레드에서 QImage로 처리
+- 원본은 ImageStore(image_url 해시 기반 blob)에서 가져옴 — URL이 바뀌면 새로 받음
+- 같은 캐릭터에 대한 동시 요청은 작업 하나로 합침 (다운로드 1회)
+- 결과는 시그널로 전달, 스케일된 QPixmap은 크기별 LRU 메모리 캐시에 보관
+- 완성된 썸네일은 atlas에도 넣어 두어 다음 실행에서는 원본 디코딩 없이 바로 표시
+
+사용 흐름:
+    service = CharacterImageService()
+    service.image_ready.connect(on_ready)          # (이름, spec, QPixmap)
+    pixmap = service.request(url, name, ThumbnailSpec(180))
+    if pixmap is None:
+        ...  # 캐시 미스 → 나중에 image_ready로 도착
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from api.nexon_api import crop_character_image, image_to_png
+from api.image_atlas import shared_atlas
+from data_layer.image_store import ImageStore, url_key
+from utils.profiling import profiled, span
+
+
+@dataclass(frozen=True)
+class ThumbnailSpec:
+    """썸네일 크기 + 크롭 파라미터. 파라미터가 바뀌면 캐시 키도 바뀐다."""
+    size: int
+    crop_ratio: float = 0.3
+    y_offset_ratio: float = 0.05
+    x_offset: int = 0
+
+    def tag(self) -> str:
+        return f"{self.size}_{self.crop_ratio:g}_{self.y_offset_ratio:g}_{self.x_offset}"
+
+    def apply(self, image: QImage) -> QImage:
+        return crop_character_image(image, self.size, self.crop_ratio, self.y_offset_ratio, self.x_offset)
+
+
+# ---------------------------------------------------------------------------
+# 메모리 캐시
+# ---------------------------------------------------------------------------
+
+class PixmapLRU:
+    """대상 크기별로 개수 제한이 있는 QPixmap LRU 캐시. GUI 스레드 전용."""
+
+    def __init__(self, max_per_size: int = 64):
+        self._max = max_per_size
+        self._buckets: dict[int, OrderedDict] = {}
+
+    def get(self, size: int, key) -> QPixmap | None:
+        bucket = self._buckets.get(size)
+        if bucket is None or key not in bucket:
+            return None
+        bucket.move_to_end(key)
+        return bucket[key]
+
+    def put(self, size: int, key, pixmap: QPixmap) -> None:
+        bucket = self._buckets.setdefault(size, OrderedDict())
+        bucket[key] = pixmap
+        bucket.move_to_end(key)
+        while len(bucket) > self._max:
+            bucket.popitem(last=False)
+
+    def __len__(self) -> int:
+        return sum(len(b) for b in self._buckets.values())
+
+
+# ---------------------------------------------------------------------------
+# 워커
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _FetchJob:
+    """캐릭터 한 명의 진행 중 작업. 도중에 들어온 spec도 같은 작업에서 처리."""
+    url: str
+    char_name: str
+    specs: list = field(default_factory=list)
+
+
+class _ServiceSignals(QObject):
+    # 워커 스레드에서 emit → GUI 스레드 슬롯으로 queued 전달
+    done = Signal(str, str, object, QImage, object)   # (이름, url, spec, 이미지, PNG 바이트)
+    failed = Signal(str, str)                 # (이름, 에러 메시지)
+
+
+class _FetchTask(QRunnable):
+
+    def __init__(self, service: "CharacterImageService", job: _FetchJob):
+        super().__init__()
+        self._service = service
+        self._job = job
+
+    def run(self) -> None:
+        service, job = self._service, self._job
+        with span("image.fetch", "image", character=job.char_name):
+            self._run(service, job)
+
+    def _run(self, service: "CharacterImageService", job: _FetchJob) -> None:
+        try:
+            source = service._load_source(job.url, job.char_name)
+        except Exception as e:
+            service._finish_job(job)
+            service._signals.failed.emit(job.char_name, str(e))
+            return
+
+        done = []
+        while True:
+            with service._lock:
+                todo = [s for s in job.specs if s not in done]
+                if not todo:
+                    if service._jobs.get(job.char_name) is job:
+                        del service._jobs[job.char_name]
+                    break
+            for spec in todo:
+                image = spec.apply(source)
+                service._signals.done.emit(job.char_name, job.url, spec, image, image_to_png(image))
+                done.append(spec)
+
+
+# ---------------------------------------------------------------------------
+# 서비스
+# ---------------------------------------------------------------------------
+
+class CharacterImageService(QObject):
+    """캐릭터 이미지 비동기 로드 + 요청 병합 + 크기별 메모리 캐시."""
+
+    image_ready = Signal(str, object, QPixmap)   # (이름, ThumbnailSpec, 결과)
+    image_failed = Signal(str, str)              # (이름, 에러 메시지)
+
+    def __init__(self, store: ImageStore | None = None, max_per_size: int = 64,
+                 pool: QThreadPool | None = None, parent=None):
+        super().__init__(parent)
+        self.store = store or ImageStore()
+        self._pool = pool or QThreadPool.globalInstance()
+        self._cache = PixmapLRU(max_per_size)
+        self._lock = threading.Lock()
+        self._jobs: dict[str, _FetchJob] = {}
+        self._stats = {"requests": 0, "hits": 0, "atlas_hits": 0, "merged": 0, "failures": 0}
+
+        self._signals = _ServiceSignals(self)
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self._on_failed)
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    def cached(self, url: str, char_name: str, spec: ThumbnailSpec) -> QPixmap | None:
+        """메모리 캐시, 그다음 atlas에서 조회 (url 해시가 같아야 유효)."""
+        pixmap = self._cache.get(spec.size, (char_name, url, spec))
+        if pixmap is not None:
+            return pixmap
+        atlas = shared_atlas()
+        png = atlas.get(char_name, spec.tag(), url_key(url)) if atlas is not None else None
+        if png is None:
+            return None
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(png, "PNG"):
+            return None
+        self._stats["atlas_hits"] += 1
+        self._cache.put(spec.size, (char_name, url, spec), pixmap)
+        return pixmap
+
+    def request(self, url: str, char_name: str, spec: ThumbnailSpec) -> QPixmap | None:
+        """
+        캐시에 있으면 즉시 반환. 없으면 None을 반환하고 백그라운드 로드를 예약
+        (결과는 image_ready). 같은 캐릭터 작업이 진행 중이면 그 작업에 합친다.
+        """
+        self._stats["requests"] += 1
+        pixmap = self.cached(url, char_name, spec)
+        if pixmap is not None:
+            self._stats["hits"] += 1
+            return pixmap
+
+        with self._lock:
+            job = self._jobs.get(char_name)
+            if job is not None and job.url == url:
+                self._stats["merged"] += 1
+                if spec not in job.specs:
+                    job.specs.append(spec)
+                return None
+            job = _FetchJob(url, char_name, [spec])
+            self._jobs[char_name] = job
+        self._pool.start(_FetchTask(self, job))
+        return None
+
+    def stats(self) -> dict:
+        return {**self._stats, "cached": len(self._cache), "in_flight": len(self._jobs),
+                "store": dict(self.store.stats)}
+
+    def wait_idle(self, msecs: int = -1) -> bool:
+        """진행 중인 워커가 끝날 때까지 대기 (테스트/종료용)."""
+        return self._pool.waitForDone(msecs)
+
+    # ------------------------------------------------------------------
+    # 워커 스레드에서 호출
+    # ------------------------------------------------------------------
+
+    @profiled(cat="image")
+    def _load_source(self, url: str, char_name: str) -> QImage:
+        """저장소에서 현재 이미지를 가져와 디코딩 (필요 시 다운로드/재검증). 실패 시 예외."""
+        image = QImage(self.store.fetch(char_name, url))
+        if image.isNull():
+            raise ValueError("이미지를 디코딩할 수 없습니다.")
+        return image
+
+    def _finish_job(self, job: _FetchJob) -> None:
+        with self._lock:
+            if self._jobs.get(job.char_name) is job:
+                del self._jobs[job.char_name]
+
+    # ------------------------------------------------------------------
+    # GUI 스레드 슬롯
+    # ------------------------------------------------------------------
+
+    def _on_done(self, char_name: str, url: str, spec: ThumbnailSpec, image: QImage,
+                 png: bytes) -> None:
+        pixmap = QPixmap.fromImage(image)
+        self._cache.put(spec.size, (char_name, url, spec), pixmap)
+        atlas = shared_atlas()
+        if atlas is not None:
+            atlas.add(char_name, spec.tag(), url_key(url), png)
+        self.image_ready.emit(char_name, spec, pixmap)
+
+    def _on_failed(self, char_name: str, message: str) -> None:
+        self._stats["failures"] += 1
+        print(f"[Image] {char_name} 이미지 로드 실패: {message}")
+        self.image_failed.emit(char_name, message)
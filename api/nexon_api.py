@@ -3,56 +3,55 @@ Nexon Open API 연동 모듈
 - 캐릭터 OCID 조회
 - 캐릭터 기본 정보 / 스탯 조회
 - 캐릭터 이미지 다운로드 및 캐싱
-- 비동기 API 호출 QThread
+- 비동기 API 호출 어댑터 (asyncio 클라이언트 위)
 """
 
-import os
-import urllib.parse
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QPixmap, QImage
+from PySide6.QtCore import Qt, QBuffer, QByteArray, QIODevice
 
-import requests
-from PySide6.QtCore import QThread, Signal
-from PySide6.QtGui import QPixmap
-from PySide6.QtCore import Qt
-
-from config import API_KEY, NEXON_API_BASE, IMAGE_DIR
+from api.async_client import shared_async_client, shared_loop
+from api.http_client import ApiResult, shared_client
+from data_layer.image_store import ImageStore
+from utils.profiling import profiled
 
 
 # ---------------------------------------------------------------------------
 # 내부 헬퍼
 # ---------------------------------------------------------------------------
 
-def _get(endpoint: str, params: dict | None = None) -> dict | None:
+def _request(endpoint: str, params: dict | None = None, use_cache: bool = True) -> ApiResult:
+    """공통 GET 요청 (공유 세션·호출 한도·재시도·응답 캐시). 실패 내용은 ApiResult에 담긴다."""
+    result = shared_client().get(endpoint, params, use_cache=use_cache)
+    if not result.ok:
+        print(f"[API] {endpoint} 호출 실패 ({result.status}, {result.error}, "
+              f"{result.attempts}회 시도): {result.message}")
+    return result
+
+
+def _get(endpoint: str, params: dict | None = None, use_cache: bool = True) -> dict | None:
     """공통 GET 요청. 실패 시 None 반환."""
-    url = f"{NEXON_API_BASE}/{endpoint}"
-    if params:
-        url += "?" + urllib.parse.urlencode(params)
-    try:
-        resp = requests.get(url, headers={"x-nxopen-api-key": API_KEY}, timeout=5)
-        resp.raise_for_status()
-        return resp.json()
-    except Exception as e:
-        print(f"[API] {endpoint} 호출 실패: {e}")
-        return None
+    return _request(endpoint, params, use_cache).data
 
 
 # ---------------------------------------------------------------------------
 # 공개 API 함수
 # ---------------------------------------------------------------------------
 
-def get_character_ocid(character_name: str) -> str | None:
+def get_character_ocid(character_name: str, use_cache: bool = True) -> str | None:
     """캐릭터 이름으로 OCID 조회."""
-    data = _get("id", {"character_name": character_name})
+    data = _get("id", {"character_name": character_name}, use_cache)
     return data.get("ocid") if data else None
 
 
-def get_character_info(ocid: str) -> dict | None:
+def get_character_info(ocid: str, use_cache: bool = True) -> dict | None:
     """OCID로 캐릭터 기본 정보 조회."""
-    return _get("character/basic", {"ocid": ocid})
+    return _get("character/basic", {"ocid": ocid}, use_cache)
 
 
-def get_character_stat(ocid: str) -> dict | None:
+def get_character_stat(ocid: str, use_cache: bool = True) -> dict | None:
     """OCID로 캐릭터 스탯 조회."""
-    return _get("character/stat", {"ocid": ocid})
+    return _get("character/stat", {"ocid": ocid}, use_cache)
 
 
 def extract_combat_power(stat_info: dict) -> int | None:
@@ -67,6 +66,37 @@ def extract_combat_power(stat_info: dict) -> int | None:
 # 이미지 처리
 # ---------------------------------------------------------------------------
 
+def crop_character_image(
+    image: QImage,
+    target_size: int,
+    crop_ratio: float = 0.3,
+    y_offset_ratio: float = 0.05,
+    x_offset: int = 0,
+) -> QImage:
+    """
+    캐릭터 전신 이미지에서 얼굴 부근을 정사각형으로 잘라 target_size로 스케일.
+    QImage만 사용하므로 워커 스레드에서 호출해도 안전.
+    """
+    w, h = image.width(), image.height()
+    crop_side = int(min(w, h) * crop_ratio)
+    x = (w - crop_side) // 2 + x_offset
+    y = int((h - crop_side) // 2 + h * y_offset_ratio)
+
+    cropped = image.copy(x, y, crop_side, crop_side)
+    return cropped.scaled(target_size, target_size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+
+def image_to_png(image: QImage) -> bytes:
+    """QImage → PNG 바이트 (워커 스레드에서 호출 가능)."""
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.WriteOnly)
+    image.save(buf, "PNG")
+    buf.close()
+    return bytes(data)
+
+
+@profiled(cat="image")
 def load_character_pixmap(
     url: str,
     char_name: str,
@@ -77,27 +107,13 @@ def load_character_pixmap(
 ) -> QPixmap | None:
     """
     캐릭터 이미지를 URL에서 내려받거나 캐시에서 불러온 뒤
-    지정된 크기로 크롭·스케일한 QPixmap 반환.
+    지정된 크기로 크롭·스케일한 QPixmap 반환. (동기 호출 — UI에서는 CharacterImageService 사용)
     """
-    file_path = os.path.join(IMAGE_DIR, f"{char_name}.png")
-
     try:
-        if os.path.exists(file_path):
-            pixmap = QPixmap(file_path)
-        else:
-            resp = requests.get(url, timeout=5)
-            resp.raise_for_status()
-            pixmap = QPixmap()
-            pixmap.loadFromData(resp.content)
-            pixmap.save(file_path, "PNG")
-
-        w, h = pixmap.width(), pixmap.height()
-        crop_side = int(min(w, h) * crop_ratio)
-        x = (w - crop_side) // 2 + x_offset
-        y = int((h - crop_side) // 2 + h * y_offset_ratio)
-
-        pixmap = pixmap.copy(x, y, crop_side, crop_side)
-        return pixmap.scaled(target_size, target_size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        image = QImage(ImageStore().fetch(char_name, url))
+        return QPixmap.fromImage(
+            crop_character_image(image, target_size, crop_ratio, y_offset_ratio, x_offset)
+        )
 
     except Exception as e:
         print(f"[Image] {char_name} 이미지 로드 실패: {e}")
@@ -108,25 +124,41 @@ def load_character_pixmap(
 # 비동기 API 호출 스레드
 # ---------------------------------------------------------------------------
 
-class CharacterFetchThread(QThread):
-    """캐릭터 기본 정보를 백그라운드에서 조회."""
+class CharacterFetchThread(QObject):
+    """
+    캐릭터 기본 정보를 백그라운드에서 조회.
+    이전 QThread 인터페이스(start / finished / failed)를 유지하는 어댑터로,
+    실제 조회는 공용 asyncio 루프에서 다른 조회들과 함께 처리된다.
+    """
 
-    finished = Signal(dict)   # 성공: 캐릭터 info dict 전달
+    finished = Signal(dict)   # 성공: 캐릭터 info dict 전달 (ocid 포함)
     failed = Signal(str)      # 실패: 에러 메시지 전달
 
-    def __init__(self, character_name: str):
-        super().__init__()
+    def __init__(self, character_name: str, parent=None):
+        super().__init__(parent)
         self.character_name = character_name
+        self._future = None
 
-    def run(self) -> None:
-        ocid = get_character_ocid(self.character_name)
-        if not ocid:
-            self.failed.emit("OCID를 불러오지 못했습니다.")
-            return
+    def start(self) -> None:
+        self._future = shared_loop().submit(
+            shared_async_client().fetch_character(self.character_name)
+        )
+        self._future.add_done_callback(self._on_done)
 
-        info = get_character_info(ocid)
-        if not info:
-            self.failed.emit("캐릭터 정보를 불러오지 못했습니다.")
-            return
+    def cancel(self) -> None:
+        if self._future is not None:
+            self._future.cancel()
 
-        self.finished.emit(info)
+    def isRunning(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def _on_done(self, future) -> None:
+        # 루프 스레드에서 호출 → 시그널은 GUI 스레드로 queued 전달
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.failed.emit(str(error) if isinstance(error, ValueError)
+                             else f"조회 중 오류: {error}")
+            return
+        self.finished.emit(future.result())
@@ -0,0 +1,163 @@
+"""
+Nexon Open API 응답 디스크 캐시 (SQLite).
+
+- 키: 엔드포인트 + 정렬된 파라미터 ("character/basic?ocid=...")
+- 엔드포인트별 TTL (config.API_CACHE_TTL) — OCID는 만료 없음, 기본 정보/스탯은 몇 시간
+- 만료된 항목에 ETag/Last-Modified가 있으면 조건부 요청으로 재검증 (304면 본문 재사용)
+- 성공(200) 응답만 저장, 에러 응답은 저장하지 않음
+
+앱 DB(boss_data.db)와 분리된 파일을 써서, 지워도 데이터 손실이 없다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import urllib.parse
+
+from config import API_CACHE_FILE, API_CACHE_TTL
+
+
+def cache_key(endpoint: str, params: dict | None) -> str:
+    query = urllib.parse.urlencode(sorted((params or {}).items()))
+    return f"{endpoint}?{query}" if query else endpoint
+
+
+class ResponseCache:
+    """
+    엔드포인트+파라미터 → JSON 응답. 스레드마다 연결 하나를 재사용 (스레드 안전).
+    호출마다 연결을 열면 PRAGMA·스키마 파싱을 매번 반복하므로 data_layer.database와 같은 방식.
+    """
+
+    def __init__(self, path: str = API_CACHE_FILE, ttl: dict | None = None,
+                 clock=time.time):
+        self.path = path
+        self.ttl = dict(API_CACHE_TTL if ttl is None else ttl)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._local = threading.local()     # 이 스레드의 연결 (인스턴스마다 따로)
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "revalidated": 0, "stores": 0}
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key             TEXT PRIMARY KEY,   -- endpoint?params
+                    endpoint        TEXT NOT NULL,
+                    body            TEXT NOT NULL,      -- JSON
+                    etag            TEXT,
+                    last_modified   TEXT,
+                    stored_at       REAL NOT NULL,
+                    expires_at      REAL                -- NULL이면 만료 없음
+                );
+                CREATE INDEX IF NOT EXISTS idx_responses_endpoint ON responses (endpoint);
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """이 스레드의 연결. `with conn:`은 커밋/롤백만 하고 닫지 않는다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=5)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    def close(self) -> None:
+        """이 스레드의 연결 닫기 (다른 스레드의 연결은 스레드가 끝날 때 정리)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            conn.close()
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _expires_at(self, endpoint: str, now: float) -> float | None:
+        ttl = self.ttl.get(endpoint, 0)
+        return None if ttl is None else now + ttl
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+
+    def lookup(self, endpoint: str, params: dict | None) -> tuple[dict | None, dict | None]:
+        """
+        (신선한 본문, 재검증용 항목) 반환.
+        - 유효 기간 이내 → (본문, None)
+        - 만료 → (None, {"body", "etag", "last_modified"}) — 조건부 요청에 사용
+        - 없음 → (None, None)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT body, etag, last_modified, expires_at FROM responses WHERE key = ?",
+                (cache_key(endpoint, params),)
+            ).fetchone()
+        if row is None:
+            self._count("misses")
+            return None, None
+        if row["expires_at"] is None or row["expires_at"] > self._clock():
+            self._count("hits")
+            return json.loads(row["body"]), None
+        self._count("stale")
+        return None, {"body": json.loads(row["body"]), "etag": row["etag"],
+                      "last_modified": row["last_modified"]}
+
+    def store(self, endpoint: str, params: dict | None, body, etag: str | None = None,
+              last_modified: str | None = None) -> None:
+        now = self._clock()
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO responses
+                       (key, endpoint, body, etag, last_modified, stored_at, expires_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (cache_key(endpoint, params), endpoint, json.dumps(body, ensure_ascii=False),
+                 etag, last_modified, now, self._expires_at(endpoint, now))
+            )
+        self._count("stores")
+
+    def touch(self, endpoint: str, params: dict | None) -> None:
+        """304 응답 후 만료 시각만 연장."""
+        now = self._clock()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE responses SET expires_at = ? WHERE key = ?",
+                (self._expires_at(endpoint, now), cache_key(endpoint, params))
+            )
+        self._count("revalidated")
+
+    # ------------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------------
+
+    def invalidate(self, endpoint: str | None = None) -> int:
+        """엔드포인트(없으면 전체) 항목 삭제. 삭제 수 반환."""
+        with self._connect() as conn:
+            if endpoint is None:
+                return conn.execute("DELETE FROM responses").rowcount
+            return conn.execute("DELETE FROM responses WHERE endpoint = ?", (endpoint,)).rowcount
+
+    def purge_expired(self) -> int:
+        """재검증 정보도 없는 만료 항목 삭제."""
+        with self._connect() as conn:
+            return conn.execute(
+                """DELETE FROM responses
+                   WHERE expires_at IS NOT NULL AND expires_at <= ?
+                     AND etag IS NULL AND last_modified IS NULL""",
+                (self._clock(),)
+            ).rowcount
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            {"hits": 12, "misses": 3, "stale": 1, "revalidated": 1, "stores": 4,
+             "hit_rate": 0.75, "entries": {"id": 10, "character/basic": 4}}
+        """
+        with self._lock:
+            counts = dict(self._stats)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT endpoint, COUNT(*) AS n FROM responses GROUP BY endpoint"
+            ).fetchall()
+        lookups = counts["hits"] + counts["misses"] + counts["stale"]
+        counts["hit_rate"] = counts["hits"] / lookups if lookups else 0.0
+        counts["entries"] = {r["endpoint"]: r["n"] for r in rows}
+        return counts
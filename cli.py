@@ -0,0 +1,359 @@
+"""
+명령줄 인터페이스 — Qt 없이 DB 조회·리포트·체크 토글.
+
+GUI와 같은 DataManager / ParquetStore를 쓰고 PySide6는 import하지 않는다.
+보스별 집계처럼 Polars가 필요한 명령만 ParquetStore를 불러온다 (그때 스냅샷도 새로 만든다).
+헤드리스 서버의 cron에서 돌리거나 스크립트에서 JSON/CSV로 받아 쓰는 용도.
+
+실행:
+    python -m cli weeks
+    python -m cli totals --format csv
+    python -m cli characters --week 2025-37
+    python -m cli checklist --character 쿠루리우타
+    python -m cli bosses --all --format json
+    python -m cli history 검은마법사
+    python -m cli check 쿠루리우타 검은마법사          # uncheck로 해제
+    python -m cli export --week 2025-37 --format csv --out checks.csv
+    python -m cli sync /mnt/laptop/boss_data.db         # 변경분 양방향 동기화 (--dry-run)
+    python -m cli accounts                              # 계정별 캐릭터·주차·누적 수익 (전체 합산)
+    python -m cli archive --keep 12                     # 최근 12주보다 오래된 주차를 Parquet로 보관 (--dry-run)
+    python -m cli restore 2025-10 2025-11               # 보관 주차를 SQLite로 되돌림
+    python -m cli --account 부캐 totals
+    python -m cli --db /path/to/boss_data.db totals
+
+주차를 생략하면 현재 주차, DB에 아직 없으면 가장 최근 주차.
+DB 경로는 --account > --db > 환경 변수 BOSS_TRACKER_DB > config.DB_FILE 순.
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import unicodedata
+
+from config import ARCHIVE_KEEP_WEEKS, DB_FILE, PARQUET_FILE, HISTORY_PARQUET_FILE
+from data_layer import DataManager, current_week_key
+from data_layer.database import set_db_path, get_db_path, get_connection, init_db
+
+
+class CliError(Exception):
+    """사용자에게 메시지만 보여주고 종료 코드 1로 끝낼 오류."""
+
+
+# ---------------------------------------------------------------------------
+# 출력
+# ---------------------------------------------------------------------------
+
+def _width(text: str) -> int:
+    """터미널 표시 폭 (한글 등 전각 문자는 2칸)."""
+    return sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in text)
+
+
+def _table(rows: list[dict]) -> str:
+    if not rows:
+        return "(없음)"
+    columns = list(rows[0])
+    cells = [[f"{v:,}" if isinstance(v, int) and not isinstance(v, bool) else str(v)
+              for v in (r.get(c, "") for c in columns)] for r in rows]
+    widths = [max(_width(c), *(_width(row[i]) for row in cells)) for i, c in enumerate(columns)]
+    numeric = [all(isinstance(r.get(c), (int, float)) and not isinstance(r.get(c), bool) for r in rows)
+               for c in columns]
+
+    def line(values):
+        padded = []
+        for v, w, num in zip(values, widths, numeric):
+            pad = " " * (w - _width(v))
+            padded.append(pad + v if num else v + pad)
+        return "  ".join(padded).rstrip()
+
+    return "\n".join([line(columns), line(["-" * w for w in widths]), *map(line, cells)])
+
+
+def _csv(rows: list[dict]) -> str:
+    if not rows:
+        return ""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=list(rows[0]), lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buf.getvalue().rstrip("\n")
+
+
+def emit(rows: list[dict], fmt: str, out: str | None = None) -> None:
+    if fmt == "json":
+        text = json.dumps(rows, ensure_ascii=False, indent=2)
+    elif fmt == "csv":
+        text = _csv(rows)
+    else:
+        text = _table(rows)
+    if out:
+        with open(out, "w", encoding="utf-8", newline="") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+# ---------------------------------------------------------------------------
+# 공통
+# ---------------------------------------------------------------------------
+
+def _resolve_week(dm: DataManager, week: str | None) -> str:
+    weeks = dm.get_all_week_keys()
+    if week:
+        if week not in weeks:
+            raise CliError(f"주차 없음: {week} (python -m cli weeks 로 확인)")
+        return week
+    current = current_week_key()
+    if current in weeks or not weeks:
+        return current
+    return weeks[-1]
+
+
+def _parquet_store(db_path: str):
+    """DB 옆에 스냅샷을 두는 ParquetStore (여기서 처음 polars import). 항상 새로 스냅샷."""
+    from data_layer import ParquetStore
+
+    base = os.path.dirname(os.path.abspath(db_path))
+    store = ParquetStore(path=os.path.join(base, PARQUET_FILE),
+                         history_path=os.path.join(base, HISTORY_PARQUET_FILE))
+    store.snapshot()
+    return store
+
+
+# ---------------------------------------------------------------------------
+# 명령
+# ---------------------------------------------------------------------------
+
+def cmd_weeks(dm: DataManager, args) -> list[dict]:
+    return [{"week_key": w} for w in dm.get_all_week_keys()]
+
+
+def cmd_totals(dm: DataManager, args) -> list[dict]:
+    return dm.get_weekly_totals()
+
+
+def cmd_characters(dm: DataManager, args) -> list[dict]:
+    week = _resolve_week(dm, args.week)
+    return [{"week_key": week, **r} for r in dm.get_character_income_summary(week)]
+
+
+def cmd_checklist(dm: DataManager, args) -> list[dict]:
+    week = _resolve_week(dm, args.week)
+    data = dm.get_week_data(week)
+    if args.character and args.character not in data:
+        raise CliError(f"{week}에 캐릭터 없음: {args.character}")
+    names = [args.character] if args.character else list(data)
+    return [{"week_key": week, "character": name, "boss_name": b["text"],
+             "boss_value": b["value"], "checked": b["checked"]}
+            for name in names for b in data[name]["bosses"]]
+
+
+def cmd_bosses(dm: DataManager, args) -> list[dict]:
+    store = _parquet_store(args.db)
+    if args.all:
+        return store.boss_contribution_all()
+    week = _resolve_week(dm, args.week)
+    return [{"week_key": week, **r} for r in store.boss_contribution(week)]
+
+
+def cmd_history(dm: DataManager, args) -> list[dict]:
+    names = [args.boss] if args.boss else [b["name"] for b in dm.get_boss_list()]
+    rows = []
+    for name in names:
+        rows += [{"boss_name": name, **{k: v for k, v in h.items() if k != "boss_name"}}
+                 for h in dm.get_boss_price_history(name)]
+    if args.boss and not rows:
+        raise CliError(f"시세 이력 없음: {args.boss}")
+    return rows
+
+
+def cmd_check(dm: DataManager, args) -> list[dict]:
+    week = _resolve_week(dm, args.week)
+    bosses = dm.get_week_data(week).get(args.character, {}).get("bosses", [])
+    if not any(b["text"] == args.boss for b in bosses):
+        raise CliError(f"{week} {args.character}의 체크리스트에 없는 보스: {args.boss}")
+    dm.set_boss_checked(week, args.character, args.boss, args.checked)
+    return [{"week_key": week, "character": args.character, "boss_name": args.boss,
+             "checked": args.checked}]
+
+
+def cmd_export(dm: DataManager, args) -> list[dict] | None:
+    from data_layer.archive import ArchiveError, WeekArchive, archived_week_keys
+
+    query, params = "SELECT * FROM weekly_checks", ()
+    weeks = [_resolve_week(dm, args.week)] if args.week else None
+    if weeks:
+        query, params = query + " WHERE week_key = ?", tuple(weeks)
+    with get_connection() as conn:
+        rows = [dict(r) for r in conn.execute(query, params)]
+        archive = WeekArchive()
+        try:
+            for week in weeks or archived_week_keys(conn):
+                rows += archive.read_week(conn, week) or []
+        except ArchiveError as e:
+            raise CliError(str(e)) from None
+    rows.sort(key=lambda r: (r["week_key"], r["character"], r["boss_name"]))
+    for r in rows:
+        r["checked"] = bool(r["checked"])
+    if args.format == "parquet":
+        if not args.out:
+            raise CliError("--format parquet에는 --out이 필요합니다")
+        import polars as pl
+        pl.DataFrame(rows).write_parquet(args.out)
+        print(f"{len(rows)}행 저장: {args.out}", file=sys.stderr)
+        return None
+    return rows
+
+
+def cmd_accounts(dm: DataManager, args) -> list[dict]:
+    from data_layer.accounts import AccountRegistry
+    from data_layer.federated_store import FederatedParquetStore
+
+    store = FederatedParquetStore(AccountRegistry().all())
+    store.snapshot()      # 바뀐 계정만
+    return store.account_totals()
+
+
+def cmd_archive(dm: DataManager, args) -> list[dict]:
+    from data_layer.archive import ArchiveError, WeekArchive
+
+    if args.keep < 1:
+        raise CliError("--keep은 1 이상이어야 합니다 (현재 주차는 보관하지 않음)")
+    try:
+        rows = WeekArchive(keep_weeks=args.keep).archive(dry_run=args.dry_run)
+    except ArchiveError as e:
+        raise CliError(str(e)) from None
+    return [{"week_key": r["week_key"], "rows": r["rows"], "total": r["total"],
+             "bytes": r.get("bytes"), "dry_run": args.dry_run} for r in rows]
+
+
+def cmd_restore(dm: DataManager, args) -> list[dict]:
+    from data_layer.archive import ArchiveError, WeekArchive, archived_week_keys
+
+    with get_connection() as conn:
+        archived = set(archived_week_keys(conn))
+    missing = [w for w in args.weeks if w not in archived]
+    if missing:
+        raise CliError(f"보관된 주차가 아님: {', '.join(missing)}")
+    try:
+        weeks = WeekArchive().restore(args.weeks)
+    except ArchiveError as e:
+        raise CliError(str(e)) from None
+    return [{"week_key": w, "restored": True} for w in weeks]
+
+
+def cmd_sync(dm: DataManager, args) -> list[dict]:
+    from data_layer.sync import SyncError, new_replica_id, sync_databases
+
+    if args.new_id:
+        print(f"새 복제본 id: {new_replica_id(get_db_path())}", file=sys.stderr)
+        if not args.other:
+            return []
+    if not args.other:
+        raise CliError("동기화할 DB 경로가 필요합니다 (python -m cli sync OTHER_DB)")
+    if not os.path.exists(args.other):
+        raise CliError(f"DB 없음: {args.other}")
+    try:
+        result = sync_databases(get_db_path(), args.other, dry_run=args.dry_run)
+    except SyncError as e:
+        raise CliError(str(e)) from None
+    return [{**result, "dry_run": args.dry_run}]
+
+
+# ---------------------------------------------------------------------------
+
+def build_parser() -> argparse.ArgumentParser:
+    def add_common(p, defaults: bool):
+        # 공통 옵션은 명령 앞뒤 어디에 써도 되도록 하위 명령에도 붙인다 (기본값은 최상위에서만)
+        d = (lambda v: v) if defaults else (lambda v: argparse.SUPPRESS)
+        p.add_argument("--db", default=d(os.environ.get("BOSS_TRACKER_DB", DB_FILE)), help="SQLite DB 경로")
+        p.add_argument("--account", default=d(None), help="계정 이름 (그 계정의 DB, --db보다 우선)")
+        p.add_argument("--format", choices=["table", "json", "csv", "parquet"], default=d("table"),
+                       help="출력 형식 (기본 table, parquet은 export + --out 전용)")
+        p.add_argument("--out", default=d(None), help="출력 파일 (기본: stdout)")
+
+    parser = argparse.ArgumentParser(prog="python -m cli", description="보스 수익 DB 명령줄 도구 (Qt 없음)")
+    add_common(parser, defaults=True)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add(name, func, help_text):
+        p = sub.add_parser(name, help=help_text)
+        add_common(p, defaults=False)
+        p.set_defaults(func=func)
+        return p
+
+    add("weeks", cmd_weeks, "주차 목록")
+    add("totals", cmd_totals, "주차별 총 수익")
+    add("characters", cmd_characters, "주차의 캐릭터별 수익").add_argument("--week")
+
+    p = add("checklist", cmd_checklist, "주차의 캐릭터별 보스 체크 상태")
+    p.add_argument("--week")
+    p.add_argument("--character")
+
+    p = add("bosses", cmd_bosses, "보스별 수익 기여도 (Parquet 집계)")
+    p.add_argument("--week")
+    p.add_argument("--all", action="store_true", help="전체 누적 기간")
+
+    add("history", cmd_history, "보스 시세 변경 이력").add_argument("boss", nargs="?")
+
+    for name, checked in (("check", True), ("uncheck", False)):
+        p = add(name, cmd_check, f"보스 {'체크' if checked else '체크 해제'}")
+        p.add_argument("character")
+        p.add_argument("boss")
+        p.add_argument("--week")
+        p.set_defaults(checked=checked)
+
+    p = add("export", cmd_export, "weekly_checks 원본 행 내보내기")
+    p.add_argument("--week")
+
+    add("accounts", cmd_accounts, "계정별 캐릭터·주차·누적 수익")
+
+    p = add("archive", cmd_archive, "오래된 주차를 Parquet 파일로 보관 (SQLite에서 이동)")
+    p.add_argument("--keep", type=int, default=ARCHIVE_KEEP_WEEKS or 12,
+                   help="SQLite에 남길 최근 주차 수 (현재 주차 포함)")
+    p.add_argument("--dry-run", action="store_true", help="보관할 주차만 보여주고 옮기지 않음")
+
+    p = add("restore", cmd_restore, "보관 주차를 SQLite로 되돌림")
+    p.add_argument("weeks", nargs="+", metavar="WEEK")
+
+    p = add("sync", cmd_sync, "다른 DB 파일과 변경분 양방향 동기화")
+    p.add_argument("other", nargs="?", help="상대 DB 경로 (노트북 DB 등)")
+    p.add_argument("--dry-run", action="store_true", help="주고받을 변경만 세고 저장하지 않음")
+    p.add_argument("--new-id", action="store_true",
+                   help="이 DB에 새 복제본 id 부여 (파일을 복사해 만든 DB일 때)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.account:
+        from data_layer.accounts import AccountRegistry
+        try:
+            args.db = AccountRegistry().get(args.account).db_path
+        except ValueError as e:
+            print(e, file=sys.stderr)
+            return 1
+    if not os.path.exists(args.db):
+        print(f"DB 없음: {args.db}", file=sys.stderr)
+        return 1
+    set_db_path(args.db)
+    init_db()     # 앱보다 오래된 DB면 새 테이블 생성 (이미 있으면 아무것도 안 함)
+    try:
+        if args.format == "parquet" and args.command != "export":
+            raise CliError("parquet 형식은 export 명령에서만 쓸 수 있습니다")
+        # 데이터 계층의 진행 로그([Archive] 등)가 json/csv 출력에 섞이지 않도록
+        with contextlib.redirect_stdout(sys.stderr):
+            rows = args.func(DataManager(), args)
+    except CliError as e:
+        print(e, file=sys.stderr)
+        return 1
+    if rows is not None:
+        emit(rows, args.format, args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
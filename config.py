@@ -8,12 +8,70 @@ import os
 SAVE_FILE = "boss_data.json"       # 레거시 (마이그레이션 후 미사용)
 DB_FILE = "boss_data.db"           # SQLite DB
 PARQUET_FILE = "stats_snapshot.parquet"  # Polars 통계용 스냅샷
+HISTORY_PARQUET_FILE = "history_snapshot.parquet"  # 레벨·전투력 이력 스냅샷
+WARM_START_FILE = "warm_start.json"  # 첫 화면용 상태 (DB 조회 없이 바로 그림)
+USE_WARM_START = True
+WARM_START_SAVE_DELAY_MS = 5000      # 마지막 변경 후 이만큼 조용하면 상태 파일 갱신
+ACCOUNTS_DIR = "accounts"            # 추가 계정의 파일 위치 (accounts/<이름>/boss_data.db, 스냅샷, 웜 스타트)
+DEFAULT_ACCOUNT = "기본"             # 위의 파일들(boss_data.db 등)을 그대로 쓰는 계정
+ACCOUNT = os.environ.get("BOSS_TRACKER_ACCOUNT") or None   # 시작 계정 (없으면 마지막으로 쓴 계정)
+ARCHIVE_DIR = "archive"              # 오래된 주차의 Parquet 파티션 (DB 파일 옆 폴더)
+# 앱 시작 시 자동 보관: SQLite에 남길 최근 주차 수 (현재 주차 포함). 기본 0 = 끔 —
+# 보관하면 DB 파일만으로는 전체 데이터가 아니므로 (data_layer/archive.py) 켜는 것은 사용자가
+ARCHIVE_KEEP_WEEKS = int(os.environ.get("BOSS_TRACKER_ARCHIVE_KEEP_WEEKS", 0))
+ARCHIVE_DELAY_MS = 10_000            # 앱 시작 후 이만큼 지나서 보관 대상 확인 (백그라운드)
 IMAGE_DIR = "character_images"
+THUMBNAIL_DIR = os.path.join(IMAGE_DIR, "thumbs")  # 크롭·스케일된 아이콘 디스크 캐시
+IMAGE_BLOB_DIR = os.path.join(IMAGE_DIR, "blobs")  # image_url 해시 기반 원본 이미지
+IMAGE_REVALIDATE_SECONDS = 24 * 3600               # 같은 URL 이미지 조건부 재검증 주기
+IMAGE_ATLAS_FILE = os.path.join(IMAGE_DIR, "atlas.bin")  # 썸네일 묶음 파일 (mmap)
+USE_IMAGE_ATLAS = True
+ATLAS_FLUSH_INTERVAL_MS = 2000                     # 새 썸네일을 atlas에 모아 쓰는 주기
 os.makedirs(IMAGE_DIR, exist_ok=True)
+os.makedirs(IMAGE_BLOB_DIR, exist_ok=True)
+os.makedirs(THUMBNAIL_DIR, exist_ok=True)
 
 # --- Nexon API ---
-API_KEY = "add_your_api_key"
-NEXON_API_BASE = "https://open.api.nexon.com/maplestory/v1"
+# 환경 변수로 덮어쓸 수 있음 (로컬 스텁 서버: tools/fake_nexon_server.py)
+API_KEY = os.environ.get("NEXON_API_KEY", "add_your_api_key")
+NEXON_API_BASE = os.environ.get("NEXON_API_BASE", "https://open.api.nexon.com/maplestory/v1")
+NEXON_API_RATE = float(os.environ.get("NEXON_API_RATE", 5))  # 초당 호출 수 (개발 단계 키 기준, 서비스 키는 더 높음)
+NEXON_API_BURST = 1         # 순간 최대 호출 수 (1초 창 안에 burst + rate까지 나갈 수 있음)
+NEXON_API_MAX_RETRIES = 3   # 429 / 5xx / 연결 오류 재시도 횟수
+NEXON_API_TIMEOUT = 5       # 요청 1회 타임아웃(초)
+NEXON_API_POOL_SIZE = 8     # keep-alive 커넥션 풀 크기
+NEXON_API_PARALLELISM = 4   # 일괄 새로고침 동시 작업 수 (캐릭터 단위)
+
+# --- API 응답 캐시 ---
+API_CACHE_FILE = "api_cache.db"    # 지워도 되는 캐시 전용 DB
+USE_API_CACHE = True
+API_CACHE_TTL = {                  # 엔드포인트별 유효 기간(초), None이면 만료 없음
+    "id": None,                    # OCID는 바뀌지 않음
+    "character/basic": 6 * 3600,
+    "character/stat": 1 * 3600,
+}
+
+# --- 진단 ---
+SQL_TRACE = os.environ.get("BOSS_TRACKER_SQL_TRACE") == "1"   # 시작부터 쿼리 추적 (실행 중에도 켜고 끌 수 있음)
+SQL_SLOW_MS = 50                   # 이보다 오래 걸린 DataManager 호출은 느린 호출 로그에 기록
+SQL_TRACE_FILE = "sql_trace.json"  # 추적을 끌 때 보고서 저장 위치
+EVENT_MONITOR = os.environ.get("BOSS_TRACKER_EVENT_MONITOR") == "1"   # 시작부터 이벤트 루프 감시
+EVENT_HEARTBEAT_MS = 50            # GUI 스레드 박동 간격
+EVENT_STALL_MS = 100               # 박동이 이만큼 늦으면 멈춤으로 보고 스택 샘플링
+EVENT_SAMPLE_MS = 10               # 멈춤 중 스택 샘플링 간격 (감시 스레드)
+EVENT_MONITOR_FILE = "event_stalls.json"   # 멈춤 보고서 저장 위치
+
+# --- 트래커 서버 (여러 PC가 DB 하나를 공유) ---
+# 설정하면 GUI가 로컬 DB 대신 서버에 붙는다. ex) http://127.0.0.1:8765 (서버: python -m daemon)
+TRACKER_SERVER = os.environ.get("BOSS_TRACKER_SERVER") or None
+DAEMON_HOST = "127.0.0.1"          # 다른 PC에서 붙으려면 --host 0.0.0.0
+DAEMON_PORT = 8765
+DAEMON_BATCH_MS = 5                # 첫 쓰기 후 이만큼 더 모아서 한 트랜잭션으로 커밋
+DAEMON_BATCH_MAX = 64              # 한 번에 커밋할 최대 쓰기 수
+DAEMON_EVENT_BACKLOG = 1000        # 서버가 기억하는 변경 알림 수 (더 밀린 클라이언트는 전체 새로고침)
+LONG_POLL_TIMEOUT = 25             # 변경 알림 대기 최대 시간(초)
+REMOTE_TIMEOUT = 10                # 서버 요청 1회 타임아웃(초, 대기 요청 제외)
+REMOTE_CACHE_DIR = "remote_cache"  # 서버 Parquet 스냅샷을 받아 두는 위치
 
 # --- 기본 보스 목록 ---
 DEFAULT_BOSSES = [
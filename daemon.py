@@ -0,0 +1,416 @@
+"""
+트래커 서버 — SQLite DB 하나를 여러 PC의 GUI·스크립트가 공유하도록 HTTP/JSON으로 노출.
+
+DB는 이 프로세스만 연다. 클라이언트(data_layer.remote.RemoteDataManager)는
+DataManager와 같은 메서드를 호출하고, 서버는:
+- 읽기는 요청 스레드에서 바로 실행 (WAL이라 쓰기와 동시에 읽힘)
+- 쓰기는 큐에 모아 짧은 창(DAEMON_BATCH_MS) 안에 들어온 것을 한 트랜잭션으로 커밋 (그룹 커밋).
+  쓰기마다 SAVEPOINT를 걸어 하나가 실패해도 나머지는 커밋된다. 호출은 커밋 후에 응답한다.
+- 커밋된 쓰기마다 변경 알림을 남기고, /api/events를 기다리는 클라이언트를 깨운다 (long poll)
+- 통계 집계는 ParquetStore로 계산하거나 스냅샷 파일을 그대로 내려준다 (변경이 있을 때만 새로 스냅샷)
+
+프로토콜은 data_layer/remote.py 참고. GUI를 붙이려면:
+    BOSS_TRACKER_SERVER=http://127.0.0.1:8765 python main.py
+
+실행:
+    python -m daemon                                   # 127.0.0.1:8765, ./boss_data.db
+    python -m daemon --db /srv/boss/boss_data.db --host 0.0.0.0 --port 8765
+    python -m daemon --batch-ms 20 --batch-max 256
+"""
+
+import argparse
+import json
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+import urllib.parse
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import (
+    DB_FILE, PARQUET_FILE, HISTORY_PARQUET_FILE,
+    DAEMON_HOST, DAEMON_PORT, DAEMON_BATCH_MS, DAEMON_BATCH_MAX, DAEMON_EVENT_BACKLOG,
+    LONG_POLL_TIMEOUT,
+)
+from data_layer import DataManager
+from data_layer.database import set_db_path, init_db, shared_transaction
+from data_layer.remote import READ_METHODS, WRITE_METHODS, STATS_METHODS
+from data_layer.sync import compact_change_log
+
+# long poll 한 번에 허용하는 최대 대기 (클라이언트가 더 길게 달라고 해도)
+_MAX_POLL_S = 60
+
+
+def _jsonable(value):
+    """sqlite3.Row 등 JSON으로 못 보내는 결과를 dict/list로."""
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if hasattr(value, "keys"):
+        return {k: value[k] for k in value.keys()}
+    return value
+
+
+# ---------------------------------------------------------------------------
+# 변경 알림
+# ---------------------------------------------------------------------------
+
+class EventLog:
+    """커밋된 쓰기의 순번 붙은 기록. 최근 backlog개만 기억한다."""
+
+    def __init__(self, backlog: int = DAEMON_EVENT_BACKLOG):
+        self._events: deque[dict] = deque(maxlen=backlog)
+        self._seq = 0
+        self._cond = threading.Condition()
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def publish(self, events: list[dict]) -> None:
+        if not events:
+            return
+        with self._cond:
+            for event in events:
+                self._seq += 1
+                self._events.append({"seq": self._seq, **event})
+            self._cond.notify_all()
+
+    def wait(self, since: int, timeout: float) -> dict:
+        """
+        since 이후의 알림. 없으면 timeout초까지 기다린다.
+
+        Returns:
+            {"seq": 42, "reset": False, "events": [...]}
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._seq <= since:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            oldest = self._events[0]["seq"] if self._events else self._seq + 1
+            # since가 서버 순번보다 크면 서버가 다시 시작된 것
+            reset = since > self._seq or (since < oldest - 1 and self._seq > since)
+            events = [e for e in self._events if e["seq"] > since] if not reset else []
+            return {"seq": self._seq, "reset": reset, "events": events}
+
+
+# ---------------------------------------------------------------------------
+# 묶음 쓰기
+# ---------------------------------------------------------------------------
+
+class _Write:
+    __slots__ = ("method", "args", "kwargs", "client", "done", "result", "error")
+
+    def __init__(self, method: str, args: list, kwargs: dict, client: str | None):
+        self.method, self.args, self.kwargs, self.client = method, args, kwargs, client
+        self.done = threading.Event()
+        self.result = None
+        self.error: Exception | None = None
+
+
+class WriteBatcher:
+    """
+    쓰기 호출을 전용 스레드에서 모아 한 트랜잭션으로 커밋.
+
+    첫 쓰기가 들어오면 max_delay_ms 동안(또는 max_batch개까지) 더 모은 뒤
+    shared_transaction 하나로 실행한다. 작업마다 SAVEPOINT를 걸어 실패한 작업만 되돌린다.
+    """
+
+    def __init__(self, dm: DataManager, events: EventLog, on_commit=None,
+                 max_delay_ms: float = DAEMON_BATCH_MS, max_batch: int = DAEMON_BATCH_MAX):
+        self._dm = dm
+        self._events = events
+        self._on_commit = on_commit
+        self._max_delay = max_delay_ms / 1000
+        self._max_batch = max_batch
+        self._queue: queue.Queue[_Write | None] = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="write-batcher", daemon=True)
+        self.stats = {"batches": 0, "writes": 0, "failed": 0, "max_batch": 0, "commit_ms": 0.0}
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def submit(self, method: str, args: list, kwargs: dict, client: str | None = None):
+        """커밋될 때까지 기다렸다가 결과 반환 (실패한 작업이면 그 예외를 다시 던짐)."""
+        write = _Write(method, args, kwargs, client)
+        self._queue.put(write)
+        write.done.wait()
+        if write.error is not None:
+            raise write.error
+        return write.result
+
+    def _loop(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self._max_delay
+            stop = False
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._commit(batch)
+            if stop:
+                return
+
+    def _commit(self, batch: list[_Write]) -> None:
+        started = time.perf_counter()
+        try:
+            with shared_transaction() as conn:
+                for write in batch:
+                    conn.execute("SAVEPOINT write")
+                    try:
+                        write.result = getattr(self._dm, write.method)(*write.args, **write.kwargs)
+                    except Exception as e:
+                        conn.execute("ROLLBACK TO write")
+                        write.error = e
+                    conn.execute("RELEASE write")
+        except Exception as e:
+            # 커밋 자체가 실패 (디스크 오류 등) → 묶음 전체 실패
+            for write in batch:
+                write.error = write.error or e
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        ok = [w for w in batch if w.error is None]
+        self.stats["batches"] += 1
+        self.stats["writes"] += len(batch)
+        self.stats["failed"] += len(batch) - len(ok)
+        self.stats["max_batch"] = max(self.stats["max_batch"], len(batch))
+        self.stats["commit_ms"] += elapsed_ms
+
+        now = time.time()
+        self._events.publish([{"method": w.method, "args": _jsonable(w.args), "client": w.client,
+                               "ts": now} for w in ok])
+        if ok and self._on_commit:
+            self._on_commit()
+        for write in batch:
+            write.done.set()
+
+
+# ---------------------------------------------------------------------------
+# 서버
+# ---------------------------------------------------------------------------
+
+class _HTTPServer(ThreadingHTTPServer):
+    # 기본 listen 대기열(5)은 GUI·스크립트 여러 개가 한꺼번에 붙으면 넘쳐 SYN 재전송(1초)을 기다린다
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class TrackerServer:
+    """
+    스레드에서 도는 트래커 서버 (tools/fake_nexon_server.FakeNexonServer와 같은 모양).
+
+    db_path의 디렉터리에 Parquet 스냅샷을 둔다. port=0이면 빈 포트.
+    """
+
+    def __init__(self, db_path: str = DB_FILE, host: str = DAEMON_HOST, port: int = DAEMON_PORT,
+                 batch_ms: float = DAEMON_BATCH_MS, batch_max: int = DAEMON_BATCH_MAX):
+        set_db_path(db_path)
+        init_db()
+        self.db_path = db_path
+        self._dm = DataManager()
+        self._dm.ensure_current_week()
+        with shared_transaction() as conn:
+            removed = compact_change_log(conn)    # 서버 DB는 동기화를 안 하면 정리될 기회가 없으므로 시작할 때
+        if removed:
+            print(f"[Sync] change_log 정리: {removed}건 삭제")
+        self.events = EventLog()
+        self.batcher = WriteBatcher(self._dm, self.events, on_commit=self._mark_dirty,
+                                    max_delay_ms=batch_ms, max_batch=batch_max)
+
+        from data_layer.parquet_store import ParquetStore
+        base = os.path.dirname(os.path.abspath(db_path))
+        self._store = ParquetStore(path=os.path.join(base, PARQUET_FILE),
+                                   history_path=os.path.join(base, HISTORY_PARQUET_FILE))
+        self._snapshot_lock = threading.Lock()
+        self._snapshot_dirty = True
+        self._started = time.time()
+        self._requests = 0
+        self._requests_lock = threading.Lock()     # 요청 스레드마다 += 하므로
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"     # keep-alive (Content-Length 항상 보냄)
+            disable_nagle_algorithm = True    # 헤더·본문 두 번 쓰기 + delayed ACK로 40ms씩 늦어지지 않게
+
+            def do_GET(self):
+                self._dispatch("GET", None)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self._dispatch("POST", self.rfile.read(length))
+
+            def _dispatch(self, method, body):
+                status, payload, content_type = server.handle(
+                    method, self.path, body, self.headers.get("X-Client-Id"))
+                if not isinstance(payload, bytes):
+                    payload = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = _HTTPServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "TrackerServer":
+        self.batcher.start()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="tracker-http", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self.batcher.stop()
+
+    # ------------------------------------------------------------------
+    # 요청 처리
+    # ------------------------------------------------------------------
+
+    def handle(self, method: str, raw_path: str, body: bytes | None,
+               client: str | None) -> tuple[int, dict | bytes, str]:
+        """
+        Returns:
+            (status, JSON으로 보낼 dict 또는 bytes, content-type)
+        """
+        with self._requests_lock:
+            self._requests += 1
+        parsed = urllib.parse.urlsplit(raw_path)
+        path = parsed.path.rstrip("/")
+        query = {k: v[-1] for k, v in urllib.parse.parse_qs(parsed.query).items()}
+        try:
+            if method == "POST" and path == "/api/call":
+                return self._call(json.loads(body or b"{}"), client)
+            if method == "GET" and path == "/api/health":
+                return 200, self.health(), "application/json"
+            if method == "GET" and path == "/api/events":
+                timeout = min(float(query.get("timeout", LONG_POLL_TIMEOUT)), _MAX_POLL_S)
+                return 200, self.events.wait(int(query.get("since", 0)), timeout), "application/json"
+            if method == "GET" and path.startswith("/api/stats/"):
+                return self._stats(path.removeprefix("/api/stats/"), query)
+            if method == "GET" and path.startswith("/api/snapshot/"):
+                return self._snapshot_file(path.removeprefix("/api/snapshot/"))
+        except (ValueError, TypeError, KeyError) as e:
+            return 400, {"error": f"잘못된 요청: {e}"}, "application/json"
+        except Exception as e:
+            print(f"[Daemon] {method} {path} 실패: {e!r}")
+            return 500, {"error": f"{type(e).__name__}: {e}"}, "application/json"
+        return 404, {"error": f"없는 경로: {method} {path}"}, "application/json"
+
+    def _call(self, request: dict, client: str | None) -> tuple[int, dict, str]:
+        name = request["method"]
+        args, kwargs = list(request.get("args", [])), dict(request.get("kwargs", {}))
+        if name in READ_METHODS:
+            result = getattr(self._dm, name)(*args, **kwargs)
+        elif name in WRITE_METHODS:
+            result = self.batcher.submit(name, args, kwargs, client)
+        else:
+            return 404, {"error": f"지원하지 않는 메서드: {name}"}, "application/json"
+        return 200, {"result": _jsonable(result)}, "application/json"
+
+    def _stats(self, name: str, query: dict) -> tuple[int, dict, str]:
+        if name not in STATS_METHODS:
+            return 404, {"error": f"지원하지 않는 집계: {name}"}, "application/json"
+        self._ensure_snapshot()
+        return 200, {"result": getattr(self._store, name)(**query)}, "application/json"
+
+    def _snapshot_file(self, name: str) -> tuple[int, dict | bytes, str]:
+        paths = {"checks": self._store.path, "history": self._store.history_path}
+        if name not in paths:
+            return 404, {"error": f"없는 스냅샷: {name}"}, "application/json"
+        self._ensure_snapshot()
+        try:
+            with open(paths[name], "rb") as f:
+                return 200, f.read(), "application/vnd.apache.parquet"
+        except FileNotFoundError:
+            return 404, {"error": "스냅샷 없음 (DB가 비어 있음)"}, "application/json"
+
+    def _mark_dirty(self) -> None:
+        self._snapshot_dirty = True
+
+    def _ensure_snapshot(self) -> None:
+        """쓰기가 커밋된 뒤 처음 요청될 때만 Parquet 스냅샷 (동시 요청은 한 번만 만듦)."""
+        with self._snapshot_lock:
+            if not self._snapshot_dirty:
+                return
+            self._snapshot_dirty = False
+            if os.path.exists(self._store.path):
+                os.remove(self._store.path)     # 빈 DB가 되면 예전 스냅샷이 남지 않게
+            self._store.snapshot()
+
+    def health(self) -> dict:
+        stats = dict(self.batcher.stats)
+        batches = stats["batches"] or 1
+        return {
+            "db": os.path.abspath(self.db_path),
+            "uptime_s": round(time.time() - self._started, 1),
+            "requests": self._requests,
+            "event_seq": self.events.seq,
+            "batches": stats["batches"],
+            "writes": stats["writes"],
+            "failed_writes": stats["failed"],
+            "max_batch": stats["max_batch"],
+            "avg_batch": round(stats["writes"] / batches, 2),
+            "avg_commit_ms": round(stats["commit_ms"] / batches, 3),
+        }
+
+
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m daemon", description="보스 트래커 공유 서버 (HTTP/JSON)")
+    parser.add_argument("--db", default=os.environ.get("BOSS_TRACKER_DB", DB_FILE), help="SQLite DB 경로")
+    parser.add_argument("--host", default=DAEMON_HOST)
+    parser.add_argument("--port", type=int, default=DAEMON_PORT)
+    parser.add_argument("--batch-ms", type=float, default=DAEMON_BATCH_MS, help="쓰기를 모으는 시간(ms)")
+    parser.add_argument("--batch-max", type=int, default=DAEMON_BATCH_MAX, help="한 번에 커밋할 최대 쓰기 수")
+    args = parser.parse_args()
+
+    server = TrackerServer(args.db, args.host, args.port, args.batch_ms, args.batch_max).start()
+    print(f"[Daemon] {server.base_url} ← {os.path.abspath(args.db)} "
+          f"(묶음 {args.batch_ms}ms / 최대 {args.batch_max}개)")
+
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    stop.wait()
+    server.stop()
+    health = server.health()
+    print(f"[Daemon] 종료 — 요청 {health['requests']}, 쓰기 {health['writes']} "
+          f"(커밋 {health['batches']}회, 평균 {health['avg_batch']}개)")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
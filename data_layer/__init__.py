@@ -1,2 +1,13 @@
-from data_layer.data_manager import DataManager, current_week_key
-from data_layer.parquet_store import ParquetStore
\ No newline at end of file
+from data_layer.data_manager import DataManager, current_week_key, week_bounds
+
+
+def __getattr__(name: str):
+    # ParquetStore는 polars를 끌어오므로 처음 쓰일 때 import (앱 시작 시간 단축)
+    if name == "ParquetStore":
+        from data_layer.parquet_store import ParquetStore
+        return ParquetStore
+    # ImageStore는 requests를 끌어오므로 CLI처럼 이미지가 필요 없는 곳에서는 import하지 않음
+    if name == "ImageStore":
+        from data_layer.image_store import ImageStore
+        return ImageStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
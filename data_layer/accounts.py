@@ -0,0 +1,162 @@
+"""
+계정(메이플 계정)별 DB 분리.
+
+계정마다 SQLite DB, Parquet 스냅샷, 웜 스타트 파일을 따로 둔다.
+- 기본 계정: 원래 파일 그대로 (boss_data.db, stats_snapshot.parquet, ...)
+- 추가 계정: ACCOUNTS_DIR/<이름>/ 아래 같은 이름의 파일들
+
+한 번에 열려 있는 DB는 활성 계정 하나뿐이고 (set_db_path), 계정 전체 합산 통계는
+계정별 Parquet 스냅샷을 함께 스캔한다 (data_layer.federated_store).
+캐릭터 이미지 blob·썸네일 atlas는 계정 사이에 공유한다.
+
+사용 흐름:
+    registry = AccountRegistry()
+    account = registry.activate(registry.last_used())   # 이후 get_connection()은 이 계정 DB
+    registry.create("부캐 계정", template=account)       # 보스 목록·시세 이력 복사
+"""
+
+import os
+from dataclasses import dataclass
+
+from config import (
+    ACCOUNTS_DIR, DEFAULT_ACCOUNT, DB_FILE, PARQUET_FILE, HISTORY_PARQUET_FILE, WARM_START_FILE,
+)
+from data_layer.database import connect, get_db_path, init_db, set_db_path
+
+_LAST_USED_FILE = "last_account"     # ACCOUNTS_DIR 안, 마지막으로 쓴 계정 이름
+_NAME_MAX = 20
+_FORBIDDEN = set('\\/:*?"<>|')       # 폴더 이름으로 못 쓰는 문자 (Windows 기준)
+
+
+@dataclass(frozen=True)
+class Account:
+    name: str
+    db_path: str
+    parquet_path: str
+    history_path: str
+    warm_start_path: str
+
+
+class AccountRegistry:
+    """계정 목록·생성·전환. 기본 계정 + ACCOUNTS_DIR 아래 DB가 있는 폴더마다 계정 하나."""
+
+    def __init__(self, root: str = ACCOUNTS_DIR):
+        self.root = root
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def names(self) -> list[str]:
+        """기본 계정이 맨 앞, 나머지는 이름 순."""
+        try:
+            entries = sorted(os.listdir(self.root))
+        except FileNotFoundError:
+            entries = []
+        return [DEFAULT_ACCOUNT] + [
+            n for n in entries if os.path.isfile(os.path.join(self.root, n, DB_FILE))
+        ]
+
+    def all(self) -> list[Account]:
+        return [self._account(n) for n in self.names()]
+
+    def get(self, name: str) -> Account:
+        if name not in self.names():
+            raise ValueError(f"계정 없음: {name}")
+        return self._account(name)
+
+    def other_db_paths(self) -> list[str]:
+        """활성 계정이 아닌 계정들의 DB 경로 (공유 이미지 blob 참조 확인용)."""
+        current = os.path.abspath(get_db_path())
+        return [a.db_path for a in self.all() if os.path.abspath(a.db_path) != current]
+
+    def other_character_names(self) -> set[str]:
+        """다른 계정들의 캐릭터 이름 (공유 썸네일 atlas 정리 시 남길 항목)."""
+        names = set()
+        for path in self.other_db_paths():
+            if not os.path.exists(path):
+                continue
+            conn = connect(path)
+            try:
+                names.update(r[0] for r in conn.execute("SELECT name FROM characters"))
+            finally:
+                conn.close()
+        return names
+
+    def _account(self, name: str) -> Account:
+        if name == DEFAULT_ACCOUNT:
+            return Account(name, DB_FILE, PARQUET_FILE, HISTORY_PARQUET_FILE, WARM_START_FILE)
+        base = os.path.join(self.root, name)
+        return Account(name, os.path.join(base, DB_FILE), os.path.join(base, PARQUET_FILE),
+                       os.path.join(base, HISTORY_PARQUET_FILE), os.path.join(base, WARM_START_FILE))
+
+    # ------------------------------------------------------------------
+    # 생성 / 전환
+    # ------------------------------------------------------------------
+
+    def validate_name(self, name: str) -> str:
+        """폴더 이름으로 쓸 수 있는 새 계정 이름인지 확인. 안 되면 ValueError."""
+        name = name.strip()
+        if not name:
+            raise ValueError("계정 이름을 입력하세요.")
+        if len(name) > _NAME_MAX:
+            raise ValueError(f"계정 이름은 {_NAME_MAX}자 이하여야 합니다.")
+        if name.startswith(".") or any(ch in _FORBIDDEN or ord(ch) < 32 for ch in name):
+            raise ValueError("계정 이름에 . 로 시작하거나 \\ / : * ? \" < > | 문자를 쓸 수 없습니다.")
+        if name.casefold() in {n.casefold() for n in self.names()}:
+            raise ValueError(f"이미 있는 계정입니다: {name}")
+        return name
+
+    def create(self, name: str, template: Account | None = None) -> Account:
+        """
+        새 계정 DB 생성. template이 있으면 그 계정의 보스 목록·시세 이력을 복사
+        (캐릭터·주차 체크는 비어 있음). 활성 계정은 바꾸지 않는다.
+        """
+        account = self._account(self.validate_name(name))
+        os.makedirs(os.path.dirname(account.db_path), exist_ok=True)
+        init_db(account.db_path)
+        if template is not None:
+            conn = connect(account.db_path)
+            try:
+                conn.execute("ATTACH DATABASE ? AS src", (template.db_path,))
+                with conn:
+                    conn.execute("INSERT OR IGNORE INTO boss_list (name, value) "
+                                 "SELECT name, value FROM src.boss_list")
+                    conn.execute("""INSERT INTO boss_price_history (boss_name, value, applied_from, note)
+                                    SELECT boss_name, value, applied_from, note
+                                    FROM src.boss_price_history ORDER BY id""")
+                conn.execute("DETACH DATABASE src")
+            finally:
+                conn.close()
+        print(f"[Account] 계정 생성: {account.name} ({account.db_path})")
+        return account
+
+    def activate(self, name: str) -> Account:
+        """
+        이후 get_connection()이 이 계정 DB를 열게 한다. 스키마 확인(init_db)은 호출하는 쪽에서
+        (웜 스타트는 첫 화면 이후 백그라운드로 미루므로).
+        """
+        account = self.get(name)
+        set_db_path(account.db_path)
+        self._remember(account.name)
+        return account
+
+    def last_used(self) -> str:
+        """마지막으로 쓴 계정 (없거나 지워졌으면 기본 계정)."""
+        try:
+            with open(os.path.join(self.root, _LAST_USED_FILE), encoding="utf-8") as f:
+                name = f.read().strip()
+        except OSError:
+            return DEFAULT_ACCOUNT
+        return name if name in self.names() else DEFAULT_ACCOUNT
+
+    def _remember(self, name: str) -> None:
+        path = os.path.join(self.root, _LAST_USED_FILE)
+        if name == DEFAULT_ACCOUNT and not os.path.exists(path):
+            return      # 계정을 하나도 안 만들었으면 폴더도 만들지 않음
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(name)
+        except OSError as e:
+            print(f"[Account] 마지막 계정 저장 실패: {e}")
@@ -0,0 +1,246 @@
+"""
+오래된 주차 보관 (cold storage).
+
+weekly_checks는 계속 늘지만 쓰기는 현재 주차와 최근 몇 주에만 일어난다.
+최근 ARCHIVE_KEEP_WEEKS주보다 오래된 주차는 주차마다 zstd 압축 Parquet 파일 하나로 옮기고
+SQLite에서 지운다. 파일은 한 번 쓰면 바꾸지 않는다.
+
+- archived_weeks 테이블: 보관 주차 → 파일 이름, 행 수, 체크 합계, 캐릭터·보스 목록
+  (주차 목록·주차별 합계·캐릭터 삭제 대상 찾기는 polars 없이 SQL로)
+- DataManager는 SQLite에 없는 주차를 여기서 읽고, 보관 주차에 쓰려고 하면 먼저 복원한다
+- ParquetStore 스냅샷은 SQLite 행과 보관 파티션을 함께 스캔한다
+- 보관·복원이 남기는 change_log 기록은 지운다 — 동기화 상대에게는 삭제·재삽입이 아니다
+  (상대 변경이 보관 주차에 오면 sync.apply_changes가 먼저 복원)
+
+복원으로 색인에서 빠진 파일은 다음 보관 때 정리한다 (트랜잭션이 롤백될 수 있으므로 바로 지우지 않음).
+
+주의: 보관한 뒤에는 DB 파일만으로는 전체 데이터가 아니다. 보관 주차의 행은 DB 옆
+archive/<DB 이름>/ 폴더에만 있으므로 DB를 복사·백업·커밋할 때는 이 폴더도 함께 옮긴다
+(다른 PC로 옮기는 것은 python -m cli sync가 안전 — 보관 주차도 행으로 전해진다).
+그래서 앱의 자동 보관은 기본으로 꺼져 있다 (ARCHIVE_KEEP_WEEKS = 0, 환경 변수로 켬).
+진행 출력은 하지 않는다 — 결과는 반환값으로 (앱은 ui/archive_worker가 요약을 출력).
+
+사용 흐름:
+    archive = WeekArchive(keep_weeks=12) # 현재 DB 옆 archive/boss_data/
+    archive.archive()                    # 최근 12주보다 오래된 주차 이동
+    archive.restore("2025-10")           # 다시 SQLite로
+"""
+
+import os
+import sqlite3
+import time
+from datetime import timedelta
+
+from config import ARCHIVE_DIR, ARCHIVE_KEEP_WEEKS
+from data_layer.data_manager import current_week_key, week_bounds
+from data_layer.database import connect, get_db_path
+
+_COLUMNS = ("week_key", "character", "boss_name", "boss_value", "checked")
+
+
+class ArchiveError(Exception):
+    """보관 파일을 쓰거나 읽을 수 없음 (다시 읽은 내용이 다름, 파일 없음 등)."""
+
+
+def _schema():
+    import polars as pl
+    # checked도 정수 그대로 (SQLite 값과 왕복이 같도록), 통계용 Boolean 변환은 scan()에서
+    return {"week_key": pl.Utf8, "character": pl.Utf8, "boss_name": pl.Utf8,
+            "boss_value": pl.Int64, "checked": pl.Int64}
+
+
+def _week_start(week_key: str):
+    try:
+        return week_bounds(week_key)[0]
+    except ValueError:
+        return None      # 형식이 다른 주차 키는 보관하지 않음
+
+
+# ---------------------------------------------------------------------------
+# 색인 (SQL만, polars 없음)
+# ---------------------------------------------------------------------------
+
+def is_archived(conn: sqlite3.Connection, week_key: str) -> bool:
+    return conn.execute("SELECT 1 FROM archived_weeks WHERE week_key = ?", (week_key,)).fetchone() is not None
+
+
+def archived_week_keys(conn: sqlite3.Connection) -> list[str]:
+    return [r[0] for r in conn.execute("SELECT week_key FROM archived_weeks ORDER BY week_key")]
+
+
+def archived_weeks_with(conn: sqlite3.Connection, column: str, value: str) -> list[str]:
+    """column("characters" / "bosses")에 value가 있는 보관 주차."""
+    return [r[0] for r in conn.execute(
+        f"SELECT a.week_key FROM archived_weeks a, json_each(a.{column}) j WHERE j.value = ?", (value,))]
+
+
+class WeekArchive:
+    """DB 하나의 보관 파티션 (DB 파일 옆 ARCHIVE_DIR/<DB 파일 이름>)."""
+
+    def __init__(self, db_path: str | None = None, keep_weeks: int = ARCHIVE_KEEP_WEEKS):
+        self.db_path = db_path or get_db_path()
+        # 같은 폴더의 다른 DB(동기화 상대 사본 등)와 파일이 섞이지 않도록 DB마다 하위 폴더
+        base, name = os.path.split(os.path.abspath(self.db_path))
+        self.dir = os.path.join(base, ARCHIVE_DIR, os.path.splitext(name)[0])
+        self.keep_weeks = keep_weeks
+
+    def _path(self, file: str) -> str:
+        return os.path.join(self.dir, file)
+
+    def due(self, conn: sqlite3.Connection) -> list[str]:
+        """SQLite에 있는 주차 중 최근 keep_weeks주(현재 주차 포함)보다 오래된 주차 (오래된 순)."""
+        if self.keep_weeks <= 0:
+            return []
+        cutoff = week_bounds(current_week_key())[0] - timedelta(weeks=self.keep_weeks - 1)
+        starts = {w: _week_start(w) for (w,) in conn.execute("SELECT DISTINCT week_key FROM weekly_checks")}
+        return sorted((w for w, start in starts.items() if start is not None and start < cutoff),
+                      key=starts.get)
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+
+    def read_week(self, conn: sqlite3.Connection, week_key: str) -> list[dict] | None:
+        """보관 주차의 행 (weekly_checks와 같은 컬럼). 보관 주차가 아니면 None."""
+        entry = conn.execute("SELECT file, rows FROM archived_weeks WHERE week_key = ?",
+                             (week_key,)).fetchone()
+        if entry is None:
+            return None
+        import polars as pl
+        try:
+            df = pl.read_parquet(self._path(entry["file"]))
+        except (OSError, pl.exceptions.PolarsError) as e:
+            raise ArchiveError(f"보관 파일을 읽을 수 없음: {entry['file']} ({e})") from None
+        if df.height != entry["rows"]:
+            raise ArchiveError(f"보관 파일 행 수가 다름: {entry['file']} ({df.height} != {entry['rows']})")
+        return df.to_dicts()
+
+    def scan(self, conn: sqlite3.Connection):
+        """모든 보관 주차의 LazyFrame (checked는 Boolean, 스냅샷과 같은 스키마). 없으면 None."""
+        files = [self._path(r[0]) for r in conn.execute("SELECT file FROM archived_weeks")]
+        if not files:
+            return None
+        import polars as pl
+        return pl.scan_parquet(files).with_columns(pl.col("checked").cast(pl.Boolean))
+
+    # ------------------------------------------------------------------
+    # 보관 / 복원
+    # ------------------------------------------------------------------
+
+    def archive(self, weeks: list[str] | None = None, dry_run: bool = False) -> list[dict]:
+        """
+        weeks(기본: due())를 주차마다 한 트랜잭션으로 보관.
+        파일을 쓰고 다시 읽어 원래 행과 같은지 확인한 뒤에만 SQLite에서 지운다.
+
+        Returns:
+            [{"week_key": "2025-10", "rows": 84, "total": 3120000000, "bytes": 2301}, ...]
+        """
+        conn = connect(self.db_path)
+        conn.isolation_level = None      # BEGIN/COMMIT 직접 관리
+        try:
+            weeks = self.due(conn) if weeks is None else weeks
+            if dry_run:
+                return [{"week_key": w, **self._summary(conn, w)} for w in weeks]
+            self._prune_files(conn)
+            done = []
+            for week in weeks:
+                result = self._archive_week(conn, week)
+                if result is not None:
+                    done.append(result)
+            return done
+        finally:
+            conn.close()
+
+    def _summary(self, conn: sqlite3.Connection, week: str) -> dict:
+        row = conn.execute(
+            """SELECT COUNT(*) AS rows,
+                      COALESCE(SUM(checked = 1), 0) AS checked,
+                      COALESCE(SUM(CASE WHEN checked = 1 THEN boss_value ELSE 0 END), 0) AS total,
+                      json_group_array(DISTINCT character) AS characters,
+                      json_group_array(DISTINCT boss_name) AS bosses
+               FROM weekly_checks WHERE week_key = ?""", (week,)).fetchone()
+        return dict(row)
+
+    def _archive_week(self, conn: sqlite3.Connection, week: str) -> dict | None:
+        import polars as pl
+
+        conn.execute("BEGIN IMMEDIATE")     # 읽기부터 삭제까지 다른 쓰기가 끼지 않게
+        try:
+            rows = [tuple(r) for r in conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM weekly_checks WHERE week_key = ? "
+                "ORDER BY character, boss_name", (week,))]
+            if not rows:
+                conn.execute("ROLLBACK")
+                return None
+            summary = self._summary(conn, week)
+            file = f"weekly_checks_{week}.parquet"
+            path, tmp = self._path(file), self._path(file) + ".tmp"
+            os.makedirs(self.dir, exist_ok=True)
+            pl.DataFrame(rows, schema=_schema(), orient="row").write_parquet(tmp, compression="zstd")
+            if pl.read_parquet(tmp).rows() != rows:
+                os.remove(tmp)
+                raise ArchiveError(f"{week}: 다시 읽은 보관 파일이 원래 행과 다름 (SQLite에 그대로 둠)")
+            os.replace(tmp, path)
+
+            before = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()[0]
+            conn.execute(
+                """INSERT OR REPLACE INTO archived_weeks
+                       (week_key, file, rows, checked, total, characters, bosses, archived_at)
+                   VALUES (:week_key, :file, :rows, :checked, :total, :characters, :bosses, :archived_at)""",
+                {**summary, "week_key": week, "file": file, "archived_at": int(time.time())})
+            conn.execute("DELETE FROM weekly_checks WHERE week_key = ?", (week,))
+            conn.execute("DELETE FROM change_log WHERE seq > ?", (before,))   # 동기화할 삭제가 아님
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return {"week_key": week, "rows": summary["rows"], "total": summary["total"],
+                "bytes": os.path.getsize(path)}
+
+    def restore_weeks(self, conn: sqlite3.Connection, week_keys) -> list[str]:
+        """
+        week_keys 중 보관 주차를 SQLite로 되돌림. 트랜잭션은 호출한 쪽 (그 주차에 쓰기 직전).
+        파일은 롤백될 수 있으므로 두고, 다음 보관 때 정리한다.
+        """
+        weeks = [w for w in dict.fromkeys(week_keys) if is_archived(conn, w)]
+        if not weeks:
+            return []
+        before = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM change_log").fetchone()[0]
+        for week in weeks:
+            rows = self.read_week(conn, week)
+            conn.executemany(
+                f"INSERT OR IGNORE INTO weekly_checks ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?)",
+                [tuple(r[c] for c in _COLUMNS) for r in rows])
+            conn.execute("DELETE FROM archived_weeks WHERE week_key = ?", (week,))
+        conn.execute("DELETE FROM change_log WHERE seq > ?", (before,))   # 상대도 이미 가진 행
+        return weeks
+
+    def restore(self, week_keys) -> list[str]:
+        """보관 주차를 SQLite로 되돌리고 파일 정리 (CLI용)."""
+        conn = connect(self.db_path)
+        conn.isolation_level = None
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                weeks = self.restore_weeks(conn, week_keys)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self._prune_files(conn)
+            return weeks
+        finally:
+            conn.close()
+
+    def _prune_files(self, conn: sqlite3.Connection) -> None:
+        """색인에 없는 파티션·임시 파일 삭제. 쓰기 잠금 안에서 (다른 보관 작업이 파일을 쓰는 중일 수 있음)."""
+        if not os.path.isdir(self.dir):
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            keep = {r[0] for r in conn.execute("SELECT file FROM archived_weeks")}
+            for name in os.listdir(self.dir):
+                if name.startswith("weekly_checks_") and name not in keep:
+                    os.remove(self._path(name))
+        finally:
+            conn.execute("COMMIT")
@@ -1,12 +1,17 @@
 """
 SQLite 기반 데이터 관리.
 기존 JSON DataManager와 동일한 인터페이스를 유지합니다.
+보관된 오래된 주차(data_layer/archive.py)도 같은 메서드로 읽고, 쓰면 먼저 SQLite로 복원합니다.
 """
 # sqlite3.Row를 반환하는 함수에서 타입 힌트용
+import json
 import sqlite3
+import time
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from data_layer.database import get_connection
+from data_layer.query_trace import traced_methods
+from utils.profiling import profiled_methods
 
 
 # ---------------------------------------------------------------------------
@@ -22,12 +27,22 @@ def current_week_key() -> str:
     return f"{year}-{week}"
 
 
+def week_bounds(week_key: str) -> tuple[datetime, datetime]:
+    """주차 키 → (시작 목요일 0시, 다음 목요일 0시), 로컬 시간."""
+    year, week = (int(p) for p in week_key.split("-"))
+    thursday = date.fromisocalendar(year, week, 4)
+    start = datetime.combine(thursday, datetime.min.time())
+    return start, start + timedelta(days=7)
+
+
 # ---------------------------------------------------------------------------
 # DataManager
 # ---------------------------------------------------------------------------
 
+@traced_methods
+@profiled_methods("db")
 class DataManager:
-    """SQLite 기반 앱 데이터 관리."""
+    """SQLite 기반 앱 데이터 관리. 공개 메서드는 쿼리 추적 시 호출 시간이 기록된다."""
 
     # ------------------------------------------------------------------
     # 초기화
@@ -66,17 +81,35 @@ class DataManager:
     # ------------------------------------------------------------------
 
     def get_all_week_keys(self) -> list[str]:
+        """SQLite에 있는 주차 + 보관 주차."""
         with get_connection() as conn:
             rows = conn.execute(
-                "SELECT DISTINCT week_key FROM weekly_checks ORDER BY week_key"
+                """SELECT week_key FROM weekly_checks
+                   UNION SELECT week_key FROM archived_weeks
+                   ORDER BY week_key"""
             ).fetchall()
         return [r["week_key"] for r in rows]
 
     def get_weekly_checks(self, week_key: str) -> list[sqlite3.Row]:
+        """보관 주차면 Parquet에서 읽은 dict 목록 (row["컬럼"] 접근은 같음)."""
         with get_connection() as conn:
-            return conn.execute(
+            rows = conn.execute(
                 "SELECT * FROM weekly_checks WHERE week_key = ?", (week_key,)
             ).fetchall()
+            if not rows:
+                rows = self._archived_rows(conn, week_key) or []
+        return rows
+
+    @staticmethod
+    def _archived_rows(conn: sqlite3.Connection, week_key: str) -> list[dict] | None:
+        from data_layer.archive import WeekArchive
+        return WeekArchive().read_week(conn, week_key)
+
+    @staticmethod
+    def _restore_archived(conn: sqlite3.Connection, week_keys) -> None:
+        """보관 주차에 쓰기 전에 같은 트랜잭션에서 SQLite로 복원."""
+        from data_layer.archive import WeekArchive
+        WeekArchive().restore_weeks(conn, week_keys)
 
     def get_week_data(self, week_key: str) -> dict:
         """
@@ -98,13 +131,16 @@ class DataManager:
             char_data["bosses"].sort(key=lambda b: b["value"])
         return result
 
+    _SET_CHECKED_SQL = """UPDATE weekly_checks SET checked = ?
+                          WHERE week_key = ? AND character = ? AND boss_name = ?"""
+
     def set_boss_checked(self, week_key: str, character: str, boss_name: str, checked: bool) -> None:
+        params = (1 if checked else 0, week_key, character, boss_name)
         with get_connection() as conn:
-            conn.execute(
-                """UPDATE weekly_checks SET checked = ?
-                   WHERE week_key = ? AND character = ? AND boss_name = ?""",
-                (1 if checked else 0, week_key, character, boss_name)
-            )
+            # 보관 주차 확인은 바뀐 행이 없을 때만 (보통의 토글은 쿼리 1회)
+            if conn.execute(self._SET_CHECKED_SQL, params).rowcount == 0:
+                self._restore_archived(conn, [week_key])
+                conn.execute(self._SET_CHECKED_SQL, params)
 
     # ------------------------------------------------------------------
     # 캐릭터
@@ -122,30 +158,94 @@ class DataManager:
             ).fetchone()
         return dict(row) if row else None
 
+    _UPSERT_CHARACTER_SQL = """
+        INSERT INTO characters (name, ocid, level, job, power, image_url)
+        VALUES (:name, :ocid, :level, :job, :power, :image_url)
+        ON CONFLICT(name) DO UPDATE SET
+            ocid      = COALESCE(excluded.ocid, ocid),
+            level     = COALESCE(excluded.level, level),
+            job       = COALESCE(excluded.job, job),
+            power     = COALESCE(excluded.power, power),
+            image_url = COALESCE(excluded.image_url, image_url)"""
+
     def upsert_character(self, name: str, ocid: str = None, level: int = None,
                          job: str = None, power: int = None, image_url: str = None) -> None:
+        self.upsert_characters([{
+            "name": name, "ocid": ocid, "level": level,
+            "job": job, "power": power, "image_url": image_url,
+        }])
+
+    # 기록 시각 직전 샘플과 (레벨, 전투력)이 다른 캐릭터만 새 샘플 추가
+    _RECORD_HISTORY_SQL = """
+        INSERT OR REPLACE INTO character_history (char_id, ts, level, power)
+        SELECT i.id, :ts, c.level, c.power
+        FROM characters c JOIN character_ids i ON i.name = c.name
+        WHERE c.name IN (SELECT value FROM json_each(:names))
+          AND (c.level IS NOT NULL OR c.power IS NOT NULL)
+          AND NOT EXISTS (
+              SELECT 1 FROM character_history h
+              WHERE h.char_id = i.id
+                AND h.ts = (SELECT MAX(ts) FROM character_history
+                            WHERE char_id = i.id AND ts <= :ts)
+                AND h.level IS c.level AND h.power IS c.power
+          )"""
+
+    def upsert_characters(self, rows: list[dict], recorded_at: int | None = None) -> None:
+        """
+        여러 캐릭터를 한 트랜잭션으로 저장 (일괄 새로고침용).
+        None인 필드는 기존 값 유지. 레벨·전투력이 바뀌었으면 이력에 샘플 추가.
+        """
+        keys = ("name", "ocid", "level", "job", "power", "image_url")
+        names = [row["name"] for row in rows]
         with get_connection() as conn:
-            conn.execute(
-                """INSERT INTO characters (name, ocid, level, job, power, image_url)
-                   VALUES (?, ?, ?, ?, ?, ?)
-                   ON CONFLICT(name) DO UPDATE SET
-                       ocid      = COALESCE(excluded.ocid, ocid),
-                       level     = COALESCE(excluded.level, level),
-                       job       = COALESCE(excluded.job, job),
-                       power     = COALESCE(excluded.power, power),
-                       image_url = COALESCE(excluded.image_url, image_url)""",
-                (name, ocid, level, job, power, image_url)
+            conn.executemany(
+                self._UPSERT_CHARACTER_SQL,
+                [{k: row.get(k) for k in keys} for row in rows],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO character_ids (name) VALUES (?)", [(n,) for n in names]
             )
+            conn.execute(self._RECORD_HISTORY_SQL, {
+                "ts": recorded_at if recorded_at is not None else int(time.time()),
+                "names": json.dumps(names, ensure_ascii=False),
+            })
+
+    def get_character_history(self, name: str, since: int | None = None,
+                              until: int | None = None) -> list[dict]:
+        """
+        캐릭터의 레벨·전투력 이력 (시간순). since/until은 epoch 초.
+
+        Returns:
+            [{"ts": 1760000000, "level": 280, "power": 69802554}, ...]
+        """
+        with get_connection() as conn:
+            rows = conn.execute(
+                """SELECT h.ts, h.level, h.power
+                   FROM character_history h JOIN character_ids i ON i.id = h.char_id
+                   WHERE i.name = ? AND h.ts >= ? AND h.ts < ?
+                   ORDER BY h.ts""",
+                (name, since or 0, until if until is not None else 2**62)
+            ).fetchall()
+        return [dict(r) for r in rows]
 
     def delete_character(self, name: str) -> None:
+        from data_layer.archive import archived_weeks_with
         with get_connection() as conn:
+            self._restore_archived(conn, archived_weeks_with(conn, "characters", name))
             conn.execute("DELETE FROM characters WHERE name = ?", (name,))
             conn.execute("DELETE FROM weekly_checks WHERE character = ?", (name,))
+            conn.execute(
+                """DELETE FROM character_history
+                   WHERE char_id = (SELECT id FROM character_ids WHERE name = ?)""",
+                (name,)
+            )
+            conn.execute("DELETE FROM character_ids WHERE name = ?", (name,))
 
     def add_character_to_week(self, week_key: str, character: str) -> None:
         """캐릭터를 해당 주차에 추가 (전역 보스 목록 기준으로 행 생성)."""
         bosses = self.get_boss_list()
         with get_connection() as conn:
+            self._restore_archived(conn, [week_key])
             for boss in bosses:
                 conn.execute(
                     """INSERT OR IGNORE INTO weekly_checks
@@ -179,7 +279,9 @@ class DataManager:
             )
 
     def delete_boss(self, name: str) -> None:
+        from data_layer.archive import archived_weeks_with
         with get_connection() as conn:
+            self._restore_archived(conn, archived_weeks_with(conn, "bosses", name))
             conn.execute("DELETE FROM boss_list WHERE name = ?", (name,))
             conn.execute(
                 "DELETE FROM weekly_checks WHERE boss_name = ?", (name,)
@@ -187,6 +289,7 @@ class DataManager:
 
     def add_boss_to_character(self, week_key: str, character: str, boss_name: str, boss_value: int) -> None:
         with get_connection() as conn:
+            self._restore_archived(conn, [week_key])
             conn.execute(
                 """INSERT OR IGNORE INTO weekly_checks
                    (week_key, character, boss_name, boss_value, checked)
@@ -196,6 +299,7 @@ class DataManager:
 
     def remove_boss_from_character(self, week_key: str, character: str, boss_name: str) -> None:
         with get_connection() as conn:
+            self._restore_archived(conn, [week_key])
             conn.execute(
                 """DELETE FROM weekly_checks
                    WHERE week_key = ? AND character = ? AND boss_name = ?""",
@@ -214,6 +318,10 @@ class DataManager:
         그 이전 주차는 절대 건드리지 않음 (과거 내역 보호).
         """
         with get_connection() as conn:
+            # 0. 3에서 갱신할 주차가 보관돼 있으면 먼저 복원
+            self._restore_archived(conn, [r["week_key"] for r in conn.execute(
+                "SELECT week_key FROM archived_weeks a JOIN json_each(a.bosses) j "
+                "WHERE j.value = ? AND week_key >= ?", (boss_name, applied_from))])
             # 1. 현재 시세 업데이트
             conn.execute(
                 "UPDATE boss_list SET value = ? WHERE name = ?",
@@ -246,13 +354,15 @@ class DataManager:
     # ------------------------------------------------------------------
 
     def get_weekly_totals(self) -> list[dict]:
-        """주차별 총 수익 반환. Polars/Parquet 연동 전 기본 집계."""
+        """주차별 총 수익 반환. Polars/Parquet 연동 전 기본 집계 (보관 주차는 색인의 합계)."""
         with get_connection() as conn:
             rows = conn.execute(
                 """SELECT week_key, SUM(boss_value) as total
                    FROM weekly_checks
                    WHERE checked = 1
                    GROUP BY week_key
+                   UNION ALL
+                   SELECT week_key, total FROM archived_weeks WHERE checked > 0
                    ORDER BY week_key"""
             ).fetchall()
         return [dict(r) for r in rows]
@@ -268,6 +378,33 @@ class DataManager:
                    ORDER BY total DESC""",
                 (week_key,)
             ).fetchall()
+            if not rows:
+                return self._archived_character_totals(conn, week_key, checked_only=True)
         return [dict(r) for r in rows]
 
+    def get_character_income_summary(self, week_key: str) -> list[dict]:
+        """특정 주차의 캐릭터별 수익 반환. 수익 없는 캐릭터도 0으로 포함 (쿼리 1회)."""
+        with get_connection() as conn:
+            rows = conn.execute(
+                """SELECT character,
+                          SUM(CASE WHEN checked = 1 THEN boss_value ELSE 0 END) as total
+                   FROM weekly_checks
+                   WHERE week_key = ?
+                   GROUP BY character
+                   ORDER BY total DESC""",
+                (week_key,)
+            ).fetchall()
+            if not rows:
+                return self._archived_character_totals(conn, week_key)
+        return [dict(r) for r in rows]
 
+    def _archived_character_totals(self, conn: sqlite3.Connection, week_key: str,
+                                   checked_only: bool = False) -> list[dict]:
+        """보관 주차의 캐릭터별 수익 (위 두 쿼리와 같은 결과 형식)."""
+        totals: dict[str, int] = {}
+        for row in self._archived_rows(conn, week_key) or []:
+            if row["checked"] == 1 or not checked_only:
+                totals[row["character"]] = totals.get(row["character"], 0) + (
+                    row["boss_value"] if row["checked"] == 1 else 0)
+        return [{"character": c, "total": t}
+                for c, t in sorted(totals.items(), key=lambda kv: kv[1], reverse=True)]
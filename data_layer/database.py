@@ -3,22 +3,122 @@ SQLite 연결 및 테이블 초기화 담당.
 앱 시작 시 한 번만 호출하면 됩니다.
 """
 
+import os
 import sqlite3
+import threading
+from contextlib import closing, contextmanager, nullcontext
+
 from config import DB_FILE
+from data_layer.query_trace import tracer
+
+
+_db_path = DB_FILE
+_local = threading.local()     # 이 스레드의 연결 (conn, path)과 진행 중인 묶음 쓰기 연결 (shared)
+
+
+def set_db_path(path: str) -> None:
+    """이후 get_connection()이 열 DB 파일 변경 (CLI --db 등)."""
+    global _db_path
+    _db_path = path
+
+
+def get_db_path() -> str:
+    return _db_path
+
+
+class _SharedConnection:
+    """
+    shared_transaction() 안에서 get_connection()이 돌려주는 연결.
+    `with conn:`이 커밋하지 않아 여러 DataManager 호출이 한 트랜잭션(그룹 커밋)으로 묶인다.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False     # 커밋/롤백은 shared_transaction이 한 번에
+
+    def close(self) -> None:
+        pass
+
+
+@contextmanager
+def shared_transaction():
+    """
+    이 블록에서 (같은 스레드의) get_connection() 호출은 모두 연결 하나를 공유하고
+    블록이 끝날 때 한 번 커밋한다. 예외가 나면 전체 롤백.
+
+        with shared_transaction() as conn:
+            for op in ops:
+                conn.execute("SAVEPOINT op")   # 작업별 부분 롤백이 필요하면
+                ...
+    """
+    if getattr(_local, "shared", None) is not None:
+        yield _local.shared          # 중첩 시 바깥 트랜잭션에 합류
+        return
+    conn = _open()
+    conn.isolation_level = None      # BEGIN/COMMIT/SAVEPOINT를 직접 관리
+    shared = _local.shared = _SharedConnection(conn)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield shared
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        _local.shared = None
+        conn.close()
 
 
 def get_connection() -> sqlite3.Connection:
-    """DB 연결 반환. Row를 dict처럼 접근 가능하게 설정."""
-    conn = sqlite3.connect(DB_FILE)
+    """
+    DB 연결 반환. Row를 dict처럼 접근 가능하게 설정.
+    스레드마다 연결 하나를 재사용한다 — 새 연결은 스키마(변경 기록 트리거 포함)를 매번 다시
+    파싱하고 쓰기 문장의 트리거도 다시 컴파일한다. `with conn:`은 커밋/롤백만 하고 닫지 않는다.
+    """
+    shared = getattr(_local, "shared", None)
+    if shared is not None:
+        return shared
+    path = os.path.abspath(_db_path)     # set_db_path()나 작업 디렉터리가 바뀌면 새로 연다
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != path:
+        if conn is not None:
+            conn.close()
+        conn = _local.conn = _open(path)
+        _local.path = path
+    else:
+        tracer.attach(conn)     # 연결을 연 뒤 쿼리 추적을 켜거나 껐을 수 있음
+    return conn
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """현재 DB가 아닌 다른 DB 파일 연결 (동기화 상대 등). 설정은 get_connection()과 같다."""
+    return _open(path)
+
+
+def _open(path: str | None = None) -> sqlite3.Connection:
+    conn = sqlite3.connect(path or _db_path)
     conn.row_factory = sqlite3.Row  # row["컬럼명"] 형태로 접근 가능
     conn.execute("PRAGMA journal_mode=WAL")  # 동시 읽기 성능 향상
     conn.execute("PRAGMA foreign_keys=ON")
+    tracer.attach(conn)   # 쿼리 추적이 켜져 있을 때만 trace callback 등록
     return conn
 
 
-def init_db() -> None:
-    """테이블이 없으면 생성. 앱 시작 시 한 번 호출."""
-    with get_connection() as conn:
+def init_db(path: str | None = None) -> None:
+    """테이블이 없으면 생성. 앱 시작 시 한 번 호출 (path: 다른 DB 파일)."""
+    # 다른 DB 파일 연결은 끝나면 닫는다 (뒤의 conn은 트랜잭션 — 성공하면 커밋)
+    with (closing(connect(path)) if path else nullcontext(get_connection())) as conn, conn:
+        has_change_log = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'change_log'"
+        ).fetchone() is not None
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS characters (
                 name        TEXT PRIMARY KEY,
@@ -52,4 +152,134 @@ def init_db() -> None:
                 checked     INTEGER DEFAULT 0,
                 PRIMARY KEY (week_key, character, boss_name)
             );
-        """)
+
+            -- 보관 주차: weekly_checks에서 Parquet 파티션으로 옮긴 주차 (data_layer/archive.py)
+            CREATE TABLE IF NOT EXISTS archived_weeks (
+                week_key    TEXT PRIMARY KEY,
+                file        TEXT NOT NULL,       -- 보관 폴더 안 파일 이름
+                rows        INTEGER NOT NULL,
+                checked     INTEGER NOT NULL,    -- 체크된 행 수
+                total       INTEGER NOT NULL,    -- 체크된 boss_value 합
+                characters  TEXT NOT NULL,       -- 그 주차의 캐릭터 (JSON 배열)
+                bosses      TEXT NOT NULL,       -- 그 주차의 보스 (JSON 배열)
+                archived_at INTEGER NOT NULL     -- epoch 초
+            );
+
+            -- 캐릭터 → 현재 이미지 blob (image_url 해시)
+            CREATE TABLE IF NOT EXISTS character_images (
+                character       TEXT PRIMARY KEY,
+                url_hash        TEXT NOT NULL,   -- blob 파일 이름
+                image_url       TEXT NOT NULL,
+                etag            TEXT,            -- 조건부 재검증용
+                last_modified   TEXT,
+                checked_at      INTEGER          -- 마지막 검증 시각 (epoch 초)
+            );
+            CREATE INDEX IF NOT EXISTS idx_character_images_hash
+                ON character_images (url_hash);
+
+            -- 캐릭터 이름 → 정수 id (이력 테이블을 작게 유지)
+            CREATE TABLE IF NOT EXISTS character_ids (
+                id          INTEGER PRIMARY KEY,
+                name        TEXT NOT NULL UNIQUE
+            );
+
+            -- 레벨·전투력 이력 (값이 바뀐 시점만 저장)
+            CREATE TABLE IF NOT EXISTS character_history (
+                char_id     INTEGER NOT NULL,
+                ts          INTEGER NOT NULL,    -- 기록 시각 (epoch 초)
+                level       INTEGER,
+                power       INTEGER,
+                PRIMARY KEY (char_id, ts)
+            ) WITHOUT ROWID;
+
+            -- 기존 캐릭터의 현재 값을 첫 샘플로 (이력이 없는 캐릭터만)
+            INSERT OR IGNORE INTO character_ids (name) SELECT name FROM characters;
+            INSERT OR IGNORE INTO character_history (char_id, ts, level, power)
+                SELECT i.id, CAST(strftime('%s', 'now') AS INTEGER), c.level, c.power
+                FROM characters c JOIN character_ids i ON i.name = c.name
+                WHERE (c.level IS NOT NULL OR c.power IS NOT NULL)
+                  AND NOT EXISTS (SELECT 1 FROM character_history h WHERE h.char_id = i.id);
+
+            -- 동기화: 이 DB의 복제본 id (파일마다 한 번 생성)
+            CREATE TABLE IF NOT EXISTS sync_meta (
+                key         TEXT PRIMARY KEY,
+                value       TEXT
+            );
+            INSERT OR IGNORE INTO sync_meta (key, value)
+                VALUES ('replica_id', lower(hex(randomblob(8))));
+
+            -- 동기화 대상 테이블의 변경 기록 (트리거가 추가만 함)
+            -- origin·origin_seq·pk·cols는 동기화할 때 채운다 (data_layer/sync.py의 stamp_changes)
+            CREATE TABLE IF NOT EXISTS change_log (
+                seq         INTEGER PRIMARY KEY,
+                origin      TEXT,                -- 변경이 처음 일어난 복제본 (NULL: 아직 동기화 전인 이 DB의 변경)
+                origin_seq  INTEGER,             -- 그 복제본 안에서의 순번
+                ts          REAL NOT NULL,       -- 변경 시각 (julianday, 충돌 시 나중 것이 이김)
+                tbl         TEXT NOT NULL,
+                pk          TEXT,                -- 행 키 (JSON 배열)
+                op          TEXT NOT NULL,       -- 'I' 처음 보는 행 삽입, 'U' 수정·재삽입, 'D' 삭제
+                row         TEXT,                -- 'I'/'U'면 행 전체 (SYNC_TABLES 컬럼 순서의 JSON 배열)
+                old         TEXT,                -- 번호를 붙이기 전 'U'의 수정 전 행 (붙이면서 cols로 바꾸고 지움)
+                cols        TEXT,                -- 'U'에서 바뀐 컬럼 (JSON 배열, 안 바뀐 자리는 null), NULL이면 행 전체
+                UNIQUE (origin, origin_seq)
+            );
+            CREATE INDEX IF NOT EXISTS idx_change_log_row ON change_log (tbl, pk, ts);
+        """ + _change_log_triggers())
+        if not has_change_log:
+            _seed_change_log(conn)
+
+
+# ---------------------------------------------------------------------------
+# 변경 기록 (동기화용)
+# ---------------------------------------------------------------------------
+
+# 테이블 → (행 키 컬럼, 기록할 컬럼)
+# boss_price_history는 추가만 되는 이력이고 id가 복제본마다 달라지므로 행 내용 전체가 키
+SYNC_TABLES = {
+    "weekly_checks": (("week_key", "character", "boss_name"),
+                      ("week_key", "character", "boss_name", "boss_value", "checked")),
+    "characters": (("name",), ("name", "ocid", "level", "job", "power", "image_url")),
+    "boss_list": (("name",), ("name", "value")),
+    "boss_price_history": (("boss_name", "applied_from", "value", "note"),
+                           ("boss_name", "value", "applied_from", "note")),
+}
+
+
+def _json_row(table: str, ref: str) -> str:
+    return "json_array(" + ",".join(f"{ref}.{c}" for c in SYNC_TABLES[table][1]) + ")"
+
+
+def _log_sql(table: str, op: str, ref: str, old: str = "NULL") -> str:
+    return (f"INSERT INTO change_log(ts,tbl,op,row,old) "
+            f"VALUES(julianday('now'),'{table}','{op}',{_json_row(table, ref)},{old});")
+
+
+def _change_log_triggers() -> str:
+    """
+    SYNC_TABLES마다 삽입·수정·삭제 트리거. 트리거 본문은 연결을 열 때마다 스키마와 함께 파싱되고
+    쓰기 문장을 준비할 때마다 컴파일되므로 행만 기록하고 끝낸다 —
+    키·바뀐 컬럼·'I'/'U' 구분·값이 그대로인 UPDATE 제거는 동기화 때 한 번에.
+    """
+    parts = []
+    for table, (keys, _columns) in SYNC_TABLES.items():
+        moved = " OR ".join(f"OLD.{k} IS NOT NEW.{k}" for k in keys)
+        parts.append(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_log_insert AFTER INSERT ON {table}
+            BEGIN {_log_sql(table, "I", "NEW")} END;
+            CREATE TRIGGER IF NOT EXISTS {table}_log_update AFTER UPDATE ON {table}
+            BEGIN {_log_sql(table, "U", "NEW", _json_row(table, "OLD"))} END;
+            CREATE TRIGGER IF NOT EXISTS {table}_log_delete AFTER DELETE ON {table}
+            BEGIN {_log_sql(table, "D", "OLD")} END;
+            CREATE TRIGGER IF NOT EXISTS {table}_log_rekey AFTER UPDATE ON {table} WHEN {moved}
+            BEGIN {_log_sql(table, "D", "OLD")} END;""")
+    return "\n".join(parts)
+
+
+def _seed_change_log(conn: sqlite3.Connection) -> None:
+    """
+    change_log를 처음 만든 DB는 기존 행을 시각 0의 삽입('I')으로 기록해 둔다.
+    그래야 기록 이전부터 있던 데이터도 상대 DB로 넘어가고, 이후 실제 변경에는 항상 진다.
+    """
+    for table in SYNC_TABLES:
+        conn.execute(f"INSERT INTO change_log (ts, tbl, op, row) "
+                     f"SELECT 0, '{table}', 'I', {_json_row(table, table)} FROM {table}")
@@ -0,0 +1,105 @@
+"""
+계정 전체 합산 통계용 ParquetStore.
+
+계정마다 ParquetStore(자기 DB → 자기 스냅샷)를 두고,
+- snapshot()은 DB가 스냅샷보다 새로운 계정만 스레드 풀에서 동시에 다시 만들고
+- load()는 계정별 Parquet를 한 번에 스캔해 합친다 (account 컬럼 추가)
+
+집계 메서드는 ParquetStore 그대로라 통계 탭은 store만 바꿔 끼우면 된다.
+SQLite ATTACH로 DB를 묶지 않는 이유: 연결 하나에 붙일 수 있는 DB 수 제한(기본 10)이 있고
+집계가 한 스레드에서 돌며, 통계 탭은 어차피 Parquet를 읽기 때문.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
+
+from data_layer.accounts import Account
+from data_layer.database import init_db
+from data_layer.parquet_store import ParquetStore
+from utils.profiling import profiled_methods
+
+
+@profiled_methods("parquet")
+class FederatedParquetStore(ParquetStore):
+
+    def __init__(self, accounts: list[Account]):
+        super().__init__(path=None, history_path=None)
+        self.accounts = accounts
+        for account in accounts:
+            init_db(account.db_path)    # 한동안 안 연 계정 DB는 스키마가 예전 것일 수 있음
+        self._stores = {a.name: ParquetStore(a.parquet_path, a.history_path, db_path=a.db_path)
+                        for a in accounts}
+
+    # ------------------------------------------------------------------
+    # 스냅샷
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> None:
+        """DB(또는 WAL)가 스냅샷보다 새로운 계정만 다시 스냅샷 (동시에)."""
+        self._parallel(ParquetStore.snapshot, [s for s in self._stores.values() if _stale(s)])
+
+    def snapshot_history(self) -> None:
+        self._parallel(ParquetStore.snapshot_history, list(self._stores.values()))
+
+    def _parallel(self, func, stores: list[ParquetStore]) -> None:
+        if len(stores) <= 1:
+            for store in stores:
+                func(store)
+            return
+        # 행을 dict·DataFrame으로 만드는 구간이 GIL을 잡아 스레드로는 조금만 빨라진다
+        # (sqlite3 조회와 Parquet 쓰기가 겹치는 만큼). 큰 이득은 바뀐 계정만 다시 스냅샷하는 것
+        with ThreadPoolExecutor(max_workers=min(len(stores), os.cpu_count() or 4),
+                                thread_name_prefix="snapshot") as pool:
+            list(pool.map(func, stores))
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+
+    def load(self) -> pl.DataFrame:
+        """모든 계정의 weekly_checks (account 컬럼 추가). 스냅샷이 없는 계정은 먼저 만든다."""
+        return self._scan("path", ParquetStore.snapshot)
+
+    def load_history(self) -> pl.DataFrame:
+        return self._scan("history_path", ParquetStore.snapshot_history)
+
+    def account_totals(self) -> list[dict]:
+        """
+        계정별 누적 수익.
+
+        Returns:
+            [{"account": "기본", "characters": 6, "weeks": 40, "total": 15234000000}, ...]
+        """
+        df = self.load()
+        names = [a.name for a in self.accounts]
+        if df.is_empty():
+            return [{"account": n, "characters": 0, "weeks": 0, "total": 0} for n in names]
+        summary = {r["account"]: r for r in (
+            df.group_by("account")
+              .agg(pl.col("character").n_unique().alias("characters"),
+                   pl.col("week_key").n_unique().alias("weeks"),
+                   pl.col("boss_value").filter(pl.col("checked")).sum().alias("total"))
+              .to_dicts()
+        )}
+        return [summary.get(n, {"account": n, "characters": 0, "weeks": 0, "total": 0}) for n in names]
+
+    def _scan(self, attr: str, snapshot) -> pl.DataFrame:
+        self._parallel(snapshot, [s for s in self._stores.values()
+                                  if not os.path.exists(getattr(s, attr))])
+        frames = [pl.scan_parquet(getattr(s, attr)).with_columns(pl.lit(name).alias("account"))
+                  for name, s in self._stores.items() if os.path.exists(getattr(s, attr))]
+        if not frames:
+            return pl.DataFrame()
+        # 파일 읽기·합치기는 Polars가 여러 스레드로
+        return pl.concat(frames, how="diagonal_relaxed").collect()
+
+
+def _stale(store: ParquetStore) -> bool:
+    try:
+        snap = os.path.getmtime(store.path)
+    except OSError:
+        return True
+    return any(os.path.getmtime(p) > snap for p in (store.db_path, store.db_path + "-wal")
+               if os.path.exists(p))
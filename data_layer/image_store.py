@@ -0,0 +1,249 @@
+"""
+캐릭터 이미지 content-addressed 저장소.
+
+- 이미지 파일은 image_url 해시를 이름으로 IMAGE_BLOB_DIR에 저장 (blob)
+- character_images 테이블이 캐릭터 → 현재 blob을 가리킴
+- image_url이 바뀌면(코디 변경) 새 blob을 받고, 참조가 끊긴 blob은 GC로 삭제
+- 같은 URL은 ETag/Last-Modified 조건부 요청으로만 재검증 (변경 없으면 304, 재다운로드 없음)
+- blob 폴더는 계정 사이에 공유하므로 삭제 전에 다른 계정 DB의 참조도 확인
+
+사용 흐름:
+    store = ImageStore()
+    path = store.fetch("쿠루리우타", image_url)   # 필요할 때만 네트워크 사용
+    store.gc()                                    # 참조 없는 blob / 삭제된 캐릭터 정리
+"""
+
+import hashlib
+import os
+import shutil
+import time
+from typing import Callable
+
+import requests
+
+from data_layer.database import connect, get_connection
+from config import IMAGE_DIR, IMAGE_BLOB_DIR, IMAGE_REVALIDATE_SECONDS
+
+
+def url_key(url: str) -> str:
+    """image_url → blob 이름 (sha256 앞 32자)."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+
+def source_id(path: str) -> str:
+    """
+    원본 이미지 식별자 (파일 확인 없이 경로만으로 결정).
+    blob은 파일 이름이 곧 url 해시, 레거시 파일은 더 이상 새로 쓰이지 않으므로 고정값.
+    """
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return stem if os.path.dirname(os.path.abspath(path)) == os.path.abspath(IMAGE_BLOB_DIR) else "legacy"
+
+
+class ImageStore:
+    """image_url 해시 기반 이미지 blob 저장소 + 캐릭터 인덱스."""
+
+    def __init__(self, blob_dir: str = IMAGE_BLOB_DIR,
+                 revalidate_after: int = IMAGE_REVALIDATE_SECONDS,
+                 http_get: Callable | None = None, timeout: float = 5):
+        self.blob_dir = blob_dir
+        self.revalidate_after = revalidate_after
+        self._http_get = http_get or requests.get
+        self._timeout = timeout
+        self.stats = {"hits": 0, "downloads": 0, "not_modified": 0, "adopted": 0, "revalidate_failed": 0}
+        os.makedirs(blob_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def blob_path(self, url_hash: str) -> str:
+        return os.path.join(self.blob_dir, f"{url_hash}.png")
+
+    def lookup(self, character: str) -> dict | None:
+        with get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM character_images WHERE character = ?", (character,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def current_paths(self) -> dict[str, str]:
+        """
+        전체 캐릭터의 현재 이미지 경로 (쿼리 1회, 파일 확인 없음).
+
+        Returns:
+            {"쿠루리우타": "character_images/blobs/3f2a....png", ...}
+        """
+        with get_connection() as conn:
+            rows = conn.execute("SELECT character, url_hash FROM character_images").fetchall()
+        return {r["character"]: self.blob_path(r["url_hash"]) for r in rows}
+
+    # ------------------------------------------------------------------
+    # 가져오기
+    # ------------------------------------------------------------------
+
+    def fetch(self, character: str, url: str) -> str:
+        """
+        캐릭터의 현재 이미지 blob 경로 반환. 필요할 때만 네트워크 사용.
+        - 인덱스와 URL이 같고 재검증 주기 이내 → 그대로 반환
+        - 인덱스와 URL이 같지만 오래됨 → 조건부 요청 (304면 유지, 연결 실패·5xx면 가진 blob을
+          그대로 반환하고 다음 호출에 다시 재검증)
+        - 같은 URL의 blob이 이미 있음 → 인덱스만 갱신
+        - 레거시 파일(IMAGE_DIR/<이름>.png)이 있고 처음 보는 캐릭터 → 복사해 편입
+        - 그 외 → 다운로드
+        새로 받아야 하는데 다운로드가 실패하면 예외.
+        """
+        key = url_key(url)
+        path = self.blob_path(key)
+        entry = self.lookup(character)
+        now = int(time.time())
+
+        if entry and entry["url_hash"] == key and os.path.exists(path):
+            if now - (entry["checked_at"] or 0) < self.revalidate_after:
+                self.stats["hits"] += 1
+                return path
+            return self._revalidate(character, url, entry, now)
+
+        if os.path.exists(path):
+            self.stats["hits"] += 1
+            self._set_current(character, url, key, None, None, now, replaced=entry)
+            return path
+
+        legacy = os.path.join(IMAGE_DIR, f"{character}.png")
+        if entry is None and os.path.exists(legacy):
+            # 첫 실행: 기존 이름 기반 캐시를 blob으로 편입, 다음 재검증 때 최신화
+            shutil.copyfile(legacy, path)
+            self.stats["adopted"] += 1
+            self._set_current(character, url, key, None, None, 0)
+            return path
+
+        return self._download(character, url, key, now, replaced=entry)
+
+    def _download(self, character: str, url: str, key: str, now: int,
+                  replaced: dict | None = None) -> str:
+        resp = self._http_get(url, timeout=self._timeout)
+        resp.raise_for_status()
+        self._write_blob(key, resp.content)
+        self.stats["downloads"] += 1
+        self._set_current(character, url, key, resp.headers.get("ETag"),
+                          resp.headers.get("Last-Modified"), now, replaced=replaced)
+        return self.blob_path(key)
+
+    def _revalidate(self, character: str, url: str, entry: dict, now: int) -> str:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            resp = self._http_get(url, headers=headers, timeout=self._timeout)
+        except requests.RequestException:
+            resp = None
+        if resp is None or resp.status_code >= 500:
+            # 오프라인·서버 오류: 디스크의 blob으로 충분. checked_at을 그대로 둬 다음 호출에 다시 시도
+            self.stats["revalidate_failed"] += 1
+            return self.blob_path(entry["url_hash"])
+        if resp.status_code == 304:
+            self.stats["not_modified"] += 1
+        else:
+            resp.raise_for_status()
+            self._write_blob(entry["url_hash"], resp.content)
+            self.stats["downloads"] += 1
+        self._set_current(
+            character, url, entry["url_hash"],
+            resp.headers.get("ETag") or entry.get("etag"),
+            resp.headers.get("Last-Modified") or entry.get("last_modified"),
+            now,
+        )
+        return self.blob_path(entry["url_hash"])
+
+    def _write_blob(self, key: str, content: bytes) -> None:
+        """같은 blob을 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 임시 파일 후 교체."""
+        path = self.blob_path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
+
+    def _set_current(self, character: str, url: str, key: str, etag: str | None,
+                     last_modified: str | None, checked_at: int,
+                     replaced: dict | None = None) -> None:
+        with get_connection() as conn:
+            conn.execute(
+                """INSERT INTO character_images
+                       (character, url_hash, image_url, etag, last_modified, checked_at)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(character) DO UPDATE SET
+                       url_hash = excluded.url_hash, image_url = excluded.image_url,
+                       etag = excluded.etag, last_modified = excluded.last_modified,
+                       checked_at = excluded.checked_at""",
+                (character, key, url, etag, last_modified, checked_at)
+            )
+        # 이전 blob은 더 이상 참조가 없을 때만 삭제
+        if replaced and replaced["url_hash"] != key:
+            self._remove_if_unreferenced(replaced["url_hash"])
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+
+    def forget(self, character: str) -> None:
+        """캐릭터 삭제 시 인덱스에서 제거하고, 참조 없는 blob 삭제."""
+        entry = self.lookup(character)
+        if not entry:
+            return
+        with get_connection() as conn:
+            conn.execute("DELETE FROM character_images WHERE character = ?", (character,))
+        self._remove_if_unreferenced(entry["url_hash"])
+
+    def gc(self) -> dict:
+        """
+        삭제·개명된 캐릭터의 인덱스 행과, 어떤 캐릭터도 참조하지 않는 blob 삭제.
+
+        Returns:
+            {"orphan_rows": 1, "blobs_removed": 3}
+        """
+        with get_connection() as conn:
+            orphan_rows = conn.execute(
+                """DELETE FROM character_images
+                   WHERE character NOT IN (SELECT name FROM characters)"""
+            ).rowcount
+            referenced = {r["url_hash"] for r in conn.execute(
+                "SELECT DISTINCT url_hash FROM character_images"
+            ).fetchall()}
+        referenced |= self._referenced_by_other_accounts()
+
+        removed = 0
+        for filename in os.listdir(self.blob_dir):
+            stem, ext = os.path.splitext(filename)
+            if ext == ".png" and stem not in referenced:
+                os.remove(os.path.join(self.blob_dir, filename))
+                removed += 1
+        return {"orphan_rows": orphan_rows, "blobs_removed": removed}
+
+    def _remove_if_unreferenced(self, url_hash: str) -> None:
+        with get_connection() as conn:
+            in_use = conn.execute(
+                "SELECT 1 FROM character_images WHERE url_hash = ? LIMIT 1", (url_hash,)
+            ).fetchone()
+        if not in_use and url_hash not in self._referenced_by_other_accounts():
+            try:
+                os.remove(self.blob_path(url_hash))
+            except FileNotFoundError:
+                pass
+
+    def _referenced_by_other_accounts(self) -> set[str]:
+        """활성 계정이 아닌 계정 DB들이 가리키는 blob (계정이 하나면 빈 집합)."""
+        from data_layer.accounts import AccountRegistry
+
+        referenced = set()
+        for path in AccountRegistry().other_db_paths():
+            if not os.path.exists(path):
+                continue
+            conn = connect(path)
+            try:
+                referenced.update(r[0] for r in conn.execute(
+                    "SELECT DISTINCT url_hash FROM character_images"))
+            finally:
+                conn.close()
+        return referenced
@@ -2,7 +2,8 @@
 Parquet 기반 통계 스냅샷 저장소.
 
 역할:
-- SQLite의 weekly_checks 데이터를 Parquet로 스냅샷 저장
+- SQLite의 weekly_checks 데이터를 Parquet로 스냅샷 저장 (보관된 오래된 주차 파티션도 함께 스캔)
+- 레벨·전투력 이력(character_history)도 별도 Parquet로 스냅샷
 - Polars로 빠르게 읽어 통계 계산
 - SQLite는 실시간 체크 상태 관리, Parquet는 통계 전용
 
@@ -11,37 +12,77 @@ Parquet 기반 통계 스냅샷 저장소.
     store.snapshot()           # SQLite → Parquet 동기화
     df = store.load()          # Polars DataFrame 반환
     totals = store.weekly_totals()  # 주차별 수익 집계
+    growth = store.power_vs_income("쿠루리우타")  # 주차별 수익 + 주말 전투력
 """
 
 import os
+from contextlib import closing
+
 import polars as pl
 
-from data_layer.database import get_connection
-from config import PARQUET_FILE
+from data_layer.archive import WeekArchive
+from data_layer.database import connect, get_connection
+from data_layer.data_manager import week_bounds
+from config import PARQUET_FILE, HISTORY_PARQUET_FILE
+from utils.profiling import profiled_methods
+
+
+_HISTORY_SCHEMA = {"character": pl.Utf8, "ts": pl.Int64, "level": pl.Int32, "power": pl.Int64}
 
 
+@profiled_methods("parquet")
 class ParquetStore:
     """weekly_checks 데이터를 Parquet로 스냅샷하고 Polars로 집계."""
 
-    def __init__(self, path: str = PARQUET_FILE):
+    def __init__(self, path: str = PARQUET_FILE, history_path: str = HISTORY_PARQUET_FILE,
+                 db_path: str | None = None):
+        """db_path: 현재 DB(get_connection) 대신 스냅샷할 DB 파일 (다른 계정 등)"""
         self.path = path
+        self.history_path = history_path
+        self.db_path = db_path
 
     # ------------------------------------------------------------------
     # 스냅샷 (SQLite → Parquet)
     # ------------------------------------------------------------------
 
     def snapshot(self) -> None:
-        """SQLite의 weekly_checks 전체를 Parquet로 저장."""
-        with get_connection() as conn:
-            rows = conn.execute("SELECT * FROM weekly_checks").fetchall()
-
-        if not rows:
+        """SQLite의 weekly_checks 전체 + 보관 주차, 캐릭터 이력을 Parquet로 저장."""
+        self.snapshot_history()
+        with self._connection() as conn:
+            # 한 읽기 트랜잭션 안에서 — 그 사이 보관된 주차가 양쪽에 다 세어지지 않게.
+            # 복원(restore_weeks)은 파일을 남겨 두므로 collect까지 이 안에서 끝내면 된다
+            conn.execute("BEGIN")
+            try:
+                rows = conn.execute("SELECT * FROM weekly_checks").fetchall()
+                cold = WeekArchive(self.db_path).scan(conn)
+                frames = [] if cold is None else [cold.collect()]
+            finally:
+                conn.execute("COMMIT")
+
+        if rows:
+            frames.insert(0, pl.DataFrame([dict(r) for r in rows]).with_columns(
+                pl.col("checked").cast(pl.Boolean)
+            ))
+        if not frames:
             return
 
-        df = pl.DataFrame([dict(r) for r in rows]).with_columns(
-            pl.col("checked").cast(pl.Boolean)
-        )
-        df.write_parquet(self.path)
+        pl.concat(frames, how="vertical_relaxed").write_parquet(self.path)
+
+    def snapshot_history(self) -> None:
+        """character_history → Parquet (캐릭터 이름 복원, ts는 Datetime)."""
+        with self._connection() as conn:
+            rows = conn.execute(
+                """SELECT i.name AS character, h.ts, h.level, h.power
+                   FROM character_history h JOIN character_ids i ON i.id = h.char_id
+                   ORDER BY i.name, h.ts"""
+            ).fetchall()
+
+        df = pl.DataFrame([dict(r) for r in rows], schema=_HISTORY_SCHEMA, orient="row")
+        df.with_columns(pl.from_epoch("ts", time_unit="s")).write_parquet(self.history_path)
+
+    def _connection(self):
+        # 다른 DB 파일 연결은 with가 끝나면 닫는다 (get_connection()은 스레드마다 재사용)
+        return closing(connect(self.db_path)) if self.db_path else get_connection()
 
     # ------------------------------------------------------------------
     # 읽기
@@ -57,6 +98,12 @@ class ParquetStore:
 
         return pl.read_parquet(self.path)
 
+    def load_history(self) -> pl.DataFrame:
+        """이력 Parquet → DataFrame (character, ts: Datetime, level, power)."""
+        if not os.path.exists(self.history_path):
+            self.snapshot_history()
+        return pl.read_parquet(self.history_path)
+
     # ------------------------------------------------------------------
     # 집계
     # ------------------------------------------------------------------
@@ -116,6 +163,36 @@ class ParquetStore:
         )
         return result.to_dicts()
 
+    def characters(self) -> list[str]:
+        """체크리스트에 한 번이라도 오른 캐릭터 이름 (가나다순)."""
+        df = self.load()
+        if df.is_empty():
+            return []
+        return df.get_column("character").unique().sort().to_list()
+
+    def achievement_rates(self, week_key: str) -> list[dict]:
+        """
+        특정 주차의 캐릭터별 보스 달성률 (높은 순).
+
+        Returns:
+            [{"character": "쿠루리우타", "done": 11, "total": 14, "rate": 78.6}, ...]
+        """
+        df = self.load()
+        if df.is_empty():
+            return []
+
+        result = (
+            df.filter(pl.col("week_key") == week_key)
+              .group_by("character")
+              .agg(
+                  pl.col("checked").sum().cast(pl.Int64).alias("done"),
+                  pl.len().cast(pl.Int64).alias("total"),
+              )
+              .with_columns((pl.col("done") / pl.col("total") * 100).round(1).alias("rate"))
+              .sort(["rate", "character"], descending=[True, False])
+        )
+        return result.to_dicts()
+
     def accumulated_total(self) -> int:
         """전체 누적 수익 합계."""
         df = self.load()
@@ -138,4 +215,41 @@ class ParquetStore:
               .agg(pl.col("boss_value").sum().alias("total"))
               .sort("total", descending=True)
         )
-        return result.to_dicts()
\ No newline at end of file
+        return result.to_dicts()
+
+    def power_vs_income(self, character: str) -> list[dict]:
+        """
+        캐릭터의 주차별 보스 수익과 그 주 마지막 시점의 레벨·전투력.
+        (주차 종료 시각 이전의 가장 최근 이력 샘플을 join_asof로 매칭)
+
+        Returns:
+            [{"week_key": "2025-37", "income": 123000000,
+              "power": 69802554, "level": 280}, ...]   # 주차 시간순, 이력 없으면 None
+        """
+        df = self.load()
+        if df.is_empty():
+            return []
+
+        weeks = (
+            df.filter(pl.col("character") == character)
+              .group_by("week_key")
+              .agg(
+                  pl.col("boss_value").filter(pl.col("checked")).sum().alias("income")
+              )
+        )
+        if weeks.is_empty():
+            return []
+        weeks = weeks.with_columns(
+            pl.Series("week_end", [week_bounds(w)[1] for w in weeks["week_key"]],
+                      dtype=pl.Datetime("us"))
+        ).sort("week_end")
+
+        history = (
+            self.load_history()
+                .filter(pl.col("character") == character)
+                .select(pl.col("ts").cast(pl.Datetime("us")), "level", "power")
+                .sort("ts")
+        )
+        result = weeks.join_asof(history, left_on="week_end", right_on="ts",
+                                 strategy="backward")
+        return result.select("week_key", "income", "power", "level").to_dicts()
@@ -0,0 +1,286 @@
+"""
+SQLite 쿼리 추적 / 느린 호출 로그.
+
+- get_connection()이 만든 연결에 set_trace_callback을 걸어 실행된 SQL 문장을 센다
+- DataManager 메서드는 traced_methods로 감싸 호출 시간(히스토그램)을 잰다
+- 모든 기록에는 그 쿼리를 일으킨 UI 동작 태그(주차 전환, 체크, 탭 전환 ...)가 붙는다
+- 임계값(slow_ms)을 넘는 메서드 호출은 실행한 SQL과 함께 느린 호출 로그에 남긴다
+
+꺼져 있을 때는 플래그 확인 한 번만 하고 원래 함수를 그대로 호출한다.
+
+사용 흐름:
+    tracer.enable(slow_ms=20)
+    with tracer.action("week_switch"):
+        tab.switch_week("2025-37")
+    print(tracer.format_report())
+    tracer.disable()
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+
+from config import SQL_TRACE, SQL_SLOW_MS
+from utils.profiling import profiler
+
+# 메서드 호출 시간 히스토그램 구간 (ms, 상한)
+HISTOGRAM_BOUNDS = (1, 2, 5, 10, 25, 50, 100, 250, 500)
+
+_UNTAGGED = "-"
+_action: contextvars.ContextVar[str] = contextvars.ContextVar("sql_action", default=_UNTAGGED)
+_WHITESPACE = re.compile(r"\s+")
+_WRITE_VERBS = ("INSERT", "UPDATE", "DELETE", "REPLACE")    # 트리거가 걸릴 수 있는 문장
+# trace callback은 파라미터 값을 채운 SQL을 넘긴다 → 문자열·숫자·blob 리터럴을 ?로 되돌린다
+_LITERAL = re.compile(r"[xX]'[0-9a-fA-F]*'|'(?:[^']|'')*'|(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?(?![\w.])")
+
+
+def normalize_sql(sql: str, limit: int = 160) -> str:
+    """리터럴을 ?로 바꾸고 공백을 줄여 한 줄로 (파라미터만 다른 같은 문장끼리 묶어 세기 위함)."""
+    sql = _WHITESPACE.sub(" ", _LITERAL.sub("?", sql)).strip()
+    return sql if len(sql) <= limit else sql[:limit - 1] + "…"
+
+
+class _MethodStats:
+    __slots__ = ("count", "total_ms", "max_ms", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        for i, bound in enumerate(HISTOGRAM_BOUNDS):
+            if ms < bound:
+                self.buckets[i] += 1
+                return
+        self.buckets[-1] += 1
+
+    def as_dict(self) -> dict:
+        labels = [f"<{b}ms" for b in HISTOGRAM_BOUNDS] + [f">={HISTOGRAM_BOUNDS[-1]}ms"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "histogram": {label: n for label, n in zip(labels, self.buckets) if n},
+        }
+
+
+class QueryTracer:
+    """쿼리 수·메서드 시간·느린 호출을 UI 동작별로 집계. 스레드 안전."""
+
+    def __init__(self, enabled: bool = False, slow_ms: float = SQL_SLOW_MS, max_slow: int = 200):
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._local = threading.local()      # 스레드별 진행 중인 메서드 호출 스택
+        self._max_slow = max_slow
+        self.reset()
+
+    # ------------------------------------------------------------------
+    # 켜기 / 끄기
+    # ------------------------------------------------------------------
+
+    def enable(self, slow_ms: float | None = None) -> None:
+        if slow_ms is not None:
+            self.slow_ms = slow_ms
+        self.enabled = True
+        print(f"[SQL] 추적 시작 (느린 호출 기준 {self.slow_ms:g}ms)")
+
+    def disable(self) -> None:
+        self.enabled = False
+        print("[SQL] 추적 중지")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements: Counter = Counter()           # (동작, SQL) → 횟수
+            self._methods: dict[tuple[str, str], _MethodStats] = {}   # (동작, 메서드)
+            self._outer: dict[str, list] = {}    # 동작 → [가장 바깥 호출 수, 시간 ms]
+            self._slow: deque = deque(maxlen=self._max_slow)
+            self._started = time.time()
+
+    # ------------------------------------------------------------------
+    # UI 동작 태그
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def current_action() -> str:
+        return _action.get()
+
+    @contextmanager
+    def action(self, name: str):
+        """이 블록 안에서 실행된 쿼리에 동작 이름을 붙인다 (중첩 시 안쪽 우선)."""
+        token = _action.set(name)
+        try:
+            yield
+        finally:
+            _action.reset(token)
+
+    # ------------------------------------------------------------------
+    # 기록 (연결 / 메서드 래퍼에서 호출)
+    # ------------------------------------------------------------------
+
+    def attach(self, conn) -> None:
+        """get_connection()에서 호출. 켜져 있으면 걸고 꺼져 있으면 뗀다 (스레드별로 재사용하는 연결)."""
+        conn.set_trace_callback(self._on_statement if self.enabled else None)
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _on_statement(self, sql: str) -> None:
+        # 트리거(변경 기록) 본문이 실행될 때마다 바깥 쓰기 문장이 다시 보고됨 → 바로 앞과 같은 쓰기 문장은 한 번으로.
+        # 읽기 문장은 트리거가 없으니 연속 반복도 그대로 센다 (last는 메서드 호출 경계에서 지움)
+        last, self._local.last = getattr(self._local, "last", None), sql
+        if sql == last and sql.lstrip()[:7].upper().startswith(_WRITE_VERBS):
+            return
+        sql = normalize_sql(sql)
+        if sql.startswith("PRAGMA"):
+            return      # 연결마다 붙는 설정 문장은 제외
+        stack = self._stack()
+        if stack:
+            stack[-1].append(sql)
+        with self._lock:
+            self._statements[(_action.get(), sql)] += 1
+
+    def call(self, name: str, func, *args, **kwargs):
+        """메서드 호출 시간 측정 + 그 동안 실행된 SQL 수집."""
+        stack = self._stack()
+        statements: list[str] = []
+        stack.append(statements)
+        self._local.last = None        # 앞 호출의 마지막 문장과 겹쳐 세지 않도록
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            ms = (time.perf_counter() - started) * 1000
+            self._local.last = None
+            stack.pop()
+            if stack:
+                stack[-1].extend(statements)   # 바깥 메서드에도 포함
+            action = _action.get()
+            with self._lock:
+                self._methods.setdefault((action, name), _MethodStats()).add(ms)
+                if not stack:                  # 동작별 합계는 중첩 호출을 한 번만 셈
+                    outer = self._outer.setdefault(action, [0, 0.0])
+                    outer[0] += 1
+                    outer[1] += ms
+                if ms >= self.slow_ms:
+                    self._slow.append({"at": time.time(), "action": action, "method": name,
+                                       "ms": round(ms, 2), "statements": statements[:20]})
+            if ms >= self.slow_ms:
+                print(f"[SQL] 느린 호출 {name} {ms:.1f}ms ({action}, 쿼리 {len(statements)}개)")
+
+    # ------------------------------------------------------------------
+    # 보고
+    # ------------------------------------------------------------------
+
+    def report(self, top: int = 15) -> dict:
+        """
+        Returns:
+            {"enabled": True, "since": 1760000000.0,
+             "actions": {"toggle": {"queries": 3, "calls": 2, "total_ms": 1.8}, ...},
+             "methods": {"toggle/set_boss_checked": {"count": 1, "avg_ms": 0.9, "histogram": {...}}},
+             "statements": [{"action": "toggle", "sql": "UPDATE ...", "count": 1}, ...],
+             "slow": [{"action": "week_switch", "method": "get_week_data", "ms": 52.1, ...}]}
+        """
+        with self._lock:
+            statements = self._statements.copy()
+            methods = {k: v.as_dict() for k, v in self._methods.items()}
+            outer = {k: list(v) for k, v in self._outer.items()}
+            slow = list(self._slow)
+
+        actions: dict[str, dict] = {}
+        for (action, _sql), n in statements.items():
+            actions.setdefault(action, {"queries": 0, "calls": 0, "total_ms": 0.0})["queries"] += n
+        for action, (calls, ms) in outer.items():
+            entry = actions.setdefault(action, {"queries": 0, "calls": 0, "total_ms": 0.0})
+            entry["calls"] = calls
+            entry["total_ms"] = round(ms, 2)
+
+        return {
+            "enabled": self.enabled,
+            "since": self._started,
+            "slow_ms": self.slow_ms,
+            "actions": actions,
+            "methods": {f"{a}/{name}": m for (a, name), m in sorted(methods.items())},
+            "statements": [{"action": a, "sql": sql, "count": n}
+                           for (a, sql), n in statements.most_common(top)],
+            "slow": slow,
+        }
+
+    def format_report(self, top: int = 15) -> str:
+        r = self.report(top)
+        lines = [f"[SQL] 동작별 (느린 호출 기준 {r['slow_ms']:g}ms)"]
+        for action, a in sorted(r["actions"].items(), key=lambda kv: -kv[1]["queries"]):
+            lines.append(f"  {action:<22} 쿼리 {a['queries']:>5}  호출 {a['calls']:>5}  "
+                         f"{a['total_ms']:>9.1f}ms")
+        lines.append("[SQL] 자주 실행된 문장")
+        for s in r["statements"]:
+            lines.append(f"  {s['count']:>5}  {s['action']:<16} {s['sql']}")
+        if r["slow"]:
+            lines.append(f"[SQL] 느린 호출 {len(r['slow'])}건")
+            for s in r["slow"][-10:]:
+                lines.append(f"  {s['ms']:>8.1f}ms  {s['action']:<16} {s['method']} "
+                             f"(쿼리 {len(s['statements'])}개)")
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(top=100), f, ensure_ascii=False, indent=2)
+
+
+tracer = QueryTracer(enabled=SQL_TRACE)
+
+
+# ---------------------------------------------------------------------------
+# 데코레이터
+# ---------------------------------------------------------------------------
+
+def traced(name: str):
+    """함수 호출 시간 측정 (꺼져 있으면 원래 함수 그대로 호출)."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            return tracer.call(name, func, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def traced_methods(cls):
+    """클래스의 공개 메서드 전부에 traced 적용 (이름은 메서드 이름)."""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, traced(attr)(value))
+    return cls
+
+
+def traced_action(name: str):
+    """
+    UI 핸들러에 동작 태그를 붙이는 데코레이터. 프로파일러가 켜져 있으면 같은 이름의 span도 기록.
+    둘 다 꺼져 있으면 원래 함수 그대로 호출.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled and not profiler.enabled:
+                return func(*args, **kwargs)
+            with tracer.action(name), profiler.span(name, "ui"):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,189 @@
+"""
+트래커 서버(python -m daemon) HTTP/JSON 클라이언트.
+
+RemoteDataManager는 DataManager와 같은 메서드를 가지며 호출을 서버로 보낸다.
+BOSS_TRACKER_SERVER가 설정되면 GUI가 DataManager 대신 이것을 쓴다.
+서버가 노출하는 메서드 목록(READ_METHODS / WRITE_METHODS)도 여기 둔다 — 서버와 클라이언트가 공유.
+
+프로토콜:
+    POST /api/call            {"method": "set_boss_checked", "args": [...], "kwargs": {...}}
+                              → {"result": ...} | {"error": "..."} (400/404/500)
+    GET  /api/stats/<이름>?week_key=...  ParquetStore 집계 결과
+    GET  /api/snapshot/checks | history  Parquet 스냅샷 파일 (없으면 404)
+    GET  /api/events?since=N&timeout=25  변경 알림 대기 (long poll)
+    GET  /api/health                     서버 상태 · 묶음 커밋 통계
+요청마다 X-Client-Id 헤더를 붙여 서버가 변경 알림에 보낸 쪽을 적는다.
+
+사용 흐름:
+    dm = RemoteDataManager("http://127.0.0.1:8765")
+    dm.set_boss_checked("2025-37", "쿠루리우타", "검은마법사", True)
+    feed = dm.wait_events(since=0, timeout=25)
+"""
+
+import http.client
+import json
+import threading
+import urllib.parse
+import uuid
+
+from config import REMOTE_TIMEOUT
+from utils.profiling import profiled
+
+# 서버가 그대로 실행하는 DataManager 읽기 메서드
+READ_METHODS = (
+    "get_all_week_keys", "get_weekly_checks", "get_week_data",
+    "get_all_characters", "get_character", "get_character_history",
+    "get_boss_list", "get_boss_price_history",
+    "get_weekly_totals", "get_character_weekly_totals", "get_character_income_summary",
+)
+
+# 서버의 쓰기 큐를 거쳐 묶음 커밋되는 메서드 (성공하면 변경 알림 발행)
+WRITE_METHODS = (
+    "ensure_current_week", "set_boss_checked",
+    "upsert_character", "upsert_characters", "delete_character", "add_character_to_week",
+    "add_boss", "delete_boss", "add_boss_to_character", "remove_boss_from_character",
+    "update_boss_price",
+)
+
+# /api/stats/<이름> 으로 노출하는 ParquetStore 집계
+STATS_METHODS = (
+    "weekly_totals", "character_totals", "boss_contribution", "accumulated_total",
+    "boss_contribution_all", "power_vs_income", "characters", "achievement_rates",
+)
+
+
+class RemoteError(Exception):
+    """서버가 오류를 돌려줬거나 연결할 수 없음."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+class TrackerClient:
+    """
+    keep-alive HTTP 클라이언트 (스레드마다 연결 하나).
+
+    GUI 스레드의 호출과 변경 알림 대기 스레드가 서로 막지 않도록 연결을 나눠 쓴다.
+    """
+
+    def __init__(self, base_url: str, client_id: str | None = None, timeout: float = REMOTE_TIMEOUT):
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme != "http" or not parsed.hostname:
+            raise ValueError(f"http://호스트:포트 형식이어야 합니다: {base_url}")
+        self.base_url = base_url.rstrip("/")
+        self.client_id = client_id or uuid.uuid4().hex[:12]
+        self._host, self._port = parsed.hostname, parsed.port or 80
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self, timeout: float) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def request(self, method: str, path: str, body: dict | None = None,
+                timeout: float | None = None) -> tuple[int, bytes, str]:
+        """
+        Returns:
+            (status, body bytes, content-type)
+        끊긴 keep-alive 연결이면 한 번 다시 연결해 재시도한다.
+        """
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8") if body is not None else None
+        headers = {"X-Client-Id": self.client_id}
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+        for attempt in range(2):
+            conn = self._connection(timeout or self._timeout)
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+                return resp.status, data, resp.getheader("Content-Type", "")
+            except (ConnectionError, http.client.HTTPException) as e:
+                conn.close()
+                self._local.conn = None
+                if attempt == 1:
+                    raise RemoteError(f"서버 연결 실패: {self.base_url} ({e})") from e
+            except OSError as e:
+                conn.close()
+                self._local.conn = None
+                raise RemoteError(f"서버 연결 실패: {self.base_url} ({e})") from e
+
+    def get_json(self, path: str, params: dict | None = None, timeout: float | None = None):
+        if params:
+            path += "?" + urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+        status, data, _ = self.request("GET", path, timeout=timeout)
+        return self._decode(status, data)
+
+    def post_json(self, path: str, body: dict):
+        status, data, _ = self.request("POST", path, body)
+        return self._decode(status, data)
+
+    @staticmethod
+    def _decode(status: int, data: bytes):
+        try:
+            payload = json.loads(data) if data else {}
+        except ValueError:
+            payload = {"error": data[:200].decode("utf-8", "replace")}
+        if status != 200:
+            raise RemoteError(payload.get("error", f"HTTP {status}"), status)
+        return payload
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class RemoteDataManager:
+    """
+    DataManager와 같은 인터페이스로 트래커 서버를 호출.
+
+    get_weekly_checks는 sqlite3.Row 대신 dict 목록을 돌려준다 (row["컬럼"] 접근은 동일).
+    쓰기 메서드는 서버가 커밋을 마친 뒤에 돌아온다.
+    """
+
+    def __init__(self, base_url: str, client_id: str | None = None):
+        self.client = TrackerClient(base_url, client_id)
+
+    @property
+    def client_id(self) -> str:
+        return self.client.client_id
+
+    def call(self, method: str, *args, **kwargs):
+        return self.client.post_json("/api/call", {"method": method, "args": list(args),
+                                                   "kwargs": kwargs})["result"]
+
+    def health(self) -> dict:
+        return self.client.get_json("/api/health")
+
+    def wait_events(self, since: int, timeout: float) -> dict:
+        """
+        since 이후의 변경 알림. 새 알림이 없으면 timeout초까지 기다린다.
+
+        Returns:
+            {"seq": 42, "reset": False,
+             "events": [{"seq": 42, "method": "set_boss_checked", "client": "a1b2...",
+                         "args": [...], "ts": 1760000000.0}, ...]}
+            reset=True면 since가 서버 기록보다 오래됨 → 전체 새로고침 필요
+        """
+        return self.client.get_json("/api/events", {"since": since, "timeout": timeout},
+                                    timeout=timeout + REMOTE_TIMEOUT)
+
+
+def _make_method(name: str):
+    def method(self, *args, **kwargs):
+        return self.call(name, *args, **kwargs)
+    method.__name__ = name
+    method.__qualname__ = f"RemoteDataManager.{name}"
+    return profiled(cat="api")(method)
+
+
+for _name in READ_METHODS + WRITE_METHODS:
+    setattr(RemoteDataManager, _name, _make_method(_name))
@@ -0,0 +1,46 @@
+"""
+트래커 서버의 Parquet 스냅샷을 받아 쓰는 ParquetStore.
+
+집계는 ParquetStore 그대로 (로컬 Polars), snapshot()만 SQLite 대신
+서버의 /api/snapshot/* 파일을 REMOTE_CACHE_DIR에 내려받는다.
+서버는 변경이 있었을 때만 스냅샷을 새로 만든다.
+"""
+
+import os
+
+from config import REMOTE_CACHE_DIR, PARQUET_FILE, HISTORY_PARQUET_FILE
+from data_layer.parquet_store import ParquetStore
+from data_layer.remote import TrackerClient, RemoteError
+from utils.profiling import profiled_methods
+
+
+@profiled_methods("parquet")
+class RemoteParquetStore(ParquetStore):
+
+    def __init__(self, client: TrackerClient, cache_dir: str = REMOTE_CACHE_DIR):
+        os.makedirs(cache_dir, exist_ok=True)
+        super().__init__(path=os.path.join(cache_dir, PARQUET_FILE),
+                         history_path=os.path.join(cache_dir, HISTORY_PARQUET_FILE))
+        self._client = client
+
+    def snapshot(self) -> None:
+        """서버 스냅샷 (weekly_checks + 캐릭터 이력) 다운로드."""
+        self.snapshot_history()
+        self._download("/api/snapshot/checks", self.path)
+
+    def snapshot_history(self) -> None:
+        self._download("/api/snapshot/history", self.history_path)
+
+    def _download(self, path: str, dest: str) -> None:
+        status, data, _ = self._client.request("GET", path)
+        if status == 404:
+            # 서버 DB가 비어 있음 → 예전 캐시를 지워 빈 결과가 되게
+            if os.path.exists(dest):
+                os.remove(dest)
+            return
+        if status != 200:
+            raise RemoteError(f"스냅샷 다운로드 실패: {path} (HTTP {status})", status)
+        tmp = dest + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, dest)
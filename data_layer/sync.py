@@ -0,0 +1,309 @@
+"""
+두 트래커 DB 파일 사이의 변경분 동기화.
+
+각 DB는 init_db()가 만든 트리거로 weekly_checks / characters / boss_list /
+boss_price_history 변경을 change_log에 쌓는다. 동기화는:
+0. 아직 동기화하지 않은 변경에 (복제본 id, 복제본 안의 순번)을 붙이고 (stamp_changes)
+1. 양쪽의 버전 벡터(복제본별 최대 순번)를 비교해
+2. 상대가 아직 못 본 변경만 서로 보내고
+3. 받은 변경을 적용한다. 같은 행에 대한 변경 중 순위 키가 가장 큰 것이 이긴다
+   (last-writer-wins, 양쪽이 같은 규칙이라 결과가 항상 같음). 진 변경도 기록은 남겨 다시 보내지 않는다.
+4. 같은 행의 더 나중 기록에 완전히 덮인 기록은 지운다 (compact_change_log —
+   앱 시작 후 백그라운드 작업과 트래커 서버 시작 때도).
+
+순위 키 = (수정·삭제인가, ts, origin, origin_seq). 키가 그대로인 수정은 바뀐 컬럼(cols)만 겨룬다 —
+노트북에서 체크하고 데스크톱에서 같은 행의 시세를 바꿔도 둘 다 남는다.
+'I'(그 DB가 처음 보는 행의 삽입)는 어떤 수정·삭제에도 진다. 두 PC가 각자 새 주차를 만들었을 때
+나중에 주차를 연 쪽의 "체크 안 됨" 행이 먼저 연 쪽의 체크를 덮어쓰지 않게 하기 위함.
+
+파일 복사가 아니라 SQLite 연결로 읽고 쓰므로 WAL이 살아 있는 DB(앱 실행 중)에도 안전하다.
+양쪽 트랜잭션은 따로 커밋되지만, 한쪽만 커밋된 채 중단돼도 다음 동기화가 남은 변경만 보낸다.
+character_history(레벨·전투력 이력)와 이미지 인덱스는 PC별 데이터라 동기화하지 않는다.
+오래된 주차 보관(data_layer/archive.py)도 PC별이다 — 보관·복원은 change_log에 남지 않고,
+상대 변경이 이 DB의 보관 주차에 오면 적용 전에 그 주차를 복원한다.
+
+사용 흐름:
+    result = sync_databases("boss_data.db", "/mnt/laptop/boss_data.db")
+    print(result["sent"], result["received"], result["conflicts"])
+"""
+
+import json
+import sqlite3
+import time
+
+from data_layer.database import SYNC_TABLES, connect, init_db
+
+
+_TS_STEP = 1e-8      # 같은 행의 앞선 기록보다 나중으로 미는 최소 간격 (julianday, 약 1ms)
+
+
+class SyncError(Exception):
+    """동기화할 수 없는 상태 (같은 복제본 id 등)."""
+
+
+def replica_id(conn: sqlite3.Connection) -> str:
+    return conn.execute("SELECT value FROM sync_meta WHERE key = 'replica_id'").fetchone()[0]
+
+
+def _json_at(column: str, i: int) -> str:
+    return f"json_extract({column}, '$[{i}]')"
+
+
+def _stamp_table_sql(table: str) -> str:
+    """트리거가 남긴 행 JSON에서 키(pk)와 바뀐 컬럼(cols)을 채우는 UPDATE."""
+    keys, columns = SYNC_TABLES[table]
+    key_at = [columns.index(k) for k in keys]
+    pk = "json_array(" + ", ".join(_json_at("row", i) for i in key_at) + ")"
+    same_key = " AND ".join(f"{_json_at('old', i)} IS {_json_at('row', i)}" for i in key_at)
+    cols = "json_array(" + ", ".join(
+        f"CASE WHEN {_json_at('old', i)} IS NOT {_json_at('row', i)} THEN '{c}' END"
+        for i, c in enumerate(columns)) + ")"
+    return f"""
+        UPDATE change_log SET
+            pk = {pk},
+            cols = CASE WHEN op = 'U' AND {same_key} THEN {cols} END,
+            row = CASE WHEN op = 'D' THEN NULL ELSE row END,
+            old = NULL
+        WHERE origin IS NULL AND tbl = '{table}'"""
+
+
+def stamp_changes(conn: sqlite3.Connection) -> int:
+    """
+    트리거가 남긴 이 DB의 변경(origin NULL)을 동기화할 수 있는 모양으로 만들고 복제본 id와
+    순번(= seq)을 붙인다. 트리거를 짧게 두려고 쓰기마다 하지 않고 동기화 직전에 한 번에 하는 일:
+      - 값이 그대로인 UPDATE 기록은 버리고, 키와 바뀐 컬럼을 채움
+      - 이 DB가 이미 본 행의 'I'(삭제 후 다시 만든 행 등)는 'U'로
+      - 같은 행의 앞선 기록(시계가 빠른 상대 것 포함)보다 조금이라도 나중 시각으로 — 받은 뒤에 한
+        로컬 변경이 시계 차이 때문에 지지 않게
+    Returns: 붙인 변경 수
+    """
+    conn.execute("DELETE FROM change_log WHERE origin IS NULL AND op = 'U' AND old = row")
+    for table in SYNC_TABLES:
+        conn.execute(_stamp_table_sql(table))
+    return conn.execute(f"""
+        UPDATE change_log AS c SET
+            origin = (SELECT value FROM sync_meta WHERE key = 'replica_id'),
+            origin_seq = seq,
+            op = CASE WHEN op = 'I' AND EXISTS (SELECT 1 FROM change_log p
+                          WHERE p.tbl = c.tbl AND p.pk = c.pk AND p.seq < c.seq)
+                      THEN 'U' ELSE op END,
+            ts = MAX(ts, COALESCE((SELECT MAX(p.ts) + {_TS_STEP} FROM change_log p
+                                   WHERE p.tbl = c.tbl AND p.pk = c.pk AND p.seq < c.seq), 0))
+        WHERE origin IS NULL""").rowcount
+
+
+def new_replica_id(path: str) -> str:
+    """
+    파일을 복사해 만든 DB에 새 복제본 id 부여. 복사 전 변경은 원래 id로 남아 있어 그대로 맞는다.
+    """
+    init_db(path)
+    with connect(path) as conn:
+        stamp_changes(conn)          # 아직 안 붙인 변경은 복사 전 id 것
+        conn.execute("UPDATE sync_meta SET value = lower(hex(randomblob(8))) WHERE key = 'replica_id'")
+        return replica_id(conn)
+
+
+def version_vector(conn: sqlite3.Connection) -> dict[str, int]:
+    """{복제본 id: 이 DB가 가진 그 복제본의 최대 순번}"""
+    return {r[0]: r[1] for r in conn.execute(
+        "SELECT origin, MAX(origin_seq) FROM change_log WHERE origin IS NOT NULL GROUP BY origin")}
+
+
+def changes_since(conn: sqlite3.Connection, vector: dict[str, int]) -> list[dict]:
+    """vector(상대가 이미 본 순번) 이후의 변경. 적용 순서(ts, origin, origin_seq)로 정렬."""
+    changes = []
+    for origin, last in version_vector(conn).items():
+        seen = vector.get(origin, 0)
+        if last <= seen:
+            continue
+        changes += [dict(r) for r in conn.execute(
+            """SELECT origin, origin_seq, ts, tbl, pk, op, row, cols FROM change_log
+               WHERE origin = ? AND origin_seq > ? ORDER BY origin_seq""", (origin, seen))]
+    changes.sort(key=lambda c: (c["ts"], c["origin"], c["origin_seq"]))
+    return changes
+
+
+def _rank(change: dict) -> tuple:
+    """충돌 시 비교 키 (클수록 이김)."""
+    return (int(change["op"] != "I"), change["ts"], change["origin"], change["origin_seq"])
+
+
+# 이 DB가 가진 같은 행의 가장 높은 순위 변경 — {scope}로 행 전체 / 특정 컬럼을 건드린 것만 고름
+_LATEST = """
+    SELECT op != 'I', ts, origin, origin_seq, op FROM change_log
+    WHERE tbl = ? AND pk = ? AND origin IS NOT NULL {scope}
+    ORDER BY op != 'I' DESC, ts DESC, origin DESC, origin_seq DESC LIMIT 1"""
+_WHOLE_ROW = "AND cols IS NULL"
+_TOUCHES = "AND (cols IS NULL OR EXISTS (SELECT 1 FROM json_each(cols) WHERE value = ?))"
+
+
+def _beats(conn: sqlite3.Connection, change: dict, scope: str = "", *params) -> tuple[bool, str | None]:
+    """(change가 이 DB의 기록을 이기는가, 이긴 쪽 기록의 op)"""
+    latest = conn.execute(_LATEST.format(scope=scope),
+                          (change["tbl"], change["pk"], *params)).fetchone()
+    if latest is None:
+        return True, None
+    return _rank(change) > tuple(latest[:4]), latest[4]
+
+
+def _where_key(keys) -> str:
+    # boss_price_history의 note처럼 NULL일 수 있는 키 → IS 비교
+    return " AND ".join(f"{k} IS ?" for k in keys)
+
+
+def _apply_row(conn: sqlite3.Connection, change: dict) -> None:
+    keys, columns = SYNC_TABLES[change["tbl"]]
+    conn.execute(f"DELETE FROM {change['tbl']} WHERE {_where_key(keys)}", json.loads(change["pk"]))
+    if change["op"] != "D":
+        conn.execute(f"INSERT INTO {change['tbl']} ({', '.join(columns)}) "
+                     f"VALUES ({', '.join('?' * len(columns))})", json.loads(change["row"]))
+
+
+def _apply_columns(conn: sqlite3.Connection, change: dict) -> bool:
+    """
+    컬럼 단위 수정('U' + cols) 적용. 행 삭제가 더 나중이면 버리고, 행이 없으면 행 전체로 다시 만들고,
+    있으면 이 DB의 기록보다 나중인 컬럼만 바꾼다. 하나라도 반영했으면 True.
+    """
+    wins, op = _beats(conn, change, _WHOLE_ROW)
+    if not wins and op == "D":
+        return False
+    keys, columns = SYNC_TABLES[change["tbl"]]
+    pk = json.loads(change["pk"])
+    exists = conn.execute(f"SELECT 1 FROM {change['tbl']} WHERE {_where_key(keys)}", pk).fetchone()
+    if not exists:
+        _apply_row(conn, change)
+        return True
+    row = dict(zip(columns, json.loads(change["row"])))
+    won = [c for c in json.loads(change["cols"]) if c and _beats(conn, change, _TOUCHES, c)[0]]
+    if won:
+        conn.execute(f"UPDATE {change['tbl']} SET {', '.join(f'{c} = ?' for c in won)} "
+                     f"WHERE {_where_key(keys)}", [row[c] for c in won] + pk)
+    return bool(won)
+
+
+def apply_changes(conn: sqlite3.Connection, changes: list[dict]) -> dict:
+    """
+    상대 변경을 적용하고 change_log에 원래 (origin, origin_seq, ts)로 기록. 트랜잭션은 호출한 쪽.
+    적용하면서 트리거가 남긴 기록(origin NULL)은 이 DB의 변경이 아니므로 끝에 지운다 —
+    그래서 먼저 이 DB의 변경에 번호를 붙여 둔다.
+
+    Returns:
+        {"applied": 12, "conflicts": 1}   # conflicts: 이 DB의 더 나중 변경이 이겨 적용하지 않은 수
+    """
+    stamp_changes(conn)
+    _restore_archived_weeks(conn, changes)
+    applied = conflicts = 0
+    for change in changes:
+        if change["cols"] is not None:
+            ok = _apply_columns(conn, change)
+        else:
+            ok = _beats(conn, change)[0]
+            if ok:
+                _apply_row(conn, change)
+        applied += ok
+        conflicts += not ok
+        conn.execute(
+            """INSERT OR IGNORE INTO change_log (origin, origin_seq, ts, tbl, pk, op, row, cols)
+               VALUES (:origin, :origin_seq, :ts, :tbl, :pk, :op, :row, :cols)""", change)
+    conn.execute("DELETE FROM change_log WHERE origin IS NULL")
+    return {"applied": applied, "conflicts": conflicts}
+
+
+def _restore_archived_weeks(conn: sqlite3.Connection, changes: list[dict]) -> None:
+    """받은 weekly_checks 변경이 이 DB의 보관 주차에 닿으면 먼저 SQLite로 복원 (주차 일부만 살아나지 않게)."""
+    weeks = {json.loads(c["pk"])[0] for c in changes if c["tbl"] == "weekly_checks"}
+    if weeks and conn.execute("SELECT 1 FROM archived_weeks LIMIT 1").fetchone():
+        from data_layer.archive import WeekArchive
+        WeekArchive(conn.execute("PRAGMA database_list").fetchone()["file"]).restore_weeks(conn, weeks)
+
+
+# 같은 행의 더 나중(순위 키가 큰) 기록이 이 기록의 컬럼을 모두 덮으면 이 기록은 어떤 충돌 판정에도,
+# 처음 받는 상대의 행 재구성에도 쓰이지 않는다 (기록마다 행 전체를 가짐). 복제본별 최대 순번 기록은
+# 버전 벡터라서 남긴다 — 지우면 상대가 이미 가진 변경을 다시 보낸다.
+_COMPACT = """
+    DELETE FROM change_log WHERE seq IN (
+        SELECT e.seq FROM change_log e
+        WHERE (e.tbl, e.pk) IN (SELECT tbl, pk FROM change_log GROUP BY tbl, pk HAVING COUNT(*) > 1)
+          AND e.origin IS NOT NULL
+          AND e.origin_seq < (SELECT MAX(m.origin_seq) FROM change_log m WHERE m.origin = e.origin)
+          AND EXISTS (
+              SELECT 1 FROM change_log l
+              WHERE l.tbl = e.tbl AND l.pk = e.pk AND l.origin IS NOT NULL
+                AND (l.op != 'I', l.ts, l.origin, l.origin_seq) > (e.op != 'I', e.ts, e.origin, e.origin_seq)
+                AND (l.cols IS NULL OR (e.cols IS NOT NULL AND NOT EXISTS (
+                    SELECT 1 FROM json_each(e.cols) c
+                    WHERE c.value IS NOT NULL
+                      AND c.value NOT IN (SELECT value FROM json_each(l.cols) WHERE value IS NOT NULL))))))"""
+
+
+def compact_change_log(conn: sqlite3.Connection) -> int:
+    """
+    더 나중 기록에 완전히 덮인 change_log 기록 삭제 (같은 행을 여러 번 체크·해제한 기록 등).
+    동기화를 한 번도 안 하는 DB도 쓰기마다 기록이 쌓이므로 먼저 번호를 붙인다. 트랜잭션은 호출한 쪽.
+    Returns: 지운 기록 수
+    """
+    stamp_changes(conn)
+    return conn.execute(_COMPACT).rowcount
+
+
+def _record_peer(conn: sqlite3.Connection, peer: str, now: float) -> None:
+    conn.execute("INSERT OR REPLACE INTO sync_meta (key, value) VALUES (?, ?)",
+                 (f"last_sync:{peer}", str(now)))
+
+
+def sync_databases(local_path: str, remote_path: str, dry_run: bool = False) -> dict:
+    """
+    두 DB 파일을 양방향 동기화.
+
+    Returns:
+        {"local": "16317c84...", "remote": "9a0b1c2d...",
+         "sent": 12, "received": 3,                      # 보낸 / 받은 변경 수
+         "applied_local": 3, "applied_remote": 11,       # 실제로 행에 반영된 수
+         "conflicts": 1, "elapsed_ms": 8.4}
+    """
+    started = time.perf_counter()
+    init_db(local_path)
+    init_db(remote_path)
+    local, remote = connect(local_path), connect(remote_path)
+    for conn in (local, remote):
+        conn.isolation_level = None        # BEGIN/COMMIT 직접 관리
+    try:
+        local_id, remote_id = replica_id(local), replica_id(remote)
+        if local_id == remote_id:
+            raise SyncError(f"두 DB의 복제본 id가 같음 ({local_id}) — 파일을 복사해 만든 DB라면 "
+                            f"한쪽에 새 id를 부여하세요 (python -m cli --db <복사본> sync --new-id)")
+        local.execute("BEGIN IMMEDIATE")
+        remote.execute("BEGIN IMMEDIATE")
+        stamp_changes(local)
+        stamp_changes(remote)
+        to_remote = changes_since(local, version_vector(remote))
+        to_local = changes_since(remote, version_vector(local))
+        at_remote = apply_changes(remote, to_remote)
+        at_local = apply_changes(local, to_local)
+        now = time.time()
+        _record_peer(local, remote_id, now)
+        _record_peer(remote, local_id, now)
+        compact_change_log(local)
+        compact_change_log(remote)
+        if dry_run:
+            local.execute("ROLLBACK")
+            remote.execute("ROLLBACK")
+        else:
+            remote.execute("COMMIT")
+            local.execute("COMMIT")
+    except BaseException:
+        for conn in (local, remote):
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+        raise
+    finally:
+        local.close()
+        remote.close()
+
+    return {
+        "local": local_id, "remote": remote_id,
+        "sent": len(to_remote), "received": len(to_local),
+        "applied_local": at_local["applied"], "applied_remote": at_remote["applied"],
+        "conflicts": at_local["conflicts"] + at_remote["conflicts"],
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
@@ -0,0 +1,109 @@
+"""
+웜 스타트 상태 파일.
+
+종료 시 / 유휴 시점에 첫 화면에 필요한 값만 JSON 하나로 저장해 두고,
+다음 실행에서는 DB 조회 없이 그 값으로 체크리스트를 먼저 그린다.
+DB 확인(init_db, 주차 초기화)과 최신 값 비교는 창이 뜬 뒤 백그라운드에서 한다.
+
+저장 항목:
+- 주차 키, 주차 목록, 현재 주차 데이터 (get_week_data 구조 그대로)
+- 선택된 캐릭터, 주차 캐릭터들의 정보(레벨·직업·전투력·이미지 URL)
+- 캐릭터별 수익 합계, 전역 보스 목록
+- 캐릭터 → 원본 이미지 경로 (사이드바 아이콘을 atlas에서 바로 찾는 데 사용)
+
+스케일된 사이드바 아이콘 자체는 썸네일 atlas(character_images/atlas.bin)에 있으므로
+여기서는 atlas 조회 키(원본 경로)만 저장한다.
+
+사용 흐름:
+    store = WarmStartStore()
+    state = store.load(current_week_key())   # 없거나 맞지 않으면 None
+    ...
+    store.save(store.collect(dm, week_key, selected))
+"""
+
+import json
+import os
+import time
+
+from config import WARM_START_FILE
+from data_layer.data_manager import DataManager
+from data_layer.image_store import ImageStore
+
+# 저장 구조가 바뀌면 올림 (이전 파일은 무시)
+WARM_START_VERSION = 1
+
+# 다시 읽은 DB 값과 비교하는 항목 (선택 캐릭터·저장 시각은 제외)
+STATE_KEYS = ("week_keys", "week_data", "characters", "totals", "boss_list", "sources")
+
+
+class WarmStartStore:
+    """웜 스타트 상태 JSON 읽기/쓰기."""
+
+    def __init__(self, path: str = WARM_START_FILE):
+        self.path = path
+
+    def load(self, week_key: str) -> dict | None:
+        """
+        저장된 상태 반환. 파일이 없거나, 버전·주차가 다르거나, 깨졌으면 None.
+
+        Returns:
+            {"version": 1, "saved_at": 1760000000, "week_key": "2025-37",
+             "week_keys": [...], "week_data": {...}, "current_character": "쿠루리우타",
+             "characters": {"쿠루리우타": {"level": 280, ...}}, "totals": [...],
+             "boss_list": [...], "sources": {"쿠루리우타": "character_images/blobs/....png"}}
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if state.get("version") != WARM_START_VERSION or state.get("week_key") != week_key:
+            return None
+        if any(key not in state for key in STATE_KEYS):
+            return None
+        return state
+
+    def save(self, state: dict) -> None:
+        """반쯤 쓰인 파일을 읽지 않도록 임시 파일에 쓰고 교체."""
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"[WarmStart] 저장 실패: {e}")
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def collect(dm: DataManager, week_key: str, current_character: str | None) -> dict:
+        """DB에서 현재 상태 수집 (워커 스레드에서 호출 가능)."""
+        week_data = dm.get_week_data(week_key)
+        characters = {}
+        for c in dm.get_all_characters():
+            if c["name"] in week_data:
+                characters[c["name"]] = {k: c.get(k) for k in ("level", "job", "power", "image_url")}
+        return {
+            "version": WARM_START_VERSION,
+            "saved_at": int(time.time()),
+            "week_key": week_key,
+            "week_keys": dm.get_all_week_keys(),
+            "week_data": week_data,
+            "current_character": current_character,
+            "characters": characters,
+            "totals": dm.get_character_income_summary(week_key),
+            "boss_list": dm.get_boss_list(),
+            "sources": ImageStore().current_paths(),
+        }
+
+    @staticmethod
+    def changed_keys(old: dict, new: dict) -> set[str]:
+        """두 상태에서 값이 다른 항목 이름. 주차 데이터는 캐릭터 순서(사이드바 순서)도 비교."""
+        changed = {key for key in STATE_KEYS if old.get(key) != new.get(key)}
+        if list(old.get("week_data", {})) != list(new.get("week_data", {})):
+            changed.add("week_data")
+        return changed
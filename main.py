@@ -1,5 +1,8 @@
 """
 앱 진입점.
+
+    python main.py
+    python main.py --profile out.json   # 종료 시 Chrome trace 저장 (chrome://tracing, Perfetto)
 """
 
 import sys
@@ -10,14 +13,37 @@ import PySide6
 plugin_path = os.path.join(os.path.dirname(PySide6.__file__), "Qt", "plugins", "platforms")
 os.environ["QT_QPA_PLATFORM_PLUGIN_PATH"] = plugin_path
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QFontDatabase, QFont
+from utils.profiling import profiler, span
 
-from ui.app import BossTrackerApp
 
+def _pop_profile_arg(argv: list[str]) -> str | None:
+    """--profile PATH를 argv에서 빼서 반환 (나머지는 Qt 인자로 넘김)."""
+    for i, arg in enumerate(argv):
+        if arg == "--profile" and i + 1 < len(argv):
+            path = argv[i + 1]
+            del argv[i:i + 2]
+            return path
+        if arg.startswith("--profile="):
+            del argv[i]
+            return arg.split("=", 1)[1]
+    return None
 
-def main() -> None:
-    app = QApplication(sys.argv)
+
+# import 시간도 타임라인에 나오도록 무거운 import 전에 켠다
+PROFILE_PATH = _pop_profile_arg(sys.argv) if __name__ == "__main__" else None
+if PROFILE_PATH:
+    profiler.enable()
+
+with span("import", "startup"):
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtGui import QFontDatabase, QFont
+
+    from ui.app import BossTrackerApp
+
+
+def create_application(argv: list[str]) -> QApplication:
+    """QApplication 생성 + 폰트·QSS 적용 (창은 만들지 않음)."""
+    app = QApplication(argv)
 
     # 한글 폰트 등록
     font_id = QFontDatabase.addApplicationFont("fonts/NotoSansKR-Regular.ttf")
@@ -31,9 +57,17 @@ def main() -> None:
             app.setStyleSheet(f.read())
     except FileNotFoundError:
         pass
+    return app
 
-    win = BossTrackerApp()
+
+def main() -> None:
+    with span("create_application", "startup"):
+        app = create_application(sys.argv)
+    with span("BossTrackerApp", "startup"):
+        win = BossTrackerApp()
     win.show()
+    if PROFILE_PATH:
+        app.aboutToQuit.connect(lambda: profiler.dump(PROFILE_PATH))
     sys.exit(app.exec())
 
 
@@ -0,0 +1,198 @@
+"""
+주차 보관 왕복 점검 — 임시 디렉터리의 합성 DB로 data_layer.archive를 확인.
+
+보관 전후에 앱이 보는 값이 하나도 달라지지 않아야 한다.
+
+    reads    DataManager 조회(주차 목록·주차 데이터·주차별/캐릭터별 합계)와
+             ParquetStore 집계가 보관 전과 같고, change_log에 남는 것이 없음
+    sync     보관한 DB와 동기화해도 상대의 행은 그대로, 상대가 보관 주차를 고치면
+             이쪽에서 그 주차를 복원한 뒤 반영해 같아짐
+    write    보관 주차에 체크하면 그 주차가 SQLite로 돌아오고 값이 반영됨
+    restore  전부 복원하면 weekly_checks가 보관 전과 같음 (boss_value 포함), 파일도 정리
+
+실행:
+    python -m tools.archive_check          # 실패 시 exit 1
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from tools.synthetic_data import REPO_ROOT, Scale, generate
+from tools.sync_check import _Check, _checked, _dm, _flip
+
+_KEEP = 4        # 현재 주차 포함 → 직전 3주만 SQLite에 남음
+
+
+def _rows(path: str) -> list[tuple]:
+    """weekly_checks + 보관 주차 행 (앱에서 보이는 전체)."""
+    from data_layer.archive import WeekArchive, archived_week_keys
+    from data_layer.database import connect
+
+    cols = ("week_key", "character", "boss_name", "boss_value", "checked")
+    conn = connect(path)
+    try:
+        rows = [tuple(r) for r in conn.execute(f"SELECT {', '.join(cols)} FROM weekly_checks")]
+        archive = WeekArchive(path)
+        for week in archived_week_keys(conn):
+            rows += [tuple(r[c] for c in cols) for r in archive.read_week(conn, week)]
+    finally:
+        conn.close()
+    return sorted(rows)
+
+
+def _count(path: str, sql: str) -> int:
+    from data_layer.database import connect
+
+    conn = connect(path)
+    try:
+        return conn.execute(sql).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def _views(path: str, work: str) -> dict:
+    """앱이 보는 값 전부 (합계 동률 순서 차이는 무시하도록 정렬)."""
+    from data_layer.parquet_store import ParquetStore
+
+    dm = _dm(path)
+    weeks = dm.get_all_week_keys()
+    store = ParquetStore(os.path.join(work, "snap.parquet"), os.path.join(work, "hist.parquet"), db_path=path)
+    store.snapshot()
+    return {
+        "week_keys": weeks,
+        "week_data": {w: dm.get_week_data(w) for w in weeks},
+        "weekly_totals": dm.get_weekly_totals(),
+        "income_summary": {w: sorted(map(tuple, (r.values() for r in dm.get_character_income_summary(w))))
+                           for w in weeks},
+        "character_totals": {w: sorted(map(tuple, (r.values() for r in dm.get_character_weekly_totals(w))))
+                             for w in weeks},
+        "parquet_weekly_totals": store.weekly_totals(),
+        "parquet_accumulated": store.accumulated_total(),
+        "parquet_bosses": sorted(map(tuple, (r.values() for r in store.boss_contribution_all()))),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 시나리오
+# ---------------------------------------------------------------------------
+
+def scenario_reads(check: _Check, work: str, a: str) -> list[str]:
+    from data_layer.archive import WeekArchive
+
+    before = _views(a, work)
+    log_before = _count(a, "SELECT COUNT(*) FROM change_log")
+    result = WeekArchive(a, keep_weeks=_KEEP).archive()
+    weeks = [r["week_key"] for r in result]
+    print(f"  {len(weeks)}개 주차 보관, {sum(r['rows'] for r in result)}행 → "
+          f"{sum(r['bytes'] for r in result):,}B")
+    check.expect("직전 3주만 SQLite에 남음",
+                 _count(a, "SELECT COUNT(DISTINCT week_key) FROM weekly_checks") == _KEEP - 1)
+    after = _views(a, work)
+    diff = [k for k in before if before[k] != after[k]]
+    check.expect("조회 결과가 보관 전과 같음", not diff, f"다른 항목: {diff}")
+    check.expect("change_log에 남는 것 없음",
+                 _count(a, "SELECT COUNT(*) FROM change_log") == log_before)
+    check.expect("다시 보관할 것 없음", WeekArchive(a, keep_weeks=_KEEP).archive() == [])
+    return weeks
+
+
+def scenario_sync(check: _Check, a: str, b: str, archived: list[str]) -> None:
+    from data_layer.archive import is_archived
+    from data_layer.database import connect
+    from data_layer.sync import sync_databases
+
+    result = sync_databases(a, b)
+    check.expect("보관 후 동기화할 것 없음", result["sent"] == result["received"] == 0, str(result))
+    check.expect("상대 DB의 행은 그대로", _rows(a) == _rows(b))
+
+    week = archived[len(archived) // 2]
+    dm = _dm(b)
+    character, boss = next((r["character"], r["boss_name"]) for r in dm.get_weekly_checks(week))
+    value = _flip(dm, week, character, boss)        # B에는 보관 안 된 행
+    sync_databases(a, b)
+    conn = connect(a)
+    try:
+        restored = not is_archived(conn, week)
+    finally:
+        conn.close()
+    check.expect("상대가 고친 보관 주차를 복원", restored)
+    check.expect("상대 변경이 반영됨", _checked(a, week, character, boss) == value)
+    check.expect("보관분 포함 같아짐", _rows(a) == _rows(b))
+    again = sync_databases(a, b)
+    check.expect("복원은 동기화 대상이 아님", again["sent"] == again["received"] == 0, str(again))
+
+
+def scenario_write(check: _Check, a: str, archived: list[str]) -> None:
+    from data_layer.archive import is_archived
+    from data_layer.database import connect
+
+    week = archived[0]
+    dm = _dm(a)
+    row = dm.get_weekly_checks(week)[0]          # 보관 파일에서 읽은 행
+    character, boss, value = row["character"], row["boss_name"], 1 - row["checked"]
+    dm.set_boss_checked(week, character, boss, bool(value))
+    conn = connect(a)
+    try:
+        restored = not is_archived(conn, week)
+    finally:
+        conn.close()
+    check.expect("보관 주차에 체크하면 복원", restored)
+    check.expect("체크가 반영됨", _checked(a, week, character, boss) == value)
+    _flip(dm, week, character, boss)      # 원래대로
+
+
+def scenario_restore(check: _Check, a: str, original: list[tuple]) -> None:
+    from data_layer.archive import WeekArchive, archived_week_keys
+    from data_layer.database import connect
+
+    archive = WeekArchive(a)
+    conn = connect(a)
+    try:
+        weeks = archived_week_keys(conn)
+    finally:
+        conn.close()
+    archive.restore(weeks)
+    check.expect("전부 복원하면 보관 전과 같음", _rows(a) == original)
+    check.expect("보관 색인 비움", _count(a, "SELECT COUNT(*) FROM archived_weeks") == 0)
+    left = os.listdir(archive.dir) if os.path.isdir(archive.dir) else []
+    check.expect("보관 파일 정리", not left, str(left))
+
+
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    sys.path.insert(0, REPO_ROOT)
+    from data_layer.sync import sync_databases
+
+    work = tempfile.mkdtemp(prefix="archive_check_")
+    cwd = os.getcwd()
+    os.chdir(work)
+    check = _Check()
+    try:
+        a, b = os.path.join(work, "a.db"), os.path.join(work, "b.db")
+        _dm(a)
+        generate(Scale(6, 12, 30))
+        _dm(b)
+        sync_databases(a, b)
+        original = _rows(a)
+        print("[reads]")
+        archived = scenario_reads(check, work, a)
+        print("[sync]")
+        scenario_sync(check, a, b, archived)
+        print("[write]")
+        scenario_write(check, a, archived)
+        print("[restore]")
+        scenario_restore(check, a, _rows(b))
+        check.expect("B의 변경 외에는 처음과 같음",
+                     len(set(original) ^ set(_rows(a))) == 2)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work, ignore_errors=True)
+    print(f"\n[Archive] {'통과' if not check.failures else f'실패 {check.failures}건'}")
+    sys.exit(1 if check.failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+캐릭터 추가 / 새로고침 / 이미지 로드 end-to-end 벤치마크 — 로컬 스텁 서버 + 실제 앱 코드.
+
+tools.fake_nexon_server를 띄우고 환경 변수(NEXON_API_BASE / NEXON_API_KEY /
+NEXON_API_RATE)로 앱 설정을 그쪽에 돌린 뒤, 체크리스트 탭과 같은 경로로 실행한다.
+    add           CharacterFetchThread(공용 asyncio 루프) → upsert_character + 주차 추가 (한 명씩)
+    refresh_one   BulkRefreshThread([캐릭터]) → upsert_characters (한 명씩, 새로고침 버튼)
+    refresh_all   BulkRefreshThread(전체) → upsert_characters (전체 새로고침 버튼)
+    image_cold    CharacterImageService.request → 다운로드·크롭 (image_ready까지)
+    image_warm    load_character_pixmap (저장소 적중 + 디코딩·크롭, 동기)
+
+DB·응답 캐시·이미지 저장소는 임시 디렉터리에 새로 만든다 (작업 트리의 DB는 건드리지 않음).
+호출 한도(기본 config 값)가 그대로 적용되므로, 한도를 뺀 순수 지연을 보려면 --api-rate를 올린다.
+
+실행:
+    python -m tools.bench_api_e2e
+    python -m tools.bench_api_e2e --count 40 --latency 0.15 --jitter 0.05 --api-rate 50
+    python -m tools.bench_api_e2e --error-rate 0.1 --rate-limit 5 --json e2e.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from tools.fake_nexon_server import FakeNexonServer, REPO_ROOT
+
+
+def _summary(label: str, total: float, latencies: list[float], failures: int) -> dict:
+    ops = len(latencies) + failures
+    latencies = sorted(latencies) or [0.0]
+    return {
+        "scenario": label,
+        "ops": ops,
+        "failures": failures,
+        "total_s": round(total, 3),
+        "ops_per_s": round(ops / total, 2) if total else None,
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[max(0, int(len(latencies) * 0.95) - 1)] * 1000, 1),
+        "max_ms": round(latencies[-1] * 1000, 1),
+    }
+
+
+def _wait(app, predicate, timeout: float) -> bool:
+    """GUI 이벤트를 돌리며 조건이 참이 될 때까지 대기 (시그널은 queued로 도착)."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.001)
+    return True
+
+
+# ---------------------------------------------------------------------------
+# 시나리오
+# ---------------------------------------------------------------------------
+
+def bench_add(app, dm, week_key: str, names: list[str], timeout: float) -> dict:
+    from api import CharacterFetchThread
+
+    latencies, failures = [], 0
+    started = time.perf_counter()
+    for name in names:
+        result = {}
+        thread = CharacterFetchThread(name)
+        thread.finished.connect(lambda info: result.setdefault("info", info))
+        thread.failed.connect(lambda msg: result.setdefault("error", msg))
+        t = time.perf_counter()
+        thread.start()
+        if not _wait(app, lambda: result, timeout) or "error" in result:
+            failures += 1
+            continue
+        # ChecklistTab._on_character_fetch_success와 같은 저장
+        info = result["info"]
+        dm.upsert_character(name=name, ocid=info.get("ocid"), level=info.get("character_level"),
+                            job=info.get("character_class"), image_url=info.get("character_image"))
+        dm.add_character_to_week(week_key, name)
+        latencies.append(time.perf_counter() - t)
+    return _summary("add", time.perf_counter() - started, latencies, failures)
+
+
+def _run_refresh(app, dm, characters: list[dict], timeout: float) -> tuple[list, dict]:
+    from api import BulkRefreshThread
+
+    result = {}
+    thread = BulkRefreshThread(characters)
+    thread.completed.connect(lambda rows, errors: result.update(rows=rows, errors=errors))
+    thread.start()
+    if not _wait(app, lambda: result, timeout):
+        thread.cancel()
+        thread.wait()
+        return [], {c["name"]: "시간 초과" for c in characters}
+    thread.wait()
+    if result["rows"]:
+        dm.upsert_characters(result["rows"])
+    return result["rows"], result["errors"]
+
+
+def bench_refresh_one(app, dm, timeout: float) -> dict:
+    latencies, failures = [], 0
+    characters = [{"name": c["name"], "ocid": c["ocid"]} for c in dm.get_all_characters()]
+    started = time.perf_counter()
+    for char in characters:
+        t = time.perf_counter()
+        rows, _ = _run_refresh(app, dm, [char], timeout)
+        if rows:
+            latencies.append(time.perf_counter() - t)
+        else:
+            failures += 1
+    return _summary("refresh_one", time.perf_counter() - started, latencies, failures)
+
+
+def bench_refresh_all(app, dm, timeout: float) -> dict:
+    characters = [{"name": c["name"], "ocid": c["ocid"]} for c in dm.get_all_characters()]
+    started = time.perf_counter()
+    rows, errors = _run_refresh(app, dm, characters, timeout)
+    total = time.perf_counter() - started
+    # 일괄 작업은 결과가 한 번에 도착하므로 지연 = 전체 시간, 처리량 = 캐릭터 수 / 전체 시간
+    return _summary("refresh_all", total, [total] * len(rows), len(errors))
+
+
+def bench_image_cold(app, dm, timeout: float) -> dict:
+    from api import CharacterImageService, ThumbnailSpec
+
+    service = CharacterImageService()
+    spec = ThumbnailSpec(180)
+    arrived, failed = {}, set()
+    service.image_ready.connect(lambda name, _spec, _pixmap: arrived.setdefault(name, time.perf_counter()))
+    service.image_failed.connect(lambda name, _msg: failed.add(name))
+
+    characters = [c for c in dm.get_all_characters() if c.get("image_url")]
+    started = time.perf_counter()
+    for c in characters:
+        service.request(c["image_url"], c["name"], spec)
+    _wait(app, lambda: len(arrived) + len(failed) >= len(characters), timeout)
+    service.wait_idle()
+    latencies = [t - started for t in arrived.values()]
+    return _summary("image_cold", time.perf_counter() - started, latencies,
+                    len(characters) - len(latencies))
+
+
+def bench_image_warm(dm) -> dict:
+    from api import load_character_pixmap
+
+    latencies, failures = [], 0
+    started = time.perf_counter()
+    for c in dm.get_all_characters():
+        if not c.get("image_url"):
+            continue
+        t = time.perf_counter()
+        if load_character_pixmap(c["image_url"], c["name"], 180) is None:
+            failures += 1
+        else:
+            latencies.append(time.perf_counter() - t)
+    return _summary("image_warm", time.perf_counter() - started, latencies, failures)
+
+
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="캐릭터 추가·새로고침 end-to-end 벤치마크")
+    parser.add_argument("--count", type=int, default=0,
+                        help="캐릭터 수 (0이면 픽스처 전원, 넘치면 생성된 캐릭터로 채움)")
+    parser.add_argument("--latency", type=float, default=0.1, help="스텁 서버 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연에 더할 무작위 폭(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 확률")
+    parser.add_argument("--rate-limit", type=float, default=None, help="서버 측 초당 허용 요청 수")
+    parser.add_argument("--api-rate", type=float, default=None,
+                        help="클라이언트 초당 호출 수 (기본: config.NEXON_API_RATE)")
+    parser.add_argument("--timeout", type=float, default=120, help="시나리오별 대기 한도(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", action="store_true", help="임시 작업 디렉터리를 남김")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    json_path = os.path.abspath(args.json) if args.json else None
+    server = FakeNexonServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                             rate_limit=args.rate_limit, seed=args.seed).start()
+    names = list(server.fixtures)
+    count = args.count or len(names)
+    names = (names + [f"벤치{i}" for i in range(max(0, count - len(names)))])[:count]
+
+    # 설정 모듈을 읽기 전에 환경을 바꾸고, 상대 경로(DB·캐시·이미지)는 임시 디렉터리로
+    workdir = tempfile.mkdtemp(prefix="bench_api_")
+    os.chdir(workdir)
+    sys.path.insert(0, REPO_ROOT)
+    os.environ.update(NEXON_API_BASE=server.base_url, NEXON_API_KEY="bench")
+    if args.api_rate:
+        os.environ["NEXON_API_RATE"] = str(args.api_rate)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PySide6.QtGui import QGuiApplication
+    from config import NEXON_API_RATE
+    from data_layer import DataManager, current_week_key
+    from data_layer.database import init_db
+
+    app = QGuiApplication(sys.argv[:1])
+    init_db()
+    dm = DataManager()
+    dm.ensure_current_week()
+    week_key = current_week_key()
+
+    results = [
+        bench_add(app, dm, week_key, names, args.timeout),
+        bench_refresh_one(app, dm, args.timeout),
+        bench_refresh_all(app, dm, args.timeout),
+        bench_image_cold(app, dm, args.timeout),
+        bench_image_warm(dm),
+    ]
+    stats = dict(server.stats)
+    server.stop()
+
+    print(f"{count}명, 응답 지연 {args.latency * 1000:.0f}ms(+{args.jitter * 1000:.0f}), "
+          f"에러율 {args.error_rate:g}, 클라이언트 {NEXON_API_RATE:g}/s")
+    print(f"{'scenario':<12} {'ops':>5} {'fail':>5} {'total(s)':>9} {'ops/s':>7} "
+          f"{'p50(ms)':>9} {'p95(ms)':>9} {'max(ms)':>9}")
+    for r in results:
+        print(f"{r['scenario']:<12} {r['ops']:>5} {r['failures']:>5} {r['total_s']:>9} "
+              f"{r['ops_per_s']:>7} {r['p50_ms']:>9} {r['p95_ms']:>9} {r['max_ms']:>9}")
+    print(f"서버 {stats}")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"count": count, "latency": args.latency, "jitter": args.jitter,
+                       "error_rate": args.error_rate, "api_rate": NEXON_API_RATE,
+                       "server": stats, "results": results}, f, ensure_ascii=False, indent=2)
+
+    os.chdir(REPO_ROOT)
+    if not args.keep:
+        shutil.rmtree(workdir, ignore_errors=True)
+    else:
+        print(f"작업 디렉터리: {workdir}")
+    # 공용 asyncio 루프/스레드 풀 정리를 기다리지 않음
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
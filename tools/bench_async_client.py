@@ -0,0 +1,138 @@
+"""
+캐릭터 조회 지연 벤치마크 — 로컬 스텁 서버(응답 200ms) 기준.
+
+같은 N명 조회(OCID → 기본 정보)를 세 방식으로 비교한다.
+    serial   동기 클라이언트로 한 명씩
+    threads  조회마다 스레드 하나 (이전 CharacterFetchThread 방식)
+    asyncio  이벤트 루프 하나에서 동시에 (AsyncNexonClient)
+
+실행:
+    python -m tools.bench_async_client
+    python -m tools.bench_async_client --count 50 --latency 0.2 --json bench.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import threading
+import time
+
+from api.async_client import AsyncNexonClient
+from api.http_client import NexonClient, TokenBucket
+from tools.fake_nexon_server import FakeNexonServer, scratch_dir
+
+
+def _summary(label: str, total: float, latencies: list[float], server: FakeNexonServer,
+             threads: int) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "mode": label,
+        "total_s": round(total, 3),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+        "connections": server.stats["connections"],
+        "threads": threads,
+    }
+
+
+def _fetch_sync(client: NexonClient, name: str) -> None:
+    ocid = client.get("id", {"character_name": name}, use_cache=False).data["ocid"]
+    client.get("character/basic", {"ocid": ocid}, use_cache=False)
+
+
+def bench_serial(names: list[str], latency: float, rate: float) -> dict:
+    server = FakeNexonServer(latency=latency).start()
+    client = NexonClient(base_url=server.base_url, api_key="bench", rate=rate, burst=int(rate))
+    latencies = []
+    started = time.perf_counter()
+    for name in names:
+        t = time.perf_counter()
+        _fetch_sync(client, name)
+        latencies.append(time.perf_counter() - t)
+    result = _summary("serial", time.perf_counter() - started, latencies, server, 1)
+    server.stop()
+    return result
+
+
+def bench_threads(names: list[str], latency: float, rate: float) -> dict:
+    server = FakeNexonServer(latency=latency).start()
+    client = NexonClient(base_url=server.base_url, api_key="bench", rate=rate, burst=int(rate),
+                         pool_size=len(names))
+    latencies = []
+    lock = threading.Lock()
+
+    def work(name):
+        t = time.perf_counter()
+        _fetch_sync(client, name)
+        with lock:
+            latencies.append(time.perf_counter() - t)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=work, args=(n,)) for n in names]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    result = _summary("threads", time.perf_counter() - started, latencies, server, len(names))
+    server.stop()
+    return result
+
+
+def bench_asyncio(names: list[str], latency: float, rate: float, connections: int) -> dict:
+    server = FakeNexonServer(latency=latency).start()
+    client = AsyncNexonClient(base_url=server.base_url, api_key="bench",
+                              limiter=TokenBucket(rate, int(rate)), cache=None,
+                              max_connections=connections, share_sync_state=False)
+
+    async def timed(name):
+        t = time.perf_counter()
+        await client.fetch_character(name)
+        return time.perf_counter() - t
+
+    async def main():
+        try:
+            return await asyncio.gather(*(timed(n) for n in names))
+        finally:
+            client.close()
+
+    started = time.perf_counter()
+    latencies = asyncio.run(main())
+    result = _summary("asyncio", time.perf_counter() - started, latencies, server, 1)
+    server.stop()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="캐릭터 조회 지연 벤치마크")
+    parser.add_argument("--count", type=int, default=20, help="조회할 캐릭터 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="스텁 서버 응답 지연(초)")
+    parser.add_argument("--rate", type=float, default=1000, help="초당 호출 한도")
+    parser.add_argument("--connections", type=int, default=16, help="asyncio 동시 커넥션 수")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    names = [f"bench{i}" for i in range(args.count)]
+    json_path = os.path.abspath(args.json) if args.json else None
+    with scratch_dir("bench_async_"):
+        results = [
+            bench_serial(names, args.latency, args.rate),
+            bench_threads(names, args.latency, args.rate),
+            bench_asyncio(names, args.latency, args.rate, args.connections),
+        ]
+
+    print(f"{args.count}명 조회, 응답 지연 {args.latency * 1000:.0f}ms")
+    print(f"{'mode':<8} {'total(s)':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'conns':>6} {'threads':>8}")
+    for r in results:
+        print(f"{r['mode']:<8} {r['total_s']:>9} {r['p50_ms']:>9} {r['p95_ms']:>9} "
+              f"{r['connections']:>6} {r['threads']:>8}")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"count": args.count, "latency": args.latency, "results": results},
+                      f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+성능 회귀 검사 — tools.bench_suite 결과를 커밋된 기준선과 비교.
+
+항목마다 잡음 폭(band)을 정하고 현재 중앙값이 `기준 중앙값 + band`를 넘으면 회귀로 본다.
+
+    band = max(기준 중앙값 × --tolerance,
+               --noise × 1.4826 × max(기준 MAD, 현재 MAD),     # MAD → 표준편차 환산
+               --floor-ms)
+
+회귀가 하나라도 있으면 비교 표를 출력하고 종료 코드 1. 네트워크·디스플레이 없이 실행된다
+(합성 DB + offscreen Qt). 기준선은 측정한 기계에 묶이므로, 다른 기계에서 만든
+기준선이면 경고를 출력한다 — 그때는 --update-baseline으로 그 기계의 기준선을 새로 만든다.
+
+실행:
+    python -m tools.bench_gate                             # 기준선 규모를 돌려서 비교
+    python -m tools.bench_gate --current bench.json        # 이미 저장한 결과와 비교
+    python -m tools.bench_gate --update-baseline           # 현재 결과로 기준선 교체
+    python -m tools.bench_gate --tolerance 0.3 --filter db. --filter parquet.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from tools.synthetic_data import REPO_ROOT
+
+BASELINE_FILE = os.path.join(REPO_ROOT, "tools", "bench_baseline.json")
+DEFAULT_SCALES = ["small"]
+
+# 정규분포에서 MAD × 1.4826 ≈ 표준편차
+_MAD_TO_SIGMA = 1.4826
+
+
+def run_suite(scales: list[str], repeat: int, filters: list[str] | None) -> dict:
+    """tools.bench_suite를 별도 프로세스로 실행하고 JSON 결과를 읽는다."""
+    fd, path = tempfile.mkstemp(prefix="bench_gate_", suffix=".json")
+    os.close(fd)
+    cmd = [sys.executable, "-m", "tools.bench_suite", "--json", path, "--repeat", str(repeat)]
+    for scale in scales:
+        cmd += ["--scale", scale]
+    for f in filters or []:
+        cmd += ["--filter", f]
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    try:
+        proc = subprocess.run(cmd, cwd=REPO_ROOT, env=env)
+        if proc.returncode != 0:
+            raise RuntimeError(f"bench_suite 실패 (exit {proc.returncode})")
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        os.remove(path)
+
+
+def compare(baseline: dict, current: dict, tolerance: float, noise: float, floor_ms: float,
+            filters: list[str] | None = None) -> list[dict]:
+    """
+    Returns:
+        [{"scale": "small", "bench": "db.get_week_data", "base_ms": 0.80, "cur_ms": 0.95,
+          "band_ms": 0.5, "delta_pct": 18.8, "status": "ok"}, ...]
+        status: ok | regression | improved | new | missing
+    """
+    rows = []
+    for label, base_scale in baseline.get("scales", {}).items():
+        cur_scale = current.get("scales", {}).get(label)
+        if cur_scale is None:
+            continue     # 이번 실행에서 돌리지 않은 규모
+        if cur_scale.get("size") != base_scale.get("size"):
+            raise ValueError(f"{label}: 규모가 다름 ({base_scale.get('size')} ≠ {cur_scale.get('size')})")
+        names = sorted(set(base_scale["benchmarks"]) | set(cur_scale["benchmarks"]))
+        for name in names:
+            if filters and not any(f in name for f in filters):
+                continue
+            base = base_scale["benchmarks"].get(name)
+            cur = cur_scale["benchmarks"].get(name)
+            row = {"scale": label, "bench": name,
+                   "base_ms": base and base["median_ms"], "cur_ms": cur and cur["median_ms"],
+                   "band_ms": None, "delta_pct": None}
+            if base is None or cur is None:
+                row["status"] = "new" if base is None else "missing"
+                rows.append(row)
+                continue
+            mad = max(base.get("mad_ms", base["stdev_ms"]), cur.get("mad_ms", cur["stdev_ms"]))
+            band = max(base["median_ms"] * tolerance, noise * _MAD_TO_SIGMA * mad, floor_ms)
+            diff = cur["median_ms"] - base["median_ms"]
+            row["band_ms"] = round(band, 3)
+            row["delta_pct"] = round(diff / base["median_ms"] * 100, 1) if base["median_ms"] else None
+            row["status"] = "regression" if diff > band else "improved" if diff < -band else "ok"
+            rows.append(row)
+    return rows
+
+
+def format_table(rows: list[dict], only_changed: bool = False) -> str:
+    marks = {"ok": " ", "regression": "✗", "improved": "↓", "new": "+", "missing": "-"}
+    lines = [f"  {'':1} {'scale':<8} {'benchmark':<44} {'baseline':>11} {'current':>11} "
+             f"{'delta':>8} {'band':>10}"]
+    for r in rows:
+        if only_changed and r["status"] == "ok":
+            continue
+        base = f"{r['base_ms']:.2f}ms" if r["base_ms"] is not None else "-"
+        cur = f"{r['cur_ms']:.2f}ms" if r["cur_ms"] is not None else "-"
+        delta = f"{r['delta_pct']:+.1f}%" if r["delta_pct"] is not None else ""
+        band = f"±{r['band_ms']:.2f}ms" if r["band_ms"] is not None else ""
+        lines.append(f"  {marks[r['status']]} {r['scale']:<8} {r['bench']:<44} {base:>11} {cur:>11} "
+                     f"{delta:>8} {band:>10}")
+    return "\n".join(lines)
+
+
+def _environment_warning(baseline: dict, current: dict) -> str | None:
+    keys = ("platform", "cpu_count", "python", "polars", "pyside6")
+    base, cur = baseline.get("meta", {}), current.get("meta", {})
+    diff = [f"{k} {base.get(k)} → {cur.get(k)}" for k in keys if base.get(k) != cur.get(k)]
+    if diff:
+        return "기준선과 실행 환경이 다름 (" + ", ".join(diff) + ") — 결과 해석에 주의"
+    return None
+
+
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 성능 회귀 검사")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="기준선 JSON")
+    parser.add_argument("--current", metavar="PATH", help="새로 돌리지 않고 이 결과 JSON과 비교")
+    parser.add_argument("--scale", action="append",
+                        help="돌릴 규모 (기본: 기준선에 있는 규모, 기준선이 없으면 small)")
+    parser.add_argument("--filter", action="append", help="이 문자열이 들어간 항목만")
+    parser.add_argument("--repeat", type=int, default=9, help="항목별 최대 실행 횟수")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 상대 증가 (0.25 = 25%%)")
+    parser.add_argument("--noise", type=float, default=3.0, help="잡음 폭 배수 (MAD 기반 표준편차의 몇 배)")
+    parser.add_argument("--floor-ms", type=float, default=0.5, help="이보다 작은 차이는 무시 (ms)")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 결과를 기준선으로 저장")
+    parser.add_argument("--all", action="store_true", help="변화 없는 항목도 표에 출력")
+    args = parser.parse_args()
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    elif not args.update_baseline:
+        print(f"[Gate] 기준선 없음: {args.baseline} (--update-baseline으로 생성)")
+        sys.exit(2)
+
+    if args.current:
+        with open(args.current, encoding="utf-8") as f:
+            current = json.load(f)
+    else:
+        scales = args.scale or (list(baseline["scales"]) if baseline else DEFAULT_SCALES)
+        current = run_suite(scales, args.repeat, args.filter)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"[Gate] 기준선 저장: {args.baseline}")
+        return
+
+    warning = _environment_warning(baseline, current)
+    if warning:
+        print(f"[Gate] {warning}")
+
+    rows = compare(baseline, current, args.tolerance, args.noise, args.floor_ms, args.filter)
+    regressions = [r for r in rows if r["status"] == "regression"]
+    counts = {s: sum(r["status"] == s for r in rows) for s in ("ok", "regression", "improved", "new", "missing")}
+
+    print()
+    print(format_table(rows, only_changed=not args.all))
+    print(f"\n[Gate] 비교 {len(rows)}개 — 유지 {counts['ok']}, 회귀 {counts['regression']}, "
+          f"개선 {counts['improved']}, 신규 {counts['new']}, 누락 {counts['missing']}")
+    if regressions:
+        worst = max(regressions, key=lambda r: r["delta_pct"] or 0)
+        print(f"[Gate] 실패: {worst['scale']}/{worst['bench']} {worst['delta_pct']:+.1f}% "
+              f"(기준 {worst['base_ms']:.2f}ms → {worst['cur_ms']:.2f}ms)")
+        sys.exit(1)
+    print("[Gate] 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+앱 시작 시간 벤치마크 + 예산 검사 (offscreen 플랫폼).
+
+    import_ms       python -X importtime -c "import main" 의 누적 import 시간
+    first_paint_ms  프로세스 시작 → BossTrackerApp 첫 Paint 이벤트
+    stats_open_ms   첫 화면 이후 통계 탭을 처음 열 때 생성 + 갱신 (LazyTab)
+
+첫 화면 시점에 무거운 모듈(polars, QtCharts)이 올라와 있으면 예산 위반으로 본다.
+작업 트리 DB를 건드리지 않도록 DB·이미지·폰트를 임시 디렉터리에 복사해서 실행한다.
+중앙값이 tools/startup_budget.json의 예산을 넘으면 종료 코드 1.
+
+실행:
+    python -m tools.bench_startup
+    python -m tools.bench_startup --runs 5 --json startup.json
+    python -m tools.bench_startup --data /path/to/app/dir   # 다른 DB로 측정
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(REPO_ROOT, "tools", "startup_budget.json")
+# DB는 -wal까지 파일째 복사 — 체크포인트 안 된 변경은 -wal에만 있고, SQLite로 열어 옮기면
+# 닫을 때 체크포인트가 원본(저장소) DB 파일을 바꾼다
+APP_FILES = ["boss_data.db", "boss_data.db-wal", "warm_start.json", "style.qss", "icon.png"]
+APP_DIRS = ["character_images", "fonts"]
+
+
+def prepare_workdir(data_dir: str) -> str:
+    """앱이 시작할 때 읽는 파일만 임시 디렉터리로 복사."""
+    workdir = tempfile.mkdtemp(prefix="bench_startup_")
+    for name in APP_FILES:
+        if os.path.exists(os.path.join(data_dir, name)):
+            shutil.copy2(os.path.join(data_dir, name), workdir)
+    for name in APP_DIRS:
+        if os.path.isdir(os.path.join(data_dir, name)):
+            shutil.copytree(os.path.join(data_dir, name), os.path.join(workdir, name))
+    return workdir
+
+
+def _child_env() -> dict:
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (REPO_ROOT, env.get("PYTHONPATH")) if p)
+    return env
+
+
+# ---------------------------------------------------------------------------
+# import 시간
+# ---------------------------------------------------------------------------
+
+def measure_imports(workdir: str) -> dict:
+    """
+    Returns:
+        {"import_ms": 312.4, "top": [["ui.app", 250.1], ["PySide6.QtWidgets", 40.2], ...]}
+    """
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                          cwd=workdir, env=_child_env(), capture_output=True, text=True)
+    total_us, top = 0, []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, raw = line.split("|", 2)
+        depth = (len(raw) - len(raw.lstrip()) - 1) // 2
+        if depth == 0:
+            total_us += int(cumulative)
+        if depth <= 1:
+            top.append([raw.strip(), round(int(cumulative) / 1000, 1)])
+    top.sort(key=lambda t: t[1], reverse=True)
+    return {"import_ms": round(total_us / 1000, 1), "top": top[:8]}
+
+
+# ---------------------------------------------------------------------------
+# 첫 화면 (자식 프로세스)
+# ---------------------------------------------------------------------------
+
+def measure_first_paint(workdir: str, forbidden: list[str]) -> dict:
+    """
+    Returns:
+        {"first_paint_ms": 480.2, "stats_open_ms": 350.7, "loaded_heavy": []}
+    """
+    started = time.time()
+    proc = subprocess.run([sys.executable, "-m", "tools.bench_startup", "--child",
+                           "--started", repr(started), "--forbidden", *forbidden],
+                          cwd=workdir, env=_child_env(), capture_output=True, text=True,
+                          timeout=120)
+    for line in proc.stdout.splitlines():
+        if line.startswith("BENCH "):
+            return json.loads(line[len("BENCH "):])
+    raise RuntimeError(f"자식 프로세스 결과 없음 (exit {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+
+def _child(started: float, forbidden: list[str]) -> None:
+    import main as entry
+    from PySide6.QtCore import QEvent, QObject
+
+    from ui.app import BossTrackerApp
+
+    class PaintWatcher(QObject):
+        painted_at = None
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and self.painted_at is None:
+                self.painted_at = time.time()
+            return False
+
+    def wait(app, predicate, timeout=30.0):
+        deadline = time.monotonic() + timeout
+        while not predicate() and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.001)
+
+    app = entry.create_application(sys.argv[:1])
+    win = BossTrackerApp()
+    watcher = PaintWatcher()
+    win.installEventFilter(watcher)
+    win.show()
+    wait(app, lambda: watcher.painted_at is not None)
+    loaded_heavy = [m for m in forbidden if m in sys.modules]
+
+    # 통계 탭 첫 진입: LazyTab 생성 → 무효화 버스가 스냅샷 + refresh
+    tab = win._weekly_stats_tab
+    opened = time.perf_counter()
+    win._tabs.setCurrentWidget(tab)
+    wait(app, lambda: tab.is_built() and not win._bus.is_dirty("weekly_stats"))
+    app.processEvents()
+    stats_open = time.perf_counter() - opened
+
+    result = {
+        "first_paint_ms": round((watcher.painted_at - started) * 1000, 1),
+        "stats_open_ms": round(stats_open * 1000, 1),
+        "loaded_heavy": loaded_heavy,
+    }
+    print("BENCH " + json.dumps(result), flush=True)
+    os._exit(0)
+
+
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="앱 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--data", default=REPO_ROOT, help="DB·이미지를 복사해 올 앱 디렉터리")
+    parser.add_argument("--budget", default=BUDGET_FILE, help="예산 파일")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--started", type=float, help=argparse.SUPPRESS)
+    parser.add_argument("--forbidden", nargs="*", default=[], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.started, args.forbidden)
+        return
+
+    with open(args.budget, encoding="utf-8") as f:
+        budget = json.load(f)
+    forbidden = budget.get("forbidden_at_first_paint", [])
+
+    workdir = prepare_workdir(args.data)
+    try:
+        imports = [measure_imports(workdir) for _ in range(args.runs)]
+        paints = [measure_first_paint(workdir, forbidden) for _ in range(args.runs)]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    result = {
+        "runs": args.runs,
+        "import_ms": statistics.median(r["import_ms"] for r in imports),
+        "first_paint_ms": statistics.median(r["first_paint_ms"] for r in paints),
+        "stats_open_ms": statistics.median(r["stats_open_ms"] for r in paints),
+        "loaded_heavy": sorted({m for r in paints for m in r["loaded_heavy"]}),
+        "top_imports": imports[-1]["top"],
+    }
+
+    violations = [f"{key} {result[key]:.0f}ms > 예산 {budget[key]}ms"
+                  for key in ("import_ms", "first_paint_ms", "stats_open_ms")
+                  if key in budget and result[key] > budget[key]]
+    if result["loaded_heavy"]:
+        violations.append(f"첫 화면 전에 로드됨: {', '.join(result['loaded_heavy'])}")
+    result["violations"] = violations
+
+    print(f"{'metric':<16} {'median(ms)':>11} {'budget(ms)':>11}")
+    for key in ("import_ms", "first_paint_ms", "stats_open_ms"):
+        print(f"{key:<16} {result[key]:>11.1f} {budget.get(key, '-'):>11}")
+    print("import 상위: " + ", ".join(f"{name} {ms}ms" for name, ms in result["top_imports"]))
+    for v in violations:
+        print(f"[Budget] 초과: {v}")
+    print("예산 통과" if not violations else "예산 초과")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    sys.exit(1 if violations else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+데이터 계층 · 통계 탭 벤치마크 모음 (offscreen, 합성 데이터).
+
+규모(캐릭터 x 보스 x 주차)마다 임시 디렉터리에 tools.synthetic_data로 DB를 만들고
+실제 앱 코드를 그대로 호출해 시간을 잰다.
+
+    db.*       DataManager — ensure_current_week(주차 초기화), get_week_data, 수익 요약, 체크 토글 처리량
+    parquet.*  ParquetStore — snapshot, 각 집계 메서드 (load 포함)
+    fmt.*      utils.formatters — 1만 회 호출
+    chart.*    통계 탭 — CharStatsTab 꺾은선/달성률 차트 생성, 탭별 refresh
+
+각 항목은 warmup 1회 후 --repeat회(항목당 --budget초를 넘으면 최소 3회에서 중단) 실행하고
+중앙값·최소·최대·표준편차·MAD를 기록한다. --json으로 저장한 결과는
+tools.bench_gate가 기준선과 비교하는 데 쓴다.
+
+실행:
+    python -m tools.bench_suite                       # small, medium
+    python -m tools.bench_suite --scale large --json bench.json
+    python -m tools.bench_suite --scale 50x30x104 --filter parquet. --repeat 15
+    python -m tools.bench_suite --list
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from tools.synthetic_data import REPO_ROOT, SCALES, Scale, generate
+
+DEFAULT_SCALES = ["small", "medium"]
+TOGGLES_PER_RUN = 200
+FORMAT_CALLS = 10_000
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[], object]
+    setup: Callable[[], None] | None = None   # 매 실행 전 (시간에 포함 안 됨)
+    ops: int = 1                               # 한 번 실행에 처리하는 작업 수 (처리량 계산용)
+
+
+def measure(case: Case, repeat: int, budget_s: float, min_runs: int = 3) -> dict:
+    """
+    Returns:
+        {"runs": 7, "ops": 1, "median_ms": 12.3, "mean_ms": 12.6, "min_ms": 11.9,
+         "max_ms": 14.0, "stdev_ms": 0.7, "mad_ms": 0.3, "ops_per_s": 81.3}
+    """
+    if case.setup:
+        case.setup()
+    case.run()        # warmup (import·캐시 적재 제외)
+
+    times = []
+    spent = 0.0
+    while len(times) < repeat and (len(times) < min_runs or spent < budget_s):
+        if case.setup:
+            case.setup()
+        started = time.perf_counter()
+        case.run()
+        elapsed = time.perf_counter() - started
+        times.append(elapsed * 1000)
+        spent += elapsed
+
+    median = statistics.median(times)
+    return {
+        "runs": len(times),
+        "ops": case.ops,
+        "median_ms": round(median, 3),
+        "mean_ms": round(statistics.fmean(times), 3),
+        "min_ms": round(min(times), 3),
+        "max_ms": round(max(times), 3),
+        "stdev_ms": round(statistics.stdev(times), 3) if len(times) > 1 else 0.0,
+        # 중앙값 절대 편차 — 튀는 실행 한두 번에 덜 흔들리는 잡음 폭 (회귀 검사에서 사용)
+        "mad_ms": round(statistics.median(abs(t - median) for t in times), 3),
+        "ops_per_s": round(case.ops / (median / 1000), 1) if median else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# 항목
+# ---------------------------------------------------------------------------
+
+def db_cases(dm, info: dict) -> list[Case]:
+    from data_layer import current_week_key
+    from data_layer.database import get_connection
+
+    current = current_week_key()
+    last_week = info["week_keys"][-1]
+
+    def drop_current_week():
+        with get_connection() as conn:
+            conn.execute("DELETE FROM weekly_checks WHERE week_key = ?", (current,))
+
+    rows = [(r["character"], r["boss_name"]) for r in dm.get_weekly_checks(last_week)]
+    toggles = [rows[i % len(rows)] for i in range(TOGGLES_PER_RUN)]
+    state = {"checked": True}
+
+    def toggle_many():
+        checked = state["checked"] = not state["checked"]
+        for character, boss_name in toggles:
+            dm.set_boss_checked(last_week, character, boss_name, checked)
+
+    return [
+        Case("db.ensure_current_week", dm.ensure_current_week, setup=drop_current_week),
+        Case("db.get_week_data", lambda: dm.get_week_data(last_week)),
+        Case("db.get_character_income_summary", lambda: dm.get_character_income_summary(last_week)),
+        Case("db.get_all_week_keys", dm.get_all_week_keys),
+        Case("db.toggle", toggle_many, ops=TOGGLES_PER_RUN),
+    ]
+
+
+def parquet_cases(store, info: dict) -> list[Case]:
+    last_week = info["week_keys"][-1]
+    character = info["characters"][0]
+    return [
+        Case("parquet.snapshot", store.snapshot),
+        Case("parquet.weekly_totals", store.weekly_totals),
+        Case("parquet.character_totals", lambda: store.character_totals(last_week)),
+        Case("parquet.boss_contribution", lambda: store.boss_contribution(last_week)),
+        Case("parquet.accumulated_total", store.accumulated_total),
+        Case("parquet.boss_contribution_all", store.boss_contribution_all),
+        Case("parquet.power_vs_income", lambda: store.power_vs_income(character)),
+        Case("parquet.characters", store.characters),
+        Case("parquet.achievement_rates", lambda: store.achievement_rates(last_week)),
+    ]
+
+
+def format_cases() -> list[Case]:
+    from utils import format_currency_ko, format_power_ko
+
+    values = [i * 7_919_993 for i in range(FORMAT_CALLS)]
+    return [
+        Case("fmt.format_currency_ko", lambda: [format_currency_ko(v) for v in values], ops=FORMAT_CALLS),
+        Case("fmt.format_power_ko", lambda: [format_power_ko(v) for v in values], ops=FORMAT_CALLS),
+    ]
+
+
+def chart_cases(app, store, info: dict) -> list[Case]:
+    from ui.stats_tab import WeeklyStatsTab, BossStatsTab, CharStatsTab, GrowthStatsTab
+
+    last_week = info["week_keys"][-1]
+    tabs = {cls.__name__: cls(store=store) for cls in
+            (WeeklyStatsTab, BossStatsTab, CharStatsTab, GrowthStatsTab)}
+    char_tab = tabs["CharStatsTab"]
+
+    def build(make):
+        def run():
+            view = make()
+            view.deleteLater()
+            app.processEvents()
+        return run
+
+    def refresh(tab):
+        def run():
+            tab.refresh()
+            app.processEvents()
+        return run
+
+    cases = [
+        Case("chart.CharStatsTab._build_line_chart", build(char_tab._build_line_chart)),
+        Case("chart.CharStatsTab._build_achievement_chart",
+             build(lambda: char_tab._build_achievement_chart(last_week))),
+    ]
+    cases += [Case(f"chart.{name}.refresh", refresh(tab)) for name, tab in tabs.items()]
+    return cases
+
+
+# ---------------------------------------------------------------------------
+# 실행
+# ---------------------------------------------------------------------------
+
+def run_scale(app, label: str, scale: Scale, args, workdir: str) -> dict:
+    scale_dir = os.path.join(workdir, scale.name)
+    os.makedirs(scale_dir, exist_ok=True)
+    os.chdir(scale_dir)       # DB·Parquet는 설정의 상대 경로 → 규모별 디렉터리
+
+    from data_layer import DataManager
+    from data_layer.parquet_store import ParquetStore
+
+    info = generate(scale, seed=args.seed)
+    print(f"\n== {label} ({scale.name}, weekly_checks {info['weekly_checks']}행, "
+          f"생성 {info['elapsed_s']}s) ==")
+
+    dm, store = DataManager(), ParquetStore()
+    store.snapshot()
+    groups = [
+        lambda: db_cases(dm, info),
+        lambda: parquet_cases(store, info),
+        format_cases,
+        lambda: chart_cases(app, store, info),
+    ]
+
+    results = {}
+    for make_cases in groups:
+        for case in make_cases():
+            if args.filter and not any(f in case.name for f in args.filter):
+                continue
+            stats = measure(case, args.repeat, args.budget)
+            results[case.name] = stats
+            rate = f"{stats['ops_per_s']:>12,.0f}/s" if case.ops > 1 else ""
+            print(f"  {case.name:<44} {stats['median_ms']:>10.2f}ms  "
+                  f"±{stats['stdev_ms']:<8.2f} n={stats['runs']:<3}{rate}")
+    return {"size": scale.name, "weekly_checks": info["weekly_checks"], "benchmarks": results}
+
+
+def _meta() -> dict:
+    import polars
+    import PySide6
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "polars": polars.__version__,
+        "pyside6": PySide6.__version__,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="데이터 계층 · 통계 탭 벤치마크")
+    parser.add_argument("--scale", action="append",
+                        help=f"프리셋({', '.join(SCALES)}) 또는 캐릭터x보스x주차 (여러 번 지정 가능)")
+    parser.add_argument("--filter", action="append", help="이 문자열이 들어간 항목만 (여러 번 지정 가능)")
+    parser.add_argument("--repeat", type=int, default=7, help="항목별 최대 실행 횟수")
+    parser.add_argument("--budget", type=float, default=5.0, help="항목별 시간 한도(초), 최소 3회는 실행")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    parser.add_argument("--keep", action="store_true", help="임시 작업 디렉터리를 남김")
+    parser.add_argument("--list", action="store_true", help="규모 프리셋 출력")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, scale in SCALES.items():
+            print(f"{name:<8} {scale.name}")
+        return
+
+    scales = [(s, SCALES[s] if s in SCALES else Scale.parse(s)) for s in (args.scale or DEFAULT_SCALES)]
+    json_path = os.path.abspath(args.json) if args.json else None
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, REPO_ROOT)
+    workdir = tempfile.mkdtemp(prefix="bench_suite_")
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    report = {"meta": _meta(), "config": {"repeat": args.repeat, "budget_s": args.budget,
+                                          "seed": args.seed}, "scales": {}}
+    try:
+        for label, scale in scales:
+            report["scales"][label] = run_scale(app, label, scale, args, workdir)
+    finally:
+        os.chdir(REPO_ROOT)
+        if args.keep:
+            print(f"\n작업 디렉터리: {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+트래커 서버 점검 — 임시 합성 DB로 daemon.TrackerServer(port=0)를 띄워 HTTP로 확인.
+
+    batch     동시에 들어온 체크 여러 개가 한 트랜잭션으로 커밋 (묶음 수 < 쓰기 수), 값도 반영
+    rollback  같은 묶음의 실패한 쓰기는 SAVEPOINT까지만 되돌리고 나머지 쓰기는 커밋
+    events    /api/events long poll이 다른 클라이언트의 쓰기로 바로 깨어남,
+              서버를 다시 띄우면 예전 순번으로 물은 클라이언트는 reset
+    snapshot  RemoteParquetStore가 /api/snapshot/*을 받아 로컬 ParquetStore와 같은 집계,
+              쓰기 후에는 새 스냅샷
+
+실행:
+    python -m tools.daemon_check          # 실패 시 exit 1
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+from tools.synthetic_data import REPO_ROOT, Scale, generate
+from tools.sync_check import _Check, _checked, _dm
+
+_BATCH_MS = 200      # 동시 쓰기가 한 묶음에 들어가도록 넉넉히
+_WRITERS = 12
+
+
+def _concurrently(calls: list) -> list:
+    """호출을 스레드에서 한꺼번에 시작해 (결과 또는 예외) 목록 반환."""
+    results = [None] * len(calls)
+    barrier = threading.Barrier(len(calls))
+
+    def run(i, call):
+        barrier.wait()
+        try:
+            results[i] = call()
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=run, args=(i, c)) for i, c in enumerate(calls)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def _boss_value(path: str, boss: str) -> int | None:
+    from data_layer.database import connect
+
+    conn = connect(path)
+    try:
+        row = conn.execute("SELECT value FROM boss_list WHERE name = ?", (boss,)).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+# ---------------------------------------------------------------------------
+# 시나리오
+# ---------------------------------------------------------------------------
+
+def scenario_batch(check: _Check, server, db: str, rows: list, week: str) -> None:
+    from data_layer.remote import RemoteDataManager
+
+    before = server.health()
+    clients = [RemoteDataManager(server.base_url) for _ in range(_WRITERS)]
+    targets = rows[:_WRITERS]
+    _concurrently([lambda c=c, r=r: c.set_boss_checked(week, r["character"], r["boss_name"], not r["checked"])
+                   for c, r in zip(clients, targets)])
+    health = server.health()
+    writes, batches = health["writes"] - before["writes"], health["batches"] - before["batches"]
+    print(f"  쓰기 {writes}건 → 커밋 {batches}회 (최대 묶음 {health['max_batch']})")
+    check.expect("동시 쓰기를 묶어서 커밋", writes == _WRITERS and batches < writes, str(health))
+    check.expect("모든 쓰기가 반영",
+                 all(_checked(db, week, r["character"], r["boss_name"]) == 1 - r["checked"] for r in targets))
+
+
+def scenario_rollback(check: _Check, server, db: str, rows: list, week: str) -> None:
+    from data_layer.remote import RemoteDataManager, RemoteError
+
+    boss = rows[0]["boss_name"]
+    value = _boss_value(db, boss)
+    targets = rows[_WRITERS:_WRITERS * 2]
+    before = server.health()
+    clients = [RemoteDataManager(server.base_url) for _ in range(len(targets) + 1)]
+    # 시세 None: boss_list UPDATE는 되고 이력 INSERT(NOT NULL)에서 실패 → UPDATE까지 되돌려야 함
+    calls = [lambda: clients[0].update_boss_price(boss, None, week, "실패해야 함")]
+    calls += [lambda c=c, r=r: c.set_boss_checked(week, r["character"], r["boss_name"], not r["checked"])
+              for c, r in zip(clients[1:], targets)]
+    results = _concurrently(calls)
+    health = server.health()
+    print(f"  쓰기 {health['writes'] - before['writes']}건, 실패 {health['failed_writes'] - before['failed_writes']}건, "
+          f"커밋 {health['batches'] - before['batches']}회")
+    check.expect("실패한 쓰기는 호출한 쪽에 오류", isinstance(results[0], RemoteError), repr(results[0]))
+    check.expect("실패한 쓰기와 같은 묶음이 있었음", health["batches"] - before["batches"] < len(calls), str(health))
+    check.expect("실패한 쓰기의 앞부분도 되돌림", _boss_value(db, boss) == value)
+    check.expect("나머지 쓰기는 커밋", all(r is None for r in results[1:])
+                 and all(_checked(db, week, r["character"], r["boss_name"]) == 1 - r["checked"] for r in targets),
+                 repr(results[1:]))
+
+
+def scenario_events(check: _Check, server, db: str, rows: list, week: str) -> "object":
+    from daemon import TrackerServer
+    from data_layer.remote import RemoteDataManager
+
+    listener, writer = RemoteDataManager(server.base_url), RemoteDataManager(server.base_url)
+    since = listener.wait_events(0, 0)["seq"]
+    r = rows[-1]
+    box = {}
+
+    def poll():
+        started = time.perf_counter()
+        box["reply"] = listener.wait_events(since, 10)
+        box["elapsed"] = time.perf_counter() - started
+
+    thread = threading.Thread(target=poll)
+    thread.start()
+    time.sleep(0.3)
+    writer.set_boss_checked(week, r["character"], r["boss_name"], not r["checked"])
+    thread.join()
+    events = box["reply"]["events"]
+    print(f"  {box['elapsed'] * 1000:.0f}ms 만에 응답, 알림 {len(events)}건")
+    check.expect("쓰기로 long poll이 깨어남", box["elapsed"] < 5 and len(events) == 1, str(box["reply"]))
+    check.expect("알림에 메서드·보낸 클라이언트",
+                 events and events[0]["method"] == "set_boss_checked" and events[0]["client"] == writer.client_id,
+                 str(events))
+
+    seq = box["reply"]["seq"]
+    server.stop()
+    server = TrackerServer(db, port=0, batch_ms=_BATCH_MS).start()
+    reply = RemoteDataManager(server.base_url).wait_events(seq, 0)
+    check.expect("서버를 다시 띄우면 예전 순번은 reset", reply["reset"] and not reply["events"], str(reply))
+    return server
+
+
+def scenario_snapshot(check: _Check, server, db: str, work: str, rows: list, week: str) -> None:
+    from data_layer.parquet_store import ParquetStore
+    from data_layer.remote import RemoteDataManager, TrackerClient
+    from data_layer.remote_store import RemoteParquetStore
+
+    def views(store) -> dict:
+        return {"weekly_totals": store.weekly_totals(), "accumulated": store.accumulated_total(),
+                "characters": store.characters(),
+                "bosses": sorted(map(tuple, (r.values() for r in store.boss_contribution_all())))}
+
+    def local_views() -> dict:
+        store = ParquetStore(os.path.join(work, "local.parquet"), os.path.join(work, "local_hist.parquet"),
+                             db_path=db)
+        store.snapshot()
+        return views(store)
+
+    remote = RemoteParquetStore(TrackerClient(server.base_url), cache_dir=os.path.join(work, "remote_cache"))
+    remote.snapshot()
+    check.expect("스냅샷 파일 두 개 받음", os.path.exists(remote.path) and os.path.exists(remote.history_path))
+    check.expect("원격 집계가 로컬과 같음", views(remote) == local_views())
+
+    before = remote.accumulated_total()
+    r = next(r for r in rows if not _checked(db, week, r["character"], r["boss_name"]))
+    RemoteDataManager(server.base_url).set_boss_checked(week, r["character"], r["boss_name"], True)
+    remote.snapshot()
+    after = remote.accumulated_total()
+    check.expect("쓰기 후 새 스냅샷", after == before + r["boss_value"], f"{before} → {after}")
+    check.expect("쓰기 후에도 로컬과 같음", views(remote) == local_views())
+
+
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    sys.path.insert(0, REPO_ROOT)
+    from daemon import TrackerServer
+
+    work = tempfile.mkdtemp(prefix="daemon_check_")
+    cwd = os.getcwd()
+    os.chdir(work)
+    check = _Check()
+    server = None
+    try:
+        db = os.path.join(work, "daemon.db")
+        dm = _dm(db)
+        generate(Scale(3, 15, 4))
+        week = dm.get_all_week_keys()[-1]
+        rows = [dict(r) for r in dm.get_weekly_checks(week)]
+        server = TrackerServer(db, port=0, batch_ms=_BATCH_MS).start()
+        print(f"[batch] {server.base_url}")
+        scenario_batch(check, server, db, rows, week)
+        print("[rollback]")
+        scenario_rollback(check, server, db, rows, week)
+        print("[events]")
+        server = scenario_events(check, server, db, rows, week)
+        print("[snapshot]")
+        scenario_snapshot(check, server, db, work, rows, week)
+    finally:
+        if server is not None:
+            server.stop()
+        os.chdir(cwd)
+        shutil.rmtree(work, ignore_errors=True)
+    print(f"\n[Daemon] {'통과' if not check.failures else f'실패 {check.failures}건'}")
+    sys.exit(1 if check.failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,521 @@
+"""
+로컬 Nexon Open API 스텁 서버 + HTTP 클라이언트 점검 스크립트.
+
+실제 API 키/호출 한도 없이 api 모듈 전체(동기·asyncio 클라이언트, 이미지 저장소)를
+돌려 볼 수 있다. id / character/basic / character/stat 과 캐릭터 이미지 URL을
+녹화된 응답(tools/fixtures/nexon_characters.json)으로 돌려주고, 픽스처에 없는
+이름은 이름 해시로 만든 결정적 응답을 돌려준다 (synthesize=False면 400).
+지연(+지터), 429 (초당 한도 초과 / N번째 요청마다), 5xx를 주입할 수 있고,
+ETag를 붙여 조건부 요청(304)도 흉내 낸다.
+
+앱을 스텁 서버에 붙이려면 환경 변수로 주소를 바꾼다:
+    NEXON_API_BASE=http://127.0.0.1:8080/maplestory/v1 NEXON_API_KEY=test python main.py
+
+실행:
+    python -m tools.fake_nexon_server                 # 클라이언트 점검
+    python -m tools.fake_nexon_server --serve 8080    # 서버만 실행
+    python -m tools.fake_nexon_server --record 쿠루리우타 폴짝돌   # 실제 API 응답 녹화 (키 필요)
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import random
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import zlib
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_FILE = os.path.join(REPO_ROOT, "tools", "fixtures", "nexon_characters.json")
+IMAGE_PREFIX = "/static/maplestory/character/look/"
+
+_SYNTH_CLASSES = ["아크메이지(불,독)", "비숍", "나이트로드", "엔젤릭버스터", "카데나", "렌", "제논"]
+
+
+def load_fixtures(path: str = FIXTURE_FILE) -> dict:
+    """
+    녹화된 응답 로드.
+
+    Returns:
+        {"쿠루리우타": {"ocid": ..., "basic": {...}, "stat": {...},
+                        "image": "character_images/쿠루리우타.png"}, ...}
+        basic.character_image는 서버 기준 경로 ("/static/maplestory/character/look/...")
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["characters"]
+
+
+def placeholder_png(size: int = 96, seed: int = 0) -> bytes:
+    """이미지 픽스처가 없을 때 쓰는 단색 PNG (Qt 없이 생성)."""
+    rgb = bytes(((seed >> 16) & 0xFF, (seed >> 8) & 0xFF, seed & 0xFF))
+    raw = b"".join(b"\x00" + rgb * size for _ in range(size))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (struct.pack(">I", len(data)) + tag + data
+                + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    # 기본 listen 대기열(5)은 동시 연결 16~20개에서 넘쳐 일부 클라이언트가 SYN 재전송(1초)을 기다린다
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FakeNexonServer:
+    """
+    스레드에서 도는 스텁 서버.
+
+    latency:       응답 전 지연(초), jitter만큼 무작위로 더해짐
+    rate_limit:    초당 허용 API 요청 수 (초과 시 429 + Retry-After), None이면 무제한
+    throttle_every: N번째 API 요청마다 429 (0이면 끔)
+    error_rate:    500 응답 확률 (이미지 요청 포함)
+    etags:         200 응답에 ETag를 붙이고 If-None-Match가 맞으면 304
+    fixtures:      녹화된 응답 (None이면 FIXTURE_FILE)
+    synthesize:    픽스처에 없는 이름도 해시 기반 응답 생성 (False면 400)
+
+    이미지(/static/...)는 호출 한도·API 키 검사 대상이 아니다 (실서비스 CDN과 동일).
+    stats의 requests는 이미지를 포함한 전체 요청 수 (ok·not_modified·errors도 같은 기준),
+    images는 그중 이미지 응답 수.
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.0, rate_limit: float | None = None,
+                 throttle_every: int = 0, error_rate: float = 0.0, seed: int = 0,
+                 etags: bool = False, jitter: float = 0.0, fixtures: dict | None = None,
+                 synthesize: bool = True):
+        self.latency = latency
+        self.jitter = jitter
+        self.etags = etags
+        self.rate_limit = rate_limit
+        self.throttle_every = throttle_every
+        self.error_rate = error_rate
+        self.synthesize = synthesize
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._recent: deque[float] = deque()
+        self._api_calls = 0
+        self.stats = {"requests": 0, "ok": 0, "not_modified": 0, "throttled": 0, "errors": 0,
+                      "images": 0, "connections": 0}
+
+        self.fixtures = load_fixtures() if fixtures is None else fixtures
+        self._by_ocid = {c["ocid"]: c for c in self.fixtures.values()}
+        self._images = {c["basic"]["character_image"]: c.get("image")
+                        for c in self.fixtures.values()}
+        self._image_files = sorted({p for p in self._images.values() if p})
+        self._image_cache: dict[str, bytes] = {}
+        self._synth_names: dict[str, str] = {}
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"   # keep-alive 지원
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.stats["connections"] += 1
+
+            def do_GET(self):
+                status, body, headers = server.handle(self.path, self.headers)
+                if isinstance(body, bytes):
+                    data, content_type = body, "image/png"
+                else:
+                    data = b"" if status == 304 else json.dumps(body, ensure_ascii=False).encode("utf-8")
+                    content_type = "application/json; charset=utf-8"
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = _HTTPServer(("127.0.0.1", port), Handler)
+        self._thread = None
+
+    @property
+    def origin(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.origin}/maplestory/v1"
+
+    def start(self) -> "FakeNexonServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    # ------------------------------------------------------------------
+
+    def _delay(self) -> None:
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+
+    def _throttle(self) -> bool:
+        with self._lock:
+            self.stats["requests"] += 1
+            self._api_calls += 1      # N번째 요청마다 429는 API 호출만 센다 (이미지 제외)
+            if self.throttle_every and self._api_calls % self.throttle_every == 0:
+                return True
+            if self.rate_limit:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0] >= 1.0:
+                    self._recent.popleft()
+                if len(self._recent) >= self.rate_limit:
+                    return True
+                self._recent.append(now)
+            return False
+
+    def _fail_randomly(self) -> bool:
+        with self._lock:
+            if self.error_rate and self._random.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return True
+            return False
+
+    def _respond(self, body, headers) -> tuple[int, dict | bytes, dict]:
+        """200 응답 (etags면 ETag 비교 후 304)."""
+        if self.etags:
+            digest = hashlib.md5(body if isinstance(body, bytes) else
+                                 json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest()
+            etag = f'"{digest}"'
+            if headers.get("If-None-Match") == etag:
+                with self._lock:
+                    self.stats["not_modified"] += 1
+                return 304, {}, {"ETag": etag}
+            with self._lock:
+                self.stats["ok"] += 1
+            return 200, body, {"ETag": etag}
+
+        with self._lock:
+            self.stats["ok"] += 1
+        return 200, body, {}
+
+    def handle(self, path: str, headers) -> tuple[int, dict | bytes, dict]:
+        self._delay()
+        if path.startswith("/static/"):
+            return self._handle_image(path, headers)
+
+        if self._throttle():
+            with self._lock:
+                self.stats["throttled"] += 1
+            return 429, {"error": {"name": "OPENAPI00007", "message": "Too Many Requests"}}, \
+                {"Retry-After": "0.2"}
+        if self._fail_randomly():
+            return 500, {"error": {"name": "OPENAPI00001", "message": "Server Error"}}, {}
+
+        parsed = urllib.parse.urlparse(path)
+        query = dict(urllib.parse.parse_qsl(parsed.query))
+        endpoint = parsed.path.split("/maplestory/v1/", 1)[-1]
+        if not headers.get("x-nxopen-api-key"):
+            return 401, {"error": {"name": "OPENAPI00005", "message": "Invalid API key"}}, {}
+
+        body = None
+        if endpoint == "id" and "character_name" in query:
+            body = self._ocid(query["character_name"])
+        elif endpoint == "character/basic" and "ocid" in query:
+            body = self._basic(query["ocid"])
+        elif endpoint == "character/stat" and "ocid" in query:
+            body = self._stat(query["ocid"])
+        if body is None:
+            return 400, {"error": {"name": "OPENAPI00004", "message": "Please input valid parameter"}}, {}
+        return self._respond(body, headers)
+
+    # ------------------------------------------------------------------
+    # 응답 본문 (픽스처 → 없으면 해시 기반 생성)
+    # ------------------------------------------------------------------
+
+    def _ocid(self, name: str) -> dict | None:
+        if name in self.fixtures:
+            return {"ocid": self.fixtures[name]["ocid"]}
+        if not self.synthesize:
+            return None
+        ocid = hashlib.md5(name.encode("utf-8")).hexdigest()
+        with self._lock:
+            self._synth_names[ocid] = name
+        return {"ocid": ocid}
+
+    def _basic(self, ocid: str) -> dict | None:
+        fixture = self._by_ocid.get(ocid)
+        if fixture is not None:
+            basic = dict(fixture["basic"])
+            basic["character_image"] = self.origin + basic["character_image"]
+            return basic
+        if not self.synthesize:
+            return None
+        h = int(ocid[:8], 16)
+        return {"character_name": self._synth_names.get(ocid, f"캐릭터{ocid[:4]}"),
+                "character_level": 200 + h % 90,
+                "character_class": _SYNTH_CLASSES[h % len(_SYNTH_CLASSES)],
+                "character_image": f"{self.origin}{IMAGE_PREFIX}{ocid}"}
+
+    def _stat(self, ocid: str) -> dict | None:
+        fixture = self._by_ocid.get(ocid)
+        if fixture is not None:
+            return fixture["stat"]
+        if not self.synthesize:
+            return None
+        power = 1_000_000 + int(ocid[:8], 16) % 99_000_000
+        return {"final_stat": [{"stat_name": "전투력", "stat_value": str(power)}]}
+
+    def _handle_image(self, path: str, headers) -> tuple[int, dict | bytes, dict]:
+        with self._lock:
+            self.stats["requests"] += 1      # ok·not_modified·errors와 같은 기준 (images는 그중 이미지 수)
+        if self._fail_randomly():
+            return 500, {"error": {"name": "OPENAPI00001", "message": "Server Error"}}, {}
+        if path in self._images:
+            file = self._images[path]
+        elif path.startswith(IMAGE_PREFIX) and self.synthesize:
+            # 생성된 캐릭터는 픽스처 이미지 중 하나를 해시로 골라 재사용
+            ocid = urllib.parse.urlparse(path).path[len(IMAGE_PREFIX):]
+            h = int(hashlib.md5(ocid.encode("utf-8")).hexdigest()[:8], 16)
+            file = self._image_files[h % len(self._image_files)] if self._image_files else None
+        else:
+            return 404, {"error": {"name": "OPENAPI00004", "message": "Not Found"}}, {}
+
+        with self._lock:
+            self.stats["images"] += 1
+            data = self._image_cache.get(file or "")
+        if data is None:
+            full = os.path.join(REPO_ROOT, file) if file else None
+            if full and os.path.exists(full):
+                with open(full, "rb") as f:
+                    data = f.read()
+            else:
+                data = placeholder_png(seed=zlib.crc32(path.encode("utf-8")))
+            with self._lock:
+                self._image_cache[file or ""] = data
+        return self._respond(data, headers)
+
+
+@contextlib.contextmanager
+def scratch_dir(prefix: str = "fake_nexon_"):
+    """
+    임시 디렉터리를 현재 디렉터리로 (끝나면 되돌리고 지움).
+
+    설정의 상대 경로(boss_data.db, api_cache.db 등)가 저장소 파일을 가리키지 않게
+    점검·벤치마크를 이 안에서 돌린다.
+    """
+    workdir = tempfile.mkdtemp(prefix=prefix)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        yield workdir
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+# ---------------------------------------------------------------------------
+# 픽스처 녹화
+# ---------------------------------------------------------------------------
+
+def record_fixtures(names: list[str], path: str = FIXTURE_FILE) -> dict:
+    """
+    실제 API(config의 키/주소)로 캐릭터 응답을 받아 픽스처 파일에 추가·갱신.
+    이미지는 character_images/<이름>.png 로 저장 (없을 때만 다운로드).
+    """
+    import requests
+    from api.http_client import shared_client
+    from config import IMAGE_DIR
+
+    client = shared_client()
+    fixtures = load_fixtures(path)
+    for name in names:
+        ocid = client.get("id", {"character_name": name}, use_cache=False)
+        if not ocid.ok:
+            print(f"[Fake] {name} OCID 조회 실패: {ocid.error}")
+            continue
+        params = {"ocid": ocid.data["ocid"]}
+        basic = client.get("character/basic", params, use_cache=False)
+        stat = client.get("character/stat", params, use_cache=False)
+        if not basic.ok or not stat.ok:
+            print(f"[Fake] {name} 정보 조회 실패: {basic.error or stat.error}")
+            continue
+
+        url = urllib.parse.urlsplit(basic.data["character_image"])
+        image = os.path.join(IMAGE_DIR, f"{name}.png")
+        if not os.path.exists(os.path.join(REPO_ROOT, image)):
+            resp = requests.get(basic.data["character_image"], timeout=5)
+            resp.raise_for_status()
+            with open(os.path.join(REPO_ROOT, image), "wb") as f:
+                f.write(resp.content)
+
+        fixtures[name] = {
+            "ocid": ocid.data["ocid"],
+            "basic": {**basic.data,
+                      "character_image": url.path + (f"?{url.query}" if url.query else "")},
+            "stat": stat.data,
+            "image": image.replace(os.sep, "/"),
+        }
+        print(f"[Fake] {name} 녹화 완료")
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"characters": fixtures}, f, ensure_ascii=False, indent=2)
+    return fixtures
+
+
+# ---------------------------------------------------------------------------
+# 클라이언트 점검
+# ---------------------------------------------------------------------------
+
+def _check_client() -> bool:
+    from api.http_client import NexonClient
+
+    def run(label, server, client, n, threads=4):
+        results = []
+        lock = threading.Lock()
+
+        def worker(ids):
+            for i in ids:
+                r = client.get("id", {"character_name": f"char{i}"})
+                with lock:
+                    results.append(r)
+
+        started = time.monotonic()
+        chunks = [range(i, n, threads) for i in range(threads)]
+        ts = [threading.Thread(target=worker, args=(c,)) for c in chunks]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+        elapsed = time.monotonic() - started
+        ok = sum(r.ok for r in results)
+        print(f"[{label}] {ok}/{n} 성공, {elapsed:.2f}s, 클라이언트 {client.stats}, "
+              f"서버 {server.stats}")
+        return ok, elapsed
+
+    passed = True
+
+    # 1) 지연 + 서버 한도(초당 10) ≥ 클라이언트 한도(초당 8 + burst 1) → 429 없이 전부 성공
+    server = FakeNexonServer(latency=0.05, rate_limit=10).start()
+    client = NexonClient(base_url=server.base_url, api_key="test", rate=8, burst=1)
+    ok, elapsed = run("rate-limited", server, client, 40)
+    passed &= ok == 40 and server.stats["throttled"] == 0 and elapsed >= 3.5
+    passed &= server.stats["connections"] <= 4          # keep-alive 재사용
+    server.stop()
+
+    # 2) 주기적 429 + 500 → 재시도로 전부 성공
+    server = FakeNexonServer(latency=0.02, throttle_every=5, error_rate=0.1).start()
+    client = NexonClient(base_url=server.base_url, api_key="test", rate=50, burst=10,
+                         backoff_base=0.05)
+    ok, _ = run("429/5xx", server, client, 40)
+    passed &= ok == 40 and client.stats["retries"] > 0
+    server.stop()
+
+    # 3) 잘못된 요청은 재시도하지 않고 구조화된 에러
+    server = FakeNexonServer().start()
+    client = NexonClient(base_url=server.base_url, api_key="test")
+    r = client.get("character/basic")
+    print(f"[bad-request] {r}")
+    passed &= (not r.ok and r.status == 400 and r.error == "OPENAPI00004" and r.attempts == 1)
+    server.stop()
+
+    # 4) 연결 실패
+    client = NexonClient(base_url="http://127.0.0.1:1", api_key="test", max_retries=1,
+                         backoff_base=0.01)
+    r = client.get("id", {"character_name": "x"})
+    print(f"[unreachable] ok={r.ok} error={r.error} attempts={r.attempts}")
+    passed &= not r.ok and r.status is None and r.attempts == 2
+
+    # 5) 응답 캐시: OCID는 영구, 만료된 기본 정보는 ETag 재검증(304), use_cache=False는 우회
+    from api.response_cache import ResponseCache
+    server = FakeNexonServer(etags=True).start()
+    now = [1000.0]
+    path = os.path.abspath("api_cache.db")      # scratch_dir 안
+    cache = ResponseCache(path, ttl={"id": None, "character/basic": 60}, clock=lambda: now[0])
+    client = NexonClient(base_url=server.base_url, api_key="test", cache=cache)
+    ocid = client.get("id", {"character_name": "a"}).data["ocid"]
+    r1 = client.get("character/basic", {"ocid": ocid})
+    r2 = client.get("character/basic", {"ocid": ocid})
+    now[0] += 3600
+    r3 = client.get("id", {"character_name": "a"})
+    r4 = client.get("character/basic", {"ocid": ocid})
+    r5 = client.get("character/basic", {"ocid": ocid}, use_cache=False)
+    stats = cache.stats()
+    print(f"[cache] {stats}, 서버 {server.stats}")
+    passed &= (not r1.cached and r2.cached and r3.cached and r4.cached and r4.status == 304
+               and not r5.cached and r4.data == r1.data)
+    passed &= server.stats["ok"] == 3 and server.stats["not_modified"] == 1
+    server.stop()
+    cache.close()
+
+    # 6) 녹화된 픽스처: 기록된 OCID/정보, 이미지 URL은 스텁 서버를 가리키고 PNG를 돌려줌
+    import requests
+    server = FakeNexonServer(etags=True, synthesize=False).start()
+    client = NexonClient(base_url=server.base_url, api_key="test")
+    name, fixture = next(iter(server.fixtures.items()))
+    ocid = client.get("id", {"character_name": name}).data["ocid"]
+    basic = client.get("character/basic", {"ocid": ocid}).data
+    image = requests.get(basic["character_image"], timeout=5)
+    again = requests.get(basic["character_image"], timeout=5,
+                         headers={"If-None-Match": image.headers["ETag"]})
+    missing = client.get("id", {"character_name": "없는캐릭터"})
+    print(f"[fixtures] {len(server.fixtures)}명, {name} → {basic['character_level']} "
+          f"{basic['character_class']}, 이미지 {len(image.content)}B, 서버 {server.stats}")
+    passed &= (ocid == fixture["ocid"] and basic["character_image"].startswith(server.origin)
+               and image.content[:8] == b"\x89PNG\r\n\x1a\n" and again.status_code == 304
+               and missing.status == 400)
+    server.stop()
+
+    print("통과" if passed else "실패")
+    return passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--serve", type=int, metavar="PORT", help="서버만 실행")
+    parser.add_argument("--record", nargs="+", metavar="NAME", help="실제 API 응답을 픽스처로 녹화")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--throttle-every", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--etags", action="store_true")
+    parser.add_argument("--fixtures-only", action="store_true", help="픽스처에 없는 이름은 400")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures(args.record)
+        return
+    if args.serve is None:
+        with scratch_dir("fake_nexon_check_"):
+            passed = _check_client()
+        sys.exit(0 if passed else 1)
+
+    server = FakeNexonServer(args.serve, args.latency, args.rate_limit,
+                             args.throttle_every, args.error_rate, etags=args.etags,
+                             jitter=args.jitter, synthesize=not args.fixtures_only)
+    print(f"[Fake] {server.base_url} 에서 대기 중, 픽스처 {len(server.fixtures)}명 (Ctrl+C 종료)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+캐릭터 이미지 저장소 점검 — 임시 디렉터리의 DB·blob 폴더와 가짜 http_get으로 data_layer.image_store를 확인.
+
+    download    처음 보는 URL은 받아서 blob으로, 재검증 주기 안의 두 번째 호출은 네트워크 없이
+    revalidate  주기가 지나면 조건부 요청, 304면 blob 유지하고 확인 시각 갱신
+    offline     주기가 지났는데 연결 실패·5xx면 가진 blob 경로를 그대로 돌려주고,
+                확인 시각은 그대로라 다음 호출에 다시 재검증
+    new_url     새 URL을 받아야 하는데 연결 실패면 예외 (가진 blob이 없음)
+
+실행:
+    python -m tools.image_store_check       # 실패 시 exit 1
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from tools.synthetic_data import REPO_ROOT
+from tools.sync_check import _Check, _dm
+
+_URL = "https://open.api.nexon.com/static/maplestory/character/look/abc"
+_PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+class _Response:
+    def __init__(self, status_code: int, content: bytes = b"", headers: dict | None = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        import requests
+
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}", response=self)
+
+
+class _FakeGet:
+    """다음 응답(또는 던질 예외)을 정해 두고 호출 수를 센다."""
+
+    def __init__(self):
+        self.calls = 0
+        self.next = _Response(200, _PNG, {"ETag": '"v1"'})
+
+    def __call__(self, url, headers=None, timeout=None):
+        self.calls += 1
+        if isinstance(self.next, Exception):
+            raise self.next
+        return self.next
+
+
+def _expire(character: str) -> int:
+    """재검증 주기가 지난 것처럼 확인 시각을 과거로. 바꾼 확인 시각 반환."""
+    from data_layer.database import get_connection
+
+    checked_at = 1
+    with get_connection() as conn:
+        conn.execute("UPDATE character_images SET checked_at = ? WHERE character = ?", (checked_at, character))
+    return checked_at
+
+
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    sys.path.insert(0, REPO_ROOT)
+    work = tempfile.mkdtemp(prefix="image_store_check_")
+    cwd = os.getcwd()
+    os.chdir(work)      # config의 상대 경로(character_images/)가 임시 디렉터리를 가리키게
+    check = _Check()
+    try:
+        import requests
+        from data_layer.image_store import ImageStore
+
+        _dm(os.path.join(work, "images.db"))
+        http = _FakeGet()
+        store = ImageStore(blob_dir=os.path.join(work, "blobs"), revalidate_after=3600, http_get=http)
+
+        print("[download]")
+        path = store.fetch("캐릭터", _URL)
+        check.expect("처음 보는 URL은 받음", http.calls == 1 and store.stats["downloads"] == 1)
+        check.expect("blob에 저장", os.path.exists(path) and open(path, "rb").read() == _PNG)
+        check.expect("주기 안이면 네트워크 없이", store.fetch("캐릭터", _URL) == path and http.calls == 1)
+
+        print("[revalidate]")
+        _expire("캐릭터")
+        http.next = _Response(304, headers={"ETag": '"v1"'})
+        check.expect("304면 같은 blob", store.fetch("캐릭터", _URL) == path and store.stats["not_modified"] == 1)
+        check.expect("확인 시각 갱신", store.lookup("캐릭터")["checked_at"] > 1)
+
+        print("[offline]")
+        for label, failure in (("연결 실패", requests.ConnectionError("network down")),
+                               ("503", _Response(503))):
+            checked_at = _expire("캐릭터")
+            http.next = failure
+            calls, failed = http.calls, store.stats["revalidate_failed"]
+            try:
+                result = store.fetch("캐릭터", _URL)
+            except Exception as e:
+                result = repr(e)
+            check.expect(f"{label}: 가진 blob 경로 반환", result == path, str(result))
+            check.expect(f"{label}: 실패 횟수 기록", store.stats["revalidate_failed"] == failed + 1)
+            check.expect(f"{label}: 확인 시각 그대로", store.lookup("캐릭터")["checked_at"] == checked_at)
+            store.fetch("캐릭터", _URL)
+            check.expect(f"{label}: 다음 호출에 다시 재검증", http.calls == calls + 2)
+        check.expect("blob은 그대로", open(path, "rb").read() == _PNG)
+
+        print("[new_url]")
+        http.next = requests.ConnectionError("network down")
+        try:
+            store.fetch("캐릭터", _URL + "?v=2")
+            raised = False
+        except requests.RequestException:
+            raised = True
+        check.expect("새 URL 다운로드 실패는 예외", raised)
+        check.expect("인덱스는 예전 blob", store.lookup("캐릭터")["image_url"] == _URL)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work, ignore_errors=True)
+    print(f"\n[Image] {'통과' if not check.failures else f'실패 {check.failures}건'}")
+    sys.exit(1 if check.failures else 0)
+
+
+if __name__ == "__main__":
+    main()
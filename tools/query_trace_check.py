@@ -0,0 +1,113 @@
+"""
+SQL 추적 집계 점검 — 임시 합성 DB로 data_layer.query_trace의 쿼리 수 세기를 확인.
+
+    repeat    같은 조회를 N번 부르면 쿼리 N개 (연속 반복을 트리거 재보고로 오인하지 않음)
+    template  파라미터만 다른 체크 N번은 문장 항목 하나에 N회
+    trigger   변경 기록 트리거가 걸리는 체크 한 번은 UPDATE 한 번 (트리거 재보고 제외)
+    rewrite   같은 행을 두 번 뒤집으면 UPDATE 두 번 (호출 경계를 넘어 합치지 않음)
+    lazy      숨은 뷰를 체크가 무효화해도, 탭 전환으로 보일 때의 재계산 쿼리는 탭 전환 몫
+
+실행:
+    python -m tools.query_trace_check       # 실패 시 exit 1
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from tools.synthetic_data import REPO_ROOT, Scale, generate
+from tools.sync_check import _Check, _dm, _flip
+
+_UPDATE = "UPDATE weekly_checks SET checked = ?"
+
+
+def _action(tracer, name: str) -> dict:
+    report = tracer.report(top=100)
+    return {"queries": report["actions"].get(name, {}).get("queries", 0),
+            "calls": report["actions"].get(name, {}).get("calls", 0),
+            "statements": {s["sql"]: s["count"] for s in report["statements"] if s["action"] == name}}
+
+
+def _updates(stats: dict) -> list[int]:
+    return [n for sql, n in stats["statements"].items() if sql.startswith(_UPDATE)]
+
+
+def scenario_lazy(check: _Check, tracer, dm, week: str, r) -> None:
+    from PySide6.QtCore import QCoreApplication
+    from ui.invalidation import InvalidationBus
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    visible = {"stats": False}
+    bus = InvalidationBus()
+    bus.register("stats", lambda: dm.get_weekly_totals(), lambda: visible["stats"])
+    with tracer.action("toggle"):
+        _flip(dm, week, r["character"], r["boss_name"])
+        bus.invalidate("stats")
+    bus.flush()                         # 숨어 있어 미뤄짐
+    with tracer.action("tab_open"):
+        visible["stats"] = True
+        bus.schedule()
+    bus.flush()
+    actions = tracer.report(top=100)["actions"]
+    check.expect("보일 때 재계산은 탭 전환으로 집계",
+                 actions.get("tab_open", {}).get("calls", 0) == 1 and actions["toggle"]["calls"] == 1,
+                 str({k: v["calls"] for k, v in actions.items()}))
+
+
+def main() -> None:
+    sys.path.insert(0, REPO_ROOT)
+    from data_layer.query_trace import tracer
+
+    work = tempfile.mkdtemp(prefix="query_trace_check_")
+    cwd = os.getcwd()
+    os.chdir(work)
+    check = _Check()
+    try:
+        dm = _dm(os.path.join(work, "trace.db"))
+        generate(Scale(2, 15, 2))
+        week = dm.get_all_week_keys()[-1]
+        rows = dm.get_weekly_checks(week)
+        tracer.reset()
+        tracer.enable()
+
+        print("[repeat]")
+        with tracer.action("repeat"):
+            for _ in range(3):
+                dm.get_all_week_keys()
+        stats = _action(tracer, "repeat")
+        check.expect("같은 조회 3번 → 호출 3, 쿼리 3", stats["calls"] == 3 and stats["queries"] == 3, str(stats))
+
+        print("[template]")
+        with tracer.action("template"):
+            for r in rows[:15]:
+                dm.set_boss_checked(week, r["character"], r["boss_name"], not r["checked"])
+        stats = _action(tracer, "template")
+        check.expect("보스 15개 체크 → UPDATE 항목 하나에 15회", _updates(stats) == [15], str(stats["statements"]))
+
+        print("[trigger]")
+        r = rows[0]
+        with tracer.action("trigger"):
+            _flip(dm, week, r["character"], r["boss_name"])    # 값이 바뀌어 변경 기록 트리거가 돈다
+        stats = _action(tracer, "trigger")
+        check.expect("트리거가 걸린 체크 → UPDATE 1회", _updates(stats) == [1], str(stats["statements"]))
+
+        print("[rewrite]")
+        with tracer.action("rewrite"):
+            _flip(dm, week, r["character"], r["boss_name"])
+            _flip(dm, week, r["character"], r["boss_name"])
+        stats = _action(tracer, "rewrite")
+        check.expect("같은 행 두 번 → UPDATE 2회", _updates(stats) == [2], str(stats["statements"]))
+
+        print("[lazy]")
+        scenario_lazy(check, tracer, dm, week, r)
+    finally:
+        tracer.disable()
+        os.chdir(cwd)
+        shutil.rmtree(work, ignore_errors=True)
+    print(f"\n[SQL] {'통과' if not check.failures else f'실패 {check.failures}건'}")
+    sys.exit(1 if check.failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""
+DB 동기화 왕복 점검 — 임시 디렉터리의 DB 파일 두세 개로 data_layer.sync를 확인.
+
+시나리오마다 양쪽에서 DataManager로 실제 앱과 같은 변경을 낸 뒤 동기화하고,
+동기화 대상 테이블 전체가 같아졌는지 (그리고 기대한 값이 이겼는지) 확인한다.
+
+    initial     합성 데이터가 있는 DB → 빈 DB 전체 전송, 두 번째 동기화는 0건
+    concurrent  양쪽 체크·보스 추가·시세 변경·캐릭터 삭제, 같은 컬럼 충돌은 나중 것이 이기고
+                같은 행의 다른 컬럼 변경(체크 vs 시세)은 둘 다 남음
+    new_week    두 PC가 각자 새 주차를 만들어도 먼저 한 체크가 "체크 안 됨"에 덮이지 않음
+    clock_skew  시계가 1시간 빠른 상대의 변경 뒤에 한 로컬 변경도 이김
+    relay       A↔B, B↔C 후 C는 A의 변경을 가짐, A↔C는 보낼 것 없음
+    copied      파일 복사로 만든 DB는 거부, 새 id 부여 후 동기화
+    compact     같은 행을 여러 번 뒤집은 기록은 정리돼도 기존 상대·처음 받는 DB 모두 같아짐
+
+실행:
+    python -m tools.sync_check            # 실패 시 exit 1
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from tools.synthetic_data import REPO_ROOT, Scale, generate
+
+
+def _dump(path: str) -> dict:
+    from data_layer.database import SYNC_TABLES, connect
+
+    conn = connect(path)
+    try:
+        return {table: sorted(tuple(r) for r in conn.execute(f"SELECT {', '.join(cols)} FROM {table}"))
+                for table, (_keys, cols) in SYNC_TABLES.items()}
+    finally:
+        conn.close()
+
+
+def _dm(path: str):
+    from data_layer import DataManager
+    from data_layer.database import set_db_path, init_db
+
+    set_db_path(path)
+    init_db()
+    return DataManager()
+
+
+def _checked(path: str, week: str, character: str, boss: str) -> int | None:
+    from data_layer.database import connect
+
+    conn = connect(path)
+    try:
+        row = conn.execute(
+            "SELECT checked FROM weekly_checks WHERE week_key = ? AND character = ? AND boss_name = ?",
+            (week, character, boss)).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+def _flip(dm, week: str, character: str, boss: str) -> int:
+    """체크 상태를 뒤집고 새 값 반환 (같은 값으로 UPDATE하면 변경으로 기록되지 않으므로)."""
+    from data_layer.database import get_db_path
+
+    value = 1 - _checked(get_db_path(), week, character, boss)
+    dm.set_boss_checked(week, character, boss, bool(value))
+    return value
+
+
+class _Check:
+    def __init__(self):
+        self.failures = 0
+
+    def expect(self, label: str, ok: bool, detail: str = "") -> None:
+        print(f"  {'ok ' if ok else 'FAIL'} {label}{'' if ok else '  ' + detail}")
+        self.failures += not ok
+
+    def converged(self, label: str, *paths: str) -> None:
+        dumps = [_dump(p) for p in paths]
+        diff = [t for t in dumps[0] if any(d[t] != dumps[0][t] for d in dumps[1:])]
+        self.expect(label, not diff, f"다른 테이블: {diff}")
+
+
+# ---------------------------------------------------------------------------
+# 시나리오
+# ---------------------------------------------------------------------------
+
+def scenario_initial(check: _Check, work: str) -> tuple[str, str]:
+    from data_layer.sync import sync_databases
+
+    a, b = os.path.join(work, "a.db"), os.path.join(work, "b.db")
+    _dm(a)
+    generate(Scale(5, 10, 6))
+    _dm(b)
+    result = sync_databases(a, b)
+    print(f"  전송 {result['sent']}건 / 수신 {result['received']}건 ({result['elapsed_ms']}ms)")
+    check.converged("빈 DB로 전체 전송", a, b)
+    again = sync_databases(a, b)
+    check.expect("두 번째 동기화는 0건", again["sent"] == again["received"] == 0, str(again))
+    return a, b
+
+
+def scenario_concurrent(check: _Check, a: str, b: str) -> None:
+    from data_layer.sync import sync_databases
+
+    dm = _dm(a)
+    week = dm.get_all_week_keys()[-1]
+    rows = [(r["character"], r["boss_name"]) for r in dm.get_weekly_checks(week)]
+    (c1, b1), (c2, b2), (c3, b3) = rows[0], rows[1], rows[2]
+    v1 = _flip(dm, week, c1, b1)
+    _flip(dm, week, c3, b3)
+    _flip(dm, week, c3, b3)                        # 충돌: A는 원래 값으로, B가 나중에 뒤집음
+    dm.add_boss("신규보스A", 77_000_000)
+    dm.update_boss_price(b2, 123_000_000, week, "A 패치")
+
+    dm = _dm(b)
+    _flip(dm, week, c2, b2)
+    v3 = _flip(dm, week, c3, b3)
+    victim = dm.get_all_characters()[-1]["name"]
+    dm.delete_character(victim)
+    dm.add_boss("신규보스B", 88_000_000)
+
+    result = sync_databases(a, b)
+    print(f"  전송 {result['sent']}건 / 수신 {result['received']}건, 충돌 {result['conflicts']}")
+    check.converged("양쪽 변경 후 같아짐", a, b)
+    check.expect("같은 행 충돌은 나중 변경(B)이 이김", _checked(a, week, c3, b3) == v3)
+    check.expect("A의 체크가 B에 반영", _checked(b, week, c1, b1) == v1)
+    check.expect("삭제한 캐릭터가 A에서도 사라짐",
+                 victim not in {c["name"] for c in _dm(a).get_all_characters()})
+    dm = _dm(b)
+    values = {r["boss_value"] for r in dm.get_weekly_checks(week) if r["boss_name"] == b2}
+    check.expect("시세 이력·주차별 시세(boss_value) 전달",
+                 any(h["note"] == "A 패치" for h in dm.get_boss_price_history(b2))
+                 and values == {123_000_000}, str(values))
+
+
+def scenario_new_week(check: _Check, a: str, b: str) -> None:
+    from data_layer import current_week_key
+    from data_layer.database import connect
+    from data_layer.sync import sync_databases
+
+    week = current_week_key()
+    for path in (a, b):    # 현재 주차가 없는 상태에서 시작
+        with connect(path) as conn:
+            conn.execute("DELETE FROM weekly_checks WHERE week_key = ?", (week,))
+    sync_databases(a, b)
+
+    dm = _dm(a)
+    dm.ensure_current_week()
+    character, boss = next((r["character"], r["boss_name"]) for r in dm.get_weekly_checks(week))
+    dm.set_boss_checked(week, character, boss, True)
+    _dm(b).ensure_current_week()             # B는 나중에 주차를 만듦 (체크 안 됨 행)
+
+    sync_databases(a, b)
+    check.converged("각자 만든 새 주차가 같아짐", a, b)
+    check.expect("먼저 한 체크가 나중에 만든 주차 행에 덮이지 않음",
+                 _checked(a, week, character, boss) == 1 and _checked(b, week, character, boss) == 1)
+
+
+def scenario_clock_skew(check: _Check, a: str, b: str) -> None:
+    from data_layer.database import connect
+    from data_layer.sync import sync_databases
+
+    dm = _dm(b)
+    week = dm.get_all_week_keys()[-1]
+    character, boss = next((r["character"], r["boss_name"]) for r in dm.get_weekly_checks(week))
+    _flip(dm, week, character, boss)
+    with connect(b) as conn:                 # B의 시계가 1시간 빠름
+        conn.execute("UPDATE change_log SET ts = ts + 1 / 24.0 WHERE seq = (SELECT MAX(seq) FROM change_log)")
+    sync_databases(a, b)
+
+    value = _flip(_dm(a), week, character, boss)      # A에서 그 뒤에 다시 뒤집음
+    sync_databases(a, b)
+    check.converged("시계가 어긋나도 같아짐", a, b)
+    check.expect("나중에 한 로컬 변경이 이김", _checked(b, week, character, boss) == value)
+
+
+def scenario_relay(check: _Check, work: str, a: str, b: str) -> None:
+    from data_layer.sync import sync_databases
+
+    c = os.path.join(work, "c.db")
+    _dm(c)
+    sync_databases(b, c)
+    dm = _dm(a)
+    week = dm.get_all_week_keys()[-1]
+    character, boss = next((r["character"], r["boss_name"]) for r in dm.get_weekly_checks(week))
+    for _ in range(3):
+        _flip(dm, week, character, boss)
+    sync_databases(a, b)
+    sync_databases(b, c)
+    check.converged("B를 거쳐 C까지 전달", a, b, c)
+    result = sync_databases(a, c)
+    check.expect("A↔C는 보낼 것 없음", result["sent"] == result["received"] == 0, str(result))
+
+
+def scenario_copied(check: _Check, work: str, a: str) -> None:
+    from data_layer.sync import SyncError, new_replica_id, sync_databases
+    from data_layer.database import connect
+
+    copy = os.path.join(work, "copy.db")
+    src = connect(a)
+    dst = connect(copy)
+    src.backup(dst)          # 실행 중인 DB를 안전하게 복사 (WAL 포함)
+    src.close()
+    dst.close()
+    try:
+        sync_databases(a, copy)
+        check.expect("복사한 DB는 거부", False, "SyncError 없음")
+    except SyncError:
+        check.expect("복사한 DB는 거부", True)
+    new_replica_id(copy)
+    _dm(copy).add_boss("복사본보스", 1_000_000)
+    result = sync_databases(a, copy)
+    check.converged("새 id 부여 후 동기화", a, copy)
+    check.expect("복사 이후 변경만 오감", result["received"] <= 3 and result["sent"] == 0, str(result))
+
+
+def scenario_compact(check: _Check, work: str, a: str, b: str) -> None:
+    from data_layer.database import connect
+    from data_layer.sync import sync_databases
+
+    def log_size(path):
+        with connect(path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM change_log").fetchone()[0]
+
+    dm = _dm(a)
+    week = dm.get_all_week_keys()[-1]
+    rows = [(r["character"], r["boss_name"]) for r in dm.get_weekly_checks(week)][:10]
+    before = log_size(a)
+    for _ in range(5):
+        for character, boss in rows:
+            _flip(dm, week, character, boss)
+    written = log_size(a) - before
+    sync_databases(a, b)
+    kept = log_size(a) - before
+    print(f"  체크 기록 {written}건 → 동기화 후 {kept}건")
+    check.expect("덮인 기록 정리", kept <= len(rows), f"{kept}건 남음")
+    check.converged("정리 후 기존 상대와 같아짐", a, b)
+
+    fresh = os.path.join(work, "fresh.db")
+    _dm(fresh)
+    sync_databases(a, fresh)
+    check.converged("정리한 DB에서 처음 받는 DB도 같아짐", a, fresh)
+    again = sync_databases(a, b)
+    check.expect("정리 후 다시 보낼 것 없음", again["sent"] == again["received"] == 0, str(again))
+
+
+# ---------------------------------------------------------------------------
+
+def main() -> None:
+    sys.path.insert(0, REPO_ROOT)
+    work = tempfile.mkdtemp(prefix="sync_check_")
+    cwd = os.getcwd()
+    os.chdir(work)
+    check = _Check()
+    try:
+        print("[initial]")
+        a, b = scenario_initial(check, work)
+        print("[concurrent]")
+        scenario_concurrent(check, a, b)
+        print("[new_week]")
+        scenario_new_week(check, a, b)
+        print("[clock_skew]")
+        scenario_clock_skew(check, a, b)
+        print("[relay]")
+        scenario_relay(check, work, a, b)
+        print("[copied]")
+        scenario_copied(check, work, a)
+        print("[compact]")
+        scenario_compact(check, work, a, b)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work, ignore_errors=True)
+    print(f"\n[Sync] {'통과' if not check.failures else f'실패 {check.failures}건'}")
+    sys.exit(1 if check.failures else 0)
+
+
+if __name__ == "__main__":
+    main()
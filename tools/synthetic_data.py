@@ -0,0 +1,153 @@
+"""
+벤치마크용 합성 DB 생성기.
+
+캐릭터 수 · 보스 수 · 주차 수로 크기를 정하고, 현재 작업 디렉터리의 DB_FILE에
+init_db() 스키마 그대로 채운다 (characters, boss_list, boss_price_history,
+weekly_checks, character_ids, character_history). 같은 seed면 같은 데이터.
+
+주차는 현재 주차의 직전 주까지 채운다 → ensure_current_week()가 실제로 주차 초기화를 한다.
+캐릭터마다 보스 카탈로그 중 일부(bosses_per_character)만 체크리스트에 올린다.
+
+실행:
+    python -m tools.synthetic_data --characters 50 --bosses 30 --weeks 104 --out /tmp/synthetic
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 체크리스트 한 장에 올리는 보스 수 (게임 내 주간 보스 제한과 비슷하게)
+DEFAULT_BOSSES_PER_CHARACTER = 14
+
+
+@dataclass(frozen=True)
+class Scale:
+    characters: int
+    bosses: int
+    weeks: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.characters}x{self.bosses}x{self.weeks}"
+
+    @classmethod
+    def parse(cls, text: str) -> "Scale":
+        """'10x20x52' → Scale(10, 20, 52)"""
+        characters, bosses, weeks = (int(p) for p in text.lower().split("x"))
+        return cls(characters, bosses, weeks)
+
+
+# 이름 있는 프리셋 (벤치마크 기본값)
+SCALES = {
+    "small": Scale(10, 20, 52),
+    "medium": Scale(100, 30, 156),
+    "large": Scale(500, 40, 520),
+}
+
+
+def past_week_keys(count: int, before: str | None = None) -> list[str]:
+    """before 주차(기본: 현재 주차) 직전까지 count개의 주차 키, 오래된 순."""
+    from data_layer.data_manager import current_week_key, week_bounds
+
+    start, _ = week_bounds(before or current_week_key())
+    keys = []
+    for i in range(count, 0, -1):
+        year, week, _ = (start - timedelta(weeks=i)).isocalendar()
+        keys.append(f"{year}-{week}")
+    return keys
+
+
+def generate(scale: Scale, seed: int = 0, check_rate: float = 0.7,
+             bosses_per_character: int = DEFAULT_BOSSES_PER_CHARACTER) -> dict:
+    """
+    현재 디렉터리의 DB에 합성 데이터를 채운다 (기존 데이터는 지움).
+
+    Returns:
+        {"scale": "10x20x52", "weekly_checks": 7280, "week_keys": [...],
+         "characters": [...], "elapsed_s": 0.21}
+    """
+    from data_layer.database import get_connection, init_db
+
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    init_db()
+
+    bosses = [(f"보스{i:03d}", rng.randrange(5, 600) * 1_000_000) for i in range(scale.bosses)]
+    characters = [f"캐릭터{i:04d}" for i in range(scale.characters)]
+    week_keys = past_week_keys(scale.weeks)
+    per_char = min(bosses_per_character, scale.bosses)
+    lineups = {c: rng.sample(bosses, per_char) for c in characters}
+    now = int(time.time())
+
+    with get_connection() as conn:
+        for table in ("weekly_checks", "boss_price_history", "boss_list", "character_history",
+                      "character_ids", "character_images", "characters"):
+            conn.execute(f"DELETE FROM {table}")
+
+        conn.executemany("INSERT INTO boss_list (name, value) VALUES (?, ?)", bosses)
+        conn.executemany(
+            "INSERT INTO boss_price_history (boss_name, value, applied_from, note) VALUES (?, ?, ?, ?)",
+            [(name, value, week_keys[0], "합성 데이터") for name, value in bosses])
+
+        conn.executemany(
+            "INSERT INTO characters (name, ocid, level, job, power, image_url) VALUES (?, ?, ?, ?, ?, ?)",
+            [(c, f"ocid-{i}", rng.randrange(200, 290), "합성", rng.randrange(10**7, 10**9), None)
+             for i, c in enumerate(characters)])
+        conn.executemany("INSERT INTO character_ids (id, name) VALUES (?, ?)",
+                         list(enumerate(characters, start=1)))
+
+        # 캐릭터별 주 1회 레벨·전투력 샘플 (최근 주차일수록 성장)
+        history = []
+        for char_id in range(1, scale.characters + 1):
+            level, power = rng.randrange(200, 260), rng.randrange(10**7, 10**8)
+            for i in range(scale.weeks):
+                level = min(300, level + (rng.random() < 0.2))
+                power += rng.randrange(0, 2 * 10**6)
+                history.append((char_id, now - (scale.weeks - i) * 7 * 86400, level, power))
+        conn.executemany(
+            "INSERT INTO character_history (char_id, ts, level, power) VALUES (?, ?, ?, ?)", history)
+
+        def _checks():
+            for week_key in week_keys:
+                for c in characters:
+                    for boss_name, value in lineups[c]:
+                        yield week_key, c, boss_name, value, int(rng.random() < check_rate)
+
+        conn.executemany(
+            """INSERT INTO weekly_checks (week_key, character, boss_name, boss_value, checked)
+               VALUES (?, ?, ?, ?, ?)""", _checks())
+
+    return {
+        "scale": scale.name,
+        "weekly_checks": scale.weeks * scale.characters * per_char,
+        "week_keys": week_keys,
+        "characters": characters,
+        "elapsed_s": round(time.perf_counter() - started, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 DB 생성")
+    parser.add_argument("--characters", type=int, default=10)
+    parser.add_argument("--bosses", type=int, default=20)
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", required=True, help="DB를 만들 디렉터리 (boss_data.db)")
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    os.chdir(args.out)
+    sys.path.insert(0, REPO_ROOT)
+    info = generate(Scale(args.characters, args.bosses, args.weeks), seed=args.seed)
+    print(f"[Synthetic] {info['scale']}: weekly_checks {info['weekly_checks']}행 "
+          f"({info['elapsed_s']}s) → {os.path.abspath('boss_data.db')}")
+
+
+if __name__ == "__main__":
+    main()
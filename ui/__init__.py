@@ -1,2 +1,12 @@
 from ui.checklist_tab import ChecklistTab
-from ui.stats_tab import WeeklyStatsTab, BossStatsTab, CharStatsTab
\ No newline at end of file
+from ui.lazy_tab import LazyTab
+
+_STATS_TABS = {"WeeklyStatsTab", "BossStatsTab", "CharStatsTab", "GrowthStatsTab"}
+
+
+def __getattr__(name: str):
+    # 통계 탭은 polars / QtCharts를 끌어오므로 처음 쓰일 때 import
+    if name in _STATS_TABS:
+        import ui.stats_tab
+        return getattr(ui.stats_tab, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,19 +2,37 @@
 BossTrackerApp — 앱의 진입 위젯.
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QSystemTrayIcon, QMenu, QApplication, QTabWidget
-from PySide6.QtGui import QIcon, QAction
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QSystemTrayIcon, QMenu, QApplication, QTabWidget,
+    QComboBox, QPushButton, QCheckBox, QInputDialog, QMessageBox,
+)
+from PySide6.QtGui import QIcon, QAction, QKeySequence, QShortcut
+from PySide6.QtCore import Qt, QTimer
 
-from config import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_X, WINDOW_Y
-from data_layer import DataManager, current_week_key, ParquetStore
+from config import (
+    WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_X, WINDOW_Y,
+    USE_WARM_START, WARM_START_SAVE_DELAY_MS, SQL_TRACE_FILE,
+    EVENT_MONITOR, EVENT_MONITOR_FILE, TRACKER_SERVER, ACCOUNT,
+    ARCHIVE_DELAY_MS,
+)
+from data_layer import DataManager, current_week_key
+from data_layer.accounts import AccountRegistry
 from data_layer.database import init_db
+from data_layer.query_trace import tracer, traced_action
+from data_layer.warm_start import WarmStartStore
 from ui.checklist_tab import ChecklistTab
-from ui.stats_tab import WeeklyStatsTab, BossStatsTab, CharStatsTab
-from ui.styles import APP_DARK_THEME, TAB_STYLE
+from ui.event_monitor import EventLoopMonitor
+from ui.invalidation import InvalidationBus
+from ui.lazy_tab import LazyTab
+from ui.styles import APP_DARK_THEME, TAB_STYLE, COMBO_STYLE
+from ui.archive_worker import WeekArchiver
+from ui.warm_start import WarmStartReconciler
+from utils.profiling import profiler
 
 
 class BossTrackerApp(QWidget):
 
+    @traced_action("startup")
     def __init__(self):
         super().__init__()
         self.setWindowTitle("주간 보스 체크리스트")
@@ -22,48 +40,298 @@ class BossTrackerApp(QWidget):
         self.move(WINDOW_X, WINDOW_Y)
         self.setStyleSheet(APP_DARK_THEME)
 
-        init_db()
-
-        self._dm = DataManager()
-        self._dm.ensure_current_week()
+        # 트래커 서버가 설정돼 있으면 로컬 DB 대신 서버 (python -m daemon), 계정 전환 없음
+        self._accounts = AccountRegistry()
+        self._account = None
+        if TRACKER_SERVER:
+            from data_layer.remote import RemoteDataManager
+            self._dm = RemoteDataManager(TRACKER_SERVER)
+            self.setWindowTitle(f"주간 보스 체크리스트 — {TRACKER_SERVER}")
+        else:
+            self._dm = DataManager()
+            self._account = self._accounts.activate(self._startup_account())
+            self._update_title()
+        self._pending_reconcile = None
+        self._reconciling = False
+        self._painted = False
         self._week_key = current_week_key()
-        self._store = ParquetStore()  # 통계 탭 3개가 공유
+        self._warm_store = WarmStartStore(self._account.warm_start_path) if self._account else WarmStartStore()
+        # 저장된 상태가 있으면 DB 확인은 첫 화면 이후 백그라운드로
+        warm = self._warm_store.load(self._week_key) if USE_WARM_START else None
+        if warm is None:
+            init_db()     # 트래커 서버 모드에서도 이미지 인덱스(character_images)는 PC별 로컬 DB
+            self._dm.ensure_current_week()
+        self._store = None            # 통계 탭이 공유하는 ParquetStore (처음 쓸 때 생성)
+        self._snapshot_dirty = True   # DB 변경 후 아직 Parquet에 반영 안 됨
+        self._federated = False       # 통계 탭에 모든 계정 합산
+        self._bus = InvalidationBus(self)
+        self._monitor = EventLoopMonitor(parent=self)
+        self._diagnostics = None      # 진단 패널 (처음 열 때 생성)
+        if EVENT_MONITOR:
+            self._monitor.start()
 
         self._setup_tray()
-        self._setup_tabs()
-        self._checklist_tab.switch_week(self._week_key)
+        self._setup_tabs(warm)
+        if warm is None:
+            self._checklist_tab.switch_week(self._week_key)
+        else:
+            self._checklist_tab.apply_warm_start(warm)
+            self._reconciler = WarmStartReconciler(self._dm, self._warm_store, parent=self)
+            self._reconciler.reconciled.connect(self._on_warm_start_reconciled)
+            self._reconciler.failed.connect(self._on_warm_start_failed)
+            self._pending_reconcile = warm   # 첫 paint 이후 시작 (paintEvent)
+            self._reconciling = True
+
+        # change_log 정리와 오래된 주차 보관은 첫 화면 이후 조용할 때 (서버 모드는 서버 DB라 제외).
+        # ARCHIVE_KEEP_WEEKS가 0이면 보관할 주차가 없어 정리만 한다
+        self._archiver = None
+        if not TRACKER_SERVER:
+            self._archiver = WeekArchiver(parent=self)
+
+        # 다른 클라이언트가 서버에 쓴 변경은 알림으로 받아 반영
+        self._remote_sync = None
+        if TRACKER_SERVER:
+            from ui.remote_sync import RemoteChangeListener
+            self._remote_sync = RemoteChangeListener(self._dm, parent=self)
+            self._remote_sync.changed.connect(self._checklist_tab.apply_remote_changes)
+            self._remote_sync.start()
 
-    def _setup_tabs(self) -> None:
+        # 데이터 변경 후 조용해지면 웜 스타트 상태 갱신
+        self._warm_save_timer = QTimer(self)
+        self._warm_save_timer.setSingleShot(True)
+        self._warm_save_timer.setInterval(WARM_START_SAVE_DELAY_MS)
+        self._warm_save_timer.timeout.connect(self._save_warm_start)
+
+        # 종료 시 남은 썸네일 기록 + 삭제된 캐릭터 항목 정리, 웜 스타트 상태 저장
+        QApplication.instance().aboutToQuit.connect(self._on_about_to_quit)
+
+    def _setup_tabs(self, warm: dict | None = None) -> None:
         self._tabs = QTabWidget()
         self._tabs.setStyleSheet(TAB_STYLE)
 
-        self._checklist_tab = ChecklistTab(dm=self._dm, week_key=self._week_key)
-        self._weekly_stats_tab = WeeklyStatsTab(store=self._store)
-        self._boss_stats_tab = BossStatsTab(store=self._store)
-        self._char_stats_tab = CharStatsTab(store=self._store)
+        self._checklist_tab = ChecklistTab(dm=self._dm, week_key=self._week_key, bus=self._bus,
+                                           warm=warm)
+        # 통계 탭은 처음 열릴 때 생성 (polars / QtCharts import 포함)
+        self._weekly_stats_tab = LazyTab(self._stats_tab_factory("WeeklyStatsTab"))
+        self._boss_stats_tab = LazyTab(self._stats_tab_factory("BossStatsTab"))
+        self._char_stats_tab = LazyTab(self._stats_tab_factory("CharStatsTab"))
+        self._growth_stats_tab = LazyTab(self._stats_tab_factory("GrowthStatsTab"))
+
+        self._stats_views = {
+            "weekly_stats": self._weekly_stats_tab,
+            "boss_stats": self._boss_stats_tab,
+            "char_stats": self._char_stats_tab,
+            "growth_stats": self._growth_stats_tab,
+        }
+        for name, tab in self._stats_views.items():
+            self._bus.register(name, self._make_stats_refresher(tab), tab.isVisible)
+        self._bus.invalidate(*self._stats_views)
 
         self._tabs.addTab(self._checklist_tab,    "📋 주간 체크리스트")
         self._tabs.addTab(self._weekly_stats_tab,  "📊 누적 수익")
         self._tabs.addTab(self._boss_stats_tab,    "🥧 보스별 기여도")
         self._tabs.addTab(self._char_stats_tab,    "📈 캐릭터별 통계")
+        self._tabs.addTab(self._growth_stats_tab,  "💪 성장 추이")
+
+        if self._account is not None:
+            self._tabs.setCornerWidget(self._build_account_bar(), Qt.TopRightCorner)
 
         self._tabs.currentChanged.connect(self._on_tab_changed)
-        self._checklist_tab.data_changed.connect(self._checklist_tab.refresh_stats_summary)
+        self._checklist_tab.data_changed.connect(self._on_data_changed)
 
         layout = QVBoxLayout(self)
         layout.addWidget(self._tabs)
 
-    def _on_tab_changed(self, index: int) -> None:
-        """탭 진입 시 해당 탭만 Parquet 스냅샷 + 갱신."""
-        if index == 1:
-            self._store.snapshot()
-            self._weekly_stats_tab.refresh()
-        elif index == 2:
-            self._store.snapshot()
-            self._boss_stats_tab.refresh()
-        elif index == 3:
-            self._store.snapshot()
-            self._char_stats_tab.refresh()
+    @traced_action("tab_change")
+    def _on_tab_changed(self, _index: int) -> None:
+        """탭 진입 시 새로 보이게 된 dirty 뷰만 갱신."""
+        self._bus.schedule()
+
+    def _on_data_changed(self) -> None:
+        """DB 변경 시 통계 탭은 dirty 표시만 (보일 때 한 번 갱신)."""
+        self._snapshot_dirty = True
+        self._bus.invalidate(*self._stats_views)
+        if USE_WARM_START:
+            self._warm_save_timer.start()
+
+    def _on_warm_start_reconciled(self, state: dict, changed: set) -> None:
+        # 새 상태는 워커가 이미 저장했으므로 통계 탭만 dirty 처리
+        self._reconciling = False
+        self._checklist_tab.apply_reconciled(state, changed)
+        if changed:
+            self._snapshot_dirty = True
+            self._bus.invalidate(*self._stats_views)
+
+    def _on_warm_start_failed(self, message: str) -> None:
+        self._reconciling = False
+        print(f"[WarmStart] DB 확인 실패: {message}")
+
+    def _save_warm_start(self) -> None:
+        """현재 주차·선택 캐릭터 기준으로 웜 스타트 상태 저장 (다른 주차를 보고 있으면 현재 주차)."""
+        self._warm_store.save(WarmStartStore.collect(
+            self._dm, self._week_key,
+            self._checklist_tab.current_character
+            if self._checklist_tab.week_key == self._week_key else None,
+        ))
+
+    def _on_about_to_quit(self) -> None:
+        if self._remote_sync is not None:
+            self._remote_sync.stop()
+        self._checklist_tab.flush_image_atlas(prune=True)
+        if USE_WARM_START:
+            self._warm_save_timer.stop()
+            self._save_warm_start()
+        if tracer.enabled:
+            self._trace_action.setChecked(False)   # 보고서 출력 + 저장
+        if self._monitor.running:
+            self._monitor.stop()
+            print(self._monitor.format_report())
+            self._monitor.dump(EVENT_MONITOR_FILE)
+
+    def _stats_tab_factory(self, class_name: str):
+        def _build():
+            import ui.stats_tab
+            return getattr(ui.stats_tab, class_name)(store=self._stats_store())
+        return _build
+
+    def _make_stats_refresher(self, tab):
+        def _refresh():
+            self._ensure_snapshot()
+            tab.refresh()
+        return _refresh
+
+    def _stats_store(self):
+        if self._store is None and TRACKER_SERVER:
+            from data_layer.remote_store import RemoteParquetStore
+            self._store = RemoteParquetStore(self._dm.client)
+        elif self._store is None and self._federated:
+            from data_layer.federated_store import FederatedParquetStore
+            self._store = FederatedParquetStore(self._accounts.all())
+        elif self._store is None:
+            from data_layer.parquet_store import ParquetStore
+            self._store = ParquetStore(self._account.parquet_path, self._account.history_path)
+        return self._store
+
+    def _reset_stats_store(self) -> None:
+        """계정 전환·합산 전환 후: 이미 만든 통계 탭에 새 store를 끼우고 dirty 처리."""
+        self._store = None
+        self._snapshot_dirty = True
+        for tab in self._stats_views.values():
+            if tab.is_built():
+                tab.widget.set_store(self._stats_store())
+        self._bus.invalidate(*self._stats_views)
+
+    def _ensure_snapshot(self) -> None:
+        """변경이 있었을 때만 Parquet 스냅샷 (탭 전환마다 반복하지 않음)."""
+        if self._snapshot_dirty:
+            self._stats_store().snapshot()
+            self._snapshot_dirty = False
+
+    # ------------------------------------------------------------------
+    # 계정
+    # ------------------------------------------------------------------
+
+    def _startup_account(self) -> str:
+        """BOSS_TRACKER_ACCOUNT가 있으면 그 계정, 없으면 마지막으로 쓴 계정."""
+        if ACCOUNT and ACCOUNT in self._accounts.names():
+            return ACCOUNT
+        if ACCOUNT:
+            print(f"[Account] 계정 없음: {ACCOUNT} (마지막으로 쓴 계정으로 시작)")
+        return self._accounts.last_used()
+
+    def _build_account_bar(self) -> QWidget:
+        bar = QWidget()
+        layout = QHBoxLayout(bar)
+        layout.setContentsMargins(0, 0, 6, 4)
+        layout.setSpacing(6)
+
+        self._account_combo = QComboBox()
+        self._account_combo.setStyleSheet(COMBO_STYLE)
+        self._account_combo.setToolTip("계정 (계정마다 DB를 따로 씀)")
+        self._account_combo.setMinimumWidth(110)
+        self._reload_account_combo()
+        self._account_combo.currentTextChanged.connect(self.switch_account)
+        layout.addWidget(self._account_combo)
+
+        btn_add = QPushButton("+")
+        btn_add.setToolTip("계정 추가")
+        btn_add.setFixedWidth(28)
+        btn_add.clicked.connect(self._add_account_dialog)
+        layout.addWidget(btn_add)
+
+        federated = QCheckBox("통계 합산")
+        federated.setToolTip("통계 탭에 모든 계정을 합쳐서 표시")
+        federated.toggled.connect(self._set_federated_stats)
+        layout.addWidget(federated)
+        return bar
+
+    def _reload_account_combo(self) -> None:
+        self._account_combo.blockSignals(True)
+        self._account_combo.clear()
+        self._account_combo.addItems(self._accounts.names())
+        self._account_combo.setCurrentText(self._account.name)
+        self._account_combo.blockSignals(False)
+
+    def _update_title(self) -> None:
+        self.setWindowTitle(f"주간 보스 체크리스트 — {self._account.name}"
+                            if len(self._accounts.names()) > 1 else "주간 보스 체크리스트")
+
+    @traced_action("account_switch")
+    def switch_account(self, name: str) -> None:
+        """활성 계정 DB를 바꾸고 체크리스트·통계를 그 계정 기준으로 다시 그림."""
+        if self._account is None or name == self._account.name:
+            return
+        if self._checklist_tab.busy or self._reconciling:
+            # 진행 중인 작업이 끝나면 현재 DB에 저장하므로 그 전에는 바꾸지 않음
+            QMessageBox.information(self, "알림", "캐릭터 정보를 불러오는 중에는 계정을 바꿀 수 없습니다.")
+            self._reload_account_combo()
+            return
+        if USE_WARM_START:
+            self._warm_save_timer.stop()
+            self._save_warm_start()          # 이전 계정의 첫 화면 상태
+        self._checklist_tab.flush_image_atlas()
+
+        self._account = self._accounts.activate(name)
+        init_db()
+        self._dm.ensure_current_week()
+        self._warm_store = WarmStartStore(self._account.warm_start_path)
+        self._week_key = current_week_key()
+        self._checklist_tab.reload(self._week_key)
+        self._reset_stats_store()
+        self._update_title()
+        print(f"[Account] 계정 전환: {name}")
+
+    def _add_account_dialog(self) -> None:
+        name, ok = QInputDialog.getText(self, "계정 추가", "새 계정 이름 (보스 목록·시세는 현재 계정에서 복사):")
+        if not ok:
+            return
+        try:
+            account = self._accounts.create(name, template=self._account)
+        except ValueError as e:
+            QMessageBox.warning(self, "실패", str(e))
+            return
+        self._reload_account_combo()
+        self._update_title()
+        self._account_combo.setCurrentText(account.name)    # → switch_account
+
+    def _set_federated_stats(self, enabled: bool) -> None:
+        self._federated = enabled
+        self._reset_stats_store()
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            profiler.instant("first_paint", "startup")
+            if self._archiver is not None:
+                QTimer.singleShot(ARCHIVE_DELAY_MS, self._start_archive)
+        if self._pending_reconcile is not None:
+            warm, self._pending_reconcile = self._pending_reconcile, None
+            QTimer.singleShot(0, lambda: self._reconciler.start(warm))
+
+    def _start_archive(self) -> None:
+        """활성 계정 DB의 보관 대상 주차를 백그라운드에서 옮김 (앱 실행마다 한 번)."""
+        self._archiver.start(self._account.db_path)
 
     def _setup_tray(self) -> None:
         self._tray = QSystemTrayIcon(self)
@@ -71,10 +339,43 @@ class BossTrackerApp(QWidget):
         self._tray.setToolTip("주간 보스 체크리스트")
         menu = QMenu()
         menu.addAction(QAction("열기", self, triggered=self.show_window))
+        self._trace_action = QAction("SQL 쿼리 추적", self, checkable=True,
+                                     checked=tracer.enabled, toggled=self._set_sql_trace)
+        menu.addAction(self._trace_action)
+        # 창에서도 켜고 끌 수 있게 (Ctrl+Shift+Q)
+        QShortcut(QKeySequence("Ctrl+Shift+Q"), self, activated=self._trace_action.toggle)
+        menu.addAction(QAction("진단 패널", self, triggered=self.show_diagnostics))
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=self.show_diagnostics)
         menu.addAction(QAction("종료", self, triggered=QApplication.instance().quit))
         self._tray.setContextMenu(menu)
         self._tray.show()
 
+    def _set_sql_trace(self, enabled: bool) -> None:
+        """추적을 끌 때 그동안의 보고서를 출력하고 파일로 저장."""
+        if enabled == tracer.enabled:
+            return
+        if enabled:
+            tracer.reset()
+            tracer.enable()
+            return
+        tracer.disable()
+        print(tracer.format_report())
+        tracer.dump(SQL_TRACE_FILE)
+        print(f"[SQL] 보고서 저장: {SQL_TRACE_FILE}")
+
+    def show_diagnostics(self) -> None:
+        if self._diagnostics is None:
+            from ui.diagnostics_panel import DiagnosticsPanel
+            self._diagnostics = DiagnosticsPanel(self._monitor, parent=self)
+        self._diagnostics.show()
+        self._diagnostics.raise_()
+
+    @traced_action("window_show")
+    def showEvent(self, event) -> None:
+        """트레이에서 다시 열면 숨어 있는 동안 dirty가 된 보이는 뷰를 갱신."""
+        super().showEvent(event)
+        self._bus.schedule()
+
     def show_window(self) -> None:
         self.show()
         self.raise_()
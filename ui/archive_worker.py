@@ -0,0 +1,83 @@
+"""
+오래된 주차 자동 보관 (백그라운드).
+
+앱 시작 후 ARCHIVE_DELAY_MS가 지나면 워커 스레드에서 change_log를 정리하고
+(sync.compact_change_log) WeekArchive.archive()를 한 번 돌린다.
+보관은 ARCHIVE_KEEP_WEEKS > 0일 때만 (기본 끔). 보관 대상이 없으면 주차 목록 조회로 끝나고
+polars도 import하지 않는다. 진행 출력은 여기서 요약 한 줄만.
+주차마다 짧은 트랜잭션이라 그 사이 GUI 쓰기는 잠깐 기다릴 뿐이고,
+보관된 주차를 보거나 고치는 것은 DataManager가 알아서 처리한다.
+"""
+
+from contextlib import closing
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from data_layer.archive import WeekArchive
+from data_layer.database import connect
+from data_layer.query_trace import traced_action
+from data_layer.sync import compact_change_log
+
+
+class _ArchiveSignals(QObject):
+    done = Signal(list)    # 보관한 주차 결과 (WeekArchive.archive 반환값)
+    failed = Signal(str)
+
+
+class _ArchiveTask(QRunnable):
+
+    def __init__(self, db_path: str, signals: _ArchiveSignals):
+        super().__init__()
+        self._db_path = db_path     # 도중에 계정을 바꿔도 시작한 계정 DB를 보관
+        self._signals = signals
+
+    @traced_action("archive")
+    def run(self) -> None:
+        try:
+            # 동기화를 하지 않는 PC도 체크·해제 기록이 쌓이므로 여기서 정리
+            with closing(connect(self._db_path)) as conn, conn:
+                removed = compact_change_log(conn)
+            if removed:
+                print(f"[Sync] change_log 정리: {removed}건 삭제")
+            result = WeekArchive(self._db_path).archive()
+        except Exception as e:
+            self._signals.failed.emit(str(e))
+            return
+        self._signals.done.emit(result)
+
+
+class WeekArchiver(QObject):
+    """활성 계정 DB의 change_log 정리 + 오래된 주차를 Parquet 파티션으로 옮기는 백그라운드 작업."""
+
+    archived = Signal(list)
+    failed = Signal(str)
+
+    def __init__(self, pool: QThreadPool | None = None, parent=None):
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        self._running = False
+        self._signals = _ArchiveSignals(self)
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self._on_failed)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self, db_path: str) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._pool.start(_ArchiveTask(db_path, self._signals))
+
+    def _on_done(self, result: list) -> None:
+        self._running = False
+        if result:
+            print(f"[Archive] {len(result)}개 주차 보관 완료 "
+                  f"({sum(r['rows'] for r in result)}행, {sum(r['bytes'] for r in result):,}B)")
+        self.archived.emit(result)
+
+    def _on_failed(self, message: str) -> None:
+        self._running = False
+        print(f"[Archive] 자동 보관 실패: {message}")
+        self.failed.emit(message)
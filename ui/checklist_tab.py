@@ -3,56 +3,180 @@
 SQLite DataManager 기반으로 동작.
 """
 
-from functools import partial
-
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QComboBox, QGroupBox, QInputDialog, QMessageBox, QDialog,
     QListWidget, QListWidgetItem, QLineEdit, QSpinBox, QSplitter,
-    QScrollArea, QSizePolicy,
+    QSizePolicy,
 )
 from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt, QTimer, Signal
 
 from data_layer import DataManager, current_week_key
+from data_layer.accounts import AccountRegistry
+from data_layer.query_trace import traced_action
 from ui.styles import (
-    COMBO_STYLE, CHECKLIST_BTN_STYLE, CHAR_TOTAL_LABEL_STYLE,
-    WEEK_TOTAL_LABEL_STYLE, CHAR_STAT_LABEL_STYLE,
+    COMBO_STYLE, CHAR_TOTAL_LABEL_STYLE,
+    WEEK_TOTAL_LABEL_STYLE,
 )
 from ui.widgets.character_sidebar import CharacterSidebar
+from ui.widgets.boss_checklist import BossChecklistModel, BossChecklistView
+from ui.widgets.income_summary import CharacterIncomeModel, IncomeSummaryView
+from ui.invalidation import InvalidationBus
 from api import (
-    get_character_ocid, get_character_info, get_character_stat,
-    extract_combat_power, load_character_pixmap, CharacterFetchThread,
+    CharacterFetchThread, BulkRefreshThread,
+    CharacterImageService, ThumbnailSpec,
 )
+from api.image_atlas import shared_atlas
+from config import ATLAS_FLUSH_INTERVAL_MS
 from utils import format_currency_ko, format_power_ko
 
 
+# 트래커 서버 변경 알림의 메서드별 영향
+_WEEK_LIST_METHODS = {"ensure_current_week", "add_character_to_week"}
+_BOSS_LIST_METHODS = {"add_boss", "delete_boss", "update_boss_price"}
+_WEEK_SCOPED_METHODS = {"set_boss_checked", "add_character_to_week",
+                        "add_boss_to_character", "remove_boss_from_character"}   # 첫 인자가 week_key
+
+
 class ChecklistTab(QWidget):
     data_changed = Signal()
 
-    def __init__(self, dm: DataManager, week_key: str, parent=None):
+    def __init__(self, dm: DataManager, week_key: str,
+                 bus: InvalidationBus | None = None, warm: dict | None = None, parent=None):
+        """warm: 웜 스타트 상태 (있으면 주차 목록·보스 목록을 DB 대신 여기서 읽음)"""
         super().__init__(parent)
         self._dm = dm
         self._week_key = week_key
+        self._warm = warm
         self._current_character = None
         self._current_boss_list = []
         self._fetch_thread = None
+        self._refresh_thread = None
         self._pending_checks = []
+        self._week_data_cache = None
+
+        # 상세 이미지는 워커에서 다운로드/크롭, 도착하면 시그널로 표시
+        self._images = CharacterImageService(parent=self)
+        self._images.image_ready.connect(self._on_character_image_ready)
+
+        # 새로 만든 썸네일은 모아서 주기적으로 atlas 파일에 기록
+        self._atlas_timer = QTimer(self)
+        self._atlas_timer.setInterval(ATLAS_FLUSH_INTERVAL_MS)
+        self._atlas_timer.timeout.connect(self.flush_image_atlas)
+        self._atlas_timer.start()
 
         self._save_timer = QTimer(singleShot=True)
         self._save_timer.timeout.connect(self._flush_pending_checks)
 
         self._build_ui()
 
+        # 등록 순서 = 재계산 순서 (사이드바 선택 → 체크리스트 → 요약)
+        self._bus = bus or InvalidationBus(self)
+        self._bus.register("sidebar", self._refresh_sidebar, self.isVisible)
+        self._bus.register("checklist", self._reload_checklist, self.isVisible)
+        self._bus.register("summary", self.refresh_stats_summary, self.isVisible)
+        self._warm = None   # UI 구성에만 사용, 이후 조회는 DB
+
+    @property
+    def current_character(self) -> str | None:
+        return self._current_character
+
+    @property
+    def week_key(self) -> str:
+        return self._week_key
+
+    @property
+    def busy(self) -> bool:
+        """캐릭터 조회·새로고침 워커가 도는 중 (끝나면 현재 DB에 저장하므로 계정 전환 불가)."""
+        return any(t is not None and t.isRunning() for t in (self._fetch_thread, self._refresh_thread))
+
+    def flush_image_atlas(self, prune: bool = False) -> None:
+        """새 썸네일이 있으면 atlas에 기록. prune이면 삭제된 캐릭터 항목도 정리 (atlas는 계정 공용)."""
+        atlas = shared_atlas()
+        if atlas is None or not (atlas.dirty or prune):
+            return
+        keep = None
+        if prune:
+            keep = {c["name"] for c in self._dm.get_all_characters()}
+            keep |= AccountRegistry().other_character_names()
+        try:
+            atlas.flush(keep)
+        except OSError as e:
+            print(f"[Atlas] 기록 실패: {e}")
+
+    @traced_action("week_switch")
     def switch_week(self, week_key: str) -> None:
         self._week_key = week_key
-        self._refresh_sidebar()
-        if self.sidebar.count() > 0:
-            self.sidebar.setCurrentRow(0)
-            first = self.sidebar.item(0)
-            if first:
-                self._load_character_checklist(first.data(Qt.UserRole))
-        self.refresh_stats_summary()
+        self._current_character = None  # 주차 전환 시 첫 캐릭터 선택
+        self._week_data_cache = None
+        self._bus.invalidate("sidebar", "checklist", "summary")
+
+    def reload(self, week_key: str) -> None:
+        """DB가 통째로 바뀌었을 때 (계정 전환) 주차 목록·보스 목록·체크리스트를 모두 다시 읽음."""
+        self.switch_week(week_key)
+        self.refresh_week_combo()
+        self._refresh_boss_list_widget()
+
+    # ------------------------------------------------------------------
+    # 웜 스타트
+    # ------------------------------------------------------------------
+
+    def apply_warm_start(self, state: dict) -> None:
+        """저장된 상태로 사이드바·체크리스트·요약을 바로 그림 (DB 조회 없음)."""
+        self._week_key = state["week_key"]
+        self._week_data_cache = state["week_data"]
+        names = list(state["week_data"])
+        self.sidebar.refresh(names, state["sources"])
+
+        selected = state.get("current_character")
+        if selected not in names:
+            selected = names[0] if names else None
+        self._current_character = selected
+        if selected is None:
+            self._reload_checklist()
+        else:
+            self.sidebar.blockSignals(True)
+            self.sidebar.setCurrentRow(names.index(selected))
+            self.sidebar.blockSignals(False)
+            self._show_character(selected, state["characters"].get(selected),
+                                 state["week_data"][selected])
+        self._income_model.set_totals(state["totals"])
+
+    def apply_reconciled(self, state: dict, changed: set[str]) -> None:
+        """백그라운드에서 다시 읽은 DB 상태와 다른 부분만 다시 그림."""
+        if "week_keys" in changed:
+            self.refresh_week_combo()
+        if "boss_list" in changed:
+            self._refresh_boss_list_widget()
+        views = []
+        if changed & {"week_data", "sources"}:
+            views.append("sidebar")
+        if changed & {"week_data", "characters"}:
+            views.append("checklist")
+        if changed & {"week_data", "totals"}:
+            views.append("summary")
+        if views:
+            self._week_data_cache = None
+            self._bus.invalidate(*views)
+
+    def apply_remote_changes(self, events: list[dict] | None) -> None:
+        """
+        다른 클라이언트가 서버에 커밋한 변경 반영 (events가 None이면 전체 새로고침).
+        다른 주차만 바뀌었으면 체크리스트는 그대로 두고 통계만 dirty 처리.
+        """
+        methods = {e["method"] for e in events} if events is not None else None
+        if methods is None or methods & _WEEK_LIST_METHODS:
+            self.refresh_week_combo()
+        if methods is None or methods & _BOSS_LIST_METHODS:
+            self._refresh_boss_list_widget()
+        if events is None or any(
+                e["method"] not in _WEEK_SCOPED_METHODS
+                or (e["args"][0] if e["args"] else self._week_key) == self._week_key
+                for e in events):
+            self._mark_data_changed("sidebar", "checklist", "summary")
+        else:
+            self.data_changed.emit()
 
     def refresh_week_combo(self) -> None:
         weeks = self._dm.get_all_week_keys()
@@ -63,39 +187,13 @@ class ChecklistTab(QWidget):
         self.week_combo.blockSignals(False)
 
     def refresh_stats_summary(self) -> None:
-        # 이번 주 전체 캐릭터 목록 가져오기
-        week_data = self._dm.get_week_data(self._week_key)
-        all_characters = list(week_data.keys())
-
-        # 수익 있는 캐릭터만 반환하는 기존 메서드 결과를 dict로 변환
-        char_totals_map = {
-            r["character"]: r["total"]
-            for r in self._dm.get_character_weekly_totals(self._week_key)
-        }
-
-        # 수익 없는 캐릭터도 0으로 포함
-        total = sum(char_totals_map.values())
-
-        if not hasattr(self, "_lbl_week_total"):
-            self._lbl_week_total = QLabel()
-            self._lbl_week_total.setFont(QFont("Noto Sans KR", 16, QFont.Bold))
-            self._lbl_week_total.setStyleSheet(WEEK_TOTAL_LABEL_STYLE)
-            self._lbl_week_total.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
-            self._stats_layout.insertWidget(0, self._lbl_week_total)
+        """캐릭터별 수익 전체 재조회 (주차 전환, 캐릭터/보스 구성 변경 시)."""
+        # 수익 없는 캐릭터도 0으로 포함, 주간 합계 라벨은 total_changed로 갱신
+        self._income_model.set_totals(self._dm.get_character_income_summary(self._week_key))
 
+    def _update_week_total_label(self, total: int) -> None:
         self._lbl_week_total.setText(f"이번 주 총 수익: {format_currency_ko(total)}")
 
-        for i in reversed(range(self._char_scroll_layout.count())):
-            w = self._char_scroll_layout.itemAt(i).widget()
-            if w:
-                w.setParent(None)
-
-        for char in all_characters:
-            char_total = char_totals_map.get(char, 0)  # 없으면 0
-            lbl = QLabel(f"{char}: {format_currency_ko(char_total)}")
-            lbl.setStyleSheet(CHAR_STAT_LABEL_STYLE)
-            self._char_scroll_layout.addWidget(lbl)
-
     def _build_ui(self) -> None:
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 10, 10, 10)
@@ -128,9 +226,14 @@ class ChecklistTab(QWidget):
         for lbl in (self.lbl_power, self.lbl_level, self.lbl_class):
             info_col.addWidget(lbl)
 
-        btn_refresh = QPushButton("정보 새로고침")
-        btn_refresh.clicked.connect(self._refresh_character_info)
-        info_col.addWidget(btn_refresh)
+        refresh_row = QHBoxLayout()
+        self.btn_refresh = QPushButton("정보 새로고침")
+        self.btn_refresh.clicked.connect(self._refresh_character_info)
+        self.btn_refresh_all = QPushButton("전체 새로고침")
+        self.btn_refresh_all.clicked.connect(self._refresh_all_characters)
+        refresh_row.addWidget(self.btn_refresh)
+        refresh_row.addWidget(self.btn_refresh_all)
+        info_col.addLayout(refresh_row)
 
         self.char_total_label = QLabel("선택된 캐릭터 수익: 0 메소")
         info_col.addWidget(self.char_total_label)
@@ -149,12 +252,16 @@ class ChecklistTab(QWidget):
 
         stats_group = QGroupBox("통계 요약")
         self._stats_layout = QVBoxLayout(stats_group)
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_widget = QWidget()
-        self._char_scroll_layout = QVBoxLayout(scroll_widget)
-        scroll.setWidget(scroll_widget)
-        self._stats_layout.addWidget(scroll)
+
+        self._lbl_week_total = QLabel("이번 주 총 수익: 0 메소")
+        self._lbl_week_total.setFont(QFont("Noto Sans KR", 16, QFont.Bold))
+        self._lbl_week_total.setStyleSheet(WEEK_TOTAL_LABEL_STYLE)
+        self._lbl_week_total.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        self._stats_layout.addWidget(self._lbl_week_total)
+
+        self._income_model = CharacterIncomeModel(self)
+        self._income_model.total_changed.connect(self._update_week_total_label)
+        self._stats_layout.addWidget(IncomeSummaryView(self._income_model))
         layout.addWidget(stats_group)
 
         return w
@@ -165,7 +272,8 @@ class ChecklistTab(QWidget):
 
         self.week_combo = QComboBox()
         self.week_combo.setStyleSheet(COMBO_STYLE)
-        self.week_combo.addItems(sorted(self._dm.get_all_week_keys()))
+        week_keys = self._warm["week_keys"] if self._warm else self._dm.get_all_week_keys()
+        self.week_combo.addItems(sorted(week_keys))
         self.week_combo.setCurrentText(self._week_key)
         self.week_combo.currentTextChanged.connect(self.switch_week)
 
@@ -177,8 +285,11 @@ class ChecklistTab(QWidget):
 
         checklist_group = QGroupBox("보스 체크리스트")
         checklist_col = QVBoxLayout(checklist_group)
-        self._checklist_buttons_layout = QVBoxLayout()
-        checklist_col.addLayout(self._checklist_buttons_layout)
+        self._checklist_model = BossChecklistModel(self)
+        self._checklist_model.toggled.connect(self._on_boss_toggled)
+        self.checklist_view = BossChecklistView()
+        self.checklist_view.setModel(self._checklist_model)
+        checklist_col.addWidget(self.checklist_view)
 
         boss_btn_row = QHBoxLayout()
         btn_add_boss = QPushButton("캐릭터 전용 보스 추가")
@@ -234,17 +345,47 @@ class ChecklistTab(QWidget):
         self._refresh_boss_list_widget()
         return group
 
+    # ------------------------------------------------------------------
+    # 무효화 / 재계산
+    # ------------------------------------------------------------------
+
+    def _week_data(self) -> dict:
+        """현재 주차 데이터. 한 번의 재계산 패스 안에서는 캐시를 공유."""
+        if self._week_data_cache is None:
+            self._week_data_cache = self._dm.get_week_data(self._week_key)
+        return self._week_data_cache
+
+    def _mark_data_changed(self, *views: str) -> None:
+        """DB 변경 후 호출. 주차 캐시를 비우고 영향받는 뷰만 dirty 처리."""
+        self._week_data_cache = None
+        if views:
+            self._bus.invalidate(*views)
+        self.data_changed.emit()
+
+    def _reload_checklist(self) -> None:
+        if self._current_character:
+            self._load_character_checklist(self._current_character)
+        else:
+            self._current_boss_list = []
+            self._clear_character_info()
+            self._clear_checklist()
+            self.char_total_label.setText("선택된 캐릭터 수익: 0 메소")
+
     def _load_character_checklist(self, char_name: str) -> None:
-        self._clear_checklist_buttons()
         self._current_character = char_name
 
         char_info = self._dm.get_character(char_name)
-        week_data = self._dm.get_week_data(self._week_key)
+        week_data = self._week_data()
 
         if char_name not in week_data:
             self._dm.add_character_to_week(self._week_key, char_name)
-            week_data = self._dm.get_week_data(self._week_key)
+            self._week_data_cache = None
+            week_data = self._week_data()
 
+        self._show_character(char_name, char_info, week_data.get(char_name, {}))
+
+    def _show_character(self, char_name: str, char_info: dict | None, char_week: dict) -> None:
+        """캐릭터 정보 라벨·이미지·체크리스트 표시 (DB 조회 없음)."""
         if char_info:
             self.lbl_power.setText(f"전투력: {format_power_ko(char_info.get('power', 0))}")
             self.lbl_level.setText(f"레벨: {char_info.get('level', '-')}")
@@ -254,27 +395,23 @@ class ChecklistTab(QWidget):
         else:
             self._clear_character_info()
 
-        self._current_boss_list = week_data.get(char_name, {}).get("bosses", [])
-
-        for idx, boss in enumerate(self._current_boss_list):
-            btn = QPushButton(f"{boss['text']} ({boss['value']:,}메소)")
-            btn.setCheckable(True)
-            btn.setChecked(boss.get("checked", False))
-            btn.setStyleSheet(CHECKLIST_BTN_STYLE)
-            btn.clicked.connect(partial(self._on_boss_toggled, idx, btn))
-            self._checklist_buttons_layout.addWidget(btn)
+        # 모델은 같은 리스트를 공유 — 캐릭터 전환은 모델 리셋 한 번
+        self._current_boss_list = char_week.get("bosses", [])
+        self._checklist_model.set_bosses(self._current_boss_list)
 
         self._update_char_total_label()
 
-    def _on_boss_toggled(self, idx: int, btn: QPushButton) -> None:
-        boss = self._current_boss_list[idx]
-        boss["checked"] = btn.isChecked()
+    @traced_action("toggle")
+    def _on_boss_toggled(self, row: int, checked: bool) -> None:
+        boss = self._current_boss_list[row]
+        boss["checked"] = checked
         # DB에 즉시 저장 (디바운스 제거)
         self._dm.set_boss_checked(self._week_key, self._current_character, boss["text"], boss["checked"])
         self._update_char_total_label()
-        self.refresh_stats_summary()  # 즉시 갱신
-        self.data_changed.emit()
-        
+        # 요약 테이블은 해당 캐릭터 행만 증감 (재조회 없음)
+        self._income_model.apply_delta(self._current_character, boss["value"] if checked else -boss["value"])
+        self._mark_data_changed()
+
     def _flush_pending_checks(self) -> None:
         for boss_name, checked in self._pending_checks:
             self._dm.set_boss_checked(self._week_key, self._current_character, boss_name, checked)
@@ -285,20 +422,31 @@ class ChecklistTab(QWidget):
         self.char_total_label.setText(f"{self._current_character} 수익: {format_currency_ko(total)}")
         self.char_total_label.setStyleSheet(CHAR_TOTAL_LABEL_STYLE)
 
-    def _clear_checklist_buttons(self) -> None:
-        while self._checklist_buttons_layout.count():
-            item = self._checklist_buttons_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def _clear_checklist(self) -> None:
+        self._checklist_model.set_bosses([])
 
+    @traced_action("select_character")
     def _on_sidebar_changed(self, current, _previous) -> None:
         if current:
-            self._load_character_checklist(current.data(Qt.UserRole))
-            self.refresh_stats_summary()
+            self._current_character = current.data(Qt.UserRole)
+            self._bus.invalidate("checklist")
 
     def _refresh_sidebar(self) -> None:
-        week_data = self._dm.get_week_data(self._week_key)
-        self.sidebar.refresh(list(week_data.keys()))
+        """사이드바 재구성 후 선택 캐릭터 복원 (없으면 첫 캐릭터)."""
+        names = list(self._week_data().keys())
+        self.sidebar.refresh(names, self._images.store.current_paths())
+
+        selected = None
+        if names:
+            row = names.index(self._current_character) if self._current_character in names else 0
+            self.sidebar.blockSignals(True)
+            self.sidebar.setCurrentRow(row)
+            self.sidebar.blockSignals(False)
+            selected = names[row]
+
+        if selected != self._current_character:
+            self._current_character = selected
+            self._bus.invalidate("checklist")
 
     def _add_character_dialog(self) -> None:
         text, ok = QInputDialog.getText(self, "캐릭터 추가", "추가할 캐릭터 이름을 입력하세요:")
@@ -306,7 +454,7 @@ class ChecklistTab(QWidget):
             return
         name = text.strip()
 
-        if name in self._dm.get_week_data(self._week_key):
+        if name in self._week_data():
             QMessageBox.warning(self, "중복", "이미 동일한 이름의 캐릭터가 있습니다.")
             return
 
@@ -315,6 +463,7 @@ class ChecklistTab(QWidget):
         self._fetch_thread.failed.connect(lambda msg: QMessageBox.warning(self, "실패", msg))
         self._fetch_thread.start()
 
+    @traced_action("add_character")
     def _on_character_fetch_success(self, name: str, info: dict) -> None:
         self._dm.upsert_character(
             name=name,
@@ -324,14 +473,8 @@ class ChecklistTab(QWidget):
             image_url=info.get("character_image"),
         )
         self._dm.add_character_to_week(self._week_key, name)
-        self._refresh_sidebar()
-
-        for i in range(self.sidebar.count()):
-            if self.sidebar.item(i).data(Qt.UserRole) == name:
-                self.sidebar.setCurrentRow(i)
-                break
-
-        self.data_changed.emit()
+        self._current_character = name
+        self._mark_data_changed("sidebar", "checklist", "summary")
         QMessageBox.information(self, "추가", f"{name} 캐릭터 정보가 등록되었습니다.")
 
     def _delete_character_dialog(self) -> None:
@@ -345,18 +488,10 @@ class ChecklistTab(QWidget):
         if ans != QMessageBox.Yes:
             return
 
+        self._images.store.forget(name)
         self._dm.delete_character(name)
-        self._refresh_sidebar()
-
-        if self.sidebar.count() > 0:
-            self.sidebar.setCurrentRow(0)
-        else:
-            self._current_character = None
-            self._clear_character_info()
-            self._clear_checklist_buttons()
-            self.char_total_label.setText("선택된 캐릭터 수익: 0 메소")
-
-        self.data_changed.emit()
+        self._current_character = None
+        self._mark_data_changed("sidebar", "checklist", "summary")
 
     def _add_character_boss_dialog(self) -> None:
         if not self._current_character:
@@ -405,7 +540,7 @@ class ChecklistTab(QWidget):
         def _on_ok():
             selected = [i.data(Qt.UserRole) for i in list_widget.selectedItems()]
             on_confirm(selected)
-            self._load_character_checklist(self._current_character)
+            self._mark_data_changed("checklist", "summary")
             dlg.accept()
 
         btn_ok.clicked.connect(_on_ok)
@@ -414,7 +549,7 @@ class ChecklistTab(QWidget):
 
     def _refresh_boss_list_widget(self) -> None:
         self._boss_list_widget.clear()
-        for b in self._dm.get_boss_list():
+        for b in (self._warm["boss_list"] if self._warm else self._dm.get_boss_list()):
             item = QListWidgetItem(f"{b['name']} ({b['value']:,}메소)")
             item.setData(Qt.UserRole, b)
             self._boss_list_widget.addItem(item)
@@ -429,8 +564,7 @@ class ChecklistTab(QWidget):
             return
         self._dm.add_boss(name, value)
         self._refresh_boss_list_widget()
-        if self._current_character:
-            self._load_character_checklist(self._current_character)
+        self._mark_data_changed("checklist")
 
     def _delete_selected_global_boss(self) -> None:
         sel = self._boss_list_widget.currentItem()
@@ -438,8 +572,7 @@ class ChecklistTab(QWidget):
             return
         self._dm.delete_boss(sel.data(Qt.UserRole)["name"])
         self._refresh_boss_list_widget()
-        if self._current_character:
-            self._load_character_checklist(self._current_character)
+        self._mark_data_changed("checklist", "summary")
 
     def _update_boss_price_dialog(self) -> None:
         sel = self._boss_list_widget.currentItem()
@@ -474,6 +607,7 @@ class ChecklistTab(QWidget):
 
         self._dm.update_boss_price(boss_name, new_value, applied_from.strip(), note if ok else "")
         self._refresh_boss_list_widget()
+        self._mark_data_changed("checklist", "summary")
         QMessageBox.information(
             self, "완료",
             f"{boss_name} 시세가 {new_value:,}메소로 변경되었습니다.\n"
@@ -484,31 +618,59 @@ class ChecklistTab(QWidget):
         if not self._current_character:
             QMessageBox.warning(self, "경고", "캐릭터를 먼저 선택하세요.")
             return
+        char = self._dm.get_character(self._current_character) or {}
+        self._start_refresh([{"name": self._current_character, "ocid": char.get("ocid")}])
 
-        name = self._current_character
-        char = self._dm.get_character(name) or {}
-        ocid = char.get("ocid") or get_character_ocid(name)
-        if not ocid:
-            QMessageBox.critical(self, "에러", "OCID를 불러올 수 없습니다.")
+    def _refresh_all_characters(self) -> None:
+        characters = [{"name": c["name"], "ocid": c["ocid"]} for c in self._dm.get_all_characters()]
+        if not characters:
+            QMessageBox.information(self, "알림", "등록된 캐릭터가 없습니다.")
             return
+        self._start_refresh(characters)
 
-        basic = get_character_info(ocid)
-        stat = get_character_stat(ocid)
-        power = extract_combat_power(stat) if stat else None
-
-        self._dm.upsert_character(
-            name=name, ocid=ocid,
-            level=basic.get("character_level") if basic else None,
-            job=basic.get("character_class") if basic else None,
-            image_url=basic.get("character_image") if basic else None,
-            power=power,
-        )
-        self._update_character_display(name)
+    def _start_refresh(self, characters: list[dict]) -> None:
+        """API 조회는 워커 스레드에서 동시에, 저장은 끝난 뒤 한 트랜잭션으로."""
+        if self._refresh_thread is not None and self._refresh_thread.isRunning():
+            return
+        self.btn_refresh.setEnabled(False)
+        self.btn_refresh_all.setEnabled(False)
+        self._refresh_thread = BulkRefreshThread(characters, parent=self)
+        self._refresh_thread.progress.connect(self._on_refresh_progress)
+        self._refresh_thread.completed.connect(self._on_refresh_completed)
+        self._refresh_thread.start()
+
+    def _on_refresh_progress(self, done: int, total: int, _name: str) -> None:
+        self.btn_refresh_all.setText(f"새로고침 중 {done}/{total}")
+
+    @traced_action("refresh")
+    def _on_refresh_completed(self, rows: list, errors: dict) -> None:
+        self.btn_refresh.setEnabled(True)
+        self.btn_refresh_all.setEnabled(True)
+        self.btn_refresh_all.setText("전체 새로고침")
+
+        if rows:
+            self._dm.upsert_characters(rows)
+            self._mark_data_changed()
+        if self._current_character and self._current_character in {r["name"] for r in rows}:
+            self._update_character_display(self._current_character)
+
+        if errors:
+            detail = "\n".join(f"{name}: {msg}" for name, msg in errors.items())
+            QMessageBox.warning(
+                self, "새로고침 실패",
+                f"{len(errors)}명의 정보를 불러오지 못했습니다.\n{detail}",
+            )
 
     def _show_character_image(self, url: str, char_name: str) -> None:
         size = min(self.char_image_label.width(), self.char_image_label.height())
-        pixmap = load_character_pixmap(url, char_name, target_size=size)
-        if pixmap:
+        pixmap = self._images.request(url, char_name, ThumbnailSpec(size))
+        if pixmap is not None:
+            self.char_image_label.setPixmap(pixmap)
+        else:
+            self.char_image_label.clear()   # 도착 전까지 이전 캐릭터 이미지 숨김
+
+    def _on_character_image_ready(self, char_name: str, _spec, pixmap) -> None:
+        if char_name == self._current_character:
             self.char_image_label.setPixmap(pixmap)
 
     def _update_character_display(self, char_name: str) -> None:
@@ -0,0 +1,185 @@
+"""
+진단 패널 — 이벤트 루프 멈춤 기록과 SQL 추적 보고서를 앱 안에서 확인.
+
+- 이벤트 루프: 지연 히스토그램, 멈춤 목록(시각·지속 시간·슬롯), 선택한 멈춤의 스택
+- SQL: data_layer.query_trace 보고서 (추적이 켜져 있을 때만 내용이 쌓임)
+
+패널이 떠 있는 동안 1초마다, 그리고 멈춤이 기록될 때마다 다시 그린다.
+"""
+
+import time
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QFont
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTabWidget,
+    QTableWidget, QTableWidgetItem, QPlainTextEdit, QSplitter, QWidget,
+    QHeaderView, QFileDialog, QMessageBox,
+)
+
+from config import EVENT_MONITOR_FILE
+from data_layer.query_trace import tracer
+from ui.event_monitor import EventLoopMonitor
+from ui.styles import APP_DARK_THEME, TAB_STYLE, INCOME_TABLE_STYLE
+
+
+class DiagnosticsPanel(QDialog):
+    """EventLoopMonitor / QueryTracer 보고서 뷰어 (비모달)."""
+
+    def __init__(self, monitor: EventLoopMonitor, parent=None):
+        super().__init__(parent)
+        self._monitor = monitor
+        self._stalls: list[dict] = []
+        self.setWindowTitle("진단")
+        self.resize(820, 560)
+        self.setStyleSheet(APP_DARK_THEME)
+
+        layout = QVBoxLayout(self)
+        tabs = QTabWidget()
+        tabs.setStyleSheet(TAB_STYLE)
+        tabs.addTab(self._build_loop_tab(), "이벤트 루프")
+        tabs.addTab(self._build_sql_tab(), "SQL")
+        layout.addWidget(tabs)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(1000)
+        self._refresh_timer.timeout.connect(self.refresh)
+        monitor.stalled.connect(lambda _stall: self.refresh())
+
+    # ------------------------------------------------------------------
+    # 구성
+    # ------------------------------------------------------------------
+
+    def _build_loop_tab(self) -> QWidget:
+        page = QWidget()
+        layout = QVBoxLayout(page)
+
+        row = QHBoxLayout()
+        self._summary = QLabel()
+        row.addWidget(self._summary, stretch=1)
+        self._btn_toggle = QPushButton()
+        self._btn_toggle.clicked.connect(self._toggle_monitor)
+        btn_reset = QPushButton("초기화")
+        btn_reset.clicked.connect(lambda: (self._monitor.reset(), self.refresh()))
+        btn_dump = QPushButton("파일로 저장")
+        btn_dump.clicked.connect(self._dump)
+        for btn in (self._btn_toggle, btn_reset, btn_dump):
+            row.addWidget(btn)
+        layout.addLayout(row)
+
+        self._histogram = QLabel()
+        self._histogram.setStyleSheet("color: #B5BAC1; font-weight: normal;")
+        layout.addWidget(self._histogram)
+
+        splitter = QSplitter(Qt.Vertical)
+        self._table = QTableWidget(0, 4)
+        self._table.setHorizontalHeaderLabels(["시각", "멈춤(ms)", "슬롯 / 핸들러", "샘플"])
+        self._table.setStyleSheet(INCOME_TABLE_STYLE)
+        self._table.verticalHeader().setVisible(False)
+        self._table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self._table.setSelectionBehavior(QTableWidget.SelectRows)
+        self._table.setSelectionMode(QTableWidget.SingleSelection)
+        self._table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self._table.currentCellChanged.connect(lambda row, *_: self._show_stack(row))
+        splitter.addWidget(self._table)
+
+        self._stack = self._text_view()
+        splitter.addWidget(self._stack)
+        splitter.setSizes([260, 200])
+        layout.addWidget(splitter)
+        return page
+
+    def _build_sql_tab(self) -> QWidget:
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        self._sql_status = QLabel()
+        layout.addWidget(self._sql_status)
+        self._sql_report = self._text_view()
+        layout.addWidget(self._sql_report)
+        return page
+
+    @staticmethod
+    def _text_view() -> QPlainTextEdit:
+        view = QPlainTextEdit()
+        view.setReadOnly(True)
+        view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        view.setFont(QFont("monospace", 9))
+        view.setStyleSheet("background-color: #1E1F22; border: none;")
+        return view
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> None:
+        if not self.isVisible():
+            return
+        r = self._monitor.report()
+        self._btn_toggle.setText("감시 중지" if r["running"] else "감시 시작")
+        state = "감시 중" if r["running"] else "꺼짐"
+        self._summary.setText(f"{state} · 박동 {r['beats']}회 · 최대 지연 {r['max_latency_ms']:.0f}ms · "
+                              f"멈춤 {len(r['stalls'])}건 (기준 {r['stall_ms']}ms)")
+        self._histogram.setText("지연 분포: " + ("  ".join(
+            f"{label} {n}" for label, n in r["latency_histogram"].items()) or "-"))
+
+        if r["stalls"] != self._stalls:
+            self._stalls = r["stalls"]
+            self._fill_table()
+
+        self._sql_status.setText("SQL 추적 " + ("켜짐" if tracer.enabled else
+                                               "꺼짐 (트레이 메뉴 또는 Ctrl+Shift+Q로 켜기)"))
+        self._sql_report.setPlainText(tracer.format_report())
+
+    def _fill_table(self) -> None:
+        # 최신 멈춤이 위로
+        self._table.setRowCount(len(self._stalls))
+        for row, stall in enumerate(reversed(self._stalls)):
+            cells = [time.strftime("%H:%M:%S", time.localtime(stall["at"])),
+                     f"{stall['ms']:.0f}", stall["handler"], str(stall["samples"])]
+            for col, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if col in (1, 3):
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self._table.setItem(row, col, item)
+        self._table.resizeColumnsToContents()
+        if self._stalls and self._table.currentRow() < 0:
+            self._table.selectRow(0)
+
+    def _show_stack(self, row: int) -> None:
+        if not 0 <= row < len(self._stalls):
+            self._stack.clear()
+            return
+        stall = self._stalls[len(self._stalls) - 1 - row]
+        header = f"# 샘플 {stall['samples']}개 중 {stall['stack_hits']}개에서 잡힌 스택 (바깥 → 안쪽)"
+        self._stack.setPlainText("\n".join([header, *stall["stack"]]))
+
+    # ------------------------------------------------------------------
+    # 동작
+    # ------------------------------------------------------------------
+
+    def _toggle_monitor(self) -> None:
+        if self._monitor.running:
+            self._monitor.stop()
+        else:
+            self._monitor.start()
+        self.refresh()
+
+    def _dump(self) -> None:
+        path, _ = QFileDialog.getSaveFileName(self, "진단 보고서 저장", EVENT_MONITOR_FILE,
+                                              "JSON Files (*.json)")
+        if not path:
+            return
+        try:
+            self._monitor.dump(path)
+        except OSError as e:
+            QMessageBox.critical(self, "오류", f"저장 실패:\n{e}")
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._stalls = []
+        self._refresh_timer.start()
+        self.refresh()
+
+    def hideEvent(self, event) -> None:
+        self._refresh_timer.stop()
+        super().hideEvent(event)
@@ -0,0 +1,231 @@
+"""
+GUI 이벤트 루프 지연 감시 (watchdog).
+
+- GUI 스레드 QTimer가 heartbeat_ms마다 박동 시각을 갱신하고, 예정보다 늦은 만큼(drift)을
+  히스토그램으로 모은다 → 평소 이벤트 루프 지연 분포
+- 감시 스레드가 sample_ms마다 마지막 박동을 확인해 stall_ms 이상 멈춰 있으면
+  GUI 스레드의 스택을 샘플링한다 (sys._current_frames)
+- 박동이 다시 오면 그 멈춤을 하나의 기록으로 남긴다:
+  지속 시간, 실행 중이던 슬롯(스택에서 가장 바깥의 앱 코드 프레임), 가장 많이 잡힌 스택
+
+꺼져 있을 때는 타이머도 스레드도 없다.
+
+사용 흐름:
+    monitor = EventLoopMonitor(parent=app_widget)
+    monitor.start()
+    ...
+    print(monitor.format_report())
+    monitor.dump("event_stalls.json")
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from config import EVENT_HEARTBEAT_MS, EVENT_STALL_MS, EVENT_SAMPLE_MS
+
+# 이벤트 루프 지연 히스토그램 구간 (ms, 상한)
+LATENCY_BOUNDS = (5, 10, 20, 50, 100, 250, 500, 1000)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 슬롯 이름을 찾을 때 앱 코드로 보는 패키지 (main.py의 app.exec 프레임은 제외)
+_APP_DIRS = tuple(os.path.join(REPO_ROOT, d) + os.sep for d in ("ui", "api", "data_layer", "utils"))
+# 다른 슬롯을 대신 불러주기만 하는 프레임 (무효화 버스, 추적 래퍼) — 슬롯 이름으로 쓰지 않음
+_DISPATCHERS = {
+    (os.path.abspath(__file__), None),
+    (os.path.join(REPO_ROOT, "data_layer", "query_trace.py"), None),
+    (os.path.join(REPO_ROOT, "ui", "invalidation.py"), "flush"),
+}
+
+
+def _frame_label(frame: traceback.FrameSummary) -> str:
+    path = os.path.relpath(frame.filename, REPO_ROOT) if frame.filename.startswith(REPO_ROOT) \
+        else os.path.basename(frame.filename)
+    return f"{path}:{frame.lineno} {frame.name}"
+
+
+def _handler_of(stack: traceback.StackSummary) -> str:
+    """이벤트 루프가 부른 가장 바깥의 앱 코드 프레임 = 실행 중이던 슬롯/핸들러."""
+    for frame in stack:
+        if not frame.filename.startswith(_APP_DIRS):
+            continue
+        if (frame.filename, None) in _DISPATCHERS or (frame.filename, frame.name) in _DISPATCHERS:
+            continue
+        return _frame_label(frame)
+    return _frame_label(stack[-1]) if stack else "?"
+
+
+class EventLoopMonitor(QObject):
+    """GUI 스레드 박동 + 감시 스레드 스택 샘플링."""
+
+    stalled = Signal(dict)    # 멈춤 하나가 끝날 때 (GUI 스레드에서 emit)
+
+    def __init__(self, heartbeat_ms: int = EVENT_HEARTBEAT_MS, stall_ms: int = EVENT_STALL_MS,
+                 sample_ms: int = EVENT_SAMPLE_MS, max_stalls: int = 200, parent=None):
+        super().__init__(parent)
+        self.heartbeat_ms = heartbeat_ms
+        self.stall_ms = stall_ms
+        self.sample_ms = sample_ms
+        self._max_stalls = max_stalls
+        self._gui_thread_id = threading.get_ident()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._beat)
+        self.reset()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    # ------------------------------------------------------------------
+    # 켜기 / 끄기
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._thread.start()
+        self._timer.start()
+        print(f"[Monitor] 이벤트 루프 감시 시작 (박동 {self.heartbeat_ms}ms, 멈춤 기준 {self.stall_ms}ms)")
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._timer.stop()
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+        print("[Monitor] 이벤트 루프 감시 중지")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets = [0] * (len(LATENCY_BOUNDS) + 1)
+            self._beats = 0
+            self._max_latency = 0.0
+            self._stalls: deque = deque(maxlen=self._max_stalls)
+            self._samples: list[traceback.StackSummary] = []   # 진행 중인 멈춤의 스택 샘플
+            self._stall_started: float | None = None
+            self._started = time.time()
+        self._last_beat = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # GUI 스레드: 박동
+    # ------------------------------------------------------------------
+
+    def _beat(self) -> None:
+        now = time.monotonic()
+        latency = max(0.0, (now - self._last_beat) * 1000 - self.heartbeat_ms)
+        self._last_beat = now
+        with self._lock:
+            self._beats += 1
+            self._max_latency = max(self._max_latency, latency)
+            for i, bound in enumerate(LATENCY_BOUNDS):
+                if latency < bound:
+                    self._buckets[i] += 1
+                    break
+            else:
+                self._buckets[-1] += 1
+            samples, started = self._samples, self._stall_started
+            self._samples, self._stall_started = [], None
+        if samples and latency >= self.stall_ms:
+            self._record_stall(started, latency, samples)
+
+    def _record_stall(self, started: float, latency: float, samples: list) -> None:
+        stacks = Counter(tuple(_frame_label(f) for f in s) for s in samples)
+        top_stack, hits = stacks.most_common(1)[0]
+        handlers = Counter(_handler_of(s) for s in samples)
+        stall = {
+            "at": started,
+            "ms": round(latency, 1),
+            "handler": handlers.most_common(1)[0][0],
+            "samples": len(samples),
+            "stack": list(top_stack),
+            "stack_hits": hits,
+        }
+        with self._lock:
+            self._stalls.append(stall)
+        print(f"[Monitor] 이벤트 루프 {stall['ms']:.0f}ms 멈춤 — {stall['handler']}")
+        self.stalled.emit(stall)
+
+    # ------------------------------------------------------------------
+    # 감시 스레드: 스택 샘플링
+    # ------------------------------------------------------------------
+
+    def _watch(self) -> None:
+        interval = self.sample_ms / 1000
+        while not self._stop.wait(interval):
+            since = (time.monotonic() - self._last_beat) * 1000
+            if since < self.heartbeat_ms + self.stall_ms:
+                continue
+            frame = sys._current_frames().get(self._gui_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            with self._lock:
+                if self._stall_started is None:
+                    self._stall_started = time.time() - since / 1000
+                if len(self._samples) < 500:
+                    self._samples.append(stack)
+
+    # ------------------------------------------------------------------
+    # 보고
+    # ------------------------------------------------------------------
+
+    def report(self) -> dict:
+        """
+        Returns:
+            {"running": True, "since": 1760000000.0, "heartbeat_ms": 50, "stall_ms": 100,
+             "beats": 1200, "max_latency_ms": 310.2,
+             "latency_histogram": {"<5ms": 1180, "<10ms": 15, ...},
+             "handlers": {"ui/app.py:101 _on_tab_changed": {"count": 2, "total_ms": 540.0}},
+             "stalls": [{"at": ..., "ms": 310.2, "handler": "...", "samples": 12, "stack": [...]}]}
+        """
+        with self._lock:
+            buckets = list(self._buckets)
+            stalls = list(self._stalls)
+            beats, max_latency = self._beats, self._max_latency
+        labels = [f"<{b}ms" for b in LATENCY_BOUNDS] + [f">={LATENCY_BOUNDS[-1]}ms"]
+        handlers: dict[str, dict] = {}
+        for s in stalls:
+            h = handlers.setdefault(s["handler"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            h["count"] += 1
+            h["total_ms"] = round(h["total_ms"] + s["ms"], 1)
+            h["max_ms"] = max(h["max_ms"], s["ms"])
+        return {
+            "running": self.running,
+            "since": self._started,
+            "heartbeat_ms": self.heartbeat_ms,
+            "stall_ms": self.stall_ms,
+            "beats": beats,
+            "max_latency_ms": round(max_latency, 1),
+            "latency_histogram": {label: n for label, n in zip(labels, buckets) if n},
+            "handlers": dict(sorted(handlers.items(), key=lambda kv: -kv[1]["total_ms"])),
+            "stalls": stalls,
+        }
+
+    def format_report(self) -> str:
+        r = self.report()
+        lines = [f"[Monitor] 박동 {r['beats']}회, 최대 지연 {r['max_latency_ms']:.0f}ms, "
+                 f"멈춤 {len(r['stalls'])}건 (기준 {r['stall_ms']}ms)"]
+        for label, n in r["latency_histogram"].items():
+            lines.append(f"  {label:>9} {n:>6}")
+        for handler, h in r["handlers"].items():
+            lines.append(f"  {h['total_ms']:>8.0f}ms {h['count']:>3}회 (최대 {h['max_ms']:.0f}ms)  {handler}")
+        return "\n".join(lines)
+
+    def dump(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
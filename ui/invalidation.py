@@ -0,0 +1,174 @@
+"""
+뷰 무효화(invalidation) 버스.
+
+데이터가 바뀌면 영향받는 뷰를 dirty로 표시만 해두고,
+이벤트 루프 한 바퀴에 한 번 모아서(coalescing) 다시 계산한다.
+화면에 보이지 않는 뷰는 dirty 상태로 남겨두었다가, 보이게 될 때 계산한다.
+
+사용 흐름:
+    bus = InvalidationBus()
+    bus.register("summary", tab.refresh_stats_summary, tab.isVisible)
+    bus.invalidate("summary")      # 여러 번 호출해도
+    bus.invalidate("summary")      # 다음 패스에서 한 번만 재계산
+"""
+
+from dataclasses import dataclass, asdict
+from typing import Callable
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from data_layer.query_trace import tracer
+from utils.profiling import span
+
+
+@dataclass
+class ViewCounters:
+    """뷰 하나의 무효화/재계산 카운터."""
+    invalidations: int = 0   # invalidate 호출 횟수
+    coalesced: int = 0       # 이미 dirty 상태라 합쳐진 횟수
+    recomputes: int = 0      # 실제 재계산 횟수
+    deferred: int = 0        # 보이지 않아 뒤로 미뤄진 횟수
+
+
+@dataclass
+class _View:
+    recompute: Callable[[], None]
+    is_visible: Callable[[], bool]
+
+
+class InvalidationBus(QObject):
+    """dirty 플래그 기반 뷰 재계산 스케줄러."""
+
+    flushed = Signal(list)  # 이번 패스에서 재계산된 뷰 이름 목록
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._views: dict[str, _View] = {}   # 등록 순서 = 재계산 순서
+        self._dirty: set[str] = set()
+        self._causes: dict[str, str] = {}    # 뷰 → 무효화한 UI 동작 (쿼리 추적 중에만, 다음 패스까지만)
+        self._trigger = "-"                  # 패스를 예약한 UI 동작 (탭 전환 등, 쿼리 추적 중에만)
+        self._counters: dict[str, ViewCounters] = {}
+        self._passes = 0
+        self._flushing = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    # ------------------------------------------------------------------
+    # 등록
+    # ------------------------------------------------------------------
+
+    def register(self, name: str, recompute: Callable[[], None],
+                 is_visible: Callable[[], bool] | None = None) -> None:
+        """
+        뷰 등록. 먼저 등록된 뷰가 같은 패스 안에서 먼저 재계산된다.
+        (ex. 사이드바 → 체크리스트 → 요약 순서로 의존)
+        """
+        self._views[name] = _View(recompute, is_visible or (lambda: True))
+        self._counters.setdefault(name, ViewCounters())
+
+    def unregister(self, name: str) -> None:
+        self._views.pop(name, None)
+        self._dirty.discard(name)
+        self._causes.pop(name, None)
+
+    # ------------------------------------------------------------------
+    # 무효화
+    # ------------------------------------------------------------------
+
+    def invalidate(self, *names: str) -> None:
+        """뷰를 dirty로 표시하고 다음 이벤트 루프 패스를 예약."""
+        for name in names:
+            counters = self._counters.setdefault(name, ViewCounters())
+            counters.invalidations += 1
+            if name in self._dirty:
+                counters.coalesced += 1
+            else:
+                self._dirty.add(name)
+                if tracer.enabled:
+                    self._causes[name] = tracer.current_action()
+        self.schedule()
+
+    def invalidate_all(self) -> None:
+        self.invalidate(*self._views.keys())
+
+    def is_dirty(self, name: str) -> bool:
+        return name in self._dirty
+
+    def schedule(self) -> None:
+        """dirty 뷰가 있으면 다음 패스 예약. 탭 전환 등 가시성 변화 시에도 호출."""
+        if self._dirty and tracer.enabled and tracer.current_action() != "-":
+            self._trigger = tracer.current_action()
+        if self._dirty and not self._timer.isActive():
+            self._timer.start()
+
+    # ------------------------------------------------------------------
+    # 재계산
+    # ------------------------------------------------------------------
+
+    def flush(self) -> list[str]:
+        """
+        dirty이면서 보이는 뷰만 등록 순서대로 재계산.
+        패스 도중 아직 처리 전인 뷰가 dirty가 되면 같은 패스에서 처리하고,
+        이미 처리한 뷰가 다시 dirty가 되면 다음 패스로 넘긴다.
+        """
+        if self._flushing:
+            return []
+        self._flushing = True
+        self._timer.stop()
+        self._passes += 1
+        trigger, self._trigger = self._trigger, "-"
+        done: list[str] = []
+        try:
+            for name, view in list(self._views.items()):
+                if name not in self._dirty:
+                    continue
+                if not view.is_visible():
+                    # 나중에 보일 때의 재계산은 그때 패스를 예약한 동작(탭 전환 등)의 몫
+                    self._counters[name].deferred += 1
+                    self._causes.pop(name, None)
+                    continue
+                self._dirty.discard(name)
+                self._counters[name].recomputes += 1
+                cause = self._causes.pop(name, None) or trigger
+                with span(f"bus:{name}", "ui", cause=cause):
+                    if tracer.enabled:
+                        # 재계산 쿼리는 뷰를 무효화한 동작 이름으로 집계 (모르면 뷰 이름)
+                        with tracer.action(cause if cause != "-" else f"bus:{name}"):
+                            view.recompute()
+                    else:
+                        view.recompute()
+                done.append(name)
+        finally:
+            self._flushing = False
+
+        # 처리된 뷰가 패스 도중 다시 dirty가 된 경우만 재예약
+        # (보이지 않아 남아있는 뷰는 schedule() 호출 시 처리)
+        if any(n in self._dirty for n in done):
+            self._timer.start()
+        if done:
+            self.flushed.emit(done)
+        return done
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+
+    def counters(self) -> dict:
+        """
+        뷰별 카운터 반환.
+
+        Returns:
+            {"passes": 12, "views": {"summary": {"invalidations": 5, "coalesced": 2, ...}}}
+        """
+        return {
+            "passes": self._passes,
+            "views": {name: asdict(c) for name, c in self._counters.items()},
+        }
+
+    def reset_counters(self) -> None:
+        self._passes = 0
+        for name in self._counters:
+            self._counters[name] = ViewCounters()
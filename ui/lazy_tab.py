@@ -0,0 +1,62 @@
+"""
+처음 보일 때 만들어지는 탭 자리 표시자.
+
+통계 탭은 polars / QtCharts를 import하고 차트를 구성하느라 무겁지만,
+대부분의 실행은 체크리스트만 쓴다. LazyTab은 빈 위젯으로 탭 자리를 잡아두고
+처음 보이거나 refresh()가 불릴 때 factory로 실제 탭을 만들어 끼운다.
+
+사용 흐름:
+    tab = LazyTab(lambda: WeeklyStatsTab(store=store))   # factory 안에서 import
+    tabs.addTab(tab, "📊 누적 수익")
+    bus.register("weekly_stats", tab.refresh, tab.isVisible)
+"""
+
+import time
+from typing import Callable
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
+
+
+class LazyTab(QWidget):
+    """factory()가 만든 위젯을 처음 필요할 때 생성해 담는 컨테이너."""
+
+    built = Signal(object, float)   # (생성된 위젯, 생성 시간 ms)
+
+    def __init__(self, factory: Callable[[], QWidget], parent=None):
+        super().__init__(parent)
+        self._factory = factory
+        self._widget: QWidget | None = None
+
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._placeholder = QLabel("불러오는 중…")
+        self._placeholder.setAlignment(Qt.AlignCenter)
+        self._layout.addWidget(self._placeholder)
+
+    @property
+    def widget(self) -> QWidget | None:
+        """생성된 실제 탭 (아직 없으면 None)."""
+        return self._widget
+
+    def is_built(self) -> bool:
+        return self._widget is not None
+
+    def ensure_built(self) -> QWidget:
+        if self._widget is None:
+            started = time.perf_counter()
+            self._widget = self._factory()
+            self._layout.removeWidget(self._placeholder)
+            self._placeholder.deleteLater()
+            self._layout.addWidget(self._widget)
+            elapsed = (time.perf_counter() - started) * 1000
+            print(f"[UI] {type(self._widget).__name__} 생성 ({elapsed:.0f}ms)")
+            self.built.emit(self._widget, elapsed)
+        return self._widget
+
+    def refresh(self) -> None:
+        self.ensure_built().refresh()
+
+    def showEvent(self, event) -> None:
+        self.ensure_built()
+        super().showEvent(event)
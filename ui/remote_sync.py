@@ -0,0 +1,91 @@
+"""
+트래커 서버 변경 알림 수신.
+
+감시 스레드가 /api/events를 long poll로 기다렸다가 다른 클라이언트가 커밋한 쓰기를
+GUI 스레드로 보낸다 (changed 시그널, queued). 자기 쓰기는 이미 화면에 반영돼 있으므로 거른다.
+서버가 다시 시작됐거나 알림이 너무 밀렸으면 None을 보낸다 → 전체 새로고침.
+"""
+
+import threading
+import time
+
+from PySide6.QtCore import QObject, Signal
+
+from config import LONG_POLL_TIMEOUT
+from data_layer.remote import RemoteDataManager, RemoteError
+
+_RETRY_MAX_S = 5.0     # 서버 연결 실패 시 재시도 간격 상한
+
+
+class RemoteChangeListener(QObject):
+
+    changed = Signal(object)   # [{"seq", "method", "args", "client", "ts"}, ...] 또는 None(전체)
+    connection_changed = Signal(bool)
+
+    def __init__(self, dm: RemoteDataManager, parent=None):
+        super().__init__(parent)
+        self._dm = dm
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._seq: int | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="remote-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        # 대기 중인 요청은 타임아웃까지 남지만 데몬 스레드라 종료를 막지 않음
+        self._stop.set()
+
+    def _run(self) -> None:
+        delay = 0.5
+        connected = True
+        while not self._stop.is_set():
+            try:
+                if self._seq is None:
+                    self._seq = self._dm.health()["event_seq"]   # 지금부터의 변경만
+                feed = self._dm.wait_events(self._seq, LONG_POLL_TIMEOUT)
+            except RemoteError as e:
+                if connected:
+                    print(f"[Remote] 변경 알림 끊김: {e}")
+                    connected = False
+                    self.connection_changed.emit(False)
+                self._stop.wait(delay)
+                delay = min(delay * 2, _RETRY_MAX_S)
+                continue
+            if not connected:
+                print("[Remote] 변경 알림 다시 연결됨")
+                connected = True
+                self.connection_changed.emit(True)
+                feed["reset"] = True    # 끊긴 동안 놓쳤을 수 있음
+            delay = 0.5
+
+            self._seq = feed["seq"]
+            if self._stop.is_set():
+                return
+            if feed["reset"]:
+                self.changed.emit(None)
+                continue
+            events = [e for e in feed["events"] if e.get("client") != self._dm.client_id]
+            if events:
+                self.changed.emit(events)
+        self._thread = None
+
+
+def wait_for_server(dm: RemoteDataManager, timeout: float = 5.0) -> dict:
+    """서버가 응답할 때까지 잠깐 기다림 (서버와 GUI를 같이 띄울 때). 실패하면 RemoteError."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return dm.health()
+        except RemoteError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
@@ -3,6 +3,7 @@
 - WeeklyStatsTab  : 주차별 수익 막대 + 전체 누적 수익 (기존)
 - BossStatsTab    : 보스별 기여도 파이 (주간 / 누적)
 - CharStatsTab    : 캐릭터별 수익 꺾은선(크게) + 달성률(작게)
+- GrowthStatsTab  : 캐릭터별 전투력 성장 vs 주간 보스 수익
 """
 
 import polars as pl
@@ -21,8 +22,8 @@ from PySide6.QtCore import Qt, QRectF
 from PySide6.QtWidgets import QToolTip
 
 from data_layer import ParquetStore
-from data_layer.database import get_connection
-from utils import format_currency_ko
+from utils import format_currency_ko, format_power_ko
+from utils.profiling import profiled
 
 
 CHART_COLORS = [
@@ -67,6 +68,10 @@ class DonutChartView(QChartView):
 # ===========================================================================
 
 class ChartMixin:
+    def set_store(self, store: ParquetStore) -> None:
+        """집계 대상 교체 (계정 전환, 전체 계정 합산). 다음 refresh()부터 적용."""
+        self._store = store
+
     def _make_chart(self, title: str = "") -> QChart:
         chart = QChart()
         chart.setTitle(title)
@@ -139,6 +144,7 @@ class WeeklyStatsTab(QWidget, ChartMixin):
         self._chart_area = QVBoxLayout()
         self._main_layout.addLayout(self._chart_area)
 
+    @profiled(cat="chart")
     def refresh(self) -> None:
         self._clear_layout(self._chart_area)
 
@@ -151,6 +157,7 @@ class WeeklyStatsTab(QWidget, ChartMixin):
                 self._make_group("📊 주차별 수익 추이", self._build_weekly_bar_chart(week_summaries))
             )
 
+    @profiled(cat="chart")
     def _build_weekly_bar_chart(self, week_summaries: list[dict]) -> QChartView:
         labels = [f"{i}주\n({r['week_key']})" for i, r in enumerate(week_summaries, 1)]
         values_eok = [r["total"] / 100_000_000 for r in week_summaries]
@@ -195,9 +202,7 @@ class WeeklyStatsTab(QWidget, ChartMixin):
             return
         try:
             self._store.snapshot()
-            import shutil
-            from config import PARQUET_FILE
-            shutil.copy(PARQUET_FILE, path)
+            self._store.load().write_parquet(path)   # 전체 계정 합산이면 account 컬럼 포함
             QMessageBox.information(self, "완료", f"저장 완료:\n{path}")
         except Exception as e:
             QMessageBox.critical(self, "오류", f"내보내기 실패:\n{e}")
@@ -235,6 +240,7 @@ class BossStatsTab(QWidget, ChartMixin):
         self._charts_row = QHBoxLayout()
         root.addLayout(self._charts_row)
 
+    @profiled(cat="chart")
     def refresh(self) -> None:
         weeks = [r["week_key"] for r in self._store.weekly_totals()]
         if not weeks:
@@ -251,6 +257,7 @@ class BossStatsTab(QWidget, ChartMixin):
     def _on_week_changed(self, week_key: str) -> None:
         self._render(week_key)
 
+    @profiled(cat="chart")
     def _render(self, week_key: str) -> None:
         self._clear_layout(self._charts_row)
         if not week_key:
@@ -264,6 +271,7 @@ class BossStatsTab(QWidget, ChartMixin):
         self._charts_row.addWidget(left, stretch=1)   # ← stretch=1 추가
         self._charts_row.addWidget(right, stretch=1)  # ← stretch=1 추가
 
+    @profiled(cat="chart")
     def _build_pie(self, week_key: str | None, accumulated: bool) -> QChartView:
         if accumulated:
             data = self._store.boss_contribution_all()
@@ -343,6 +351,7 @@ class CharStatsTab(QWidget, ChartMixin):
         scroll.setWidget(scroll_widget)
         root.addWidget(scroll)
 
+    @profiled(cat="chart")
     def refresh(self) -> None:
         weeks = [r["week_key"] for r in self._store.weekly_totals()]
         if not weeks:
@@ -356,6 +365,7 @@ class CharStatsTab(QWidget, ChartMixin):
 
         self._render(self._week_combo.currentText())
 
+    @profiled(cat="chart")
     def _render(self, week_key: str) -> None:
         self._clear_layout(self._content)
         if not week_key:
@@ -369,20 +379,28 @@ class CharStatsTab(QWidget, ChartMixin):
         ach_group = self._make_group(f"✅ {week_key} 캐릭터별 달성률", self._build_achievement_chart(week_key))
         self._content.addWidget(ach_group)
 
+    @profiled(cat="chart")
     def _build_line_chart(self) -> QChartView:
         
         week_summaries = self._store.weekly_totals()
         week_keys = [r["week_key"] for r in week_summaries]
         week_labels = [f"{i}주" for i in range(1, len(week_keys) + 1)]
 
-        with get_connection() as conn:
-            chars = [r[0] for r in conn.execute(
-                "SELECT DISTINCT character FROM weekly_checks ORDER BY character"
-            ).fetchall()]
+        chars = self._store.characters()
 
         chart = self._make_chart("캐릭터별 수익 추이 (억)")
         df = self._store.load()
 
+        # (캐릭터, 주차) 합계를 한 번에 집계 — 점마다 전체 프레임을 필터링하지 않음
+        totals: dict[tuple[str, str], int] = {}
+        if not df.is_empty():
+            grouped = (
+                df.filter(pl.col("checked"))
+                  .group_by(["character", "week_key"])
+                  .agg(pl.col("boss_value").sum().alias("total"))
+            )
+            totals = {(c, w): t for c, w, t in grouped.iter_rows()}
+
         for i, char in enumerate(chars):
             series = QSplineSeries()
             series.setName(char)
@@ -393,16 +411,7 @@ class CharStatsTab(QWidget, ChartMixin):
             series.setPen(pen)
 
             for j, wk in enumerate(week_keys):
-                total = 0
-                if not df.is_empty():
-                    filtered = df.filter(
-                        pl.col("checked") &
-                        (pl.col("week_key") == wk) &
-                        (pl.col("character") == char)
-                    )
-                    if not filtered.is_empty():
-                        total = filtered.select(pl.col("boss_value").sum()).item()
-                series.append(j, total / 100_000_000)
+                series.append(j, totals.get((char, wk), 0) / 100_000_000)
 
             chart.addSeries(series)
 
@@ -434,24 +443,15 @@ class CharStatsTab(QWidget, ChartMixin):
 
         return self._make_chart_view(chart, min_height=400)
 
+    @profiled(cat="chart")
     def _build_achievement_chart(self, week_key: str) -> QChartView:
-        with get_connection() as conn:
-            rows = conn.execute(
-                """SELECT character,
-                          SUM(checked) as done,
-                          COUNT(*) as total
-                   FROM weekly_checks
-                   WHERE week_key = ?
-                   GROUP BY character
-                   ORDER BY CAST(SUM(checked) AS FLOAT) / COUNT(*) DESC""",
-                (week_key,)
-            ).fetchall()
+        rows = self._store.achievement_rates(week_key)
 
         if not rows:
             return self._make_chart_view(self._make_chart("데이터 없음"), min_height=200)
 
         labels = [r["character"] for r in rows]
-        rates = [round(r["done"] / r["total"] * 100, 1) if r["total"] > 0 else 0 for r in rows]
+        rates = [r["rate"] for r in rows]
 
         bar_set = QBarSet("달성률")
         bar_set.setColor(QColor("#23A559"))
@@ -484,3 +484,142 @@ class CharStatsTab(QWidget, ChartMixin):
         series.attachAxis(axis_y)
 
         return self._make_chart_view(chart, min_height=220)
+
+
+# ===========================================================================
+# 탭 4 : 캐릭터별 전투력 성장 vs 주간 보스 수익
+# ===========================================================================
+
+class GrowthStatsTab(QWidget, ChartMixin):
+
+    def __init__(self, store: ParquetStore, parent=None):
+        super().__init__(parent)
+        self._store = store
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(15, 10, 15, 10)
+        root.setSpacing(10)
+
+        ctrl = QHBoxLayout()
+        ctrl.addWidget(QLabel("캐릭터:"))
+        self._char_combo = QComboBox()
+        self._char_combo.setFixedWidth(160)
+        self._char_combo.setStyleSheet(
+            "QComboBox { background-color:#1E1F22; border:1px solid #383A40; padding:4px 8px; border-radius:4px; }"
+        )
+        self._char_combo.currentTextChanged.connect(self._render)
+        ctrl.addWidget(self._char_combo)
+        ctrl.addStretch()
+        self._lbl_growth = QLabel("")
+        self._lbl_growth.setStyleSheet("font-size:15px; font-weight:bold; color:#23A559;")
+        ctrl.addWidget(self._lbl_growth)
+        root.addLayout(ctrl)
+
+        self._chart_area = QVBoxLayout()
+        root.addLayout(self._chart_area)
+        root.addStretch()
+
+    @profiled(cat="chart")
+    def refresh(self) -> None:
+        df = self._store.load()
+        chars = sorted(df["character"].unique().to_list()) if not df.is_empty() else []
+
+        current = self._char_combo.currentText()
+        self._char_combo.blockSignals(True)
+        self._char_combo.clear()
+        self._char_combo.addItems(chars)
+        if current in chars:
+            self._char_combo.setCurrentText(current)
+        self._char_combo.blockSignals(False)
+
+        self._render(self._char_combo.currentText())
+
+    @profiled(cat="chart")
+    def _render(self, character: str) -> None:
+        self._clear_layout(self._chart_area)
+        self._lbl_growth.setText("")
+        if not character:
+            return
+
+        rows = self._store.power_vs_income(character)
+        powers = [r["power"] for r in rows if r["power"] is not None]
+        if len(powers) >= 2 and powers[0]:
+            diff = powers[-1] - powers[0]
+            self._lbl_growth.setText(
+                f"전투력 {format_power_ko(powers[0])} → {format_power_ko(powers[-1])} "
+                f"({diff / powers[0] * 100:+.1f}%)"
+            )
+        self._chart_area.addWidget(
+            self._make_group(f"📈 {character} 전투력 성장 vs 주간 보스 수익",
+                             self._build_growth_chart(rows))
+        )
+
+    @profiled(cat="chart")
+    def _build_growth_chart(self, rows: list[dict]) -> QChartView:
+        if not rows:
+            return self._make_chart_view(self._make_chart("데이터 없음"), min_height=200)
+
+        labels = [f"{i}주" for i in range(1, len(rows) + 1)]
+        income_eok = [r["income"] / 100_000_000 for r in rows]
+
+        bar_set = QBarSet("주간 수익 (억)")
+        bar_set.setColor(QColor("#5865F2"))
+        bar_set.append(income_eok)
+        bar_set.hovered.connect(
+            lambda status, idx: QToolTip.showText(
+                QCursor.pos(),
+                f"{rows[idx]['week_key']}\n수익 {format_currency_ko(rows[idx]['income'])}\n"
+                f"전투력 {format_power_ko(rows[idx]['power'] or 0)}"
+            ) if status else QToolTip.hideText()
+        )
+        bars = QBarSeries()
+        bars.append(bar_set)
+
+        # 전투력은 이력이 있는 주차만 점으로 연결
+        power_line = QLineSeries()
+        power_line.setName("전투력 (만)")
+        pen = QPen(QColor("#FEE75C"))
+        pen.setWidth(2)
+        power_line.setPen(pen)
+        power_line.setPointsVisible(True)
+        for i, r in enumerate(rows):
+            if r["power"] is not None:
+                power_line.append(i, r["power"] / 10_000)
+
+        chart = self._make_chart()
+        chart.addSeries(bars)
+        chart.addSeries(power_line)
+
+        axis_x = QBarCategoryAxis()
+        axis_x.append(labels)
+        self._style_axis(axis_x)
+        chart.addAxis(axis_x, Qt.AlignBottom)
+        bars.attachAxis(axis_x)
+        power_line.attachAxis(axis_x)
+
+        axis_income = QValueAxis()
+        axis_income.setLabelFormat("%.1f")
+        axis_income.setTickCount(5)
+        axis_income.setRange(0, max(income_eok) * 1.2 if max(income_eok) else 1)
+        self._style_axis(axis_income)
+        chart.addAxis(axis_income, Qt.AlignLeft)
+        bars.attachAxis(axis_income)
+
+        axis_power = QValueAxis()
+        axis_power.setLabelFormat("%.0f")
+        axis_power.setTickCount(5)
+        power_values = [p.y() for p in power_line.points()]
+        if power_values:
+            low, high = min(power_values), max(power_values)
+            margin = (high - low) * 0.2 or high * 0.1 or 1
+            axis_power.setRange(max(0, low - margin), high + margin)
+        self._style_axis(axis_power)
+        axis_power.setLabelsColor(QColor("#FEE75C"))
+        chart.addAxis(axis_power, Qt.AlignRight)
+        power_line.attachAxis(axis_power)
+
+        chart.legend().setVisible(True)
+        chart.legend().setAlignment(Qt.AlignBottom)
+        chart.legend().setLabelColor(QColor("#B5BAC1"))
+
+        return self._make_chart_view(chart, min_height=420)
@@ -60,16 +60,21 @@ COMBO_STYLE = """
     }
 """
 
-CHECKLIST_BTN_STYLE = """
-    QPushButton {
-        background-color: #2B2D31; color: #B5BAC1;
-        border: 1px solid #1E1F22; border-radius: 8px;
-        padding: 10px 16px; font-size: 14px;
-    }
-    QPushButton:hover { background-color: #383A40; color: #F2F3F5; }
-    QPushButton:checked { background-color: #23A559; color: white; border: none; }
+CHECKLIST_VIEW_STYLE = """
+    QListView { background-color: transparent; border: none; outline: none; }
 """
 
+# 체크리스트 행은 델리게이트가 직접 그리므로 QSS 대신 색상 값으로 관리
+CHECKLIST_ITEM_PALETTE = {
+    "background": "#2B2D31",
+    "hover": "#383A40",
+    "checked": "#23A559",
+    "border": "#1E1F22",
+    "text": "#B5BAC1",
+    "text_hover": "#F2F3F5",
+    "text_checked": "#FFFFFF",
+}
+
 WEEK_TOTAL_LABEL_STYLE = """
     color: #23A559;
     background-color: #1E1F22;
@@ -86,10 +91,15 @@ CHAR_TOTAL_LABEL_STYLE = """
     margin-top: 10px;
 """
 
-CHAR_STAT_LABEL_STYLE = """
-    font-size: 14px;
-    font-weight: bold;
-    color: #DBDEE1;
-    margin-left: 10px;
-    margin-bottom: 4px;
+INCOME_TABLE_STYLE = """
+    QTableView {
+        background-color: transparent; border: none; outline: none;
+        font-size: 14px; font-weight: bold; color: #DBDEE1;
+        selection-background-color: #383A40;
+    }
+    QTableView::item { padding-left: 10px; }
+    QHeaderView::section {
+        background-color: #2B2D31; color: #B5BAC1;
+        border: none; padding: 4px 10px; font-weight: bold;
+    }
 """
@@ -0,0 +1,72 @@
+"""
+웜 스타트 후 백그라운드 DB 확인.
+
+창은 저장된 상태(data_layer.warm_start)로 먼저 그려지고,
+이 작업이 워커 스레드에서 init_db → ensure_current_week → 상태 재수집을 한 뒤
+결과를 GUI 스레드로 보낸다. 받는 쪽은 달라진 항목의 뷰만 다시 그린다.
+"""
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from data_layer import DataManager
+from data_layer.database import init_db
+from data_layer.query_trace import traced_action
+from data_layer.warm_start import WarmStartStore
+
+
+class _ReconcileSignals(QObject):
+    # 워커 스레드에서 emit → GUI 스레드 슬롯으로 queued 전달
+    done = Signal(dict)    # DB에서 다시 읽은 상태
+    failed = Signal(str)
+
+
+class _ReconcileTask(QRunnable):
+
+    def __init__(self, dm: DataManager, week_key: str, current_character: str | None,
+                 store: WarmStartStore, signals: _ReconcileSignals):
+        super().__init__()
+        self._dm = dm
+        self._week_key = week_key
+        self._current_character = current_character
+        self._store = store
+        self._signals = signals
+
+    @traced_action("warm_start")
+    def run(self) -> None:
+        try:
+            init_db()
+            self._dm.ensure_current_week()
+            state = self._store.collect(self._dm, self._week_key, self._current_character)
+        except Exception as e:
+            self._signals.failed.emit(str(e))
+            return
+        self._store.save(state)
+        self._signals.done.emit(state)
+
+
+class WarmStartReconciler(QObject):
+    """저장된 상태로 그린 화면을 DB와 맞추는 백그라운드 작업."""
+
+    reconciled = Signal(dict, set)   # (DB 상태, 저장된 상태와 달라진 항목)
+    failed = Signal(str)
+
+    def __init__(self, dm: DataManager, store: WarmStartStore | None = None,
+                 pool: QThreadPool | None = None, parent=None):
+        super().__init__(parent)
+        self._dm = dm
+        self._store = store or WarmStartStore()
+        self._pool = pool or QThreadPool.globalInstance()
+        self._warm: dict | None = None
+        self._signals = _ReconcileSignals(self)
+        self._signals.done.connect(self._on_done)
+        self._signals.failed.connect(self.failed)
+
+    def start(self, warm: dict) -> None:
+        self._warm = warm
+        self._pool.start(_ReconcileTask(self._dm, warm["week_key"], warm.get("current_character"),
+                                        self._store, self._signals))
+
+    def _on_done(self, state: dict) -> None:
+        changed = WarmStartStore.changed_keys(self._warm, state)
+        print(f"[WarmStart] DB 확인 완료 (변경: {', '.join(sorted(changed)) or '없음'})")
+        self.reconciled.emit(state, changed)
@@ -0,0 +1,161 @@
+"""
+보스 체크리스트 위젯 — 모델/뷰 기반.
+
+보스마다 QPushButton을 만들지 않고, 모델 하나에 데이터만 교체한다.
+캐릭터 전환은 모델 리셋 한 번, 체크 토글은 해당 행의 dataChanged 한 번으로 끝난다.
+행은 델리게이트가 직접 그리며, 보이는 행만 페인트된다.
+"""
+
+from PySide6.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtGui import QColor, QPainter, QPen, QFont
+from PySide6.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QSize, QRectF, QEvent, Signal,
+)
+
+from ui.styles import CHECKLIST_VIEW_STYLE, CHECKLIST_ITEM_PALETTE
+
+
+# 행 크기 (기존 버튼 스타일: padding 10px 16px, font 14px)
+_ROW_HEIGHT = 42
+_ROW_SPACING = 3
+_ROW_RADIUS = 8
+_TEXT_PADDING = 16
+
+
+class BossChecklistModel(QAbstractListModel):
+    """캐릭터 한 명의 주간 보스 목록. [{text, value, checked}, ...]"""
+
+    toggled = Signal(int, bool)   # (행 번호, 체크 여부) — 사용자가 토글했을 때만
+
+    BossRole = Qt.UserRole
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._bosses: list[dict] = []
+
+    # ------------------------------------------------------------------
+    # 데이터 교체 / 갱신
+    # ------------------------------------------------------------------
+
+    def set_bosses(self, bosses: list[dict]) -> None:
+        """보스 목록 교체. 행 개수와 무관하게 리셋 한 번."""
+        self.beginResetModel()
+        self._bosses = bosses
+        self.endResetModel()
+
+    def bosses(self) -> list[dict]:
+        return self._bosses
+
+    def set_checked(self, row: int, checked: bool) -> None:
+        """외부 변경 반영. 해당 행만 다시 그린다 (toggled는 발생하지 않음)."""
+        if not 0 <= row < len(self._bosses):
+            return
+        self._bosses[row]["checked"] = checked
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx, [Qt.CheckStateRole])
+
+    # ------------------------------------------------------------------
+    # QAbstractListModel
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._bosses)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        boss = self._bosses[index.row()]
+        if role == Qt.DisplayRole:
+            return f"{boss['text']} ({boss['value']:,}메소)"
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if boss.get("checked") else Qt.Unchecked
+        if role == self.BossRole:
+            return boss
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.CheckStateRole) -> bool:
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        checked = value in (Qt.Checked, Qt.Checked.value, True)
+        row = index.row()
+        if bool(self._bosses[row].get("checked")) == checked:
+            return False
+        self._bosses[row]["checked"] = checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.toggled.emit(row, checked)
+        return True
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+
+
+class BossChecklistDelegate(QStyledItemDelegate):
+    """체크 상태에 따라 둥근 버튼 모양으로 행을 그리고, 클릭 시 토글."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._colors = {k: QColor(v) for k, v in CHECKLIST_ITEM_PALETTE.items()}
+        self._font = QFont("Noto Sans KR")
+        self._font.setPixelSize(14)
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), _ROW_HEIGHT)
+
+    def paint(self, painter: QPainter, option, index) -> None:
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        if checked:
+            bg, fg, border = self._colors["checked"], self._colors["text_checked"], None
+        elif hovered:
+            bg, fg, border = self._colors["hover"], self._colors["text_hover"], self._colors["border"]
+        else:
+            bg, fg, border = self._colors["background"], self._colors["text"], self._colors["border"]
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = QRectF(option.rect).adjusted(0.5, 0.5, -0.5, -0.5)
+        painter.setPen(QPen(border, 1) if border else Qt.NoPen)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(rect, _ROW_RADIUS, _ROW_RADIUS)
+
+        painter.setFont(self._font)
+        painter.setPen(fg)
+        painter.drawText(
+            rect.adjusted(_TEXT_PADDING, 0, -_TEXT_PADDING, 0),
+            Qt.AlignCenter,
+            index.data(Qt.DisplayRole),
+        )
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        toggle = (
+            (event.type() == QEvent.MouseButtonRelease
+             and event.button() == Qt.LeftButton
+             and option.rect.contains(event.position().toPoint()))
+            or (event.type() == QEvent.KeyPress
+                and event.key() in (Qt.Key_Space, Qt.Key_Select))
+        )
+        if not toggle:
+            return event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick)
+
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
+
+
+class BossChecklistView(QListView):
+    """보스 체크리스트 뷰. 행 높이가 일정해 레이아웃 비용이 행 수와 무관."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setSpacing(_ROW_SPACING)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)  # hover 표시
+        self.setStyleSheet(CHECKLIST_VIEW_STYLE)
+        self.setItemDelegate(BossChecklistDelegate(self))
@@ -1,15 +1,18 @@
 """
 캐릭터 사이드바 위젯 — 아이콘 리스트로 캐릭터를 선택.
-"""
 
-import os
+아이콘은 자리표시자로 먼저 그리고, 화면에 보이는 행만
+atlas에서 바로 읽거나 ThumbnailLoader로 백그라운드 로드해 도착하는 대로 교체한다.
+"""
 
 from PySide6.QtWidgets import QListWidget, QListWidgetItem
 from PySide6.QtGui import QPixmap, QIcon
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer
 
-from config import IMAGE_DIR, SIDEBAR_WIDTH, SIDEBAR_ICON_SIZE
+from config import SIDEBAR_WIDTH, SIDEBAR_ICON_SIZE
 from ui.styles import SIDEBAR_STYLE
+from api import ThumbnailSpec
+from ui.widgets.thumbnail_cache import ThumbnailLoader
 
 
 # 사이드바 전용 이미지 크롭 파라미터
@@ -17,6 +20,13 @@ _SIDEBAR_CROP_RATIO = 0.3
 _SIDEBAR_Y_OFFSET = 0.05
 _SIDEBAR_X_OFFSET = 15
 
+SIDEBAR_THUMBNAIL = ThumbnailSpec(
+    size=SIDEBAR_ICON_SIZE,
+    crop_ratio=_SIDEBAR_CROP_RATIO,
+    y_offset_ratio=_SIDEBAR_Y_OFFSET,
+    x_offset=_SIDEBAR_X_OFFSET,
+)
+
 
 class CharacterSidebar(QListWidget):
     """아이콘 기반 캐릭터 선택 사이드바."""
@@ -30,44 +40,82 @@ class CharacterSidebar(QListWidget):
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.setStyleSheet(SIDEBAR_STYLE)
 
+        self._items: dict[str, QListWidgetItem] = {}
+        self._needs_icon: set[str] = set()
+
+        placeholder = QPixmap(SIDEBAR_ICON_SIZE, SIDEBAR_ICON_SIZE)
+        placeholder.fill(Qt.transparent)
+        self._placeholder = QIcon(placeholder)
+
+        self._thumbnails = ThumbnailLoader(SIDEBAR_THUMBNAIL, self)
+        self._thumbnails.loaded.connect(self._on_thumbnail_loaded)
+        self._thumbnails.missing.connect(self._needs_icon.discard)   # 원본 없음 → 자리표시자 유지
+
+        # 스크롤/리사이즈 시 새로 보이게 된 행만 로드 (이벤트 여러 번 → 한 번)
+        self._visible_timer = QTimer(self)
+        self._visible_timer.setSingleShot(True)
+        self._visible_timer.setInterval(0)
+        self._visible_timer.timeout.connect(self._load_visible_icons)
+        self.verticalScrollBar().valueChanged.connect(self._visible_timer.start)
+
     # ------------------------------------------------------------------
 
-    def refresh(self, character_names: list[str]) -> None:
-        """캐릭터 이름 목록으로 사이드바 아이콘을 재구성."""
+    def refresh(self, character_names: list[str], sources: dict[str, str] | None = None) -> None:
+        """
+        캐릭터 이름 목록으로 사이드바 아이콘을 재구성.
+        sources: 캐릭터 → 원본 이미지 경로 (없는 캐릭터는 레거시 경로)
+        """
+        self._thumbnails.set_sources(sources or {})
         self.blockSignals(True)
         self.clear()
+        self._items.clear()
+        self._needs_icon.clear()
 
         for name in character_names:
             item = QListWidgetItem()
             item.setData(Qt.UserRole, name)
             item.setToolTip(name)
-            item.setIcon(self._build_icon(name))
+            pixmap = self._thumbnails.cached(name, use_atlas=False)   # 메모리만, atlas는 보이는 행만
+            if pixmap is not None:
+                item.setIcon(QIcon(pixmap))
+            else:
+                item.setIcon(self._placeholder)
+                self._needs_icon.add(name)
+            self._items[name] = item
             self.addItem(item)
 
         self.blockSignals(False)
+        self._visible_timer.start()
 
     # ------------------------------------------------------------------
     # private
     # ------------------------------------------------------------------
 
-    def _build_icon(self, char_name: str) -> QIcon:
-        img_path = os.path.join(IMAGE_DIR, f"{char_name}.png")
-
-        if not os.path.exists(img_path):
-            fallback = QPixmap(SIDEBAR_ICON_SIZE, SIDEBAR_ICON_SIZE)
-            fallback.fill(Qt.transparent)
-            return QIcon(fallback)
-
-        pixmap = QPixmap(img_path)
-        w, h = pixmap.width(), pixmap.height()
-
-        crop_side = int(min(w, h) * _SIDEBAR_CROP_RATIO)
-        x = (w - crop_side) // 2 + _SIDEBAR_X_OFFSET
-        y = int((h - crop_side) // 2 + h * _SIDEBAR_Y_OFFSET)
-
-        pixmap = pixmap.copy(x, y, crop_side, crop_side)
-        pixmap = pixmap.scaled(
-            SIDEBAR_ICON_SIZE, SIDEBAR_ICON_SIZE,
-            Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation,
-        )
-        return QIcon(pixmap)
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._visible_timer.start()
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self._visible_timer.start()
+
+    def _load_visible_icons(self) -> None:
+        if not self._needs_icon:
+            return
+        viewport = self.viewport().rect()
+        for name in list(self._needs_icon):
+            if not self.visualItemRect(self._items[name]).intersects(viewport):
+                continue
+            pixmap = self._thumbnails.cached(name)
+            if pixmap is not None:
+                self._needs_icon.discard(name)
+                self._items[name].setIcon(QIcon(pixmap))
+            else:
+                self._thumbnails.request(name)
+
+    def _on_thumbnail_loaded(self, char_name: str, pixmap: QPixmap) -> None:
+        item = self._items.get(char_name)
+        if item is None:
+            return
+        self._needs_icon.discard(char_name)
+        item.setIcon(QIcon(pixmap))
@@ -0,0 +1,179 @@
+"""
+캐릭터별 수익 요약 테이블 — 모델/뷰 기반.
+
+캐릭터별 합계를 모델에 캐시해두고, 보스 하나를 토글하면
+해당 캐릭터 행 하나와 주간 합계만 갱신한다. (DB 재조회 없음)
+정렬은 모델이 직접 유지한다. 값이 바뀐 행은 이분 탐색으로 새 위치를 찾아
+그 행만 이동시키므로, QSortFilterProxyModel의 재정렬 비용이 들지 않는다.
+"""
+
+from PySide6.QtWidgets import QTableView, QHeaderView, QAbstractItemView
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+
+from ui.styles import INCOME_TABLE_STYLE
+from utils import format_currency_ko
+
+
+class CharacterIncomeModel(QAbstractTableModel):
+    """[캐릭터, 수익] 2열 테이블. 항상 현재 정렬 기준으로 정렬된 상태를 유지."""
+
+    total_changed = Signal(int)   # 주간 전체 합계
+
+    SortRole = Qt.UserRole   # 정렬용 원본 값
+    COL_CHARACTER, COL_TOTAL = range(2)
+    _HEADERS = ("캐릭터", "수익")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[list] = []          # [[character, total], ...]
+        self._row_of: dict[str, int] = {}    # character → 행 번호
+        self._week_total = 0
+        self._sort_column = self.COL_TOTAL
+        self._sort_order = Qt.DescendingOrder
+
+    # ------------------------------------------------------------------
+    # 데이터 교체 / 갱신
+    # ------------------------------------------------------------------
+
+    def set_totals(self, totals: list[dict]) -> None:
+        """
+        전체 교체 (주차 전환, 캐릭터 추가/삭제 시).
+
+        Args:
+            totals: [{"character": "쿠루리우타", "total": 123000000}, ...]
+        """
+        self.beginResetModel()
+        self._rows = [[r["character"], r["total"] or 0] for r in totals]
+        self._rows.sort(key=self._sort_key, reverse=self._descending())
+        self._row_of = {}
+        self._reindex(0, len(self._rows))
+        self.endResetModel()
+        self._set_week_total(sum(total for _, total in self._rows))
+
+    def apply_delta(self, character: str, delta: int) -> None:
+        """캐릭터 한 명의 수익 증감. 해당 행과 주간 합계만 갱신."""
+        row = self._row_of.get(character)
+        if row is None:
+            entry = [character, delta]
+            pos = self._insert_position(entry)
+            self.beginInsertRows(QModelIndex(), pos, pos)
+            self._rows.insert(pos, entry)
+            self._reindex(pos, len(self._rows))
+            self.endInsertRows()
+        else:
+            entry = self._rows[row]
+            entry[1] += delta
+            idx = self.index(row, self.COL_TOTAL)
+            self.dataChanged.emit(idx, idx, [Qt.DisplayRole, self.SortRole])
+            if self._sort_column == self.COL_TOTAL:
+                self._move_to_sorted_position(row)
+        self._set_week_total(self._week_total + delta)
+
+    def week_total(self) -> int:
+        return self._week_total
+
+    def totals(self) -> dict[str, int]:
+        return {name: total for name, total in self._rows}
+
+    def _set_week_total(self, total: int) -> None:
+        self._week_total = total
+        self.total_changed.emit(total)
+
+    # ------------------------------------------------------------------
+    # 정렬 유지
+    # ------------------------------------------------------------------
+
+    def _sort_key(self, entry: list):
+        return entry[self._sort_column]
+
+    def _descending(self) -> bool:
+        return self._sort_order == Qt.DescendingOrder
+
+    def _reindex(self, start: int, stop: int) -> None:
+        for i in range(start, stop):
+            self._row_of[self._rows[i][0]] = i
+
+    def _insert_position(self, entry: list, skip: int = -1) -> int:
+        """
+        정렬 순서를 유지하는 삽입 위치 (이분 탐색, 같은 값이면 뒤쪽).
+        skip 행은 없는 것으로 보고 계산한다 (이동 대상 행).
+        """
+        key = self._sort_key(entry)
+        desc = self._descending()
+        lo, hi = 0, len(self._rows) - (1 if skip >= 0 else 0)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = self._sort_key(self._rows[mid + 1 if 0 <= skip <= mid else mid])
+            if (other >= key) if desc else (other <= key):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _move_to_sorted_position(self, row: int) -> None:
+        """값이 바뀐 행 하나만 새 정렬 위치로 이동."""
+        pos = self._insert_position(self._rows[row], skip=row)
+        if pos == row:
+            return
+        # beginMoveRows의 목적지는 이동 전 기준 인덱스
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), pos + 1 if pos > row else pos)
+        self._rows.insert(pos, self._rows.pop(row))
+        self._reindex(min(row, pos), max(row, pos) + 1)
+        self.endMoveRows()
+
+    # ------------------------------------------------------------------
+    # QAbstractTableModel
+    # ------------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name, total = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            return name if col == self.COL_CHARACTER else format_currency_ko(total)
+        if role == self.SortRole:
+            return name if col == self.COL_CHARACTER else total
+        if role == Qt.TextAlignmentRole and col == self.COL_TOTAL:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._HEADERS[section]
+        return None
+
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        """헤더 클릭 시 호출. 이후 증감은 이 기준으로 정렬 위치를 유지."""
+        self._sort_column, self._sort_order = column, order
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=self._sort_key, reverse=self._descending())
+        self._reindex(0, len(self._rows))
+        self.layoutChanged.emit()
+
+
+class IncomeSummaryView(QTableView):
+    """수익 요약 테이블 뷰. 헤더 클릭으로 정렬 (기본: 수익 내림차순)."""
+
+    def __init__(self, model: CharacterIncomeModel, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+
+        self.setSortingEnabled(True)
+        self.sortByColumn(CharacterIncomeModel.COL_TOTAL, Qt.DescendingOrder)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(28)
+        # ResizeToContents는 전체 행을 측정하므로 사용하지 않음
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.setStyleSheet(INCOME_TABLE_STYLE)
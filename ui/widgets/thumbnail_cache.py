@@ -0,0 +1,162 @@
+"""
+캐릭터 썸네일 2단 캐시 + 비동기 로더.
+
+1단: QPixmapCache (메모리) — 키: (이름, 크기, 크롭 파라미터, 원본 식별자)
+2단: 썸네일 atlas (mmap 묶음 파일) — 파일 열기 1회로 전체 아이콘 조회
+3단: THUMBNAIL_DIR의 크롭·스케일 완료 PNG (디스크) — 원본보다 오래됐으면 재생성
+
+원본 식별자는 blob 해시(경로에서 바로 얻음)라 조회에 파일 확인(stat)이 필요 없다.
+
+원본 경로는 ImageStore.current_paths()로 받은 blob 경로를 쓰고,
+아직 저장소에 없는 캐릭터는 레거시 경로(IMAGE_DIR/<이름>.png)를 쓴다.
+
+원본 디코딩/크롭/스케일은 워커 스레드에서 QImage로 처리하고,
+GUI 스레드는 완성된 QImage를 QPixmap으로 바꿔 캐시에 넣기만 한다.
+"""
+
+import os
+
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from api import ThumbnailSpec, image_to_png
+from api.image_atlas import shared_atlas
+from config import IMAGE_DIR, THUMBNAIL_DIR
+from data_layer.image_store import source_id
+
+
+def legacy_source_path(char_name: str) -> str:
+    return os.path.join(IMAGE_DIR, f"{char_name}.png")
+
+
+def thumbnail_path(src: str, spec: ThumbnailSpec) -> str:
+    """원본 파일 이름(blob 해시 또는 캐릭터 이름) 기준 썸네일 경로."""
+    stem = os.path.splitext(os.path.basename(src))[0]
+    return os.path.join(THUMBNAIL_DIR, f"{stem}_{spec.tag()}.png")
+
+
+def build_thumbnail(src: str, spec: ThumbnailSpec) -> QImage | None:
+    """
+    디스크 썸네일이 최신이면 그대로 읽고, 아니면 원본에서 만들어 저장.
+    QImage만 다루므로 워커 스레드 전용으로 사용해도 안전.
+    """
+    thumb = thumbnail_path(src, spec)
+    try:
+        src_mtime = os.stat(src).st_mtime_ns
+    except OSError:
+        return None
+
+    try:
+        if os.stat(thumb).st_mtime_ns >= src_mtime:
+            image = QImage(thumb)
+            if not image.isNull():
+                return image
+    except OSError:
+        pass
+
+    image = QImage(src)
+    if image.isNull():
+        return None
+    image = spec.apply(image)
+    image.save(thumb, "PNG")
+    return image
+
+
+# ---------------------------------------------------------------------------
+# 비동기 로더
+# ---------------------------------------------------------------------------
+
+class _LoaderSignals(QObject):
+    # 워커 스레드에서 emit → GUI 스레드 슬롯으로 queued 전달
+    done = Signal(str, str, QImage, object)   # (캐릭터 이름, 캐시 키, 이미지, PNG 바이트)
+
+
+class _ThumbnailTask(QRunnable):
+
+    def __init__(self, char_name: str, src: str, key: str, spec: ThumbnailSpec,
+                 signals: _LoaderSignals):
+        super().__init__()
+        self._char_name = char_name
+        self._src = src
+        self._key = key
+        self._spec = spec
+        self._signals = signals
+
+    def run(self) -> None:
+        image = build_thumbnail(self._src, self._spec)
+        if image is None:
+            self._signals.done.emit(self._char_name, self._key, QImage(), b"")
+            return
+        self._signals.done.emit(self._char_name, self._key, image, image_to_png(image))
+
+
+class ThumbnailLoader(QObject):
+    """
+    캐릭터 썸네일 로더.
+    cached()로 메모리 캐시 → atlas 순으로 즉시 조회하고, 없으면 request()로 워커에 맡긴다.
+    같은 키의 요청이 진행 중이면 중복 요청하지 않는다.
+    """
+
+    loaded = Signal(str, QPixmap)   # (캐릭터 이름, 썸네일)
+    missing = Signal(str)           # 원본 이미지 없음 (캐릭터 이름)
+
+    def __init__(self, spec: ThumbnailSpec, parent=None, pool: QThreadPool | None = None):
+        super().__init__(parent)
+        self._spec = spec
+        self._pool = pool or QThreadPool.globalInstance()
+        self._in_flight: set[str] = set()
+        self._sources: dict[str, str] = {}
+        self._signals = _LoaderSignals(self)
+        self._signals.done.connect(self._on_done)
+
+    def set_sources(self, sources: dict[str, str]) -> None:
+        """캐릭터 → 원본 이미지 경로 (ImageStore.current_paths())."""
+        self._sources = sources
+
+    def source_path(self, char_name: str) -> str:
+        return self._sources.get(char_name) or legacy_source_path(char_name)
+
+    def source_id(self, char_name: str) -> str:
+        return source_id(self.source_path(char_name))
+
+    def cache_key(self, char_name: str) -> str:
+        return f"thumb:{char_name}:{self._spec.tag()}:{self.source_id(char_name)}"
+
+    def cached(self, char_name: str, use_atlas: bool = True) -> QPixmap | None:
+        """메모리 캐시, 그다음 atlas에서 조회. 둘 다 없으면 None."""
+        key = self.cache_key(char_name)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+        atlas = shared_atlas() if use_atlas else None
+        if atlas is None:
+            return None
+        png = atlas.get(char_name, self._spec.tag(), self.source_id(char_name))
+        if png is None:
+            return None
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(png, "PNG"):
+            return None
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def request(self, char_name: str) -> None:
+        """백그라운드 로드 요청. 결과는 loaded, 원본이 없으면 missing."""
+        key = self.cache_key(char_name)
+        if key not in self._in_flight:
+            self._in_flight.add(key)
+            self._pool.start(_ThumbnailTask(
+                char_name, self.source_path(char_name), key, self._spec, self._signals
+            ))
+
+    def _on_done(self, char_name: str, key: str, image: QImage, png: bytes) -> None:
+        self._in_flight.discard(key)
+        if image.isNull():
+            self.missing.emit(char_name)
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        atlas = shared_atlas()
+        if atlas is not None and png:
+            atlas.add(char_name, self._spec.tag(), key.rsplit(":", 1)[1], png)
+        self.loaded.emit(char_name, pixmap)
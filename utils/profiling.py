@@ -0,0 +1,193 @@
+"""
+가벼운 구간(span) 프로파일러 — Chrome trace event 형식으로 저장.
+
+핫 패스(DB 호출, 스냅샷, Parquet 집계, 차트 생성, 이미지 로드, API 호출)에
+span을 걸어 두고, `main.py --profile out.json`으로 실행하면 종료 시 파일로 저장한다.
+저장된 파일은 chrome://tracing 또는 https://ui.perfetto.dev 에서 스레드별 타임라인으로 열린다.
+
+꺼져 있을 때는 플래그 확인 한 번 후 원래 함수를 그대로 호출한다 (span()은 공유 nullcontext 반환).
+
+사용 흐름:
+    from utils.profiling import profiler, span, profiled
+
+    with span("snapshot", "parquet"):
+        ...
+
+    @profiled("chart.weekly_bar", "chart")
+    def _build_weekly_bar_chart(self, ...): ...
+
+    profiler.enable()
+    ...
+    profiler.dump("out.json")
+"""
+
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+_NULL = nullcontext()
+
+
+class Profiler:
+    """Chrome trace 이벤트 수집기. 이벤트 추가는 list.append 하나라 스레드 안전."""
+
+    def __init__(self, max_events: int = 500_000):
+        self.enabled = False
+        self._max_events = max_events
+        self._ids = itertools.count(1)      # 비동기 span id
+        self.reset()
+
+    def enable(self) -> None:
+        self.reset()
+        self.enabled = True
+        print("[Profile] 기록 시작")
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        self._events: list[dict] = []
+        self._threads: dict[int, str] = {}
+        self._origin_ns = time.perf_counter_ns()
+        self._dropped = 0
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def _now_us(self) -> float:
+        return (time.perf_counter_ns() - self._origin_ns) / 1000
+
+    def _tid(self) -> int:
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        return tid
+
+    def _add(self, event: dict) -> None:
+        if len(self._events) >= self._max_events:
+            self._dropped += 1
+            return
+        self._events.append(event)
+
+    @contextmanager
+    def _span(self, name: str, cat: str, args: dict | None):
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            event = {"name": name, "cat": cat, "ph": "X", "ts": start,
+                     "dur": self._now_us() - start, "pid": os.getpid(), "tid": self._tid()}
+            if args:
+                event["args"] = args
+            self._add(event)
+
+    def span(self, name: str, cat: str = "app", **args):
+        """구간 기록 컨텍스트 매니저 (꺼져 있으면 아무것도 하지 않음)."""
+        if not self.enabled:
+            return _NULL
+        return self._span(name, cat, args)
+
+    def instant(self, name: str, cat: str = "app", **args) -> None:
+        """시점 표시 (예: 첫 paint)."""
+        if not self.enabled:
+            return
+        event = {"name": name, "cat": cat, "ph": "i", "s": "p", "ts": self._now_us(),
+                 "pid": os.getpid(), "tid": self._tid()}
+        if args:
+            event["args"] = args
+        self._add(event)
+
+    def async_begin(self, name: str, cat: str = "app") -> int | None:
+        """같은 스레드에서 겹칠 수 있는 구간(asyncio 코루틴)용. 반환한 id를 async_end에 넘긴다."""
+        if not self.enabled:
+            return None
+        span_id = next(self._ids)
+        self._add({"name": name, "cat": cat, "ph": "b", "id": span_id, "ts": self._now_us(),
+                   "pid": os.getpid(), "tid": self._tid()})
+        return span_id
+
+    def async_end(self, span_id: int | None, name: str, cat: str = "app") -> None:
+        if span_id is None:
+            return
+        self._add({"name": name, "cat": cat, "ph": "e", "id": span_id, "ts": self._now_us(),
+                   "pid": os.getpid(), "tid": self._tid()})
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    def to_chrome_trace(self) -> dict:
+        """
+        Returns:
+            {"traceEvents": [{"name": "get_week_data", "cat": "db", "ph": "X",
+                              "ts": 1520.3, "dur": 812.0, "pid": 4120, "tid": 1401...}, ...],
+             "displayTimeUnit": "ms"}
+        """
+        pid = os.getpid()
+        meta = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                 "args": {"name": "boss-tracker"}}]
+        for tid, name in list(self._threads.items()):
+            meta.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                         "args": {"name": name}})
+        return {"traceEvents": meta + list(self._events), "displayTimeUnit": "ms",
+                "otherData": {"dropped_events": self._dropped}}
+
+    def dump(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+        print(f"[Profile] {len(self._events)}개 이벤트 저장: {path}")
+
+
+profiler = Profiler()
+
+
+def span(name: str, cat: str = "app", **args):
+    return profiler.span(name, cat, **args)
+
+
+# ---------------------------------------------------------------------------
+# 데코레이터
+# ---------------------------------------------------------------------------
+
+def profiled(name: str | None = None, cat: str = "app"):
+    """함수 호출을 span으로 기록. 코루틴 함수는 비동기 span으로 기록한다."""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not profiler.enabled:
+                    return await func(*args, **kwargs)
+                span_id = profiler.async_begin(label, cat)
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    profiler.async_end(span_id, label, cat)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            with profiler._span(label, cat, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def profiled_methods(cat: str):
+    """클래스의 공개 메서드 전부에 profiled 적용 (이름은 '클래스.메서드')."""
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.isfunction(value):
+                continue
+            setattr(cls, attr, profiled(f"{cls.__name__}.{attr}", cat)(value))
+        return cls
+    return decorator